@@ -1,21 +1,40 @@
 #!/usr/bin/env node
 /**
- * Copy Vite build output (dist/) to server/static for serving the Chat UI from the Python backend.
+ * Copy Vite build output (dist/) to server/static for serving the Chat UI from the Python backend,
+ * then write brotli (.br) and gzip (.gz) variants of the text assets next to them, which the server
+ * sends as is to clients that accept them (server/lib/static.py). server/static/build-manifest.json records
+ * a hash of the UI sources the build came from, so the server can tell when the bundle is out of date, and
+ * of each compressed file, so it never sends a variant of other contents than the file next to it.
  * Run after: npm run build
+ * Only recompress what is already in server/static: node build-static.js --compress-only
  */
+import crypto from 'crypto';
 import fs from 'fs';
 import path from 'path';
+import zlib from 'zlib';
 import { fileURLToPath } from 'url';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
 const src = path.join(__dirname, 'dist');
 const dest = path.join(__dirname, 'server', 'static');
+const compressOnly = process.argv.includes('--compress-only');
+const MANIFEST = 'build-manifest.json';
+// Inputs of the Vite build (same list as UI_SOURCES in server/lib/static.py)
+const UI_SOURCES = ['index.html', 'package.json', 'package-lock.json', 'vite.config.js', 'src', 'public'];
 
-if (!fs.existsSync(src)) {
-  console.error('Run "npm run build" first. Missing:', src);
-  process.exit(1);
-}
+// Smaller files are not worth a variant (headers and the extra lookup cost more than they save)
+const MIN_SIZE = 1024;
+const COMPRESSIBLE = new Set(['.html', '.js', '.mjs', '.css', '.svg', '.json', '.map', '.txt', '.xml', '.webmanifest']);
+const VARIANTS = [
+  ['.br', (buf) => zlib.brotliCompressSync(buf, {
+    params: {
+      [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+      [zlib.constants.BROTLI_PARAM_SIZE_HINT]: buf.length,
+    },
+  })],
+  ['.gz', (buf) => zlib.gzipSync(buf, { level: zlib.constants.Z_BEST_COMPRESSION })],
+];
 
 function copyDir(s, d) {
   fs.mkdirSync(d, { recursive: true });
@@ -30,8 +49,85 @@ function copyDir(s, d) {
   }
 }
 
-if (fs.existsSync(dest)) {
-  fs.rmSync(dest, { recursive: true });
+function listFiles(p) {
+  if (!fs.existsSync(p)) return [];
+  if (!fs.statSync(p).isDirectory()) return [p];
+  return fs.readdirSync(p).flatMap((name) => listFiles(path.join(p, name)));
 }
-copyDir(src, dest);
-console.log('Copied dist/ to server/static');
+
+// sha256 over paths and contents (CRLF read as LF), matching ui_source_hash in server/lib/static.py
+function sourceHash() {
+  const files = UI_SOURCES.flatMap((name) => listFiles(path.join(__dirname, name)))
+    .map((f) => [path.relative(__dirname, f).split(path.sep).join('/'), f])
+    .sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0));
+  const hash = crypto.createHash('sha256');
+  for (const [rel, f] of files) {
+    hash.update(rel + '\0');
+    hash.update(fs.readFileSync(f).toString('latin1').replace(/\r\n/g, '\n'), 'latin1');
+    hash.update('\0');
+  }
+  return hash.digest('hex');
+}
+
+const sha256 = (buf) => crypto.createHash('sha256').update(buf).digest('hex');
+
+// Writes the variants of the files under d; digests gets static-relative path -> sha256 of each compressed file
+function compressDir(d, totals, digests) {
+  for (const name of fs.readdirSync(d)) {
+    const filePath = path.join(d, name);
+    if (fs.statSync(filePath).isDirectory()) {
+      compressDir(filePath, totals, digests);
+      continue;
+    }
+    const variant = VARIANTS.find(([suffix]) => name.endsWith(suffix));
+    if (variant) {
+      // Left over from a file that is gone or no longer compressed
+      const original = filePath.slice(0, -variant[0].length);
+      if (!fs.existsSync(original) || fs.statSync(original).size < MIN_SIZE) fs.rmSync(filePath);
+      continue;
+    }
+    if (!COMPRESSIBLE.has(path.extname(name).toLowerCase())) continue;
+    const buf = fs.readFileSync(filePath);
+    if (buf.length < MIN_SIZE) continue;
+    for (const [suffix, compress] of VARIANTS) {
+      const out = compress(buf);
+      // Keep a variant only if it actually saves bytes
+      if (out.length < buf.length * 0.95) {
+        fs.writeFileSync(filePath + suffix, out);
+        totals[suffix] = (totals[suffix] || 0) + out.length;
+        digests[path.relative(dest, filePath).split(path.sep).join('/')] = sha256(buf);
+      } else if (fs.existsSync(filePath + suffix)) {
+        fs.rmSync(filePath + suffix);
+      }
+    }
+    totals.raw += buf.length;
+  }
+}
+
+if (compressOnly) {
+  if (!fs.existsSync(dest)) {
+    console.error('Nothing to compress. Missing:', dest);
+    process.exit(1);
+  }
+} else {
+  if (!fs.existsSync(src)) {
+    console.error('Run "npm run build" first. Missing:', src);
+    process.exit(1);
+  }
+  if (fs.existsSync(dest)) {
+    fs.rmSync(dest, { recursive: true });
+  }
+  copyDir(src, dest);
+  fs.writeFileSync(path.join(dest, MANIFEST), JSON.stringify({ sources: sourceHash() }, null, 2) + '\n');
+  console.log('Copied dist/ to server/static');
+}
+
+const totals = { raw: 0 };
+const digests = {};
+compressDir(dest, totals, digests);
+// --compress-only keeps the recorded sources hash
+const manifestPath = path.join(dest, MANIFEST);
+const manifest = fs.existsSync(manifestPath) ? JSON.parse(fs.readFileSync(manifestPath, 'utf8')) : {};
+fs.writeFileSync(manifestPath, JSON.stringify({ ...manifest, compressed: digests }, null, 2) + '\n');
+const kb = (n) => `${((n || 0) / 1024).toFixed(1)} KB`;
+console.log(`Compressed ${kb(totals.raw)} of text assets: brotli ${kb(totals['.br'])}, gzip ${kb(totals['.gz'])}`);
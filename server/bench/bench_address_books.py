@@ -0,0 +1,76 @@
+"""
+Walking a large tenant's address books with cc_list_address_books: per-page tool latency with and without
+prefetching the next page (with --think-ms between pages, as when the model reads a page before asking
+for the next), and the size of each page's result vs the raw v3/address-book response.
+Run from server/: python bench/bench_address_books.py --books 2000 --pages 10 --latency-ms 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from mock_cc import MockServer, create_app  # noqa: E402
+
+AUTH = {"__accessToken": "x", "__orgId": "org-1"}
+
+
+async def walk(pages: int, think: float) -> tuple[list[float], list[int]]:
+    from main import handle_tool_call
+    from lib.api import close_client
+    from lib.cache import address_book_pages
+
+    address_book_pages.invalidate()
+    args: dict = {}
+    latencies, sizes = [], []
+    for _ in range(pages):
+        start = time.perf_counter()
+        res = await handle_tool_call("cc_list_address_books", {**args, **AUTH})
+        latencies.append(time.perf_counter() - start)
+        text = res["content"][0]["text"]
+        sizes.append(len(text))
+        cursor = json.loads(text).get("nextCursor")
+        if not cursor:
+            break
+        args = {"cursor": cursor}
+        await asyncio.sleep(think)
+    await close_client()
+    return latencies, sizes
+
+
+async def raw_size(url: str) -> int:
+    import httpx
+
+    async with httpx.AsyncClient() as client:
+        return len((await client.get(f"{url}/organization/org-1/v3/address-book", params={"pageSize": 100})).content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", type=int, default=2000)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--think-ms", type=float, default=500.0)
+    a = parser.parse_args()
+    with MockServer(create_app(users=10, latency_ms=a.latency_ms, address_books=a.books)) as mock:
+        os.environ["CONTACT_CENTER_BASE_URL"] = mock.url
+        os.environ["CC_MIRROR_PATH"] = ""
+        print(f"books={a.books} latency={a.latency_ms:g}ms think={a.think_ms:g}ms pages={a.pages}")
+        for label, prefetch in (("no prefetch", "0"), ("prefetch next page", "1")):
+            os.environ["CC_ADDRESS_BOOK_PREFETCH"] = prefetch
+            latencies, sizes = asyncio.run(walk(a.pages, a.think_ms / 1000))
+            later = latencies[1:]
+            print(f"{label:<20} first={latencies[0] * 1000:6.1f}ms  next pages p50={statistics.median(later) * 1000:6.1f}ms  max={max(later) * 1000:6.1f}ms  bytes/page={statistics.mean(sizes):.0f}")
+        print(f"{'raw API page (100)':<20} bytes={asyncio.run(raw_size(mock.url))}  (one unpaged GET, as the tool returned it before)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Peak Python heap while reading a synthetic user bulk-export: buffered cc_rest (str + parsed tree, then index)
+vs streaming into the index vs streaming with early stop at a target email.
+Run from server/: python bench/bench_bulk_export_memory.py --users 100000 --format json
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from mock_cc import free_port  # noqa: E402
+
+PATH = "organization/org-1/user/bulk-export"
+OVERRIDES = {"token": "x", "orgId": "org-1"}
+
+
+async def buffered():
+    from lib.api import cc_rest
+    from lib.directory import UserIndex
+
+    res = await cc_rest("GET", PATH, None, OVERRIDES, {"Accept": "application/json"})
+    return UserIndex.from_payload(res["data"])
+
+
+async def streamed():
+    from lib.api import cc_stream
+    from lib.stream import build_user_index
+
+    return (await cc_stream(PATH, build_user_index, OVERRIDES))["data"]
+
+
+def early_stop(email: str):
+    async def run():
+        from lib.api import cc_stream
+        from lib.stream import user_finder
+
+        return (await cc_stream(PATH, user_finder(email), OVERRIDES))["data"]
+
+    return run
+
+
+async def measure(label: str, fn) -> None:
+    from lib.api import close_client, init_client
+
+    await init_client()
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = await fn()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await close_client()
+    print(f"{label:<22} peak={peak / 2**20:8.1f} MiB  retained={current / 2**20:7.1f} MiB  {elapsed:6.2f}s  indexed={len(index)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--format", choices=("json", "ndjson", "csv"), default="json")
+    a = parser.parse_args()
+    port = free_port()
+    mock = subprocess.Popen(
+        [sys.executable, str(HERE / "mock_cc.py"), "--port", str(port), "--users", str(a.users), "--export-format", a.format],
+    )
+    try:
+        url = f"http://127.0.0.1:{port}"
+        for _ in range(100):
+            try:
+                httpx.get(url + "/docs", timeout=1)
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        os.environ["CONTACT_CENTER_BASE_URL"] = url
+        print(f"users={a.users} format={a.format}")
+        if a.format == "json":
+            asyncio.run(measure("buffered cc_rest", buffered))
+        asyncio.run(measure("streamed index", streamed))
+        asyncio.run(measure("streamed early stop", early_stop(f"agent{a.users // 2}@example.com")))
+    finally:
+        mock.terminate()
+        mock.wait()
+
+
+if __name__ == "__main__":
+    main()
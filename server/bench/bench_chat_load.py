@@ -0,0 +1,119 @@
+"""
+Concurrent /api/chat load against mock LLM + mock Contact Center APIs: the async pipeline (this server)
+vs the previous design (synchronous chat loop pushed to the default thread pool with asyncio.to_thread).
+Each chat is two LLM rounds (tool_use, then text) plus one tool call.
+Run from server/: python bench/bench_chat_load.py --chats 200 --llm-latency-ms 300
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI, Request
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+import mock_llm  # noqa: E402
+from mock_cc import MockServer, create_app, free_port  # noqa: E402
+
+
+def threaded_chat_app(mcp_url: str) -> FastAPI:
+    """The previous /api/chat: sync Anthropic client + sync MCP HTTP calls, run via asyncio.to_thread."""
+    import anthropic
+
+    def sync_chat(prompt: str) -> dict:
+        client = anthropic.Anthropic(api_key=os.environ["CLAUDE_API_KEY"])
+        with httpx.Client(timeout=30.0) as http:
+            tools = http.post(mcp_url, json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"}).json()["result"]["tools"]
+        tools = [{"name": t["name"], "description": t["description"], "input_schema": t["inputSchema"]} for t in tools]
+        messages = [{"role": "user", "content": prompt}]
+        for _ in range(5):
+            resp = client.messages.create(model="mock", max_tokens=2048, messages=messages, tools=tools)
+            uses = [b for b in resp.content if b.type == "tool_use"]
+            if not uses:
+                return {"reply": resp.content[0].text}
+            messages.append({"role": "assistant", "content": resp.content})
+            results = []
+            for tu in uses:
+                with httpx.Client(timeout=30.0) as http:
+                    args = {**tu.input, "__accessToken": "x", "__orgId": "org-1"}
+                    body = {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": tu.name, "arguments": args}}
+                    text = http.post(mcp_url, json=body).json()["result"]["content"][0]["text"]
+                results.append({"type": "tool_result", "tool_use_id": tu.id, "content": text})
+            messages.append({"role": "user", "content": results})
+        return {"reply": "max rounds"}
+
+    app = FastAPI()
+
+    @app.post("/api/chat")
+    async def chat(request: Request):
+        data = await request.json()
+        return await asyncio.to_thread(sync_chat, data["prompt"])
+
+    return app
+
+
+async def drive(url: str, chats: int, concurrency: int) -> tuple[float, list[float], int]:
+    sem = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=300.0, limits=limits) as client:
+
+        async def one(i: int):
+            nonlocal errors
+            async with sem:
+                start = time.perf_counter()
+                body = {"prompt": f"Can agent{i % 100}@example.com dial out?", "accessToken": "x", "orgId": "org-1"}
+                resp = await client.post(url, json=body)
+                latencies.append(time.perf_counter() - start)
+                if resp.status_code != 200 or "reply" not in resp.json():
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(chats)))
+        return time.perf_counter() - start, latencies, errors
+
+
+def report(label: str, chats: int, result: tuple[float, list[float], int]) -> None:
+    elapsed, latencies, errors = result
+    q = statistics.quantiles(latencies, n=100)
+    print(f"{label:<26} {chats / elapsed:7.1f} chats/s  p50={q[49]:6.2f}s  p95={q[94]:6.2f}s  errors={errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chats", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=200, help="simultaneous client connections")
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0)
+    a = parser.parse_args()
+    os.environ["CLAUDE_API_KEY"] = "mock-key"
+    os.environ.setdefault("CHAT_MAX_CONCURRENCY", str(a.concurrency))
+    with MockServer(create_app(users=1000)) as cc, MockServer(mock_llm.create_app(a.llm_latency_ms)) as llm:
+        os.environ["CONTACT_CENTER_BASE_URL"] = cc.url
+        os.environ["ANTHROPIC_BASE_URL"] = llm.url
+        port = free_port()
+        os.environ["PORT"] = str(port)
+        import main as server
+
+        with MockServer(server.app, port=port) as srv:
+            mcp_url = f"http://localhost:{port}/mcp"
+            print(f"chats={a.chats} concurrency={a.concurrency} llm_latency={a.llm_latency_ms}ms cpu={os.cpu_count()}")
+            with MockServer(threaded_chat_app(mcp_url)) as old:
+                report("before (to_thread, sync)", a.chats, asyncio.run(drive(old.url + "/api/chat", a.chats, a.concurrency)))
+            report("after (async pipeline)", a.chats, asyncio.run(drive(srv.url + "/api/chat", a.chats, a.concurrency)))
+            scrape = httpx.get(srv.url + "/metrics").text.splitlines()
+            for line in scrape:
+                if line.startswith(("chat_llm_rounds_total", "chat_llm_tokens_total", "mcp_tool_calls_total", "cc_upstream_responses_total")):
+                    print("  " + line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+MCP overhead per chat turn (initialize + tools/list + N tools/call, no LLM) for the HTTP loopback
+transport vs in-process dispatch, against this server running on a local port with the mock Contact Center API.
+Run from server/: python bench/bench_chat_transport.py --turns 50 --tool-calls 2
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from mock_cc import MockServer, create_app, free_port  # noqa: E402
+
+AUTH = {"accessToken": "x", "orgId": "org-1"}
+
+
+async def _turns(mcp_url: str, turns: int, tool_calls: int) -> list[float]:
+    from lib.mcp_client import call_mcp_tool, get_mcp_tools
+
+    samples = []
+    for i in range(turns):
+        start = time.perf_counter()
+        await get_mcp_tools(mcp_url)
+        for j in range(tool_calls):
+            res = await call_mcp_tool(mcp_url, "cc_check_agent_outbound", {"userEmail": f"agent{(i + j) % 100}@example.com"}, AUTH)
+            assert not res.get("isError"), res
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def run_turns(server_loop, mcp_url: str, turns: int, tool_calls: int) -> list[float]:
+    # Run on the server's event loop, as /api/chat does (the in-process transport awaits the handler directly)
+    return asyncio.run_coroutine_threadsafe(_turns(mcp_url, turns, tool_calls), server_loop).result()
+
+
+def report(label: str, samples: list[float]) -> None:
+    q = statistics.quantiles(samples, n=100)
+    print(f"{label:<18} mean={statistics.mean(samples):7.2f} ms  p50={q[49]:7.2f} ms  p95={q[94]:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--tool-calls", type=int, default=2, help="tools/call requests per chat turn")
+    a = parser.parse_args()
+    with MockServer(create_app(users=1000)) as mock:
+        os.environ["CONTACT_CENTER_BASE_URL"] = mock.url
+        port = free_port()
+        os.environ["PORT"] = str(port)
+        import main as server
+
+        with MockServer(server.app, port=port) as srv:
+            mcp_url = f"http://localhost:{port}/mcp"
+            run_turns(srv.loop, mcp_url, 2, 1)  # warm the dataset cache
+            print(f"turns={a.turns} tool_calls_per_turn={a.tool_calls}")
+            os.environ["MCP_LOCAL_DISPATCH"] = "0"
+            report("HTTP loopback", run_turns(srv.loop, mcp_url, a.turns, a.tool_calls))
+            os.environ["MCP_LOCAL_DISPATCH"] = "1"
+            report("in-process", run_turns(srv.loop, mcp_url, a.turns, a.tool_calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Bulk task termination: cc_end_task called once per task (what a chat loop does) vs one cc_end_tasks call,
+against the mock Contact Center API with simulated upstream latency. 2% of the IDs are unknown (404) and
+5% are repeated, to exercise the per-task status and deduplication.
+Run from server/: python bench/bench_end_tasks.py --tasks 1000 --latency-ms 50 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from mock_cc import MockServer, create_app  # noqa: E402
+
+AUTH = {"__accessToken": "x", "__orgId": "org-1"}
+
+
+def task_ids(n: int) -> list[str]:
+    ids = [f"missing-{i}" if i % 50 == 0 else f"task-{i}" for i in range(n)]
+    return ids + ids[: n // 20]
+
+
+async def one_by_one(ids: list[str]) -> float:
+    from main import handle_tool_call
+    from lib.api import close_client
+
+    start = time.perf_counter()
+    for task_id in ids:
+        await handle_tool_call("cc_end_task", {"taskID": task_id, **AUTH})
+    elapsed = time.perf_counter() - start
+    await close_client()
+    return elapsed
+
+
+async def bulk(ids: list[str]) -> tuple[float, dict]:
+    from main import handle_tool_call
+    from lib.api import close_client
+
+    start = time.perf_counter()
+    res = await handle_tool_call("cc_end_tasks", {"taskIDs": ids, **AUTH})
+    elapsed = time.perf_counter() - start
+    await close_client()
+    return elapsed, json.loads(res["content"][0]["text"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, default=10, help="CC_END_TASKS_CONCURRENCY (and CC_ORG_MAX_CONCURRENCY)")
+    parser.add_argument("--sample", type=int, default=100, help="tasks ended one by one; the total is extrapolated")
+    a = parser.parse_args()
+    with MockServer(create_app(users=10, latency_ms=a.latency_ms)) as mock:
+        os.environ["CONTACT_CENTER_BASE_URL"] = mock.url
+        os.environ["CC_END_TASKS_CONCURRENCY"] = str(a.concurrency)
+        os.environ["CC_ORG_MAX_CONCURRENCY"] = str(a.concurrency)
+        ids = task_ids(a.tasks)
+        print(f"tasks={a.tasks} (+{len(ids) - a.tasks} duplicates) latency={a.latency_ms:g}ms concurrency={a.concurrency}")
+        sample = ids[: a.sample]
+        elapsed = asyncio.run(one_by_one(sample))
+        print(f"{'cc_end_task x N':<18} {elapsed:6.2f}s for {len(sample)}  (~{elapsed / len(sample) * a.tasks:.1f}s for {a.tasks})")
+        elapsed, result = asyncio.run(bulk(ids))
+        print(f"{'cc_end_tasks':<18} {elapsed:6.2f}s for {result['total']}  summary={result['summary']} duplicates={result['duplicates']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Throughput: old per-call httpx.Client vs pooled httpx.AsyncClient (lib.api.cc_rest) against the local mock API.
+Run from server/: python bench/bench_http_client.py --requests 500 --concurrency 20
+The mock is plain HTTP on localhost, so TLS handshake savings against the real API are larger than shown here.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mock_cc import MockServer, create_app  # noqa: E402
+
+PATH = "organization/org-1/v2/agent-profile"
+
+
+def old_cc_rest(base: str) -> bool:
+    """The previous implementation: new client (and connection) per call, blocking."""
+    with httpx.Client(timeout=30.0) as client:
+        resp = client.request("GET", base + "/" + PATH, headers={"Authorization": "Bearer x"})
+    resp.json()
+    return resp.is_success
+
+
+async def run_old(base: str, n: int) -> float:
+    # handle_tool_call awaited nothing before, so calls were serialized on the event loop
+    start = time.perf_counter()
+    for _ in range(n):
+        old_cc_rest(base)
+    return time.perf_counter() - start
+
+
+async def run_new(n: int, concurrency: int) -> float:
+    from lib.api import cc_rest, close_client, init_client
+
+    await init_client()
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with sem:
+            res = await cc_rest("GET", PATH, None, {"token": "x", "orgId": "org-1"})
+            assert res["ok"], res
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(n)))
+    elapsed = time.perf_counter() - start
+    await close_client()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="simulated upstream latency")
+    a = parser.parse_args()
+    with MockServer(create_app(users=10, latency_ms=a.latency_ms)) as mock:
+        os.environ["CONTACT_CENTER_BASE_URL"] = mock.url
+        old = asyncio.run(run_old(mock.url, a.requests))
+        new = asyncio.run(run_new(a.requests, a.concurrency))
+    print(f"requests={a.requests} upstream_latency={a.latency_ms}ms")
+    print(f"old per-call Client : {old:7.3f}s  {a.requests / old:8.1f} req/s")
+    print(f"pooled AsyncClient  : {new:7.3f}s  {a.requests / new:8.1f} req/s  (concurrency={a.concurrency})")
+
+
+if __name__ == "__main__":
+    main()
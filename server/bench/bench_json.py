@@ -0,0 +1,86 @@
+"""
+Encode/decode micro-benchmarks for MCP tool results at realistic sizes (cc_check_agents_outbound tables and
+cc_query_agents pages of N rows, a raw bulk-export of N users). Compares the old path (indent=2 tool text,
+then FastAPI's jsonable_encoder + stdlib JSONResponse for the envelope, stdlib parse on the client) with
+the lib.jsonio path (compact text, one-pass JSONBytesResponse, orjson parse when installed).
+Run from server/: python bench/bench_json.py --rows 1000 10000 50000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from lib import jsonio  # noqa: E402
+from mock_cc import make_users  # noqa: E402
+
+
+def outbound_table(n: int) -> dict:
+    rows = [[f"agent{i}@example.com", "outbound" if i % 2 else "no-outbound", f"Profile {i % 10}"] for i in range(n)]
+    return {"ok": True, "total": n, "summary": {"outbound": n // 2, "no-outbound": n - n // 2}, "columns": ["email", "status", "agentProfileName"], "rows": rows}
+
+
+def bulk_export(n: int) -> dict:
+    return {"ok": True, "data": {"data": make_users(n)}, "status": 200}
+
+
+def best(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def envelope(text: str) -> dict:
+    return {"jsonrpc": "2.0", "id": 1, "result": {"content": [{"type": "text", "text": text}]}}
+
+
+def old_server(result: dict) -> bytes:
+    return JSONResponse(jsonable_encoder(envelope(json.dumps(result, indent=2)))).body
+
+
+def new_server(result: dict) -> bytes:
+    return jsonio.JSONBytesResponse(envelope(jsonio.tool_text(result))).body
+
+
+def old_client(body: bytes):
+    return json.loads(json.loads(body)["result"]["content"][0]["text"])
+
+
+def new_client(body: bytes):
+    return jsonio.loads(jsonio.loads(body)["result"]["content"][0]["text"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    a = parser.parse_args()
+    print(f"orjson: {'yes' if jsonio.orjson is not None else 'no (stdlib fallback)'}")
+    print(f"{'payload':<22} {'old bytes':>10} {'new bytes':>10} {'encode old':>11} {'encode new':>11} {'decode old':>11} {'decode new':>11}")
+    for n in a.rows:
+        for label, result in ((f"outbound table {n}", outbound_table(n)), (f"bulk-export {n}", bulk_export(n))):
+            old_body, new_body = old_server(result), new_server(result)
+            assert old_client(old_body) == new_client(new_body)
+            enc_old = best(lambda: old_server(result), a.repeat)
+            enc_new = best(lambda: new_server(result), a.repeat)
+            dec_old = best(lambda: old_client(old_body), a.repeat)
+            dec_new = best(lambda: new_client(new_body), a.repeat)
+            print(
+                f"{label:<22} {len(old_body):>10} {len(new_body):>10} {enc_old * 1000:>9.1f}ms {enc_new * 1000:>9.1f}ms"
+                f" {dec_old * 1000:>9.1f}ms {dec_new * 1000:>9.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
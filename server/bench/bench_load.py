@@ -0,0 +1,273 @@
+"""
+End-to-end load harness: starts bench/mock_cc.py, bench/mock_llm.py and this server as separate processes
+(so the server's RSS is its own), drives /mcp tools/call and /api/chat scenarios with a fixed number of
+requests at a given concurrency, and reports per scenario throughput, errors, p50/p95/p99/max latency and
+the server's peak RSS. --json saves the results; --baseline compares with a saved run and exits 1 when a
+p95 or p99, the throughput or the peak RSS is more than --tolerance worse.
+--url drives an already running server instead (its RSS only with --pid).
+Run from server/: python bench/bench_load.py --tenant medium --profile wan --requests 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+
+from mock_cc import PROFILES, TENANTS, free_port  # noqa: E402
+
+ORG = "org-1"
+AUTH = {"__accessToken": "x", "__orgId": ORG}
+
+
+def _email(n: int) -> str:
+    return f"agent{random.randrange(n)}@example.com"
+
+
+def _tool(name: str, args: dict) -> dict:
+    return {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": name, "arguments": {**args, **AUTH}}}
+
+
+# scenario -> (path, body for request i given the tenant)
+SCENARIOS = {
+    "check": ("/mcp", lambda i, t: _tool("cc_check_agent_outbound", {"userEmail": _email(t["users"])})),
+    "check-many": ("/mcp", lambda i, t: _tool("cc_check_agents_outbound", {"userEmails": [_email(t["users"]) for _ in range(50)]})),
+    "query": ("/mcp", lambda i, t: _tool("cc_query_agents", {"status": ["no-outbound"], "groupBy": "profile", "limit": 50})),
+    "address-books": ("/mcp", lambda i, t: _tool("cc_list_address_books", {"page": i % max(1, t["address_books"] // 25)})),
+    "end-tasks": ("/mcp", lambda i, t: _tool("cc_end_tasks", {"taskIDs": [f"task-{i}-{k}" for k in range(20)] + [f"missing-{i}"]})),
+    "chat": ("/api/chat", lambda i, t: {"prompt": f"Can {_email(t['users'])} dial out?", "accessToken": "x", "orgId": ORG}),
+    "chat-stream": ("/api/chat/stream", lambda i, t: {"prompt": f"Can {_email(t['users'])} dial out?", "accessToken": "x", "orgId": ORG}),
+}
+
+
+def _failed(path: str, status: int, body: bytes) -> bool:
+    if status != 200:
+        return True
+    if path == "/mcp":
+        data = json.loads(body)
+        return "error" in data or bool(data.get("result", {}).get("isError"))
+    if path == "/api/chat/stream":
+        return b"event: done" not in body
+    return "reply" not in json.loads(body)
+
+
+def rss_kb(pid: int) -> int | None:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        return int(subprocess.check_output(["ps", "-o", "rss=", "-p", str(pid)], text=True).strip())
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
+
+
+class RssSampler:
+    """Peak RSS of a process while the context is open (sampled every interval seconds)."""
+
+    def __init__(self, pid: int | None, interval: float = 0.05):
+        self.pid = pid
+        self.interval = interval
+        self.peak: int | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while True:
+            kb = rss_kb(self.pid)
+            if kb is not None:
+                self.peak = max(self.peak or 0, kb)
+            if self._stop.wait(self.interval):
+                return
+
+    def __enter__(self):
+        if self.pid:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self.pid:
+            self._thread.join()
+
+
+async def drive(url: str, scenario: str, tenant: dict, requests: int, concurrency: int, warmup: int) -> dict:
+    path, body = SCENARIOS[scenario]
+    sem = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, timeout=300.0, limits=limits) as client:
+
+        async def one(i: int, record: bool):
+            nonlocal errors
+            async with sem:
+                start = time.perf_counter()
+                try:
+                    resp = await client.post(path, json=body(i, tenant))
+                    failed = _failed(path, resp.status_code, resp.content)
+                except (httpx.HTTPError, ValueError):
+                    failed = True
+                if record:
+                    latencies.append(time.perf_counter() - start)
+                    errors += failed
+
+        await asyncio.gather(*(one(i, False) for i in range(warmup)))
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i, True) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+    q = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50Ms": round(q[49] * 1000, 1),
+        "p95Ms": round(q[94] * 1000, 1),
+        "p99Ms": round(q[98] * 1000, 1),
+        "maxMs": round(max(latencies) * 1000, 1),
+    }
+
+
+def spawn(args: list[str], env: dict | None = None, quiet: bool = False) -> subprocess.Popen:
+    out = subprocess.DEVNULL if quiet else None  # the mocks log every request
+    return subprocess.Popen([sys.executable, *args], cwd=HERE.parent, env={**os.environ, **(env or {})}, stdout=out, stderr=out)
+
+
+def wait_ready(url: str, proc: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"{proc.args[1]} exited with {proc.returncode}")
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise SystemExit(f"{url} did not come up within {timeout:.0f}s")
+
+
+def start_stack(a, procs: list[subprocess.Popen]) -> tuple[str, int]:
+    """mock_cc, mock_llm and the server on free ports (appended to procs); returns (server url, server pid)."""
+    cc_port, llm_port, port = free_port(), free_port(), free_port()
+    procs.append(spawn(["bench/mock_cc.py", "--port", str(cc_port), "--tenant", a.tenant, "--profile", a.profile], quiet=True))
+    procs.append(spawn(["bench/mock_llm.py", "--port", str(llm_port), "--latency-ms", str(a.llm_latency_ms), "--error-rate", str(a.llm_error_rate)], quiet=True))
+    wait_ready(f"http://127.0.0.1:{cc_port}/docs", procs[0])
+    wait_ready(f"http://127.0.0.1:{llm_port}/docs", procs[1])
+    llm_url = f"http://127.0.0.1:{llm_port}"
+    claude = a.llm == "claude"
+    env = {
+        "PORT": str(port),
+        "CONTACT_CENTER_BASE_URL": f"http://127.0.0.1:{cc_port}",
+        "ANTHROPIC_BASE_URL": llm_url,
+        "OPENAI_BASE_URL": llm_url + "/v1",
+        # Empty values also keep server/.env from choosing the provider
+        "CLAUDE_API_KEY": "mock-key" if claude else "",
+        "ANTHROPIC_API_KEY": "",
+        "OPENAI_API_KEY": "" if claude else "mock-key",
+    }
+    server = ["-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+    procs.append(spawn(server, env))
+    url = f"http://127.0.0.1:{port}"
+    wait_ready(url + "/health", procs[2])
+    return url, procs[2].pid
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Regressions of results against baseline, as printable lines."""
+    worse = []
+    for name, res in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for key in ("p95Ms", "p99Ms"):
+            if base[key] and res[key] > base[key] * (1 + tolerance):
+                worse.append(f"{name}: {key} {base[key]} -> {res[key]}")
+        if base["rps"] and res["rps"] < base["rps"] * (1 - tolerance):
+            worse.append(f"{name}: rps {base['rps']} -> {res['rps']}")
+        if base.get("peakRssMb") and res.get("peakRssMb") and res["peakRssMb"] > base["peakRssMb"] * (1 + tolerance):
+            worse.append(f"{name}: peakRssMb {base['peakRssMb']} -> {res['peakRssMb']}")
+    return worse
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=300, help="measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per scenario first")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--tenant", choices=TENANTS, default="medium")
+    parser.add_argument("--profile", choices=PROFILES, default="local", help="Contact Center latency / error / throttle profile")
+    parser.add_argument("--llm", choices=("claude", "openai"), default="claude")
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--url", help="drive this running server instead of starting one")
+    parser.add_argument("--pid", type=int, help="server process id for RSS with --url")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", type=Path, help="write results here")
+    parser.add_argument("--baseline", type=Path, help="results file of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative regression (default 0.15)")
+    a = parser.parse_args()
+    random.seed(a.seed)
+    tenant = TENANTS[a.tenant]
+
+    procs: list[subprocess.Popen] = []
+    try:
+        if a.url:
+            url, pid = a.url.rstrip("/"), a.pid
+        else:
+            url, pid = start_stack(a, procs)
+        start_rss = rss_kb(pid) if pid else None
+        results = {
+            "config": {k: getattr(a, k) for k in ("tenant", "profile", "llm", "llm_latency_ms", "llm_error_rate", "requests", "concurrency")},
+            "startRssMb": round(start_rss / 1024, 1) if start_rss else None,
+            "scenarios": {},
+        }
+        print(f"tenant={a.tenant} profile={a.profile} llm={a.llm} requests={a.requests} concurrency={a.concurrency} cpu={os.cpu_count()}")
+        print(f"{'scenario':<14} {'req/s':>8} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'peak RSS':>9}")
+        for name in a.scenarios:
+            with RssSampler(pid) as rss:
+                res = asyncio.run(drive(url, name, tenant, a.requests, a.concurrency, a.warmup))
+            res["peakRssMb"] = round(rss.peak / 1024, 1) if rss.peak else None
+            results["scenarios"][name] = res
+            peak = f"{res['peakRssMb']:.1f} MB" if res["peakRssMb"] else "-"
+            print(f"{name:<14} {res['rps']:>8.1f} {res['errors']:>7} {res['p50Ms']:>8.1f} {res['p95Ms']:>8.1f} {res['p99Ms']:>8.1f} {res['maxMs']:>8.1f} {peak:>9}")
+        end_rss = rss_kb(pid) if pid else None
+        results["endRssMb"] = round(end_rss / 1024, 1) if end_rss else None
+        if results["startRssMb"]:
+            print(f"server RSS: start {results['startRssMb']} MB, end {results['endRssMb']} MB")
+    finally:
+        for proc in procs:
+            proc.terminate()
+        for proc in procs:
+            proc.wait(timeout=10)
+
+    if a.json:
+        a.json.write_text(json.dumps(results, indent=2) + "\n")
+    if a.baseline:
+        baseline = json.loads(a.baseline.read_text())
+        if baseline.get("config") != results["config"]:
+            print(f"note: baseline was run with {baseline.get('config')}")
+        worse = compare(results, baseline, a.tolerance)
+        for line in worse:
+            print("REGRESSION " + line)
+        if worse:
+            sys.exit(1)
+        print(f"no regressions over {a.tolerance:.0%} against {a.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+POST /mcp throughput: N single tools/call requests (one HTTP round-trip each) vs JSON-RPC batches of 50.
+Runs this server on a local port against the mock Contact Center API (cc_end_task, simulated upstream latency).
+Run from server/: python bench/bench_mcp_batch.py --calls 500 --batch-size 50 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from mock_cc import MockServer, create_app  # noqa: E402
+
+
+def call(i: int) -> dict:
+    args = {"taskID": f"task-{i}", "__accessToken": "x", "__orgId": "org-1"}
+    return {"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"name": "cc_end_task", "arguments": args}}
+
+
+async def singles(url: str, n: int) -> float:
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        start = time.perf_counter()
+        for i in range(n):
+            resp = await client.post(url, json=call(i))
+            assert resp.json()["id"] == i
+        return time.perf_counter() - start
+
+
+async def batches(url: str, n: int, size: int) -> float:
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        start = time.perf_counter()
+        for first in range(0, n, size):
+            ids = list(range(first, min(first + size, n)))
+            resp = await client.post(url, json=[call(i) for i in ids])
+            assert [r["id"] for r in resp.json()] == ids
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="simulated upstream latency")
+    a = parser.parse_args()
+    with MockServer(create_app(users=10, latency_ms=a.latency_ms)) as cc:
+        os.environ["CONTACT_CENTER_BASE_URL"] = cc.url
+        import main as server
+
+        with MockServer(server.app) as srv:
+            url = srv.url + "/mcp"
+            print(f"calls={a.calls} upstream_latency={a.latency_ms}ms")
+            single = asyncio.run(singles(url, a.calls))
+            print(f"single requests   : {single:7.3f}s  {a.calls / single:8.1f} calls/s")
+            batched = asyncio.run(batches(url, a.calls, a.batch_size))
+            print(f"batches of {a.batch_size:<6} : {batched:7.3f}s  {a.calls / batched:8.1f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
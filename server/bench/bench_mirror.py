@@ -0,0 +1,93 @@
+"""
+Cold vs warm start of the outbound check: first cc_check_agent_outbound of a fresh worker with an empty
+SQLite mirror (downloads the bulk-export and agent profiles) vs a fresh worker whose mirror was synced by
+an earlier one (in-process cache dropped and mirror connections reopened, as after a restart), plus the
+background sync time and an incremental re-sync after a few users changed.
+Run from server/: python bench/bench_mirror.py --users 100000 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from mock_cc import MockServer, create_app  # noqa: E402
+
+AUTH = {"__accessToken": "x", "__orgId": "org-1"}
+
+
+async def check(email: str) -> float:
+    from main import handle_tool_call
+
+    start = time.perf_counter()
+    res = await handle_tool_call("cc_check_agent_outbound", {"userEmail": email, **AUTH})
+    elapsed = time.perf_counter() - start
+    assert json.loads(res["content"][0]["text"])["ok"], res
+    return elapsed
+
+
+async def restart() -> None:
+    """Drop this worker's state as a new process would start without it."""
+    from lib.api import close_client
+    from lib.cache import org_datasets
+    from lib.mirror import mirror
+
+    org_datasets.invalidate()
+    await mirror.close()
+    await close_client()
+
+
+async def run(users: int, lookups: int, app) -> None:
+    from lib.mirror import mirror
+
+    first = await check("agent1@example.com")
+    start = time.perf_counter()
+    await mirror.drain()
+    print(f"{'cold start':<14} first lookup {first * 1000:8.1f}ms  (mirror sync {(time.perf_counter() - start) * 1000:.0f}ms in background)")
+    await restart()
+
+    first = await check("agent2@example.com")
+    rest = [await check(f"agent{i * 7919 % users}@example.com") for i in range(lookups)]
+    print(f"{'warm start':<14} first lookup {first * 1000:8.1f}ms  next p50 {statistics.median(rest) * 1000:.2f}ms  upstream requests={app.state.mock['requests']}")
+
+    # A tenant change: a few users move profile; the next full download only rewrites those rows
+    for u in app.state.mock["users"][:10]:
+        u["agentProfileName"] = "Profile 1"
+    app.state.mock["version"] += 1
+    await restart()
+    mirror.max_age = 0.001  # treat the mirror as stale so the worker downloads again
+    await asyncio.sleep(0.01)
+    before = dict(mirror.counters)
+    await check("agent3@example.com")
+    start = time.perf_counter()
+    await mirror.drain()
+    upserted = mirror.counters["upserted"] - before["upserted"]
+    print(f"{'re-sync':<14} {(time.perf_counter() - start) * 1000:8.1f}ms  upserted={upserted} deleted={mirror.counters['deleted'] - before['deleted']}")
+    await restart()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--lookups", type=int, default=200)
+    a = parser.parse_args()
+    app = create_app(users=a.users, latency_ms=a.latency_ms)
+    with tempfile.TemporaryDirectory() as tmp, MockServer(app) as mock:
+        os.environ["CONTACT_CENTER_BASE_URL"] = mock.url
+        os.environ["CC_MIRROR_PATH"] = os.path.join(tmp, "mirror.db")
+        print(f"users={a.users} latency={a.latency_ms:g}ms")
+        asyncio.run(run(a.users, a.lookups, app))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+cc_query_agents latency over a large directory: the first query builds the columnar view from the cached
+bulk-export and agent profiles; later queries (filters, group-by, pages) only read the view.
+Run from server/: python bench/bench_query_agents.py --users 50000 --repeat 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from mock_cc import MockServer, create_app  # noqa: E402
+
+AUTH = {"__accessToken": "x", "__orgId": "org-1"}
+QUERIES = {
+    "count outdial": {"outdialEnabled": True, "limit": 0},
+    "group by profile": {"groupBy": "profile"},
+    "profile + no outdial": {"profile": "Profile 3", "outdialEnabled": False},
+    "domain page 10": {"domain": "example.com", "offset": 250, "limit": 25},
+}
+
+
+async def run(repeat: int) -> None:
+    from main import handle_tool_call
+    from lib.api import close_client
+
+    async def query(args: dict) -> tuple[float, dict]:
+        start = time.perf_counter()
+        res = await handle_tool_call("cc_query_agents", {**args, **AUTH})
+        return time.perf_counter() - start, json.loads(res["content"][0]["text"])
+
+    elapsed, res = await query({"limit": 0})
+    print(f"{'first (download+build)':<24} {elapsed * 1000:8.1f}ms  total={res['total']}")
+    for label, args in QUERIES.items():
+        samples = []
+        for _ in range(repeat):
+            elapsed, res = await query(args)
+            samples.append(elapsed)
+        print(f"{label:<24} p50={statistics.median(samples) * 1000:6.2f}ms  max={max(samples) * 1000:6.2f}ms  matched={res['matched']}  bytes={len(json.dumps(res))}")
+    await close_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--profiles", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=50)
+    a = parser.parse_args()
+    with MockServer(create_app(users=a.users, profiles=a.profiles)) as mock:
+        os.environ["CONTACT_CENTER_BASE_URL"] = mock.url
+        os.environ["CC_MIRROR_PATH"] = ""
+        print(f"users={a.users} profiles={a.profiles}")
+        asyncio.run(run(a.repeat))
+
+
+if __name__ == "__main__":
+    main()
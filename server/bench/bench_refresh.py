@@ -0,0 +1,75 @@
+"""
+Lookup latency of a busy org across cache expiries: a client checks an agent every --every-ms for --seconds
+while the dataset cache expires every --ttl seconds and each Contact Center request takes --latency-ms.
+1) Blocking expiry (no stale serving, no background refresh), 2) stale-while-revalidate only,
+3) stale-while-revalidate plus the hot-key refresh scheduler refreshing ahead of expiry.
+Run from server/: python bench/bench_refresh.py --seconds 10 --ttl 2 --latency-ms 500
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from mock_cc import MockServer, create_app  # noqa: E402
+
+AUTH = {"__accessToken": "x", "__orgId": "org-1"}
+
+
+async def run(label: str, seconds: float, every: float, ttl: float, stale: float, refresh: bool) -> None:
+    from main import handle_tool_call
+    from lib.api import close_client
+    from lib.cache import org_datasets
+    from lib.refresh import refresher
+
+    org_datasets.invalidate()
+    org_datasets.ttl, org_datasets.stale = ttl, stale
+    os.environ["CC_REFRESH_CONCURRENCY"] = "4" if refresh else "0"
+    refresher.start()
+    stale_before = org_datasets.counters["stale"]
+    samples = []
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        await handle_tool_call("cc_check_agent_outbound", {"userEmail": "agent1@example.com", **AUTH})
+        samples.append(time.perf_counter() - start)
+        await asyncio.sleep(every)
+    stats = refresher.stats()
+    await refresher.stop()
+    await close_client()
+    first, samples = samples[0], samples[1:]  # the first lookup is a cold miss in every mode
+    slow = sum(s > 0.1 for s in samples)
+    q = statistics.quantiles(samples, n=100)
+    extra = f"  served stale={org_datasets.counters['stale'] - stale_before}"
+    extra += f"  refreshed={stats['refreshed']} late={stats['late']}" if refresh else ""
+    print(f"{label:<22} cold={first * 1000:6.1f}ms  p50={q[49] * 1000:6.1f}ms  p99={q[98] * 1000:7.1f}ms  max={max(samples) * 1000:7.1f}ms  slow(>100ms)={slow}/{len(samples)}{extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--every-ms", type=float, default=50.0)
+    parser.add_argument("--ttl", type=float, default=2.0)
+    parser.add_argument("--latency-ms", type=float, default=500.0)
+    parser.add_argument("--users", type=int, default=20000)
+    a = parser.parse_args()
+    with MockServer(create_app(users=a.users, latency_ms=a.latency_ms)) as mock:
+        os.environ["CONTACT_CENTER_BASE_URL"] = mock.url
+        os.environ["CC_MIRROR_PATH"] = ""
+        os.environ.update({"CC_REFRESH_INTERVAL": str(a.ttl / 10), "CC_REFRESH_AHEAD": str(a.ttl / 2), "CC_REFRESH_JITTER": str(a.ttl / 10)})
+        print(f"users={a.users} latency={a.latency_ms:g}ms ttl={a.ttl:g}s lookup every {a.every_ms:g}ms for {a.seconds:g}s")
+        every = a.every_ms / 1000
+        asyncio.run(run("blocking expiry", a.seconds, every, a.ttl, 0.0, False))
+        asyncio.run(run("stale-while-revalidate", a.seconds, every, a.ttl, a.ttl * 10, False))
+        asyncio.run(run("swr + refresh ahead", a.seconds, every, a.ttl, a.ttl * 10, True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Tail latency and outage behaviour of cc_rest against the mock Contact Center API.
+1) Hedging: agent-profile GETs with a slow tail (tail_rate of requests take tail_ms longer), without vs with
+   hedged requests (CC_HEDGE_PERCENTILE).
+2) Outage: every request hangs outage_ms and then answers 503; time for a burst of tool-sized calls without
+   vs with the circuit breaker (CC_BREAKER_FAILURES).
+Run from server/: python bench/bench_resilience.py --calls 400 --tail-rate 0.05 --tail-ms 500
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from mock_cc import MockServer, create_app  # noqa: E402
+
+PATH = "organization/org-1/v2/agent-profile"
+OVERRIDES = {"token": "x", "orgId": "org-1"}
+
+
+def with_env(env: dict):
+    for k, v in env.items():
+        os.environ[k] = v
+
+
+async def latencies(calls: int, concurrency: int) -> list[float]:
+    from lib.api import cc_rest, close_client, init_client
+    from lib.breaker import breakers
+
+    breakers.latencies.clear()
+    await init_client()
+    sem = asyncio.Semaphore(concurrency)
+    out: list[float] = []
+
+    async def one():
+        async with sem:
+            start = time.perf_counter()
+            res = await cc_rest("GET", PATH, None, OVERRIDES)
+            out.append(time.perf_counter() - start)
+            assert res["ok"], res
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    await close_client()
+    return out
+
+
+async def outage_burst(calls: int, concurrency: int) -> tuple[float, int]:
+    from lib.api import cc_rest, close_client, init_client
+    from lib.breaker import breakers
+
+    breakers.breakers.clear()
+    await init_client()
+    sem = asyncio.Semaphore(concurrency)
+    fast = 0
+
+    async def one():
+        nonlocal fast
+        async with sem:
+            res = await cc_rest("GET", PATH, None, OVERRIDES)
+            fast += bool(res.get("circuitOpen"))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    elapsed = time.perf_counter() - start
+    await close_client()
+    return elapsed, fast
+
+
+def report(label: str, samples: list[float]) -> None:
+    q = statistics.quantiles(samples, n=100)
+    print(f"{label:<18} p50={q[49] * 1000:7.1f}ms  p95={q[94] * 1000:7.1f}ms  p99={q[98] * 1000:7.1f}ms  max={max(samples) * 1000:7.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--tail-rate", type=float, default=0.05)
+    parser.add_argument("--tail-ms", type=float, default=500.0)
+    parser.add_argument("--outage-ms", type=float, default=1000.0)
+    parser.add_argument("--outage-calls", type=int, default=40)
+    a = parser.parse_args()
+    app = create_app(users=10, latency_ms=a.latency_ms, tail_rate=a.tail_rate, tail_ms=a.tail_ms)
+    with MockServer(app) as mock:
+        os.environ["CONTACT_CENTER_BASE_URL"] = mock.url
+        print(f"calls={a.calls} latency={a.latency_ms:g}ms tail={a.tail_rate:.0%} x +{a.tail_ms:g}ms")
+        with_env({"CC_HEDGE_PERCENTILE": "0"})
+        report("no hedging", asyncio.run(latencies(a.calls, a.concurrency)))
+        with_env({"CC_HEDGE_PERCENTILE": "90"})
+        report("hedged after p90", asyncio.run(latencies(a.calls, a.concurrency)))
+
+        app.state.mock["outage_ms"] = a.outage_ms
+        print(f"\noutage: every request hangs {a.outage_ms:g}ms then 503; {a.outage_calls} calls, no retries")
+        with_env({"CC_RETRY_MAX": "0", "CC_BREAKER_FAILURES": "0"})
+        elapsed, _ = asyncio.run(outage_burst(a.outage_calls, a.concurrency))
+        print(f"{'no breaker':<18} {elapsed:6.2f}s")
+        with_env({"CC_BREAKER_FAILURES": "5"})
+        elapsed, fast = asyncio.run(outage_burst(a.outage_calls, a.concurrency))
+        print(f"{'breaker (5)':<18} {elapsed:6.2f}s  failed fast={fast}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Bursty cc_rest load against a throttling mock (per-org token bucket, 429 + Retry-After): without the upstream
+scheduler (no client-side rate limit, no retries) vs with it (defaults or the CC_RATE_LIMIT_* / CC_RETRY_* env).
+Checks that with the scheduler every request succeeds and reports how many 429s the mock had to send.
+Run from server/: python bench/bench_throttle.py --requests 200 --throttle-rps 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+from mock_cc import MockServer, create_app  # noqa: E402
+
+PATH = "organization/org-1/v2/agent-profile"
+
+
+async def burst(n: int, orgs: int) -> tuple[float, int, int]:
+    from lib.api import cc_rest, close_client, init_client
+
+    await init_client()
+
+    async def one(i: int) -> bool:
+        org = f"org-{i % orgs}"
+        res = await cc_rest("GET", f"organization/{org}/v2/agent-profile", None, {"token": "x", "orgId": org})
+        return res["ok"]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(i) for i in range(n)))
+    elapsed = time.perf_counter() - start
+    await close_client()
+    ok = sum(results)
+    return elapsed, ok, n - ok
+
+
+def run(label: str, mock, n: int, orgs: int, env: dict) -> None:
+    saved = {k: os.environ.get(k) for k in env}
+    os.environ.update(env)
+    before = mock.state["throttled"]
+    try:
+        elapsed, ok, failed = asyncio.run(burst(n, orgs))
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+    print(f"{label:<22} ok={ok:4d} failed={failed:4d}  429s sent={mock.state['throttled'] - before:4d}  {elapsed:6.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--orgs", type=int, default=2)
+    parser.add_argument("--throttle-rps", type=float, default=20.0)
+    parser.add_argument("--throttle-burst", type=int, default=10)
+    a = parser.parse_args()
+    app = create_app(users=10, throttle_rps=a.throttle_rps, throttle_burst=a.throttle_burst)
+    with MockServer(app) as mock:
+        mock.state = app.state.mock
+        os.environ["CONTACT_CENTER_BASE_URL"] = mock.url
+        print(f"requests={a.requests} orgs={a.orgs} mock limit={a.throttle_rps:g} rps/org (burst {a.throttle_burst})")
+        run("no scheduler", mock, a.requests, a.orgs, {"CC_RATE_LIMIT_RPS": "0", "CC_ORG_MAX_CONCURRENCY": "0", "CC_RETRY_MAX": "0"})
+        time.sleep(a.throttle_burst / a.throttle_rps)  # let the mock's buckets refill
+        run("retries only", mock, a.requests, a.orgs, {"CC_RATE_LIMIT_RPS": "0", "CC_RETRY_MAX": "10"})
+        time.sleep(a.throttle_burst / a.throttle_rps)
+        # Client-side limit a little under the server's, so arrival jitter does not trip it
+        rate = {"CC_RATE_LIMIT_RPS": str(a.throttle_rps * 0.9), "CC_RATE_LIMIT_BURST": str(max(1, a.throttle_burst - 1))}
+        run("bucket + retries", mock, a.requests, a.orgs, rate)
+
+
+if __name__ == "__main__":
+    main()
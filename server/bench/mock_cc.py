@@ -0,0 +1,264 @@
+"""
+Local mock of the Webex Contact Center REST paths used by the MCP tools.
+Used by the benchmarks in this folder; point CONTACT_CENTER_BASE_URL at it.
+With throttle_rps > 0 each org gets a token bucket and excess requests get 429 + Retry-After.
+tail_rate / tail_ms add a slow tail (that fraction of requests takes tail_ms longer), jitter_ms a random
+0..jitter_ms on top of latency_ms, and error_rate answers that fraction of requests with 503; setting
+app.state.mock["outage_ms"] makes every request hang that long and then answer 503, and statuses appended to
+app.state.mock["script"] (an int, (status, headers) or a Response) answer the next requests in order.
+TENANTS (tenant size) and PROFILES (latency / errors / throttling) are named presets of these options.
+Run standalone: python bench/mock_cc.py --port 3901 --tenant medium --profile wan
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import random
+import socket
+import threading
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+
+# Tenant sizes: users, agent profiles, address books and entries per address book
+TENANTS = {
+    "small": {"users": 200, "profiles": 5, "address_books": 3, "entries": 20},
+    "medium": {"users": 5000, "profiles": 20, "address_books": 50, "entries": 200},
+    "large": {"users": 100000, "profiles": 50, "address_books": 500, "entries": 1000},
+}
+
+# Network / service behaviour
+PROFILES = {
+    "local": {},
+    "wan": {"latency_ms": 80.0, "jitter_ms": 40.0, "tail_rate": 0.02, "tail_ms": 500.0},
+    "flaky": {"latency_ms": 80.0, "jitter_ms": 40.0, "error_rate": 0.05},
+    "throttled": {"latency_ms": 40.0, "throttle_rps": 20.0, "throttle_burst": 10},
+}
+
+
+def make_users(n: int, profiles: int = 10) -> list[dict]:
+    return [
+        {
+            "id": f"user-{i}",
+            "email": f"agent{i}@example.com",
+            "firstName": f"Agent{i}",
+            "lastName": "Mock",
+            "agentProfileName": f"Profile {i % profiles}",
+        }
+        for i in range(n)
+    ]
+
+
+def make_profiles(n: int = 10) -> list[dict]:
+    return [{"id": f"profile-{i}", "name": f"Profile {i}", "outdialEnabled": i % 2 == 0} for i in range(n)]
+
+
+def render_export(users: list[dict], fmt: str) -> tuple[bytes, str]:
+    """Bulk-export body in the given format: json ({"data": [...]}), ndjson or csv."""
+    if fmt == "ndjson":
+        return "".join(json.dumps(u) + "\n" for u in users).encode(), "application/x-ndjson"
+    if fmt == "csv":
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(["Email", "First Name", "Last Name", "Agent Profile Name"])
+        for u in users:
+            writer.writerow([u["email"], u["firstName"], u["lastName"], u["agentProfileName"]])
+        return out.getvalue().encode(), "text/csv"
+    return json.dumps({"data": users}).encode(), "application/json"
+
+
+def create_app(
+    users: int = 1000,
+    profiles: int = 10,
+    latency_ms: float = 0.0,
+    export_format: str = "json",
+    throttle_rps: float = 0.0,
+    throttle_burst: int = 10,
+    tail_rate: float = 0.0,
+    tail_ms: float = 0.0,
+    address_books: int = 1,
+    entries: int = 5,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+) -> FastAPI:
+    app = FastAPI(title="Mock Webex Contact Center")
+    state = {"users": make_users(users, profiles), "profiles": make_profiles(profiles), "requests": 0, "version": 1, "throttled": 0, "errors": 0, "outage_ms": None, "script": []}
+    app.state.mock = state
+    # org id -> [tokens, last refill]
+    buckets: dict[str, list] = {}
+
+    @app.middleware("http")
+    async def faults(request: Request, call_next):
+        if state["script"]:
+            step = state["script"].pop(0)
+            state["requests"] += 1
+            if isinstance(step, Response):
+                return step
+            status, headers = step if isinstance(step, tuple) else (step, {})
+            return JSONResponse(status_code=status, content={"message": f"Scripted {status}"}, headers=headers)
+        if error_rate and random.random() < error_rate:
+            state["errors"] += 1
+            await _delay()
+            return JSONResponse(status_code=503, content={"message": "Service Unavailable"})
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def outage(request: Request, call_next):
+        if state["outage_ms"] is None:
+            return await call_next(request)
+        await asyncio.sleep(state["outage_ms"] / 1000.0)
+        return JSONResponse(status_code=503, content={"message": "Service Unavailable"})
+
+    @app.middleware("http")
+    async def throttle(request: Request, call_next):
+        if throttle_rps <= 0:
+            return await call_next(request)
+        org = request.headers.get("organization-id") or ""
+        now = time.monotonic()
+        bucket = buckets.setdefault(org, [float(throttle_burst), now])
+        bucket[0] = min(throttle_burst, bucket[0] + (now - bucket[1]) * throttle_rps)
+        bucket[1] = now
+        if bucket[0] < 1:
+            state["throttled"] += 1
+            retry_after = max(1, round((1 - bucket[0]) / throttle_rps))
+            return JSONResponse(status_code=429, content={"message": "Too Many Requests"}, headers={"Retry-After": str(retry_after)})
+        bucket[0] -= 1
+        return await call_next(request)
+
+    async def _delay():
+        state["requests"] += 1
+        delay = latency_ms
+        if jitter_ms:
+            delay += random.uniform(0, jitter_ms)
+        if tail_rate and random.random() < tail_rate:
+            delay += tail_ms
+        if delay:
+            await asyncio.sleep(delay / 1000.0)
+
+    def _conditional(request: Request, name: str, payload):
+        # Bump state["version"] to simulate a tenant change
+        etag = f'"{name}-{state["version"]}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        if isinstance(payload, tuple):
+            body, media_type = payload
+            return Response(content=body, media_type=media_type, headers={"ETag": etag})
+        return JSONResponse(content=payload, headers={"ETag": etag})
+
+    @app.get("/organization/{org_id}/user/bulk-export")
+    async def bulk_export(org_id: str, request: Request):
+        await _delay()
+        return _conditional(request, "users", render_export(state["users"], export_format))
+
+    @app.get("/organization/{org_id}/v2/agent-profile")
+    async def agent_profiles(org_id: str, request: Request):
+        await _delay()
+        return _conditional(request, "profiles", {"data": state["profiles"]})
+
+    def _paged(make, total: int, page: int, page_size: int) -> dict:
+        page_size = max(1, min(page_size, 100))
+        first = page * page_size
+        rows = [make(i) for i in range(first, min(total, first + page_size))]
+        meta = {"page": page, "pageSize": page_size, "totalPages": -(-total // page_size), "totalRecords": total}
+        return {"data": rows, "meta": meta}
+
+    def _book(i: int) -> dict:
+        return {
+            "id": f"ab-{i}",
+            "name": "Default" if i == 0 else f"Address book {i}",
+            "description": f"Speed dials for team {i}",
+            "parentType": "ORGANIZATION",
+            "createdTime": 1700000000000 + i,
+            "lastUpdatedTime": 1700000000000 + i,
+            "version": 1,
+            "links": {"self": f"/organization/org-1/v3/address-book/ab-{i}"},
+        }
+
+    @app.get("/organization/{org_id}/v3/address-book")
+    async def address_books_page(org_id: str, page: int = 0, pageSize: int = 100):
+        await _delay()
+        return _paged(_book, address_books, page, pageSize)
+
+    @app.get("/organization/{org_id}/v3/address-book/{book_id}/entry")
+    async def address_book_entries(org_id: str, book_id: str, page: int = 0, pageSize: int = 100):
+        await _delay()
+
+        def entry(i: int) -> dict:
+            return {"id": f"{book_id}-e{i}", "name": f"Contact {i}", "number": f"+1555{i:07d}", "createdTime": 1700000000000, "version": 1}
+
+        return _paged(entry, entries, page, pageSize)
+
+    @app.post("/v1/tasks/{task_id}/end")
+    async def end_task(task_id: str, request: Request):
+        await _delay()
+        # IDs starting with "missing" simulate tasks that already ended
+        if task_id.startswith("missing"):
+            return JSONResponse(status_code=404, content={"message": f"Task {task_id} not found"})
+        return JSONResponse(status_code=202, content={"id": task_id})
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class MockServer:
+    """Run an ASGI app with uvicorn in a background thread (context manager)."""
+
+    def __init__(self, app, port: int | None = None):
+        import uvicorn
+
+        self.port = port or free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self._server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning"))
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self._server.serve())
+
+    def __enter__(self):
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc):
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=3901)
+    parser.add_argument("--tenant", choices=TENANTS, help="tenant size preset (explicit options below win)")
+    parser.add_argument("--profile", choices=PROFILES, help="latency / error / throttle preset (explicit options below win)")
+    parser.add_argument("--users", type=int)
+    parser.add_argument("--profiles", type=int, help="agent profiles")
+    parser.add_argument("--latency-ms", type=float)
+    parser.add_argument("--jitter-ms", type=float)
+    parser.add_argument("--tail-rate", type=float)
+    parser.add_argument("--tail-ms", type=float)
+    parser.add_argument("--error-rate", type=float)
+    parser.add_argument("--export-format", choices=("json", "ndjson", "csv"))
+    parser.add_argument("--throttle-rps", type=float)
+    parser.add_argument("--throttle-burst", type=int)
+    parser.add_argument("--address-books", type=int)
+    parser.add_argument("--entries", type=int, help="entries per address book")
+    a = parser.parse_args()
+    options = {**TENANTS.get(a.tenant, {}), **PROFILES.get(a.profile, {})}
+    for name, value in vars(a).items():
+        if value is not None and name not in ("port", "tenant", "profile"):
+            options[name] = value
+    uvicorn.run(create_app(**options), host="127.0.0.1", port=a.port)
@@ -0,0 +1,208 @@
+"""
+Scripted mock of the Anthropic Messages and OpenAI Chat Completions APIs for benchmarks.
+Round 1 asks for one cc_check_agent_outbound call (email taken from the prompt if present);
+once a tool result is in the conversation it answers with plain text.
+Both support stream: true (SSE). Point the SDKs at it with ANTHROPIC_BASE_URL / OPENAI_BASE_URL (…/v1).
+Messages also mimics prompt caching: with cache_control in the request, the longest previously seen
+prefix (at message boundaries) is reported as cache_read_input_tokens and the rest as a cache write.
+jitter_ms adds a random 0..jitter_ms to latency_ms; error_rate answers that fraction of requests with the
+provider's overloaded error (Anthropic 529, OpenAI 503), which the SDKs retry.
+Run standalone: python bench/mock_llm.py --port 3902 --latency-ms 300 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+
+
+def _prompt_email(text: str) -> str:
+    m = _EMAIL.search(text or "")
+    return m.group(0) if m else "agent1@example.com"
+
+
+def _sse(event: str | None, data) -> str:
+    head = f"event: {event}\n" if event else ""
+    return f"{head}data: {data if isinstance(data, str) else json.dumps(data)}\n\n"
+
+
+def _words(text: str) -> list[str]:
+    return [w + " " for w in text.split(" ")[:-1]] + [text.split(" ")[-1]]
+
+
+def _tokens(value) -> int:
+    return len(json.dumps(value)) // 4
+
+
+def _has_cache_control(value) -> bool:
+    if isinstance(value, dict):
+        return "cache_control" in value or any(_has_cache_control(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_cache_control(v) for v in value)
+    return False
+
+
+def _strip_cache_control(value):
+    if isinstance(value, dict):
+        return {k: _strip_cache_control(v) for k, v in value.items() if k != "cache_control"}
+    if isinstance(value, list):
+        return [_strip_cache_control(v) for v in value]
+    return value
+
+
+def _cache_usage(body: dict, seen: set) -> dict:
+    """input / cache_read / cache_write token counts for a Messages request (see module docstring)."""
+    clean = _strip_cache_control({k: body.get(k) for k in ("system", "tools", "messages")})
+    total = _tokens(clean)
+    if not _has_cache_control(body):
+        return {"input_tokens": total, "cache_read_input_tokens": 0, "cache_creation_input_tokens": 0}
+    messages = clean["messages"] or []
+    prefixes = [hashlib.sha256(json.dumps({**clean, "messages": messages[:i]}).encode()).hexdigest() for i in range(len(messages) + 1)]
+    read = 0
+    for i in range(len(messages), -1, -1):
+        if prefixes[i] in seen:
+            read = _tokens({**clean, "messages": messages[:i]})
+            break
+    seen.update(prefixes)
+    return {"input_tokens": 0, "cache_read_input_tokens": read, "cache_creation_input_tokens": total - read}
+
+
+def _anthropic_events(message: dict):
+    yield _sse("message_start", {"type": "message_start", "message": {**message, "content": [], "stop_reason": None}})
+    for i, block in enumerate(message["content"]):
+        if block["type"] == "text":
+            yield _sse("content_block_start", {"type": "content_block_start", "index": i, "content_block": {"type": "text", "text": ""}})
+            for w in _words(block["text"]):
+                yield _sse("content_block_delta", {"type": "content_block_delta", "index": i, "delta": {"type": "text_delta", "text": w}})
+        else:
+            yield _sse("content_block_start", {"type": "content_block_start", "index": i, "content_block": {**block, "input": {}}})
+            partial = json.dumps(block["input"])
+            yield _sse("content_block_delta", {"type": "content_block_delta", "index": i, "delta": {"type": "input_json_delta", "partial_json": partial}})
+        yield _sse("content_block_stop", {"type": "content_block_stop", "index": i})
+    delta = {"stop_reason": message["stop_reason"], "stop_sequence": None}
+    yield _sse("message_delta", {"type": "message_delta", "delta": delta, "usage": {"output_tokens": message["usage"]["output_tokens"]}})
+    yield _sse("message_stop", {"type": "message_stop"})
+
+
+def _openai_chunks(completion: dict, include_usage: bool = False):
+    base = {k: completion[k] for k in ("id", "created", "model")}
+    message = completion["choices"][0]["message"]
+
+    def chunk(delta: dict, finish=None) -> str:
+        return _sse(None, {**base, "object": "chat.completion.chunk", "choices": [{"index": 0, "delta": delta, "finish_reason": finish}]})
+
+    yield chunk({"role": "assistant", "content": ""})
+    for w in _words(message["content"]) if message.get("content") else []:
+        yield chunk({"content": w})
+    for i, tc in enumerate(message.get("tool_calls") or []):
+        yield chunk({"tool_calls": [{"index": i, "id": tc["id"], "type": "function", "function": {"name": tc["function"]["name"], "arguments": ""}}]})
+        yield chunk({"tool_calls": [{"index": i, "function": {"arguments": tc["function"]["arguments"]}}]})
+    yield chunk({}, completion["choices"][0]["finish_reason"])
+    if include_usage:
+        yield _sse(None, {**base, "object": "chat.completion.chunk", "choices": [], "usage": completion["usage"]})
+    yield _sse(None, "[DONE]")
+
+
+def create_app(latency_ms: float = 300.0, jitter_ms: float = 0.0, error_rate: float = 0.0) -> FastAPI:
+    app = FastAPI(title="Mock LLM")
+    state = {"requests": 0, "errors": 0}
+    app.state.mock = state
+    cached_prefixes: set[str] = set()
+
+    async def _delay():
+        state["requests"] += 1
+        delay = latency_ms + (random.uniform(0, jitter_ms) if jitter_ms else 0.0)
+        if delay:
+            await asyncio.sleep(delay / 1000.0)
+
+    @app.middleware("http")
+    async def faults(request: Request, call_next):
+        if not error_rate or random.random() >= error_rate:
+            return await call_next(request)
+        state["errors"] += 1
+        if request.url.path.endswith("/messages"):
+            return JSONResponse(status_code=529, content={"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}})
+        return JSONResponse(status_code=503, content={"error": {"message": "The server is overloaded", "type": "server_error"}})
+
+    @app.post("/v1/messages")
+    async def anthropic_messages(request: Request):
+        body = await request.json()
+        await _delay()
+        messages = body.get("messages") or []
+        last = messages[-1] if messages else {}
+        has_tool_result = isinstance(last.get("content"), list) and any(
+            isinstance(b, dict) and b.get("type") == "tool_result" for b in last["content"]
+        )
+        usage = {**_cache_usage(body, cached_prefixes), "output_tokens": 20}
+        if has_tool_result or not body.get("tools"):
+            content = [{"type": "text", "text": "Done. The agent check has completed."}]
+            stop = "end_turn"
+        else:
+            text = next((m["content"] for m in reversed(messages) if m.get("role") == "user" and isinstance(m.get("content"), str)), "")
+            content = [{"type": "tool_use", "id": f"toolu_{state['requests']}", "name": "cc_check_agent_outbound", "input": {"userEmail": _prompt_email(text)}}]
+            stop = "tool_use"
+        message = {
+            "id": f"msg_{state['requests']}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model") or "mock",
+            "content": content,
+            "stop_reason": stop,
+            "stop_sequence": None,
+            "usage": usage,
+        }
+        if body.get("stream"):
+            return StreamingResponse(_anthropic_events(message), media_type="text/event-stream")
+        return message
+
+    @app.post("/v1/chat/completions")
+    async def openai_chat(request: Request):
+        body = await request.json()
+        await _delay()
+        messages = body.get("messages") or []
+        usage = {"prompt_tokens": 100 * len(messages), "completion_tokens": 20, "total_tokens": 100 * len(messages) + 20}
+        if any(m.get("role") == "tool" for m in messages) or not body.get("tools"):
+            message = {"role": "assistant", "content": "Done. The agent check has completed."}
+            finish = "stop"
+        else:
+            user = next((m.get("content") for m in messages if m.get("role") == "user"), "")
+            args = json.dumps({"userEmail": _prompt_email(user if isinstance(user, str) else "")})
+            message = {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [{"id": f"call_{state['requests']}", "type": "function", "function": {"name": "cc_check_agent_outbound", "arguments": args}}],
+            }
+            finish = "tool_calls"
+        completion = {
+            "id": f"chatcmpl-{state['requests']}",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body.get("model") or "mock",
+            "choices": [{"index": 0, "message": message, "finish_reason": finish}],
+            "usage": usage,
+        }
+        if body.get("stream"):
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            return StreamingResponse(_openai_chunks(completion, include_usage), media_type="text/event-stream")
+        return completion
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=3902)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    a = parser.parse_args()
+    uvicorn.run(create_app(a.latency_ms, a.jitter_ms, a.error_rate), host="127.0.0.1", port=a.port)
@@ -0,0 +1,97 @@
+"""
+Address-book pages for cc_list_address_books: the v3 address-book list and a book's entries are read one
+API page at a time (page / pageSize), cached as compact page summaries (projected rows plus paging info)
+and walked with opaque cursors, so results stay small whatever the tenant size.
+CC_ADDRESS_BOOK_PAGE_SIZE (default 25, at most 100) is the page size when the caller does not give one.
+"""
+
+import base64
+import binascii
+
+from lib.api import env_int
+
+MAX_PAGE_SIZE = 100
+BOOK_FIELDS = ("id", "name", "description", "parentType", "parentId")
+ENTRY_FIELDS = ("id", "name", "number", "description")
+_PAGE_FIELDS = ("page", "pageSize", "totalPages", "totalRecords")
+
+
+def _project(rows: list, fields: tuple) -> list[dict]:
+    return [{k: r[k] for k in fields if r.get(k) not in (None, "")} for r in rows if isinstance(r, dict)]
+
+
+def _page(data, fields: tuple) -> dict:
+    rows = data.get("data") if isinstance(data, dict) else data
+    meta = data.get("meta") if isinstance(data, dict) else None
+    page = {"items": _project(rows if isinstance(rows, list) else [], fields)}
+    if isinstance(meta, dict):
+        page.update({k: meta[k] for k in _PAGE_FIELDS if isinstance(meta.get(k), int)})
+    return page
+
+
+def book_page(data) -> dict:
+    """Cached value of one page of organization/{orgId}/v3/address-book."""
+    return _page(data, BOOK_FIELDS)
+
+
+def entry_page(data) -> dict:
+    """Cached value of one page of organization/{orgId}/v3/address-book/{id}/entry."""
+    return _page(data, ENTRY_FIELDS)
+
+
+def has_next(page: dict, number: int, size: int) -> bool:
+    if isinstance(page.get("totalPages"), int):
+        return number + 1 < page["totalPages"]
+    return len(page["items"]) >= size
+
+
+def encode_cursor(page: int, size: int, book_id: str | None = None) -> str:
+    raw = f"{page}:{size}:{book_id or ''}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int, str | None] | None:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        page, size, book_id = raw.split(":", 2)
+        return int(page), int(size), book_id or None
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        return None
+
+
+def page_request(args: dict) -> dict:
+    """{ ok, page, pageSize, addressBookId } from tool arguments (cursor wins over page / pageSize)."""
+    book_id = args.get("addressBookId")
+    if isinstance(book_id, int) and not isinstance(book_id, bool):
+        book_id = str(book_id)
+    elif book_id is not None and not isinstance(book_id, str):
+        return {"ok": False, "error": "addressBookId must be a string."}
+    book_id = (book_id or "").strip() or None
+    cursor = args.get("cursor")
+    if cursor:
+        decoded = decode_cursor(str(cursor))
+        if decoded is None:
+            return {"ok": False, "error": "Invalid cursor. Pass nextCursor from a previous result unchanged."}
+        page, size, book_id = decoded
+    else:
+        try:
+            page = int(args.get("page") or 0)
+            size = int(args.get("pageSize") or env_int("CC_ADDRESS_BOOK_PAGE_SIZE", 25))
+        except (TypeError, ValueError):
+            return {"ok": False, "error": "page and pageSize must be integers."}
+    if book_id is not None and "/" in book_id:
+        return {"ok": False, "error": "Invalid addressBookId."}
+    return {"ok": True, "page": max(0, page), "pageSize": min(MAX_PAGE_SIZE, max(1, size)), "addressBookId": book_id}
+
+
+def page_result(page: dict, number: int, size: int, book_id: str | None = None) -> dict:
+    """Tool result for one cached page."""
+    out = {"ok": True}
+    if book_id:
+        out["addressBookId"] = book_id
+    out["entries" if book_id else "addressBooks"] = page["items"]
+    out.update({k: page[k] for k in _PAGE_FIELDS if k in page})
+    out["page"], out["pageSize"] = number, size
+    if has_next(page, number, size):
+        out["nextCursor"] = encode_cursor(number + 1, size, book_id)
+    return out
@@ -0,0 +1,138 @@
+"""
+Columnar view of an org's agents (user bulk-export joined with agent profiles) for cc_query_agents.
+One AgentTable is built per pair of cached datasets and answers filters, group-by counts and result pages
+from posting lists (profile, domain, status -> row numbers) without touching the raw exports again.
+Status uses the cc_check_agents_outbound vocabulary: outbound, no-outbound, no-profile, profile-not-found.
+"""
+
+from collections import Counter
+
+COLUMNS = ("email", "agentProfileName", "outdialEnabled", "status")
+GROUP_BY = {"profile": "agentProfileName", "domain": "domain", "outdialEnabled": "outdialEnabled", "status": "status"}
+_OUTDIAL = {"outbound": True, "no-outbound": False}
+
+
+def _domain(email: str) -> str:
+    return email.rpartition("@")[2]
+
+
+class AgentTable:
+    __slots__ = ("emails", "domains", "profiles", "statuses", "by_profile", "by_domain", "by_status")
+
+    def __init__(self, users, profiles):
+        """users: UserIndex or mirror view (records()), profiles: anything with get(ref) -> ProfileRecord."""
+        self.emails: list[str] = []
+        self.domains: list[str] = []
+        self.profiles: list[str | None] = []
+        self.statuses: list[str] = []
+        self.by_profile: dict[str, list[int]] = {}
+        self.by_domain: dict[str, list[int]] = {}
+        self.by_status: dict[str, list[int]] = {}
+        resolved: dict = {}  # profile ref -> (name, status, lowercased keys a profile filter matches)
+        for row, user in enumerate(users.records()):
+            ref = user.profile_ref
+            if not ref:
+                name, status, keys = None, "no-profile", ()
+            else:
+                if ref not in resolved:
+                    profile = profiles.get(ref)
+                    if profile is None:
+                        resolved[ref] = (str(ref), "profile-not-found", {str(ref).lower()})
+                    else:
+                        status = "outbound" if profile.outdial_enabled else "no-outbound"
+                        keys = {k.lower() for k in (str(ref), profile.name, profile.id) if k}
+                        resolved[ref] = (profile.name or str(ref), status, keys)
+                name, status, keys = resolved[ref]
+            domain = _domain(user.email)
+            self.emails.append(user.email)
+            self.domains.append(domain)
+            self.profiles.append(name)
+            self.statuses.append(status)
+            self.by_domain.setdefault(domain, []).append(row)
+            self.by_status.setdefault(status, []).append(row)
+            for key in keys:
+                self.by_profile.setdefault(key, []).append(row)
+
+    def __len__(self) -> int:
+        return len(self.emails)
+
+    def _value(self, column: str, row: int):
+        if column == "email":
+            return self.emails[row]
+        if column == "domain":
+            return self.domains[row]
+        if column == "agentProfileName":
+            return self.profiles[row]
+        if column == "outdialEnabled":
+            return _OUTDIAL.get(self.statuses[row])
+        return self.statuses[row]
+
+    def select(self, profile: str | None = None, domain: str | None = None, outdial: bool | None = None, statuses: set | None = None) -> list[int]:
+        """Row numbers matching every given filter, in export order."""
+        postings = []
+        if profile is not None:
+            postings.append(self.by_profile.get(profile.strip().lower(), []))
+        if domain is not None:
+            postings.append(self.by_domain.get(domain.strip().lower().lstrip("@"), []))
+        wanted = set(statuses) if statuses else None
+        if outdial is not None:
+            status = "outbound" if outdial else "no-outbound"
+            wanted = {status} & wanted if wanted is not None else {status}
+        if wanted is not None:
+            postings.append(sorted(r for s in wanted for r in self.by_status.get(s, [])))
+        if not postings:
+            return list(range(len(self.emails)))
+        postings.sort(key=len)
+        rows = postings[0]
+        for other in postings[1:]:
+            keep = set(other)
+            rows = [r for r in rows if r in keep]
+        return rows
+
+    def group(self, rows: list[int], by: str) -> list[list]:
+        """[[value, count], ...] over rows, largest groups first."""
+        column = GROUP_BY[by]
+        counts = Counter(self._value(column, r) for r in rows)
+        return [[value, count] for value, count in counts.most_common()]
+
+    def page(self, rows: list[int], offset: int, limit: int) -> list[list]:
+        return [[self._value(c, r) for c in COLUMNS] for r in rows[offset : offset + limit]]
+
+
+def _int(value, default: int) -> int:
+    try:
+        return int(value) if value is not None else default
+    except (TypeError, ValueError):
+        return default
+
+
+def query_agents(table: AgentTable, args: dict, max_limit: int = 200) -> dict:
+    """Run a cc_query_agents request (tool arguments) against the table."""
+    statuses = args.get("status")
+    if isinstance(statuses, str):
+        statuses = [statuses]
+    if statuses is not None and not (isinstance(statuses, list) and all(isinstance(s, str) for s in statuses)):
+        return {"ok": False, "error": "status must be a string or a list of strings."}
+    for name in ("profile", "domain"):
+        if args.get(name) is not None and not isinstance(args[name], str):
+            return {"ok": False, "error": f"{name} must be a string."}
+    group_by = args.get("groupBy")
+    if group_by is not None and group_by not in GROUP_BY:
+        return {"ok": False, "error": f"groupBy must be one of: {', '.join(GROUP_BY)}."}
+    outdial = args.get("outdialEnabled")
+    if isinstance(outdial, str):
+        outdial = {"true": True, "false": False}.get(outdial.strip().lower())
+    rows = table.select(args.get("profile") or None, args.get("domain") or None, outdial if isinstance(outdial, bool) else None, set(statuses or ()))
+    offset = max(0, _int(args.get("offset"), 0))
+    limit = min(max_limit, max(0, _int(args.get("limit"), 0 if group_by else 25)))
+    out = {"ok": True, "total": len(table), "matched": len(rows)}
+    if group_by:
+        out["groupBy"] = group_by
+        out["groups"] = table.group(rows, group_by)
+    if limit:
+        out["columns"] = list(COLUMNS)
+        out["rows"] = table.page(rows, offset, limit)
+        out["offset"] = offset
+        if offset + limit < len(rows):
+            out["nextOffset"] = offset + limit
+    return out
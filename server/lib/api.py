@@ -1,14 +1,42 @@
 """
 Webex Contact Center API client.
 Base URL and auth from env or per-request overrides (e.g. from chat UI).
+
+All calls share one long-lived httpx.AsyncClient (keep-alive pool, HTTP/2 when the
+optional `h2` package is installed). main.py opens it at startup and closes it at
+shutdown via init_client() / close_client(); cc_rest() lazily opens it when used
+outside the app (scripts, benchmarks).
+
+Every call goes through the per-org scheduler in lib.ratelimit (token bucket, concurrency
+cap) and is retried on 429 / 502-504 (see get_rate_limits). A circuit breaker per host and
+endpoint family fails calls fast while that endpoint keeps failing, and idempotent GETs of
+selected families are hedged (see get_breaker_config and lib.breaker).
+
+The env-derived settings are read once and kept until the client is reopened (init_client after
+close_client) or reset_config() is called.
 """
 
+import asyncio
+import contextlib
 import os
+import time
+from typing import Any, Awaitable, Callable
+from urllib.parse import quote, urlsplit
 
 import httpx
 
+from lib import metrics, timing
+from lib.breaker import CircuitBreaker, breakers
+from lib.ratelimit import parse_retry_after, retry_delay, scheduler
+
 DEFAULT_BASE = "https://api.wxcc-us1.cisco.com"
 
+_client: httpx.AsyncClient | None = None
+# get_client_config / get_rate_limits / get_breaker_config results, read from env once
+_config: dict[str, dict] = {}
+# Per-host caps on in-flight requests (httpx pool limits are global, not per host)
+_host_slots: dict[str, asyncio.Semaphore] = {}
+
 
 def get_base_url() -> str:
     return os.environ.get("CONTACT_CENTER_BASE_URL") or os.environ.get("WEBEX_CC_BASE_URL") or DEFAULT_BASE
@@ -22,14 +50,161 @@ def get_org_id() -> str:
     return os.environ.get("CONTACT_CENTER_ORG_ID") or os.environ.get("WEBEX_CC_ORG_ID") or ""
 
 
-def cc_rest(
-    method: str,
-    path: str,
-    body: dict | None = None,
-    overrides: dict | None = None,
-    extra_headers: dict | None = None,
-) -> dict:
-    """Call Webex Contact Center REST API. Returns { ok, data?, error?, status? }."""
+def env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name) or default)
+    except ValueError:
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name) or default)
+    except ValueError:
+        return default
+
+
+def env_flag(name: str, default: bool = True) -> bool:
+    val = (os.environ.get(name) or "").strip().lower()
+    if not val:
+        return default
+    return val not in ("0", "false", "no", "off")
+
+
+def reset_config() -> None:
+    """Re-read the env-derived settings on next use."""
+    _config.clear()
+
+
+def _cached(name: str, build: Callable[[], dict]) -> dict:
+    cfg = _config.get(name)
+    if cfg is None:
+        cfg = _config[name] = build()
+    return cfg
+
+
+def get_client_config() -> dict:
+    """Pool settings from env. CC_HTTP_MAX_CONNECTIONS, CC_HTTP_MAX_KEEPALIVE, CC_HTTP_KEEPALIVE_EXPIRY,
+    CC_HTTP_MAX_PER_HOST (0 = no per-host cap), CC_HTTP_TIMEOUT, CC_HTTP_CONNECT_TIMEOUT, CC_HTTP2."""
+    return _cached("client", _client_config)
+
+
+def _client_config() -> dict:
+    return {
+        "max_connections": env_int("CC_HTTP_MAX_CONNECTIONS", 100),
+        "max_keepalive": env_int("CC_HTTP_MAX_KEEPALIVE", 20),
+        "keepalive_expiry": env_float("CC_HTTP_KEEPALIVE_EXPIRY", 30.0),
+        "max_per_host": env_int("CC_HTTP_MAX_PER_HOST", 20),
+        "timeout": env_float("CC_HTTP_TIMEOUT", 30.0),
+        "connect_timeout": env_float("CC_HTTP_CONNECT_TIMEOUT", 5.0),
+        "http2": env_flag("CC_HTTP2"),
+    }
+
+
+def get_rate_limits() -> dict:
+    """Upstream scheduling from env. Per org: CC_RATE_LIMIT_RPS (0 = no client-side rate limit, the default;
+    set it a little under the tenant's limit), CC_RATE_LIMIT_BURST, CC_ORG_MAX_CONCURRENCY (0 = no cap).
+    Retries: CC_RETRY_MAX (0 = none), CC_RETRY_BASE_DELAY, CC_RETRY_MAX_DELAY."""
+    return _cached("rate_limits", _rate_limits)
+
+
+def _rate_limits() -> dict:
+    return {
+        "rps": env_float("CC_RATE_LIMIT_RPS", 0.0),
+        "burst": max(1, env_int("CC_RATE_LIMIT_BURST", 20)),
+        "max_concurrency": env_int("CC_ORG_MAX_CONCURRENCY", 10),
+        "max_retries": env_int("CC_RETRY_MAX", 3),
+        "base_delay": env_float("CC_RETRY_BASE_DELAY", 0.5),
+        "max_delay": env_float("CC_RETRY_MAX_DELAY", 30.0),
+    }
+
+
+def get_breaker_config() -> dict:
+    """Circuit breaker: CC_BREAKER_FAILURES consecutive failures open it (0 = no breaker), CC_BREAKER_COOLDOWN
+    seconds before a probe. Hedging: GETs whose path contains one of CC_HEDGE_PATHS (comma-separated) get a
+    second request once the first exceeds the family's CC_HEDGE_PERCENTILE latency (0 = no hedging), measured
+    over at least CC_HEDGE_MIN_SAMPLES calls and never earlier than CC_HEDGE_MIN_DELAY seconds."""
+    return _cached("breaker", _breaker_config)
+
+
+def _breaker_config() -> dict:
+    paths = os.environ.get("CC_HEDGE_PATHS")
+    return {
+        "failures": env_int("CC_BREAKER_FAILURES", 5),
+        "cooldown": env_float("CC_BREAKER_COOLDOWN", 30.0),
+        "hedge_percentile": env_float("CC_HEDGE_PERCENTILE", 95.0),
+        "hedge_min_samples": env_int("CC_HEDGE_MIN_SAMPLES", 20),
+        "hedge_min_delay": env_float("CC_HEDGE_MIN_DELAY", 0.05),
+        "hedge_paths": tuple(p.strip() for p in (paths if paths is not None else "address-book,agent-profile").split(",") if p.strip()),
+    }
+
+
+def _h2_installed() -> bool:
+    try:
+        import h2  # noqa: F401  (httpx[http2] extra)
+    except ImportError:
+        return False
+    return True
+
+
+def _build_client() -> httpx.AsyncClient:
+    reset_config()
+    cfg = get_client_config()
+    limits = httpx.Limits(
+        max_connections=cfg["max_connections"],
+        max_keepalive_connections=cfg["max_keepalive"],
+        keepalive_expiry=cfg["keepalive_expiry"],
+    )
+    timeout = httpx.Timeout(cfg["timeout"], connect=min(cfg["timeout"], cfg["connect_timeout"]))
+    # Checked once per client: a failing import is not cached and would rescan sys.path every time
+    http2 = cfg["http2"] and _h2_installed()
+    return httpx.AsyncClient(timeout=timeout, limits=limits, http2=http2)
+
+
+async def init_client() -> httpx.AsyncClient:
+    """Open the shared client (idempotent). Call from app startup."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+        _host_slots.clear()
+        scheduler.reset()
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client and drop pooled connections. Call from app shutdown."""
+    global _client
+    client, _client = _client, None
+    _host_slots.clear()
+    reset_config()
+    scheduler.reset()
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def _host_slot(url: str) -> asyncio.Semaphore | None:
+    limit = get_client_config()["max_per_host"]
+    if limit <= 0:
+        return None
+    host = urlsplit(url).netloc
+    slot = _host_slots.get(host)
+    if slot is None:
+        slot = _host_slots[host] = asyncio.Semaphore(limit)
+    return slot
+
+
+def _validators(resp: httpx.Response) -> dict:
+    """ETag / Last-Modified of a response, for conditional revalidation by caches."""
+    out = {}
+    if resp.headers.get("etag"):
+        out["etag"] = resp.headers["etag"]
+    if resp.headers.get("last-modified"):
+        out["lastModified"] = resp.headers["last-modified"]
+    return out
+
+
+def _prepare(path: str, overrides: dict | None, extra_headers: dict | None) -> tuple[str, dict] | dict:
+    """Resolve URL and auth headers for a call, or return a cc_rest-style error result."""
     overrides = overrides or {}
     base = get_base_url().rstrip("/") + "/"
     token = overrides.get("token") or get_access_token()
@@ -45,20 +220,220 @@ def cc_rest(
         headers["Organization-Id"] = org_id
     if extra_headers:
         headers.update(extra_headers)
+    return url, headers
+
+
+def path_segment(value: str) -> str:
+    """value as one percent-encoded URL path segment ("/", "?", "#", "%" and dot segments cannot escape it)."""
+    segment = quote(str(value), safe="")
+    return segment.replace(".", "%2E") if segment in (".", "..") else segment
+
+
+def _error_result(resp: httpx.Response, text: str) -> dict:
     try:
-        with httpx.Client(timeout=30.0) as client:
-            if method.upper() in ("POST", "PUT", "PATCH") and body is not None:
-                resp = client.request(method, url, json=body, headers=headers)
+        data = resp.json() if text else None
+    except Exception:
+        data = text
+    err = data.get("message") or data.get("error") if isinstance(data, dict) else text or resp.reason_phrase
+    return {"ok": False, "error": err, "status": resp.status_code, "data": data}
+
+
+async def _backoff(method: str, path: str, org_id: str, resp: httpx.Response, attempt: int, limits: dict) -> bool:
+    """After a retryable response, wait as the retry policy says and return True; False = give up.
+    A 429 with Retry-After also pauses the org's other requests for that long."""
+    retry_after = parse_retry_after(resp.headers.get("retry-after"))
+    if resp.status_code == 429:
+        scheduler.throttled(org_id, retry_after, limits)
+    delay = retry_delay(method, resp.status_code, retry_after, attempt, limits)
+    if delay is None:
+        return False
+    metrics.UPSTREAM_RETRIES.inc(method, metrics.path_template(path), str(resp.status_code))
+    with timing.span("retry", f"{resp.status_code} after {delay:.2f}s"):
+        await asyncio.sleep(delay)
+    return True
+
+
+def _breaker(url: str, path: str, cfg: dict) -> CircuitBreaker | None:
+    if cfg["failures"] <= 0:
+        return None
+    return breakers.breaker(f"{urlsplit(url).netloc} {metrics.path_template(path)}")
+
+
+def _circuit_open(breaker: CircuitBreaker, wait: float) -> dict:
+    family = breaker.key.split(" ", 1)[-1]
+    return {
+        "ok": False,
+        "error": f"Contact Center API {family} is failing; not calling it for another {wait:.0f}s (circuit open).",
+        "status": 503,
+        "circuitOpen": True,
+    }
+
+
+@contextlib.contextmanager
+def _observed(method: str, path: str, breaker: CircuitBreaker | None = None, threshold: int = 0):
+    """Record latency, status (0 = transport error) and in-flight count of one upstream call, and its
+    outcome in breaker (5xx and transport errors count as failures). The body sets state["status"]
+    once the response headers arrive."""
+    state = {"status": 0}
+    template = metrics.path_template(path)
+    start = time.perf_counter()
+    cancelled = False
+    metrics.UPSTREAM_IN_FLIGHT.inc()
+    try:
+        with timing.span("cc", f"{method} {template}"):
+            yield state
+    except asyncio.CancelledError:
+        cancelled = True
+        raise
+    finally:
+        metrics.UPSTREAM_IN_FLIGHT.dec()
+        metrics.UPSTREAM_LATENCY.observe(time.perf_counter() - start, method, template)
+        metrics.UPSTREAM_RESPONSES.inc(method, template, str(state["status"]))
+        if breaker is not None:
+            if cancelled:
+                breaker.probing = False  # no verdict; let another call probe
             else:
-                resp = client.request(method, url, headers=headers)
+                breaker.record(0 < state["status"] < 500, threshold)
+
+
+async def _request(client: httpx.AsyncClient, method: str, url: str, kwargs: dict, slot: asyncio.Semaphore | None) -> httpx.Response:
+    if slot is None:
+        return await client.request(method, url, **kwargs)
+    async with slot:
+        return await client.request(method, url, **kwargs)
+
+
+async def _hedged(client: httpx.AsyncClient, url: str, kwargs: dict, slot, delay: float, path: str) -> httpx.Response:
+    """GET; if no response after delay seconds, send the same GET again and return whichever answers first."""
+    first = asyncio.ensure_future(_request(client, "GET", url, kwargs, slot))
+    done, _ = await asyncio.wait({first}, timeout=delay)
+    if done:
+        return first.result()
+    metrics.UPSTREAM_HEDGES.inc(metrics.path_template(path))
+    pending = {first, asyncio.ensure_future(_request(client, "GET", url, kwargs, slot))}
+    error: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _send(client: httpx.AsyncClient, method: str, url: str, kwargs: dict, slot, path: str, cfg: dict) -> httpx.Response:
+    """One upstream request; hedged when it is a GET of a CC_HEDGE_PATHS family with enough latency history."""
+    template = metrics.path_template(path)
+    if method != "GET" or cfg["hedge_percentile"] <= 0 or not any(p in template for p in cfg["hedge_paths"]):
+        return await _request(client, method, url, kwargs, slot)
+    tracker = breakers.latency(f"{urlsplit(url).netloc} {template}")
+    delay = tracker.percentile(cfg["hedge_percentile"], cfg["hedge_min_samples"])
+    start = time.perf_counter()
+    if delay is None:
+        resp = await _request(client, method, url, kwargs, slot)
+    else:
+        resp = await _hedged(client, url, kwargs, slot, max(delay, cfg["hedge_min_delay"]), path)
+    if resp.is_success:
+        tracker.add(time.perf_counter() - start)
+    return resp
+
+
+async def cc_rest(
+    method: str,
+    path: str,
+    body: dict | None = None,
+    overrides: dict | None = None,
+    extra_headers: dict | None = None,
+) -> dict:
+    """Call Webex Contact Center REST API. Returns { ok, data?, error?, status?, etag?, lastModified?, notModified? }."""
+    prepared = _prepare(path, overrides, extra_headers)
+    if isinstance(prepared, dict):
+        return prepared
+    url, headers = prepared
+    method = method.upper()
+    org_id = headers.get("Organization-Id", "")
+    limits = get_rate_limits()
+    cfg = get_breaker_config()
+    breaker = _breaker(url, path, cfg)
+    try:
+        client = await init_client()
+        kwargs = {"headers": headers}
+        if method in ("POST", "PUT", "PATCH") and body is not None:
+            kwargs["json"] = body
+        slot = _host_slot(url)
+        attempt = 0
+        while True:
+            async with scheduler.slot(org_id, limits):
+                # Asked only once the call can go: a probe never waits in (and is never cancelled from) a queue
+                wait = breaker.allow(cfg["cooldown"]) if breaker is not None else None
+                if wait is not None:
+                    return _circuit_open(breaker, wait)
+                with _observed(method, path, breaker, cfg["failures"]) as observed:
+                    resp = await _send(client, method, url, kwargs, slot, path, cfg)
+                    observed["status"] = resp.status_code
+            if resp.is_success or not await _backoff(method, path, org_id, resp, attempt, limits):
+                break
+            attempt += 1
+        if resp.status_code == 304:
+            # Conditional GET (If-None-Match / If-Modified-Since): caller keeps its copy
+            return {"ok": True, "notModified": True, "status": 304, **_validators(resp)}
         text = resp.text
+        if not resp.is_success:
+            return _error_result(resp, text)
         try:
             data = resp.json() if text else None
         except Exception:
             data = text
-        if not resp.is_success:
-            err = data.get("message") or data.get("error") if isinstance(data, dict) else text or resp.reason_phrase
-            return {"ok": False, "error": err, "status": resp.status_code, "data": data}
-        return {"ok": True, "data": data, "status": resp.status_code}
+        return {"ok": True, "data": data, "status": resp.status_code, **_validators(resp)}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+
+async def cc_stream(
+    path: str,
+    consume: Callable[[httpx.Response], Awaitable[Any]],
+    overrides: dict | None = None,
+    extra_headers: dict | None = None,
+) -> dict:
+    """GET a (large) endpoint without buffering the body: consume(resp) reads resp.aiter_bytes() and
+    returns the value placed in data. Same result shape as cc_rest; error bodies are read in full."""
+    prepared = _prepare(path, overrides, extra_headers)
+    if isinstance(prepared, dict):
+        return prepared
+    url, headers = prepared
+    org_id = headers.get("Organization-Id", "")
+    limits = get_rate_limits()
+    cfg = get_breaker_config()
+    breaker = _breaker(url, path, cfg)
+    try:
+        client = await init_client()
+        slot = _host_slot(url)
+        attempt = 0
+        while True:
+            async with contextlib.AsyncExitStack() as stack:
+                await stack.enter_async_context(scheduler.slot(org_id, limits))
+                if slot is not None:
+                    await stack.enter_async_context(slot)
+                wait = breaker.allow(cfg["cooldown"]) if breaker is not None else None
+                if wait is not None:
+                    return _circuit_open(breaker, wait)
+                # Timed until the body has been consumed (or the error body read)
+                observed = stack.enter_context(_observed("GET", path, breaker, cfg["failures"]))
+                resp = await stack.enter_async_context(client.stream("GET", url, headers=headers))
+                observed["status"] = resp.status_code
+                if resp.status_code == 304:
+                    return {"ok": True, "notModified": True, "status": 304, **_validators(resp)}
+                if resp.is_success:
+                    data = await consume(resp)
+                    return {"ok": True, "data": data, "status": resp.status_code, **_validators(resp)}
+                await resp.aread()
+            # Connection and slots released before waiting
+            if not await _backoff("GET", path, org_id, resp, attempt, limits):
+                return _error_result(resp, resp.text)
+            attempt += 1
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -0,0 +1,131 @@
+"""
+Circuit breakers and request hedging for Contact Center calls, keyed by upstream host + endpoint family
+(path template, e.g. "api.wxcc-us1.cisco.com organization/{orgId}/v2/agent-profile").
+
+A breaker opens after CC_BREAKER_FAILURES consecutive failures (transport errors, timeouts, 5xx), fails
+calls fast for CC_BREAKER_COOLDOWN seconds, then lets one probe through (half-open): success closes it,
+failure opens it again; a probe that has not reported back after another cooldown is written off and the
+next call probes instead. LatencyTracker gives the per-family latency percentile after which an idempotent
+GET is hedged with a second request.
+"""
+
+import logging
+import time
+from collections import deque
+
+from lib import metrics
+
+log = logging.getLogger(__name__)
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half-open", "open"
+_STATE_VALUE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    __slots__ = ("key", "state", "failures", "opened_at", "probing", "probe_started", "opened", "rejected")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.probe_started = 0.0
+        self.opened = 0  # times opened
+        self.rejected = 0  # calls failed fast
+
+    def _transition(self, state: str) -> None:
+        if state == self.state:
+            return
+        level = logging.WARNING if state == OPEN else logging.INFO
+        log.log(level, "circuit %s: %s -> %s (failures=%d)", self.key, self.state, state, self.failures)
+        self.state = state
+        metrics.BREAKER_STATE.set(self.key, value=_STATE_VALUE[state])
+        metrics.BREAKER_TRANSITIONS.inc(self.key, state)
+        if state == OPEN:
+            self.opened += 1
+            self.opened_at = time.monotonic()
+
+    def allow(self, cooldown: float) -> float | None:
+        """None if a call may go ahead (when half-open, as the probe: it must then record() its outcome, or
+        clear probing if it has none), else seconds until the breaker will allow a probe."""
+        if self.state == CLOSED:
+            return None
+        now = time.monotonic()
+        remaining = self.opened_at + cooldown - now
+        if self.state == OPEN and remaining <= 0:
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            remaining = self.probe_started + cooldown - now
+            if not self.probing or remaining <= 0:
+                self.probing = True
+                self.probe_started = now
+                return None
+        self.rejected += 1
+        return max(0.0, remaining)
+
+    def record(self, ok: bool, threshold: int) -> None:
+        self.probing = False
+        if ok:
+            self.failures = 0
+            self._transition(CLOSED)
+            return
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= threshold:
+            self._transition(OPEN)
+            self.opened_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        return {"state": self.state, "failures": self.failures, "opened": self.opened, "rejected": self.rejected}
+
+
+class LatencyTracker:
+    """Recent latencies of one endpoint family; the percentile is recomputed every `every` samples."""
+
+    __slots__ = ("samples", "every", "pending", "cached")
+
+    def __init__(self, size: int = 200, every: int = 20):
+        self.samples: deque[float] = deque(maxlen=size)
+        self.every = every
+        self.pending = 0
+        self.cached: dict[float, float] = {}
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.pending += 1
+        if self.pending >= self.every:
+            self.pending = 0
+            self.cached.clear()
+
+    def percentile(self, pct: float, min_samples: int) -> float | None:
+        if len(self.samples) < min_samples:
+            return None
+        value = self.cached.get(pct)
+        if value is None:
+            ordered = sorted(self.samples)
+            value = self.cached[pct] = ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+        return value
+
+
+class BreakerRegistry:
+    def __init__(self):
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.latencies: dict[str, LatencyTracker] = {}
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        breaker = self.breakers.get(key)
+        if breaker is None:
+            breaker = self.breakers[key] = CircuitBreaker(key)
+        return breaker
+
+    def latency(self, key: str) -> LatencyTracker:
+        tracker = self.latencies.get(key)
+        if tracker is None:
+            tracker = self.latencies[key] = LatencyTracker()
+        return tracker
+
+    def stats(self) -> dict:
+        return {key: b.snapshot() for key, b in self.breakers.items()}
+
+
+breakers = BreakerRegistry()
@@ -0,0 +1,155 @@
+"""
+In-process cache for org-wide Contact Center datasets (user bulk-export, agent profiles, address books).
+Entries are keyed per (dataset, orgId, token scope), expire after a TTL, are bounded by an
+LRU entry count, revalidate with If-None-Match / If-Modified-Since when the API returned
+validators, and concurrent misses for the same key share one in-flight fetch (a task of its own, so a caller
+that is cancelled, e.g. by a tool timeout, does not cancel it for the others). For CC_CACHE_STALE seconds
+after expiry (default 300, 0 disables) an entry is still served while one background fetch revalidates it.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from lib.api import env_float, env_int
+
+# fetch(conditional_headers) -> cc_rest-style result { ok, data?, error?, etag?, lastModified?, notModified? }
+Fetcher = Callable[[dict], Awaitable[dict]]
+
+
+def token_scope(token: str | None) -> str:
+    """Short, non-reversible id for an access token so cache keys never hold the token itself."""
+    if not token:
+        return "-"
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+class CacheEntry:
+    __slots__ = ("value", "fetched_at", "expires_at", "etag", "last_modified")
+
+    def __init__(self, value: Any, ttl: float, etag: str | None = None, last_modified: str | None = None):
+        self.value = value
+        self.fetched_at = time.monotonic()
+        self.expires_at = self.fetched_at + ttl
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, stale: float = 0.0) -> bool:
+        return time.monotonic() < self.expires_at + stale
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DatasetCache:
+    """TTL + LRU cache with conditional revalidation and single-flight fetches."""
+
+    def __init__(self, ttl: float | None = None, max_entries: int | None = None, stale: float | None = None):
+        self.ttl = env_float("CC_CACHE_TTL", 300.0) if ttl is None else ttl
+        self.max_entries = env_int("CC_CACHE_MAX_ENTRIES", 64) if max_entries is None else max_entries
+        self.stale = env_float("CC_CACHE_STALE", 300.0) if stale is None else stale
+        self._entries: OrderedDict[tuple, CacheEntry] = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._background: set[asyncio.Task] = set()
+        self.counters = {"hits": 0, "stale": 0, "misses": 0, "revalidated": 0, "evictions": 0, "errors": 0, "shared": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def stats(self) -> dict:
+        return {**self.counters, "entries": len(self._entries), "inflight": len(self._inflight), "ttl": self.ttl, "staleFor": self.stale, "maxEntries": self.max_entries}
+
+    def invalidate(self, key: tuple | None = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def peek(self, key: tuple) -> CacheEntry | None:
+        return self._entries.get(key)
+
+    def _store(self, key: tuple, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    async def get(self, key: tuple, fetch: Fetcher, build: Callable[[Any], Any] | None = None) -> dict:
+        """Return { ok: True, data: value, cache: hit|stale|miss|revalidated } or the failed fetch result.
+        build(data) turns the raw API payload into the cached value (default: keep as is)."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.is_fresh():
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return {"ok": True, "data": entry.value, "cache": "hit"}
+        if entry is not None and entry.is_fresh(self.stale):
+            # Stale-while-revalidate: answer now, refresh once in the background
+            self._entries.move_to_end(key)
+            self.counters["stale"] += 1
+            self.refresh_later(key, fetch, build)
+            return {"ok": True, "data": entry.value, "cache": "stale"}
+        return await self.refresh(key, fetch, build)
+
+    def refresh_later(self, key: tuple, fetch: Fetcher, build: Callable[[Any], Any] | None = None) -> None:
+        """Start a background refresh of key unless one is already running."""
+        if key in self._inflight:
+            return
+        task = asyncio.get_running_loop().create_task(self.refresh(key, fetch, build))
+        self._background.add(task)
+        task.add_done_callback(self._refreshed)
+
+    def _refreshed(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.counters["errors"] += 1
+
+    async def refresh(self, key: tuple, fetch: Fetcher, build: Callable[[Any], Any] | None = None) -> dict:
+        """Fetch (or revalidate) key now, whatever its freshness; joins a fetch already in flight.
+        Cancelling a caller only stops its wait: the fetch runs on for the other callers and the cache."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.counters["shared"] += 1
+        else:
+            task = asyncio.get_running_loop().create_task(self._refresh(key, self._entries.get(key), fetch, build))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._fetched(key, t))
+        return await asyncio.shield(task)
+
+    def _fetched(self, key: tuple, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved, so no "never retrieved" warning when every caller was cancelled
+
+    async def _refresh(self, key: tuple, entry: CacheEntry | None, fetch: Fetcher, build) -> dict:
+        res = await fetch(entry.conditional_headers() if entry is not None else {})
+        if not res.get("ok"):
+            self.counters["errors"] += 1
+            return res
+        if res.get("notModified") and entry is not None:
+            entry.fetched_at = time.monotonic()
+            entry.expires_at = entry.fetched_at + self.ttl
+            self._store(key, entry)
+            self.counters["revalidated"] += 1
+            return {"ok": True, "data": entry.value, "cache": "revalidated"}
+        self.counters["misses"] += 1
+        value = build(res.get("data")) if build else res.get("data")
+        if self.enabled:
+            self._store(key, CacheEntry(value, self.ttl, res.get("etag"), res.get("lastModified")))
+        return {"ok": True, "data": value, "cache": "miss"}
+
+
+# Shared cache for org-wide datasets (see main._get_org_dataset)
+org_datasets = DatasetCache()
+# Address-book pages (see main._address_book_page), kept apart so paging through a large tenant's books cannot
+# evict the datasets above; CC_ADDRESS_BOOK_CACHE_ENTRIES pages at most
+address_book_pages = DatasetCache(max_entries=env_int("CC_ADDRESS_BOOK_CACHE_ENTRIES", 32))
@@ -3,11 +3,36 @@ Chat with LLM + MCP tools: user prompt -> LLM decides tool calls -> we execute o
 Supports Claude (ANTHROPIC_API_KEY / CLAUDE_API_KEY) or OpenAI (OPENAI_API_KEY). Prefers Claude if set.
 """
 
+import asyncio
+import json
 import os
-from lib.mcp_client import get_mcp_tools, call_mcp_tool
+import time
+from typing import Awaitable, Callable
+
+from lib import metrics, timing
+from lib.api import env_flag, env_float, env_int
+from lib.cache import token_scope
+from lib.mcp_client import get_tool_catalog, call_mcp_tool
+from lib.sessions import get_session_store, trim_history
+from lib.shaping import shape_tool_result
 
 MAX_TOOL_ROUNDS = 5
 
+SYSTEM_PROMPT = (
+    "You are a helpful assistant that can use Webex Contact Center tools. "
+    "When the user asks to list agents, get statistics, search tasks, or call any Contact Center API, use the appropriate tool. "
+    "Reply concisely and show the user the relevant results."
+)
+
+# Anthropic prompt caching breakpoint (system prompt, tool definitions, conversation so far)
+_EPHEMERAL = {"type": "ephemeral"}
+
+# emit(event, data): streaming callback (see main.api_chat_stream). Events: delta, tool_start, tool_result
+Emit = Callable[[str, dict], Awaitable[None]]
+
+# Async LLM clients per (provider, api key), so their connection pools are reused across chats
+_llm_clients: dict[tuple[str, str], object] = {}
+
 
 def _mcp_tool_to_openai(t: dict) -> dict:
     return {
@@ -28,15 +53,106 @@ def _mcp_tool_to_anthropic(t: dict) -> dict:
     }
 
 
-def run_chat_with_mcp(
+def _tool_text(result: dict) -> str:
+    return "".join(c.get("text", "") for c in (result.get("content") or []) if c.get("type") == "text").strip() or str(result)
+
+
+async def _call_tools(mcp_url: str, calls: list[tuple[str, dict]], auth: dict, emit: Emit | None = None) -> list[dict]:
+    """Run one round's tool calls concurrently (at most CHAT_TOOL_CONCURRENCY at a time, each bounded by
+    CHAT_TOOL_TIMEOUT seconds). Results are returned in the order of calls; with emit, tool_start and
+    tool_result events are sent as each call starts and finishes."""
+    timeout = env_float("CHAT_TOOL_TIMEOUT", 60.0)
+    slots = asyncio.Semaphore(max(1, env_int("CHAT_TOOL_CONCURRENCY", 8)))
+
+    async def one(index: int, name: str, args: dict) -> dict:
+        async with slots:
+            if emit is not None:
+                await emit("tool_start", {"index": index, "name": name, "arguments": args})
+            result = await call_mcp_tool(mcp_url, name, args, auth, timeout)
+            if emit is not None:
+                await emit("tool_result", {"index": index, "name": name, "result": _tool_text(result), "isError": bool(result.get("isError"))})
+            return result
+
+    return await asyncio.gather(*(one(i, name, args) for i, (name, args) in enumerate(calls)))
+
+
+def _new_usage() -> dict:
+    """Per-chat LLM accounting, filled in by the round functions and reported by run_chat_with_mcp.
+    input counts uncached input tokens only; cache_read / cache_write are prompt-cache hits and writes."""
+    return {"rounds": 0, "input": 0, "cache_read": 0, "cache_write": 0, "output": 0}
+
+
+def _record_round(provider: str, usage: dict, start: float, tokens: dict) -> None:
+    metrics.LLM_LATENCY.observe(time.perf_counter() - start, provider)
+    metrics.LLM_ROUNDS.inc(provider)
+    usage["rounds"] += 1
+    for kind, n in tokens.items():
+        usage[kind] += n or 0
+        metrics.LLM_TOKENS.inc(provider, kind, amount=n or 0)
+
+
+def _anthropic_tokens(u) -> dict:
+    return {
+        "input": getattr(u, "input_tokens", 0) or 0,
+        "cache_read": getattr(u, "cache_read_input_tokens", 0) or 0,
+        "cache_write": getattr(u, "cache_creation_input_tokens", 0) or 0,
+        "output": getattr(u, "output_tokens", 0) or 0,
+    }
+
+
+def _openai_tokens(u) -> dict:
+    # prompt_tokens includes the (automatically) cached prefix
+    details = getattr(u, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", 0) or 0
+    return {"input": (getattr(u, "prompt_tokens", 0) or 0) - cached, "cache_read": cached, "output": getattr(u, "completion_tokens", 0) or 0}
+
+
+def _usage_report(usage: dict) -> dict:
+    return {
+        "rounds": usage["rounds"],
+        "inputTokens": usage["input"],
+        "cachedInputTokens": usage["cache_read"],
+        "cacheWriteTokens": usage["cache_write"],
+        "outputTokens": usage["output"],
+    }
+
+
+def _anthropic_client(api_key: str):
+    client = _llm_clients.get(("anthropic", api_key))
+    if client is None:
+        import anthropic
+
+        client = _llm_clients[("anthropic", api_key)] = anthropic.AsyncAnthropic(api_key=api_key)
+    return client
+
+
+def _openai_client(api_key: str):
+    client = _llm_clients.get(("openai", api_key))
+    if client is None:
+        from openai import AsyncOpenAI
+
+        client = _llm_clients[("openai", api_key)] = AsyncOpenAI(api_key=api_key)
+    return client
+
+
+def _session_key(auth: dict, conversation_id: str | None) -> str | None:
+    # Scoped to the access token: a conversation id alone does not give access to someone else's history
+    return f"{token_scope(auth.get('accessToken'))}:{conversation_id}" if conversation_id else None
+
+
+async def run_chat_with_mcp(
     prompt: str,
     mcp_server_url: str,
     openai_api_key: str | None,
     claude_api_key: str | None,
     auth: dict | None = None,
+    emit: Emit | None = None,
+    conversation_id: str | None = None,
 ) -> dict:
     """Run chat: get tools from MCP, then loop (LLM -> tool_calls -> MCP -> LLM) until done.
-    Returns { reply: str, toolCalls?: list }.
+    Returns { reply: str, toolCalls?: list, usage, conversationId? }. With conversation_id, earlier turns of that
+    conversation are sent as history and this turn is added to it. With emit, model output is streamed and
+    progress is reported as it happens.
     """
     auth = auth or {}
     use_claude = bool((claude_api_key or "").strip())
@@ -47,98 +163,216 @@ def run_chat_with_mcp(
             "No chat API key found. Add CLAUDE_API_KEY or ANTHROPIC_API_KEY (for Claude) or OPENAI_API_KEY (for OpenAI) to server .env."
         )
 
-    tools_result = get_mcp_tools(mcp_server_url)
-    tools = tools_result.get("tools") or []
     tool_call_results: list[dict] = []
-    system_prompt = (
-        "You are a helpful assistant that can use Webex Contact Center tools. "
-        "When the user asks to list agents, get statistics, search tasks, or call any Contact Center API, use the appropriate tool. "
-        "Reply concisely and show the user the relevant results."
-    )
+    provider = "anthropic" if use_claude else "openai"
+    store = get_session_store()
+    session_key = _session_key(auth, conversation_id)
+    messages: list[dict] = []
+    if session_key:
+        session = await store.get(session_key)
+        # History is in the provider's message format; a provider switch starts over
+        if session and session.get("provider") == provider:
+            messages = list(session["messages"])
+    messages.append({"role": "user", "content": prompt})
+
+    usage = _new_usage()
+    outcome = "error"
+    start = time.perf_counter()
+    try:
+        with metrics.CHATS_IN_FLIGHT.track():
+            if use_claude:
+                with timing.span("catalog"):
+                    tools = await get_tool_catalog(mcp_server_url, "anthropic", _mcp_tool_to_anthropic)
+                result = await _run_claude(api_key, messages, SYSTEM_PROMPT, tools, mcp_server_url, auth, tool_call_results, emit, usage)
+            else:
+                with timing.span("catalog"):
+                    tools = await get_tool_catalog(mcp_server_url, "openai", _mcp_tool_to_openai)
+                result = await _run_openai(api_key, messages, SYSTEM_PROMPT, tools, mcp_server_url, auth, tool_call_results, emit, usage)
+        outcome = "ok"
+    finally:
+        metrics.CHAT_LATENCY.observe(time.perf_counter() - start, provider, outcome)
+        metrics.CHAT_ROUNDS.observe(usage["rounds"], provider)
+        for kind in ("input", "cache_read", "output"):
+            metrics.CHAT_TOKENS.observe(usage[kind], provider, kind)
+    if session_key:
+        await store.put(session_key, {"provider": provider, "messages": trim_history(messages)})
+        result["conversationId"] = conversation_id
+    result["usage"] = _usage_report(usage)
+    return result
+
+
+def _finish(messages: list, reply: str, tool_call_results: list) -> dict:
+    """Close the turn in the history with the assistant's reply and build the chat result."""
+    if not messages or messages[-1].get("role") != "assistant":
+        messages.append({"role": "assistant", "content": reply})
+    return {"reply": reply, "toolCalls": tool_call_results if tool_call_results else None}
+
+
+def _block_dict(block) -> dict:
+    """Anthropic content block (SDK model) as a plain dict, so history can be stored and re-sent."""
+    if isinstance(block, dict):
+        return block
+    return block.model_dump(exclude_none=True)
 
-    if use_claude:
-        return _run_claude(api_key, prompt, system_prompt, tools, mcp_server_url, auth, tool_call_results)
 
-    return _run_openai(api_key, prompt, system_prompt, tools, mcp_server_url, auth, tool_call_results)
+def _cache_breakpoint(messages: list) -> list:
+    """Copy of messages with a cache_control breakpoint on the last block (the stored history is not touched)."""
+    if not messages:
+        return messages
+    last = messages[-1]
+    content = last["content"]
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content, "cache_control": _EPHEMERAL}]
+    else:
+        blocks = [*content[:-1], {**_block_dict(content[-1]), "cache_control": _EPHEMERAL}]
+    return [*messages[:-1], {**last, "content": blocks}]
 
 
-def _run_claude(api_key: str, prompt: str, system_prompt: str, tools: list, mcp_url: str, auth: dict, tool_call_results: list) -> dict:
-    import anthropic
+async def _claude_round(client, params: dict, emit: Emit | None, usage: dict):
+    """One Messages API call; with emit, streamed so text deltas are forwarded as they arrive."""
+    start = time.perf_counter()
+    if emit is None:
+        resp = await client.messages.create(**params)
+    else:
+        async with client.messages.stream(**params) as stream:
+            async for event in stream:
+                if event.type == "text":
+                    await emit("delta", {"text": event.text})
+            resp = await stream.get_final_message()
+    _record_round("anthropic", usage, start, _anthropic_tokens(getattr(resp, "usage", None)))
+    return resp
 
-    client = anthropic.Anthropic(api_key=api_key)
+
+async def _run_claude(api_key: str, messages: list, system_prompt: str, anthropic_tools: list, mcp_url: str, auth: dict, tool_call_results: list, emit: Emit | None = None, usage: dict | None = None) -> dict:
+    """Tool loop on messages (history + the new user prompt), which is extended in place with this turn."""
+    client = _anthropic_client(api_key)
+    usage = usage if usage is not None else _new_usage()
     model = os.environ.get("ANTHROPIC_CHAT_MODEL") or os.environ.get("CLAUDE_CHAT_MODEL") or "claude-sonnet-4-20250514"
-    anthropic_tools = [_mcp_tool_to_anthropic(t) for t in tools]
-    messages = [{"role": "user", "content": prompt}]
+    # Prompt caching: system prompt and tool definitions never change between rounds, and each round's
+    # prefix (everything up to its last message) is the next round's and next turn's prefix
+    caching = env_flag("CHAT_PROMPT_CACHE")
+    system = [{"type": "text", "text": system_prompt, "cache_control": _EPHEMERAL}] if caching else system_prompt
+    if caching and anthropic_tools:
+        anthropic_tools = [*anthropic_tools[:-1], {**anthropic_tools[-1], "cache_control": _EPHEMERAL}]
     round_count = 0
 
     while round_count < MAX_TOOL_ROUNDS:
         round_count += 1
-        resp = client.messages.create(
-            model=model,
-            max_tokens=2048,
-            system=system_prompt,
-            messages=messages,
-            tools=anthropic_tools if anthropic_tools else None,
-            tool_choice={"type": "auto"} if anthropic_tools else None,
-        )
-        content = resp.content or []
-        tool_uses = [b for b in content if getattr(b, "type", None) == "tool_use"]
+        params = {"model": model, "max_tokens": 2048, "system": system, "messages": _cache_breakpoint(messages) if caching else messages}
+        if anthropic_tools:
+            params["tools"] = anthropic_tools
+            params["tool_choice"] = {"type": "auto"}
+        with timing.span("llm", f"anthropic round {round_count}"):
+            resp = await _claude_round(client, params, emit, usage)
+        content = [_block_dict(b) for b in resp.content or []]
+        tool_uses = [b for b in content if b.get("type") == "tool_use"]
         if not tool_uses:
-            text = "".join(getattr(b, "text", "") or "" for b in content if getattr(b, "type", None) == "text").strip()
-            return {"reply": text or "(No reply)", "toolCalls": tool_call_results if tool_call_results else None}
+            text = "".join(b.get("text") or "" for b in content if b.get("type") == "text").strip()
+            return _finish(messages, text or "(No reply)", tool_call_results)
 
         messages.append({"role": "assistant", "content": content})
+        calls = [(tu.get("name") or "", tu.get("input") or {}) for tu in tool_uses]
         tool_results = []
-        for tu in tool_uses:
-            name = getattr(tu, "name", None) or ""
-            inp = getattr(tu, "input", None) or {}
-            tid = getattr(tu, "id", None) or ""
-            result = call_mcp_tool(mcp_url, name, inp, auth)
-            text = "".join(c.get("text", "") for c in (result.get("content") or []) if c.get("type") == "text").strip() or str(result)
+        for tu, (name, _), result in zip(tool_uses, calls, await _call_tools(mcp_url, calls, auth, emit)):
+            text = _tool_text(result)
             tool_call_results.append({"name": name, "result": text})
-            tool_results.append({"type": "tool_result", "tool_use_id": tid, "content": text})
+            tool_results.append({"type": "tool_result", "tool_use_id": tu.get("id") or "", "content": shape_tool_result(name, text)})
         messages.append({"role": "user", "content": tool_results})
 
-    return {"reply": "Reached maximum tool-call rounds. Try a simpler request.", "toolCalls": tool_call_results if tool_call_results else None}
+    return _finish(messages, "Reached maximum tool-call rounds. Try a simpler request.", tool_call_results)
+
 
+def _openai_message(content: str | None, tool_calls: list[dict]) -> dict:
+    message = {"role": "assistant", "content": content}
+    if tool_calls:
+        message["tool_calls"] = [
+            {"id": c["id"], "type": "function", "function": {"name": c["name"], "arguments": c["arguments"]}} for c in tool_calls
+        ]
+    return message
+
+
+async def _openai_round(client, kwargs: dict, emit: Emit | None, usage: dict) -> tuple:
+    """One Chat Completions call. Returns (assistant message for history, content, [{id, name, arguments}]),
+    or (None, None, []) when there is no choice. With emit, streamed and reassembled from deltas."""
+    start = time.perf_counter()
+    if emit is None:
+        resp = await client.chat.completions.create(**kwargs)
+        _record_round("openai", usage, start, _openai_tokens(getattr(resp, "usage", None)))
+        choice = resp.choices[0] if resp.choices else None
+        if not choice:
+            return None, None, []
+        msg = choice.message
+        tool_calls = [
+            {"id": tc.id, "name": (tc.function and tc.function.name) or "", "arguments": (tc.function and tc.function.arguments) or ""}
+            for tc in msg.tool_calls or []
+        ]
+        return _openai_message(msg.content, tool_calls), msg.content, tool_calls
+    # include_usage: token counts arrive in a final chunk with no choices
+    stream = await client.chat.completions.create(**kwargs, stream=True, stream_options={"include_usage": True})
+    parts: list[str] = []
+    acc: dict[int, dict] = {}
+    seen_choice = False
+    u = None
+    async for chunk in stream:
+        if getattr(chunk, "usage", None):
+            u = chunk.usage
+        if not chunk.choices:
+            continue
+        seen_choice = True
+        delta = chunk.choices[0].delta
+        if delta.content:
+            parts.append(delta.content)
+            await emit("delta", {"text": delta.content})
+        for tcd in delta.tool_calls or []:
+            call = acc.setdefault(tcd.index, {"id": "", "name": "", "arguments": ""})
+            if tcd.id:
+                call["id"] = tcd.id
+            if tcd.function:
+                call["name"] += tcd.function.name or ""
+                call["arguments"] += tcd.function.arguments or ""
+    _record_round("openai", usage, start, _openai_tokens(u))
+    if not seen_choice:
+        return None, None, []
+    content = "".join(parts) or None
+    tool_calls = [acc[i] for i in sorted(acc)]
+    return _openai_message(content, tool_calls), content, tool_calls
 
-def _run_openai(api_key: str, prompt: str, system_prompt: str, tools: list, mcp_url: str, auth: dict, tool_call_results: list) -> dict:
-    from openai import OpenAI
 
-    client = OpenAI(api_key=api_key)
+async def _run_openai(api_key: str, messages: list, system_prompt: str, openai_tools: list, mcp_url: str, auth: dict, tool_call_results: list, emit: Emit | None = None, usage: dict | None = None) -> dict:
+    """Tool loop on messages (history + the new user prompt, no system message), extended in place with this turn."""
+    client = _openai_client(api_key)
+    usage = usage if usage is not None else _new_usage()
     model = os.environ.get("OPENAI_CHAT_MODEL") or "gpt-4o-mini"
-    openai_tools = [_mcp_tool_to_openai(t) for t in tools]
-    messages = [{"role": "system", "content": system_prompt}, {"role": "user", "content": prompt}]
+    # OpenAI caches long identical prompt prefixes automatically; keeping system + tools first maximises hits
+    system = {"role": "system", "content": system_prompt}
     round_count = 0
 
     while round_count < MAX_TOOL_ROUNDS:
         round_count += 1
-        kwargs = {"model": model, "messages": messages, "max_tokens": 2048}
+        kwargs = {"model": model, "messages": [system, *messages], "max_tokens": 2048}
         if openai_tools:
             kwargs["tools"] = openai_tools
             kwargs["tool_choice"] = "auto"
-        resp = client.chat.completions.create(**kwargs)
-        choice = resp.choices[0] if resp.choices else None
-        if not choice:
-            return {"reply": "(No reply)", "toolCalls": tool_call_results if tool_call_results else None}
-        msg = choice.message
-        if msg.tool_calls:
+        with timing.span("llm", f"openai round {round_count}"):
+            msg, content, tool_calls = await _openai_round(client, kwargs, emit, usage)
+        if msg is None:
+            return _finish(messages, "(No reply)", tool_call_results)
+        if tool_calls:
             messages.append(msg)
-            for tc in msg.tool_calls:
-                name = (tc.function and tc.function.name) or ""
+            calls = []
+            for tc in tool_calls:
                 args = {}
-                if tc.function and tc.function.arguments:
-                    import json
+                if tc["arguments"]:
                     try:
-                        args = json.loads(tc.function.arguments)
+                        args = json.loads(tc["arguments"])
                     except Exception:
                         pass
-                result = call_mcp_tool(mcp_url, name, args, auth)
-                text = "".join(c.get("text", "") for c in (result.get("content") or []) if c.get("type") == "text").strip() or str(result)
+                calls.append((tc["name"], args))
+            for tc, (name, _), result in zip(tool_calls, calls, await _call_tools(mcp_url, calls, auth, emit)):
+                text = _tool_text(result)
                 tool_call_results.append({"name": name, "result": text})
-                messages.append({"role": "tool", "tool_call_id": tc.id, "content": text})
+                messages.append({"role": "tool", "tool_call_id": tc["id"], "content": shape_tool_result(name, text)})
             continue
-        reply = (msg.content or "").strip() or "(No reply)"
-        return {"reply": reply, "toolCalls": tool_call_results if tool_call_results else None}
+        return _finish(messages, (content or "").strip() or "(No reply)", tool_call_results)
 
-    return {"reply": "Reached maximum tool-call rounds. Try a simpler request.", "toolCalls": tool_call_results if tool_call_results else None}
+    return _finish(messages, "Reached maximum tool-call rounds. Try a simpler request.", tool_call_results)
@@ -0,0 +1,170 @@
+"""
+Agent directory helpers: read users and agent profiles out of Contact Center payloads
+and index them for O(1) lookups by normalized email and by profile name/id.
+Indexes are built once per fetched dataset (see lib.cache) and keep only the fields
+the tools need, not the raw export.
+"""
+
+
+def normalize_email(s: str) -> str:
+    """Strip, lower, and extract email from 'Name <email>' format."""
+    if not s or not isinstance(s, str):
+        return ""
+    s = s.strip().lower()
+    if "<" in s and ">" in s:
+        start = s.index("<") + 1
+        end = s.index(">")
+        s = s[start:end].strip()
+    return s
+
+
+def get_email_from_user(u: dict) -> str:
+    """Get email from user dict using any common field name."""
+    if not isinstance(u, dict):
+        return ""
+    # Prefer known email-like keys
+    for key in ("primaryEmail", "email", "userName", "emailAddress", "mail", "primaryEmailAddress", "userPrincipalName"):
+        val = u.get(key)
+        if val and isinstance(val, str) and "@" in val:
+            return normalize_email(val)
+    # Fallback: any string value that looks like an email
+    for key, val in u.items():
+        if isinstance(val, str) and "@" in val and "." in val and "email" in key.lower():
+            return normalize_email(val)
+    if u.get("id") and isinstance(u["id"], str) and "@" in u["id"]:
+        return normalize_email(u["id"])
+    return ""
+
+
+def get_profile_ref_from_user(u: dict):
+    """Agent profile name (or id) a user is assigned to, or None."""
+    return u.get("agentProfileName") or u.get("agentProfile") or u.get("profileName") or u.get("agentProfileId") or None
+
+
+def extract_user_list(data: dict | list | None) -> list:
+    """Extract list of user objects from API response (nested or flat)."""
+    if isinstance(data, list):
+        return data if data and all(isinstance(x, dict) for x in data) else []
+    if not isinstance(data, dict):
+        return []
+    # Direct keys that often hold the list
+    for key in ("data", "users", "userList", "result", "content", "items", "export", "userExport", "userDetails"):
+        val = data.get(key)
+        if isinstance(val, list) and val and isinstance(val[0], dict):
+            return val
+    # Any value that is a list of dicts (catch arbitrary key names)
+    for val in data.values():
+        if isinstance(val, list) and val and isinstance(val[0], dict):
+            return val
+    # One level deeper: data.users, etc.
+    for key in ("data", "body", "result"):
+        inner = data.get(key)
+        if isinstance(inner, dict):
+            found = extract_user_list(inner)
+            if found:
+                return found
+    return []
+
+
+def extract_profile_list(data: dict | list | None) -> list:
+    """Extract list of agent profiles from GET v2/agent-profile response."""
+    if isinstance(data, list):
+        profiles = data
+    elif isinstance(data, dict):
+        profiles = data.get("data") or data.get("agentProfiles") or data.get("result") or []
+    else:
+        profiles = []
+    return profiles if isinstance(profiles, list) else []
+
+
+class UserRecord:
+    __slots__ = ("email", "id", "profile_ref")
+
+    def __init__(self, email: str, id: str | None, profile_ref):
+        self.email = email
+        self.id = id
+        self.profile_ref = profile_ref
+
+
+class ProfileRecord:
+    __slots__ = ("id", "name", "outdial_enabled")
+
+    def __init__(self, id: str, name: str, outdial_enabled: bool):
+        self.id = id
+        self.name = name
+        self.outdial_enabled = outdial_enabled
+
+
+class UserIndex:
+    """Normalized email -> UserRecord. The first user with a given email wins, as with a linear scan."""
+
+    __slots__ = ("by_email", "rows")
+
+    def __init__(self):
+        self.by_email: dict[str, UserRecord] = {}
+        self.rows = 0
+
+    def add(self, u: dict) -> None:
+        if not isinstance(u, dict):
+            return
+        self.rows += 1
+        email = get_email_from_user(u)
+        if email and email not in self.by_email:
+            uid = u.get("id")
+            self.by_email[email] = UserRecord(email, uid if isinstance(uid, str) else None, get_profile_ref_from_user(u))
+
+    def get(self, email: str) -> UserRecord | None:
+        return self.by_email.get(normalize_email(email))
+
+    def records(self):
+        return iter(self.by_email.values())
+
+    def __len__(self) -> int:
+        return len(self.by_email)
+
+    @classmethod
+    def from_users(cls, users) -> "UserIndex":
+        index = cls()
+        for u in users:
+            index.add(u)
+        return index
+
+    @classmethod
+    def from_payload(cls, data) -> "UserIndex":
+        return cls.from_users(extract_user_list(data))
+
+
+class ProfileIndex:
+    """Profile name or id -> ProfileRecord. The first profile matching a key wins, as with a linear scan."""
+
+    __slots__ = ("by_key", "profiles")
+
+    def __init__(self):
+        self.by_key: dict[str, ProfileRecord] = {}
+        self.profiles: list[ProfileRecord] = []
+
+    def add(self, p: dict) -> None:
+        if not isinstance(p, dict):
+            return
+        name = (p.get("name") or p.get("agentProfileName") or "").strip()
+        pid = (p.get("id") or p.get("agentProfileId") or "").strip()
+        record = ProfileRecord(pid, name, p.get("outdialEnabled", False) is True)
+        self.profiles.append(record)
+        # A profile matches on name or id; earlier profiles take precedence for either key
+        if name:
+            self.by_key.setdefault(name, record)
+        if pid:
+            self.by_key.setdefault(pid, record)
+
+    def get(self, ref) -> ProfileRecord | None:
+        return self.by_key.get(ref) if isinstance(ref, str) else None
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    @classmethod
+    def from_payload(cls, data) -> "ProfileIndex":
+        index = cls()
+        for p in extract_profile_list(data):
+            index.add(p)
+        return index
@@ -0,0 +1,49 @@
+"""
+JSON encoding for tool results, MCP/chat responses and the MCP client: orjson when it is installed (several
+times faster on large results), else the stdlib encoder, both compact. MCP_PRETTY_JSON=1 indents tool
+result text for reading by hand. JSONBytesResponse renders a payload with one encoder pass, skipping
+FastAPI's jsonable_encoder walk over the whole result.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from lib.api import env_flag
+
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson
+    orjson = None
+
+_PRETTY = env_flag("MCP_PRETTY_JSON", False)
+
+
+def dumps_bytes(value: Any, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0))
+        except TypeError:
+            pass  # e.g. an int over 64 bits: the stdlib encoder handles it
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode()
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def dumps(value: Any, pretty: bool = False) -> str:
+    return dumps_bytes(value, pretty).decode()
+
+
+def tool_text(value: Any) -> str:
+    """Text of a tool result (compact unless MCP_PRETTY_JSON)."""
+    return dumps(value, _PRETTY)
+
+
+def loads(data: str | bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+class JSONBytesResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
@@ -1,11 +1,27 @@
 """
-Minimal MCP client: send JSON-RPC to an MCP server over HTTP.
+Minimal async MCP client: send JSON-RPC to an MCP server over HTTP (shared pooled client from lib.api).
+When the URL points at this server (see set_local_server and is_local_url), requests are dispatched
+in-process instead of looping back over HTTP; remote MCP URLs always go over HTTP.
 """
 
-import httpx
+import asyncio
+import time
+from typing import Callable
+from urllib.parse import urlsplit
+
+from lib import metrics, timing
+from lib.api import env_flag, env_float, init_client
+from lib.jsonio import dumps_bytes, loads
 
 _request_id = 0
 
+_LOCAL_HOSTS = frozenset(("localhost", "127.0.0.1", "0.0.0.0", "::1", "[::1]"))
+# dispatch(body) coroutine function and port of this server
+_local = {"dispatch": None, "port": None}
+
+# Tool catalog per MCP URL: { tools, expires_at, converted: { provider: [provider-specific tool schemas] } }
+_catalogs: dict[str, dict] = {}
+
 
 def _next_id() -> int:
     global _request_id
@@ -13,36 +29,95 @@ def _next_id() -> int:
     return _request_id
 
 
-def mcp_request(mcp_url: str, method: str, params: dict | None = None) -> dict:
+def set_local_server(dispatch, port: int | None = None) -> None:
+    """Register this process's MCP handler (async dispatch(body) -> response | None) for the local transport."""
+    _local.update(dispatch=dispatch, port=port)
+
+
+def local_mcp_url() -> str:
+    """This server's /mcp endpoint as is_local_url recognizes it without an origin."""
+    return f"http://localhost:{_local['port']}/mcp"
+
+
+def is_local_url(mcp_url: str, origin: str | None = None) -> bool:
+    """True if mcp_url is this server's /mcp endpoint and the local transport is enabled. origin is the
+    host[:port] of the request being served (e.g. the public App Runner host); it only counts for that request."""
+    if _local["dispatch"] is None or not env_flag("MCP_LOCAL_DISPATCH"):
+        return False
+    try:
+        parts = urlsplit(mcp_url)
+        port = parts.port
+    except ValueError:
+        return False
+    if parts.path.rstrip("/") != "/mcp":
+        return False
+    if origin and parts.netloc.lower() == origin.lower():
+        return True
+    return (parts.hostname or "").lower() in _LOCAL_HOSTS and port == _local["port"]
+
+
+async def mcp_request(mcp_url: str, method: str, params: dict | None = None, timeout: float = 30.0) -> dict:
     """Send one JSON-RPC request to the MCP server. Returns { result? } or { error? }."""
     params = params or {}
     body = {"jsonrpc": "2.0", "id": _next_id(), "method": method, "params": params}
     try:
-        with httpx.Client(timeout=30.0) as client:
-            resp = client.post(mcp_url, json=body, headers={"Content-Type": "application/json"})
-        if not resp.is_success:
-            return {"error": {"code": -32603, "message": f"HTTP {resp.status_code}: {resp.text}"}}
-        data = resp.json()
+        if is_local_url(mcp_url):
+            try:
+                data = await asyncio.wait_for(_local["dispatch"](body), timeout) or {}
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"MCP request timed out after {timeout:g}s") from None
+        else:
+            client = await init_client()
+            resp = await client.post(mcp_url, content=dumps_bytes(body), headers={"Content-Type": "application/json"}, timeout=timeout)
+            if not resp.is_success:
+                return {"error": {"code": -32603, "message": f"HTTP {resp.status_code}: {resp.text}"}}
+            data = loads(resp.content)
         if data.get("error"):
             return {"error": data["error"]}
         return {"result": data.get("result")}
     except Exception as e:
-        return {"error": {"code": -32603, "message": str(e)}}
+        return {"error": {"code": -32603, "message": str(e) or type(e).__name__}}
 
 
-def get_mcp_tools(mcp_url: str) -> dict:
+async def get_mcp_tools(mcp_url: str) -> dict:
     """Initialize and return list of tools from the MCP server. Returns { tools: [...] }."""
-    init = mcp_request(mcp_url, "initialize", {"protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "webex-mcp-chat", "version": "1.0.0"}})
+    init = await mcp_request(mcp_url, "initialize", {"protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "webex-mcp-chat", "version": "1.0.0"}})
     if init.get("error"):
         raise RuntimeError(init["error"].get("message") or "MCP initialize failed")
-    list_resp = mcp_request(mcp_url, "tools/list", {})
+    list_resp = await mcp_request(mcp_url, "tools/list", {})
     if list_resp.get("error"):
         raise RuntimeError(list_resp["error"].get("message") or "MCP tools/list failed")
     result = list_resp.get("result") or {}
     return {"tools": result.get("tools") or []}
 
 
-def call_mcp_tool(mcp_url: str, name: str, args: dict | None = None, auth: dict | None = None) -> dict:
+async def get_tool_catalog(mcp_url: str, provider: str, convert: Callable[[dict], dict]) -> list:
+    """Provider-specific tool schemas for mcp_url, cached per URL for MCP_TOOL_CATALOG_TTL seconds (default 300,
+    0 disables). A cache hit costs no MCP round-trips; convert(tool) runs once per provider per catalog."""
+    ttl = env_float("MCP_TOOL_CATALOG_TTL", 300.0)
+    key = mcp_url.rstrip("/")
+    now = time.monotonic()
+    catalog = _catalogs.get(key)
+    if catalog is None or ttl <= 0 or now >= catalog["expires_at"]:
+        tools = (await get_mcp_tools(mcp_url)).get("tools") or []
+        catalog = {"tools": tools, "expires_at": now + ttl, "converted": {}}
+        if ttl > 0:
+            _catalogs[key] = catalog
+    converted = catalog["converted"].get(provider)
+    if converted is None:
+        converted = catalog["converted"][provider] = [convert(t) for t in catalog["tools"]]
+    return converted
+
+
+def invalidate_tool_catalog(mcp_url: str | None = None) -> None:
+    """Drop the cached tool catalog for one MCP URL, or for all URLs."""
+    if mcp_url is None:
+        _catalogs.clear()
+    else:
+        _catalogs.pop(mcp_url.rstrip("/"), None)
+
+
+async def call_mcp_tool(mcp_url: str, name: str, args: dict | None = None, auth: dict | None = None, timeout: float = 30.0) -> dict:
     """Call a tool on the MCP server. auth can contain accessToken and orgId (injected as __accessToken, __orgId)."""
     args = dict(args or {})
     auth = auth or {}
@@ -50,7 +125,11 @@ def call_mcp_tool(mcp_url: str, name: str, args: dict | None = None, auth: dict
         args["__accessToken"] = auth["accessToken"]
     if auth.get("orgId"):
         args["__orgId"] = auth["orgId"]
-    res = mcp_request(mcp_url, "tools/call", {"name": name, "arguments": args})
+    transport = "local" if is_local_url(mcp_url) else "http"
+    start = time.perf_counter()
+    with timing.span("mcp", f"{name} ({transport})"):
+        res = await mcp_request(mcp_url, "tools/call", {"name": name, "arguments": args}, timeout)
+    metrics.MCP_CLIENT_LATENCY.observe(time.perf_counter() - start, metrics.tool_label(name), transport)
     if res.get("error"):
         return {"content": [{"type": "text", "text": f"Error: {res['error'].get('message', '')}"}], "isError": True}
     return res.get("result") or {"content": [], "isError": False}
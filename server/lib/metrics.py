@@ -0,0 +1,199 @@
+"""
+Minimal in-process metrics (counters, gauges, histograms with labels) rendered in the Prometheus
+text exposition format by GET /metrics. No dependency on prometheus_client; updates are plain dict
+and list operations on the event loop thread, so instrumenting the hot path costs well under a microsecond.
+"""
+
+import re
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Seconds; covers in-process tool calls (sub-ms) up to slow bulk exports and LLM rounds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+ROUND_BUCKETS = (1, 2, 3, 4, 5, 6)
+TOKEN_BUCKETS = (100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        super().__init__(name, help, labels)
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        return self.header() + [f"{self.name}{_labels(self.label_names, k)} {v:g}" for k, v in self.values.items()]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels, amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) - amount
+
+    def set(self, *labels, value: float) -> None:
+        self.values[labels] = value
+
+    @contextmanager
+    def track(self, *labels):
+        """Count the body as in flight."""
+        self.inc(*labels)
+        try:
+            yield
+        finally:
+            self.dec(*labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last = +Inf), sum, count]
+        self.values: dict[tuple, list] = {}
+
+    def observe(self, value: float, *labels) -> None:
+        series = self.values.get(labels)
+        if series is None:
+            series = self.values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    @contextmanager
+    def time(self, *labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for labels, (counts, total, count) in self.values.items():
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound:g}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {total:g}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: list[_Metric] = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for m in self.metrics:
+            lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# MCP tools (handle_tool_call)
+TOOL_LATENCY = REGISTRY.register(Histogram("mcp_tool_duration_seconds", "MCP tool call latency.", ("tool",)))
+TOOL_CALLS = REGISTRY.register(Counter("mcp_tool_calls_total", "MCP tool calls by outcome.", ("tool", "outcome")))
+TOOLS_IN_FLIGHT = REGISTRY.register(Gauge("mcp_tools_in_flight", "MCP tool calls currently running."))
+
+# Contact Center REST (cc_rest / cc_stream)
+UPSTREAM_LATENCY = REGISTRY.register(Histogram("cc_upstream_duration_seconds", "Contact Center API latency by path template.", ("method", "path")))
+UPSTREAM_RESPONSES = REGISTRY.register(Counter("cc_upstream_responses_total", "Contact Center API responses by status code (0 = transport error).", ("method", "path", "status")))
+UPSTREAM_IN_FLIGHT = REGISTRY.register(Gauge("cc_upstream_in_flight", "Contact Center API requests currently open."))
+UPSTREAM_HEDGES = REGISTRY.register(Counter("cc_upstream_hedges_total", "Hedged (duplicate) GETs sent after the latency percentile.", ("path",)))
+BREAKER_STATE = REGISTRY.register(Gauge("cc_breaker_state", "Circuit breaker state per upstream endpoint family (0 closed, 1 half-open, 2 open).", ("key",)))
+BREAKER_TRANSITIONS = REGISTRY.register(Counter("cc_breaker_transitions_total", "Circuit breaker state changes.", ("key", "state")))
+UPSTREAM_RETRIES = REGISTRY.register(Counter("cc_upstream_retries_total", "Contact Center API requests retried, by the status that caused the retry.", ("method", "path", "status")))
+
+# Background refresh of org datasets (lib.refresh)
+REFRESH_RUNS = REGISTRY.register(Counter("cc_refresh_total", "Background dataset refreshes by outcome.", ("dataset", "outcome")))
+REFRESH_LAG = REGISTRY.register(Histogram("cc_refresh_lag_seconds", "How long after its cache entry expired a background refresh finished (0 = ahead of expiry).", ("dataset",)))
+REFRESH_HOT_KEYS = REGISTRY.register(Gauge("cc_refresh_hot_keys", "Org datasets tracked as hot."))
+
+# Chat client side (call_mcp_tool) and LLM rounds
+MCP_CLIENT_LATENCY = REGISTRY.register(Histogram("chat_mcp_call_duration_seconds", "call_mcp_tool latency from the chat loop.", ("tool", "transport")))
+LLM_LATENCY = REGISTRY.register(Histogram("chat_llm_round_duration_seconds", "Latency of one LLM call (messages.create / chat.completions.create).", ("provider",)))
+LLM_ROUNDS = REGISTRY.register(Counter("chat_llm_rounds_total", "LLM calls made by the chat loop.", ("provider",)))
+LLM_TOKENS = REGISTRY.register(Counter("chat_llm_tokens_total", "LLM tokens used.", ("provider", "type")))
+CHAT_ROUNDS = REGISTRY.register(Histogram("chat_rounds_per_chat", "LLM rounds per chat.", ("provider",), ROUND_BUCKETS))
+CHAT_TOKENS = REGISTRY.register(Histogram("chat_tokens_per_chat", "LLM tokens per chat.", ("provider", "type"), TOKEN_BUCKETS))
+CHAT_LATENCY = REGISTRY.register(Histogram("chat_duration_seconds", "End-to-end chat latency.", ("provider", "outcome")))
+CHATS_IN_FLIGHT = REGISTRY.register(Gauge("chat_in_flight", "Chats currently running."))
+
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[0-9a-fA-F-]{8,}$|^\d+$")
+# Segment after these names is an identifier: organization/{orgId}, tasks/{taskID}, ...
+_NAMED_IDS = {"organization": "{orgId}", "tasks": "{taskID}", "address-book": "{id}", "agent-profile": "{id}", "user": "{id}"}
+_KNOWN_LEAVES = {"bulk-export", "end", "entry", "entries"}
+
+
+@lru_cache(maxsize=1024)
+def path_template(path: str) -> str:
+    """'organization/abc-123/user/bulk-export?x=1' -> 'organization/{orgId}/user/bulk-export' (bounded label cardinality)."""
+    path = path.split("?", 1)[0]
+    if "://" in path:
+        path = path.split("://", 1)[1].partition("/")[2]
+    out = []
+    prev = ""
+    for seg in path.strip("/").split("/"):
+        if prev in _NAMED_IDS and seg not in _KNOWN_LEAVES:
+            out.append(_NAMED_IDS[prev])
+        elif _ID_SEGMENT.match(seg):
+            out.append("{id}")
+        else:
+            out.append(seg)
+        prev = seg
+    return "/".join(out)
+
+
+_tool_names: frozenset = frozenset()
+
+
+def register_tools(names) -> None:
+    """Tool names that get their own label; set once by the server from its tool catalog."""
+    global _tool_names
+    _tool_names = frozenset(names)
+
+
+def tool_label(name) -> str:
+    """Tool name as a label: names the server does not define share "unknown" (bounded label cardinality)."""
+    return name if name in _tool_names else "unknown"
+
+
+def render() -> str:
+    return REGISTRY.render()
@@ -0,0 +1,257 @@
+"""
+On-disk mirror of org agent directories in SQLite (WAL), shared by every worker on the instance: users
+(normalized email -> id, agent profile reference) and agent profiles (name or id -> outdialEnabled), per
+(orgId, token scope) like lib.cache. Each full download of a dataset is synced into it in the background
+(changed rows upserted, vanished rows deleted, validators kept). A worker whose in-process cache has no entry
+yet (after a deploy, restart or scale-out) answers lookups with indexed queries on the mirror instead of
+downloading the export again, and later revalidates it with the mirrored ETag.
+CC_MIRROR_PATH (default <tmp>/webex-cc-mirror.db, empty disables), CC_MIRROR_MAX_AGE (seconds a mirrored
+dataset may be served without downloading it, default 3600). Datasets older than that, e.g. of access tokens
+no longer in use, are deleted on the next sync.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from lib.api import env_float
+from lib.directory import ProfileIndex, ProfileRecord, UserIndex, UserRecord, normalize_email
+
+log = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    org TEXT NOT NULL, scope TEXT NOT NULL, dataset TEXT NOT NULL,
+    etag TEXT, last_modified TEXT, synced_at REAL NOT NULL, rows INTEGER NOT NULL,
+    PRIMARY KEY (org, scope, dataset)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS users (
+    org TEXT NOT NULL, scope TEXT NOT NULL, email TEXT NOT NULL, id TEXT, profile_ref,
+    PRIMARY KEY (org, scope, email)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS users_profile ON users (org, scope, profile_ref);
+CREATE TABLE IF NOT EXISTS profiles (
+    org TEXT NOT NULL, scope TEXT NOT NULL, key TEXT NOT NULL, id TEXT, name TEXT, outdial_enabled INTEGER NOT NULL,
+    PRIMARY KEY (org, scope, key)
+) WITHOUT ROWID;
+"""
+
+# dataset -> (table, key column, value columns)
+_TABLES = {
+    "users": ("users", "email", ("id", "profile_ref")),
+    "profiles": ("profiles", "key", ("id", "name", "outdial_enabled")),
+}
+
+
+def _rows(dataset: str, index) -> dict[str, tuple]:
+    """Mirror rows of an in-memory index: key -> value columns."""
+    if dataset == "users":
+        return {email: (u.id, u.profile_ref) for email, u in index.by_email.items()}
+    return {key: (p.id, p.name, int(p.outdial_enabled)) for key, p in index.by_key.items()}
+
+
+class MirrorUsers:
+    """UserIndex-compatible view of a mirrored user directory (lookups are indexed queries)."""
+
+    __slots__ = ("_mirror", "_where", "rows")
+
+    def __init__(self, mirror: "DirectoryMirror", org: str, scope: str, rows: int):
+        self._mirror = mirror
+        self._where = (org, scope)
+        self.rows = rows
+
+    def get(self, email: str) -> UserRecord | None:
+        key = normalize_email(email)
+        row = self._mirror._query("SELECT id, profile_ref FROM users WHERE org = ? AND scope = ? AND email = ?", (*self._where, key))
+        return UserRecord(key, row[0], row[1]) if row else None
+
+    def records(self):
+        rows = self._mirror._scan("SELECT email, id, profile_ref FROM users WHERE org = ? AND scope = ?", self._where)
+        return (UserRecord(email, uid, ref) for email, uid, ref in rows)
+
+    def __len__(self) -> int:
+        row = self._mirror._query("SELECT COUNT(*) FROM users WHERE org = ? AND scope = ?", self._where)
+        return row[0] if row else 0
+
+
+class MirrorProfiles:
+    """ProfileIndex-compatible view of mirrored agent profiles."""
+
+    __slots__ = ("_mirror", "_where", "rows")
+
+    def __init__(self, mirror: "DirectoryMirror", org: str, scope: str, rows: int):
+        self._mirror = mirror
+        self._where = (org, scope)
+        self.rows = rows
+
+    def get(self, ref) -> ProfileRecord | None:
+        if not isinstance(ref, str):
+            return None
+        row = self._mirror._query("SELECT id, name, outdial_enabled FROM profiles WHERE org = ? AND scope = ? AND key = ?", (*self._where, ref))
+        return ProfileRecord(row[0], row[1], bool(row[2])) if row else None
+
+    def __len__(self) -> int:
+        return self.rows
+
+
+_VIEWS = {"users": MirrorUsers, "profiles": MirrorProfiles}
+
+
+class DirectoryMirror:
+    """Reads run on the event loop (point queries on a reader connection); syncs run in a thread on a
+    writer connection, one at a time per worker, and other workers wait on SQLite's busy timeout."""
+
+    def __init__(self, path: str | None = None, max_age: float | None = None):
+        if path is None:
+            path = os.environ.get("CC_MIRROR_PATH", os.path.join(tempfile.gettempdir(), "webex-cc-mirror.db"))
+        self.path = path.strip()
+        self.max_age = env_float("CC_MIRROR_MAX_AGE", 3600.0) if max_age is None else max_age
+        self._reader: sqlite3.Connection | None = None
+        self._writer: sqlite3.Connection | None = None
+        # The schema exists in the file at path (created by open() or the first sync, in a thread)
+        self._ready = False
+        self._lock = threading.Lock()
+        self._tasks: set[asyncio.Task] = set()
+        self.counters = {"hits": 0, "stale": 0, "syncs": 0, "upserted": 0, "deleted": 0, "pruned": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and self.max_age > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+
+    def _open_writer(self) -> sqlite3.Connection:
+        """Writer connection, creating the schema on first use. Called in a thread, under _lock."""
+        if self._writer is None:
+            conn = self._connect()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._writer = conn
+            self._ready = True
+        return self._writer
+
+    def _open(self) -> None:
+        with self._lock:
+            self._open_writer()
+
+    async def open(self) -> None:
+        """Create the schema off the event loop (at startup), so load() can answer from an existing mirror."""
+        if not self.enabled:
+            return
+        try:
+            await asyncio.to_thread(self._open)
+        except sqlite3.Error as e:
+            self.counters["errors"] += 1
+            log.warning("mirror %s: %s", self.path, e)
+
+    def _query(self, sql: str, params: tuple) -> tuple | None:
+        return self._scan(sql, params).fetchone()
+
+    def _scan(self, sql: str, params: tuple) -> sqlite3.Cursor:
+        if self._reader is None:
+            self._reader = self._connect()
+        return self._reader.execute(sql, params)
+
+    def load(self, dataset: str, org: str, scope: str) -> dict | None:
+        """cc_rest-style result whose data is a view of the mirrored dataset, or None when it is
+        missing, older than CC_MIRROR_MAX_AGE or the mirror is unusable."""
+        if not self.enabled or dataset not in _TABLES or not self._ready:
+            return None
+        try:
+            meta = self._query(
+                "SELECT etag, last_modified, synced_at, rows FROM datasets WHERE org = ? AND scope = ? AND dataset = ?",
+                (org, scope, dataset),
+            )
+        except sqlite3.Error as e:
+            self.counters["errors"] += 1
+            log.warning("mirror %s: %s", self.path, e)
+            return None
+        if meta is None:
+            return None
+        etag, last_modified, synced_at, rows = meta
+        if time.time() - synced_at > self.max_age:
+            self.counters["stale"] += 1
+            return None
+        self.counters["hits"] += 1
+        return {"ok": True, "data": _VIEWS[dataset](self, org, scope, rows), "etag": etag, "lastModified": last_modified, "mirror": True}
+
+    def _sync(self, dataset: str, org: str, scope: str, index, etag: str | None, last_modified: str | None) -> None:
+        table, key_col, value_cols = _TABLES[dataset]
+        rows = _rows(dataset, index)
+        cols = ", ".join((key_col, *value_cols))
+        marks = ", ".join("?" * (len(value_cols) + 3))
+        with self._lock, self._open_writer() as conn:
+            existing = {r[0]: r[1:] for r in conn.execute(f"SELECT {cols} FROM {table} WHERE org = ? AND scope = ?", (org, scope))}
+            changed = [(org, scope, key, *values) for key, values in rows.items() if existing.get(key) != values]
+            removed = [(org, scope, key) for key in existing.keys() - rows.keys()]
+            conn.executemany(f"INSERT OR REPLACE INTO {table} (org, scope, {cols}) VALUES ({marks})", changed)
+            conn.executemany(f"DELETE FROM {table} WHERE org = ? AND scope = ? AND {key_col} = ?", removed)
+            conn.execute(
+                "INSERT OR REPLACE INTO datasets VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (org, scope, dataset, etag, last_modified, time.time(), getattr(index, "rows", len(index))),
+            )
+            pruned = self._prune(conn, (org, scope, dataset))
+        self.counters["syncs"] += 1
+        self.counters["upserted"] += len(changed)
+        self.counters["deleted"] += len(removed)
+        self.counters["pruned"] += pruned
+
+    def _prune(self, conn: sqlite3.Connection, keep: tuple) -> int:
+        """Delete datasets other than keep older than max_age (load never serves them), e.g. of token scopes no
+        longer in use."""
+        stale = conn.execute("SELECT org, scope, dataset FROM datasets WHERE synced_at < ?", (time.time() - self.max_age,)).fetchall()
+        stale = [row for row in stale if row != keep]
+        for org, scope, dataset in stale:
+            conn.execute(f"DELETE FROM {_TABLES[dataset][0]} WHERE org = ? AND scope = ?", (org, scope))
+            conn.execute("DELETE FROM datasets WHERE org = ? AND scope = ? AND dataset = ?", (org, scope, dataset))
+        return len(stale)
+
+    def _touch(self, dataset: str, org: str, scope: str) -> None:
+        with self._lock, self._open_writer() as conn:
+            conn.execute("UPDATE datasets SET synced_at = ? WHERE org = ? AND scope = ? AND dataset = ?", (time.time(), org, scope, dataset))
+
+    def _background(self, func, dataset: str, *args) -> None:
+        if not self.enabled or dataset not in _TABLES:
+            return
+        task = asyncio.get_running_loop().create_task(asyncio.to_thread(func, dataset, *args))
+        self._tasks.add(task)
+        task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.counters["errors"] += 1
+            log.warning("mirror %s: %s", self.path, task.exception())
+
+    def sync(self, dataset: str, org: str, scope: str, index: UserIndex | ProfileIndex, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Mirror a full, freshly downloaded dataset (in the background)."""
+        self._background(self._sync, dataset, org, scope, index, etag, last_modified)
+
+    def touch(self, dataset: str, org: str, scope: str) -> None:
+        """Record that the mirrored dataset was revalidated upstream (304)."""
+        self._background(self._touch, dataset, org, scope)
+
+    async def drain(self) -> None:
+        """Wait for pending syncs."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def close(self) -> None:
+        await self.drain()
+        for conn in (self._reader, self._writer):
+            if conn is not None:
+                conn.close()
+        self._reader = self._writer = None
+
+    def stats(self) -> dict:
+        return {**self.counters, "path": self.path or None, "pending": len(self._tasks), "maxAge": self.max_age}
+
+
+# Shared mirror of org datasets (see main._get_org_dataset)
+mirror = DirectoryMirror()
@@ -0,0 +1,133 @@
+"""
+Per-org upstream scheduling for Contact Center calls: a token bucket (steady rate + burst), a cap on
+concurrent requests, and a shared pause when the API answers 429 with Retry-After. Also the retry policy
+used by cc_rest / cc_stream (Retry-After, else jittered exponential backoff).
+"""
+
+import asyncio
+import contextlib
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+RETRY_STATUSES = frozenset((429, 502, 503, 504))
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated", "paused_until")
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for seconds (server said Retry-After) and drop the burst allowance."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+    def reserve(self) -> float:
+        """Take one token; returns how long the caller must wait before sending (0 = now)."""
+        now = time.monotonic()
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        wait = max(0.0, self.paused_until - now)
+        if self.rate <= 0:
+            return wait
+        # Tokens may go negative: later callers queue behind earlier reservations
+        self.tokens -= 1
+        if self.tokens < 0:
+            wait = max(wait, -self.tokens / self.rate)
+        return wait
+
+
+class OrgLimiter:
+    __slots__ = ("bucket", "slots", "waited", "throttled")
+
+    def __init__(self, limits: dict):
+        self.bucket = TokenBucket(limits["rps"], limits["burst"])
+        cap = limits["max_concurrency"]
+        self.slots = asyncio.Semaphore(cap) if cap > 0 else None
+        self.waited = 0.0
+        self.throttled = 0
+
+
+class UpstreamScheduler:
+    """One OrgLimiter per org ID, created on first use."""
+
+    def __init__(self):
+        self._orgs: dict[str, OrgLimiter] = {}
+
+    def limiter(self, org_id: str, limits: dict) -> OrgLimiter:
+        """org_id's limiter; limits (see lib.api.get_rate_limits) apply when it is first created."""
+        limiter = self._orgs.get(org_id)
+        if limiter is None:
+            limiter = self._orgs[org_id] = OrgLimiter(limits)
+        return limiter
+
+    @contextlib.asynccontextmanager
+    async def slot(self, org_id: str, limits: dict):
+        """Wait for a concurrency slot and a token of org_id's bucket, then run the body (one upstream request)."""
+        limiter = self.limiter(org_id, limits)
+        async with contextlib.AsyncExitStack() as stack:
+            if limiter.slots is not None:
+                await stack.enter_async_context(limiter.slots)
+            wait = limiter.bucket.reserve()
+            while wait > 0:
+                limiter.waited += wait
+                await asyncio.sleep(wait)
+                # A 429 may have paused the org while this request was waiting for its token
+                wait = limiter.bucket.paused_until - time.monotonic()
+            yield
+
+    def throttled(self, org_id: str, retry_after: float | None, limits: dict) -> None:
+        """Record a 429 for org_id; with Retry-After, every request of that org waits it out."""
+        limiter = self.limiter(org_id, limits)
+        limiter.throttled += 1
+        if retry_after:
+            limiter.bucket.pause(retry_after)
+
+    def stats(self) -> dict:
+        return {
+            org or "(default)": {"throttled": lim.throttled, "waitedSeconds": round(lim.waited, 3)}
+            for org, lim in self._orgs.items()
+        }
+
+    def reset(self) -> None:
+        self._orgs.clear()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After as seconds (delta-seconds or HTTP-date), or None if absent/invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def retry_delay(method: str, status: int, retry_after: float | None, attempt: int, limits: dict) -> float | None:
+    """Seconds to wait before retrying, or None to give up. 429 is retried for any method (the request was
+    rejected, not processed); 502/503/504 only for idempotent methods. Retry-After wins over backoff;
+    a Retry-After beyond CC_RETRY_MAX_DELAY is not waited for."""
+    if status not in RETRY_STATUSES or attempt >= limits["max_retries"]:
+        return None
+    if status != 429 and method not in IDEMPOTENT_METHODS:
+        return None
+    if retry_after is not None:
+        return retry_after if retry_after <= limits["max_delay"] else None
+    # Full jitter: uniform(0, min(cap, base * 2^attempt))
+    return random.uniform(0, min(limits["max_delay"], limits["base_delay"] * 2 ** attempt))
+
+
+scheduler = UpstreamScheduler()
@@ -0,0 +1,162 @@
+"""
+Background refresh of hot org datasets (user bulk-export, agent profiles, address books), so busy orgs never
+wait on an expired cache entry. _get_org_dataset reports every lookup with track(); a key used at least
+CC_REFRESH_HOT_HITS times (default 2) is hot until it goes unused for CC_REFRESH_IDLE seconds (900).
+Every CC_REFRESH_INTERVAL seconds (5) the scheduler starts refreshes of hot keys due within CC_REFRESH_AHEAD
+seconds (60) of expiry, plus a random 0..CC_REFRESH_JITTER seconds (15) so keys do not refresh in lockstep,
+at most CC_REFRESH_CONCURRENCY (4, 0 disables) at a time. Failed refreshes back off exponentially; the cache
+keeps serving the old copy meanwhile (CC_CACHE_STALE).
+"""
+
+import asyncio
+import logging
+import random
+import time
+
+from lib import metrics
+from lib.api import env_float, env_int
+from lib.cache import DatasetCache, Fetcher, org_datasets
+
+log = logging.getLogger(__name__)
+
+
+class HotKey:
+    __slots__ = ("key", "fetch", "cache", "hits", "last_seen", "jitter", "retry_at", "failures", "refreshes", "lag", "task")
+
+    def __init__(self, key: tuple, fetch: Fetcher, cache: DatasetCache, jitter: float):
+        self.key = key
+        self.fetch = fetch
+        self.cache = cache
+        self.hits = 0
+        self.last_seen = time.monotonic()
+        self.jitter = jitter
+        self.retry_at = 0.0
+        self.failures = 0  # consecutive
+        self.refreshes = 0
+        self.lag: float | None = None  # seconds after expiry the last refresh finished (negative = ahead)
+        self.task: asyncio.Task | None = None
+
+
+class RefreshScheduler:
+    def __init__(self, cache: DatasetCache):
+        self.cache = cache
+        self.keys: dict[tuple, HotKey] = {}
+        self.counters = {"refreshed": 0, "failed": 0, "late": 0}
+        self._task: asyncio.Task | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._config()
+
+    def _config(self) -> None:
+        self.hot_hits = max(1, env_int("CC_REFRESH_HOT_HITS", 2))
+        self.idle = env_float("CC_REFRESH_IDLE", 900.0)
+        self.interval = max(0.05, env_float("CC_REFRESH_INTERVAL", 5.0))
+        self.ahead = env_float("CC_REFRESH_AHEAD", 60.0)
+        self.jitter = env_float("CC_REFRESH_JITTER", 15.0)
+        self.concurrency = env_int("CC_REFRESH_CONCURRENCY", 4)
+
+    @property
+    def enabled(self) -> bool:
+        return self.concurrency > 0 and self.cache.enabled
+
+    def track(self, key: tuple, fetch: Fetcher, cache: DatasetCache | None = None) -> None:
+        """Note a lookup of key (in cache, default the scheduler's); fetch is the latest way to refresh it (it
+        carries the caller's credentials)."""
+        if not self.enabled:
+            return
+        hot = self.keys.get(key)
+        if hot is None:
+            hot = self.keys[key] = HotKey(key, fetch, cache or self.cache, random.uniform(0, self.jitter))
+            metrics.REFRESH_HOT_KEYS.set(value=len(self.keys))
+        hot.fetch = fetch
+        hot.hits += 1
+        hot.last_seen = time.monotonic()
+
+    def _due(self, hot: HotKey, now: float) -> bool:
+        if hot.hits < self.hot_hits or hot.task is not None or now < hot.retry_at:
+            return False
+        entry = hot.cache.peek(hot.key)
+        return entry is None or now >= entry.expires_at - self.ahead - hot.jitter
+
+    def tick(self) -> int:
+        """Drop idle keys and start the refreshes that are due. Returns how many were started."""
+        now = time.monotonic()
+        started = 0
+        for key, hot in list(self.keys.items()):
+            if now - hot.last_seen > self.idle:
+                del self.keys[key]
+            elif self._due(hot, now):
+                hot.task = asyncio.get_running_loop().create_task(self._refresh(hot))
+                started += 1
+        metrics.REFRESH_HOT_KEYS.set(value=len(self.keys))
+        return started
+
+    async def _refresh(self, hot: HotKey) -> None:
+        dataset = hot.key[0]
+        try:
+            async with self._slots:
+                entry = hot.cache.peek(hot.key)
+                expires_at = entry.expires_at if entry is not None else None
+                try:
+                    res = await hot.cache.refresh(hot.key, hot.fetch)
+                except Exception as e:
+                    res = {"ok": False, "error": str(e)}
+            now = time.monotonic()
+            if res.get("ok"):
+                hot.failures = 0
+                hot.refreshes += 1
+                hot.jitter = random.uniform(0, self.jitter)
+                self.counters["refreshed"] += 1
+                metrics.REFRESH_RUNS.inc(dataset, "ok")
+                if expires_at is not None:
+                    hot.lag = now - expires_at
+                    metrics.REFRESH_LAG.observe(max(0.0, hot.lag), dataset)
+                    if hot.lag > 0:
+                        self.counters["late"] += 1
+            else:
+                hot.failures += 1
+                hot.retry_at = now + min(self.interval * 2 ** hot.failures, max(self.interval, hot.cache.ttl))
+                self.counters["failed"] += 1
+                metrics.REFRESH_RUNS.inc(dataset, "error")
+                log.warning("refresh %s/%s failed (%d in a row): %s", dataset, hot.key[1], hot.failures, res.get("error"))
+        finally:
+            hot.task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.tick()
+            except Exception:
+                log.exception("refresh tick failed")
+
+    def start(self) -> None:
+        """Start the scheduler loop (FastAPI lifespan)."""
+        self._config()
+        if not self.enabled or self._task is not None:
+            return
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        tasks = [t for t in (self._task, *(h.task for h in self.keys.values())) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self.keys.clear()
+
+    def stats(self) -> dict:
+        lags = [h.lag for h in self.keys.values() if h.lag is not None]
+        return {
+            **self.counters,
+            "running": self._task is not None,
+            "hotKeys": sum(h.hits >= self.hot_hits for h in self.keys.values()),
+            "tracked": len(self.keys),
+            "inflight": sum(h.task is not None for h in self.keys.values()),
+            "failing": sum(h.failures > 0 for h in self.keys.values()),
+            "maxLagSeconds": round(max(lags), 3) if lags else None,
+        }
+
+
+# Refreshes org_datasets (started in main.lifespan)
+refresher = RefreshScheduler(org_datasets)
@@ -0,0 +1,97 @@
+"""
+Chat sessions: conversation history kept server-side between /api/chat calls, keyed by conversation id
+(scoped to the caller's access token). SessionStore is the backend interface (async, JSON-serialisable
+values, so Redis or a database can be plugged in with set_session_store); MemorySessionStore is the
+default in-process TTL + LRU store. CHAT_SESSION_TTL (seconds, default 1800), CHAT_SESSION_MAX_ENTRIES
+(1000, 0 disables sessions), CHAT_SESSION_MAX_MESSAGES (40) bound it.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from lib.api import env_float, env_int
+
+
+class SessionStore(ABC):
+    """Backend interface. A session is { provider: str, messages: [provider-format messages] }."""
+
+    @abstractmethod
+    async def get(self, key: str) -> dict | None: ...
+
+    @abstractmethod
+    async def put(self, key: str, session: dict) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    def stats(self) -> dict:
+        return {}
+
+
+class MemorySessionStore(SessionStore):
+    def __init__(self, ttl: float | None = None, max_entries: int | None = None):
+        self.ttl = env_float("CHAT_SESSION_TTL", 1800.0) if ttl is None else ttl
+        self.max_entries = env_int("CHAT_SESSION_MAX_ENTRIES", 1000) if max_entries is None else max_entries
+        self._sessions: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self.evictions = 0
+
+    async def get(self, key: str) -> dict | None:
+        item = self._sessions.get(key)
+        if item is None:
+            return None
+        expires_at, session = item
+        if time.monotonic() >= expires_at:
+            del self._sessions[key]
+            return None
+        self._sessions.move_to_end(key)
+        return session
+
+    async def put(self, key: str, session: dict) -> None:
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        self._sessions[key] = (time.monotonic() + self.ttl, session)
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self.max_entries:
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._sessions.pop(key, None)
+
+    def stats(self) -> dict:
+        return {"sessions": len(self._sessions), "evictions": self.evictions, "ttl": self.ttl, "maxEntries": self.max_entries}
+
+
+_store: SessionStore = MemorySessionStore()
+
+
+def get_session_store() -> SessionStore:
+    return _store
+
+
+def set_session_store(store: SessionStore) -> None:
+    """Swap the backend (e.g. a Redis-backed SessionStore shared by all workers)."""
+    global _store
+    _store = store
+
+
+def _is_prompt(message: dict) -> bool:
+    """A user turn typed by the user (not a tool_result carrier), i.e. a safe point to start history."""
+    return message.get("role") == "user" and isinstance(message.get("content"), str)
+
+
+def trim_history(messages: list[dict], max_messages: int | None = None) -> list[dict]:
+    """Last max_messages messages, starting at a user prompt so no tool result loses its tool call."""
+    max_messages = env_int("CHAT_SESSION_MAX_MESSAGES", 40) if max_messages is None else max_messages
+    if len(messages) <= max_messages:
+        return messages
+    start = len(messages) - max_messages
+    for i in range(start, len(messages)):
+        if _is_prompt(messages[i]):
+            return messages[i:]
+    # One turn longer than the limit: keep it from its prompt
+    for i in range(start - 1, -1, -1):
+        if _is_prompt(messages[i]):
+            return messages[i:]
+    return []
@@ -0,0 +1,108 @@
+"""
+Shape tool results before they go back to the LLM: per-tool field projection, capped lists (with counts),
+compact JSON and a size budget. The chat loop still returns the full tool text in toolCalls for the UI.
+CHAT_TOOL_MAX_ITEMS (default 25) caps list items; CHAT_TOOL_RESULT_MAX_BYTES (default 8000, about 2k tokens;
+0 = no budget) bounds the text. Lists are shortened further, then the text is cut, until it fits.
+"""
+
+from typing import Any, Callable
+
+from lib.api import env_int
+from lib.jsonio import dumps, loads
+
+# Transport / bookkeeping fields the model never needs
+_NOISE = frozenset(("etag", "lastModified", "links", "_links"))
+
+
+def _cap(items: list, max_items: int) -> tuple[list, int]:
+    """First max_items of items and how many were left out."""
+    return items[:max_items], max(0, len(items) - max_items)
+
+
+def _prune(value: Any, max_items: int) -> Any:
+    """Generic shaping: drop noise keys and cap every list, noting how many items were left out."""
+    if isinstance(value, dict):
+        return {k: _prune(v, max_items) for k, v in value.items() if k not in _NOISE}
+    if isinstance(value, list):
+        kept, more = _cap(value, max_items)
+        kept = [_prune(v, max_items) for v in kept]
+        return kept + [f"... {more} more"] if more else kept
+    return value
+
+
+def _end_task(value: Any, max_items: int) -> Any:
+    if not isinstance(value, dict):
+        return _prune(value, max_items)
+    return {k: value[k] for k in ("ok", "status", "error", "message") if k in value}
+
+
+def _agents_outbound(value: Any, max_items: int) -> Any:
+    if not isinstance(value, dict) or not isinstance(value.get("rows"), list):
+        return _prune(value, max_items)
+    out = {k: v for k, v in value.items() if k != "rows"}
+    out["rows"], more = _cap(value["rows"], max_items)
+    if more:
+        out["omittedRows"] = more
+    return out
+
+
+def _end_tasks(value: Any, max_items: int) -> Any:
+    """Bulk end: the summary says how many were ended, so rows that did not end are listed first."""
+    if not isinstance(value, dict) or not isinstance(value.get("rows"), list):
+        return _prune(value, max_items)
+    rows = sorted(value["rows"], key=lambda row: row[1] == "ended")
+    return _agents_outbound({**value, "rows": rows}, max_items)
+
+
+def _query_agents(value: Any, max_items: int) -> Any:
+    """Agent query: a capped page moves nextOffset back so the model can ask for the rows it did not get."""
+    if not isinstance(value, dict) or not value.get("ok"):
+        return _prune(value, max_items)
+    out = dict(value)
+    if isinstance(value.get("groups"), list):
+        out["groups"], more = _cap(value["groups"], max_items)
+        if more:
+            out["omittedGroups"] = more
+    if isinstance(value.get("rows"), list) and len(value["rows"]) > max_items:
+        out["rows"] = value["rows"][:max_items]
+        out["nextOffset"] = value.get("offset", 0) + max_items
+    return out
+
+
+SHAPERS: dict[str, Callable[[Any, int], Any]] = {
+    "cc_end_task": _end_task,
+    "cc_end_tasks": _end_tasks,
+    "cc_check_agents_outbound": _agents_outbound,
+    "cc_query_agents": _query_agents,
+}
+
+
+def _compact(value: Any) -> str:
+    return dumps(value)
+
+
+def _truncate(text: str, max_bytes: int) -> str:
+    """text cut to at most max_bytes (UTF-8), note included; the note shrinks, then goes, on tiny budgets."""
+    data = text.encode()
+    if len(data) <= max_bytes:
+        return text
+    notes = (f"...[truncated to {max_bytes} of {len(data)} bytes; the user sees the full result]", "...[truncated]", "")
+    note = next(n for n in notes if len(n) <= max_bytes)
+    return data[: max_bytes - len(note)].decode(errors="ignore") + note
+
+
+def shape_tool_result(name: str, text: str, max_items: int | None = None, max_bytes: int | None = None) -> str:
+    """Model-facing version of a tool's text result (see module docstring)."""
+    max_items = max(1, max_items if max_items is not None else env_int("CHAT_TOOL_MAX_ITEMS", 25))
+    max_bytes = max_bytes if max_bytes is not None else env_int("CHAT_TOOL_RESULT_MAX_BYTES", 8000)
+    try:
+        value = loads(text)
+    except ValueError:
+        return _truncate(text, max_bytes) if max_bytes > 0 else text
+    shaper = SHAPERS.get(name, _prune)
+    while True:
+        shaped = _compact(shaper(value, max_items))
+        if max_bytes <= 0 or len(shaped.encode()) <= max_bytes or max_items == 1:
+            break
+        max_items //= 2
+    return _truncate(shaped, max_bytes) if max_bytes > 0 else shaped
@@ -0,0 +1,170 @@
+"""
+Static Chat UI (server/static) with precompressed variants and long-lived caching.
+build-static.js writes name.br / name.gz next to each compressible file; a request whose Accept-Encoding
+allows it gets the smallest variant (br before gzip) as is, never compressed per request. Variants are
+only sent for files whose sha256 matches the one build-manifest.json recorded when they were compressed
+(so a bundle copied in without recompressing never gets old variants), and cannot be requested by name. Hashed Vite
+assets (assets/name-HASH.ext) are immutable for a year; everything else (index.html, logo) is revalidated
+with its ETag on each load, so a deploy is picked up at once.
+build-static.js also records a hash of the UI sources it built from in build-manifest.json; warn_if_stale
+logs when that no longer matches the checkout (the bundle was not rebuilt after a UI change).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import stat
+from mimetypes import guess_type
+from pathlib import Path
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+
+log = logging.getLogger(__name__)
+
+MANIFEST = "build-manifest.json"
+# Inputs of the Vite build, relative to the repo root (same list as build-static.js)
+UI_SOURCES = ("index.html", "package.json", "package-lock.json", "vite.config.js", "src", "public")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+# Encoding -> file suffix, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+_HASHED = re.compile(r"(^|/)assets/[^/]+-[\w-]{8,}\.\w+$")
+
+
+def ui_source_hash(root: Path) -> str | None:
+    """sha256 over the UI source files under root (paths and contents, CRLF read as LF), as build-static.js
+    computes it; None when none of them exist (e.g. a deploy of server/ alone)."""
+    files = []
+    for name in UI_SOURCES:
+        path = root / name
+        if path.is_dir():
+            files += [f for f in path.rglob("*") if f.is_file()]
+        elif path.is_file():
+            files.append(path)
+    if not files:
+        return None
+    digest = hashlib.sha256()
+    for rel, path in sorted((f.relative_to(root).as_posix(), f) for f in files):
+        digest.update(rel.encode() + b"\0")
+        digest.update(path.read_bytes().replace(b"\r\n", b"\n") + b"\0")
+    return digest.hexdigest()
+
+
+def ui_build_status(static_dir: Path, root: Path) -> dict:
+    """{ built, sources, stale }: the sources hash recorded by the build (None = no manifest), that of the
+    checkout (None = sources not present) and whether they differ (None = cannot tell)."""
+    try:
+        built = json.loads((static_dir / MANIFEST).read_text()).get("sources")
+    except (OSError, ValueError, AttributeError):
+        built = None
+    sources = ui_source_hash(root)
+    stale = None if sources is None else built != sources
+    return {"built": built, "sources": sources, "stale": stale}
+
+
+def warn_if_stale(static_dir: Path, root: Path) -> None:
+    status = ui_build_status(static_dir, root)
+    if not status["stale"]:
+        return
+    if status["built"] is None:
+        log.warning("%s records no UI sources hash in %s and may predate the UI sources; run npm run build:server and commit server/static", static_dir, MANIFEST)
+    else:
+        log.warning("%s was built from other UI sources than this checkout; run npm run build:server and commit server/static", static_dir)
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """Content codings an Accept-Encoding header allows (q=0 excludes; * allows the rest)."""
+    allowed, refused = set(), set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        (allowed if q > 0 else refused).add(coding)
+    if "*" in allowed:
+        allowed |= {e for e, _ in ENCODINGS} - refused
+    return allowed
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (path, mtime, manifest mtime) -> [(encoding, variant path, variant stat)] of the variants to send
+        self._variants: dict[tuple, list[tuple]] = {}
+        self._compressed: tuple[int, dict] = (0, {})  # manifest mtime, {relative path: sha256 of the original}
+
+    def _rel(self, full_path: str) -> str:
+        return os.path.relpath(full_path, self.directory).replace(os.sep, "/") if self.directory else full_path
+
+    def compressed(self) -> tuple[int, dict]:
+        """(mtime, "compressed" digests) of build-manifest.json, reread when it changes."""
+        path = os.path.join(self.directory or "", MANIFEST)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return 0, {}
+        if mtime != self._compressed[0]:
+            try:
+                digests = json.loads(Path(path).read_text()).get("compressed")
+            except (OSError, ValueError, AttributeError):
+                digests = None
+            self._compressed = (mtime, digests if isinstance(digests, dict) else {})
+        return self._compressed
+
+    def variants(self, full_path: str, stat_result: os.stat_result) -> list[tuple]:
+        manifest_mtime, digests = self.compressed()
+        key = (full_path, stat_result.st_mtime_ns, manifest_mtime)
+        found = self._variants.get(key)
+        if found is None:
+            found = []
+            for encoding, suffix in ENCODINGS:
+                try:
+                    st = os.stat(full_path + suffix)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    found.append((encoding, full_path + suffix, st))
+            if found:
+                rel = self._rel(full_path)
+                expected = digests.get(rel)
+                if expected is None or hashlib.sha256(Path(full_path).read_bytes()).hexdigest() != expected:
+                    log.warning("not sending the precompressed variants of %s: not made from this file; run node build-static.js --compress-only", rel)
+                    found = []
+            self._variants[key] = found
+        return found
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        # name.br / name.gz stand in for name (file_response); they are not files of their own
+        for _, suffix in ENCODINGS:
+            if path.endswith(suffix) and super().lookup_path(path[: -len(suffix)])[1] is not None:
+                return "", None
+        return super().lookup_path(path)
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope, status_code: int = 200) -> Response:
+        full_path = str(full_path)
+        request_headers = Headers(scope=scope)
+        variants = self.variants(full_path, stat_result)
+        allowed = accepted_encodings(request_headers.get("accept-encoding", "")) if variants else set()
+        encoding, path, st = next((v for v in variants if v[0] in allowed), (None, full_path, stat_result))
+        rel = self._rel(full_path)
+        headers = {"Cache-Control": IMMUTABLE if _HASHED.search(rel) else REVALIDATE}
+        if variants:
+            headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        # The variant's own size/mtime give it a distinct ETag
+        response = FileResponse(path, status_code=status_code, headers=headers, media_type=guess_type(full_path)[0], stat_result=st)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
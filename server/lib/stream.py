@@ -0,0 +1,217 @@
+"""
+Incremental parsing of large Contact Center exports (user bulk-export) from a streamed httpx response.
+Rows are yielded one at a time from a JSON document (the first array of objects under a known
+list key, or a top-level array), NDJSON, or CSV, so callers can feed an index or stop at the
+first match without holding the whole body (as str and as a parsed tree) in memory.
+"""
+
+import codecs
+import csv
+import json
+import re
+from typing import AsyncIterator
+
+import httpx
+
+from lib.directory import UserIndex, get_email_from_user, normalize_email
+
+# Keys that hold the user list in bulk-export JSON (same set extract_user_list looks at first)
+USER_LIST_KEYS = frozenset(("data", "users", "userList", "result", "content", "items", "export", "userExport", "userDetails"))
+
+_WS = " \t\r\n"
+_LEADING = _WS + "\ufeff"  # may come before the first row (BOM)
+_decoder = json.JSONDecoder()
+
+
+async def _iter_text(resp: httpx.Response) -> AsyncIterator[str]:
+    decode = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace").decode
+    async for chunk in resp.aiter_bytes():
+        text = decode(chunk)
+        if text:
+            yield text
+    tail = decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+class _ArraySeeker:
+    """Scans JSON text until the opening '[' of a user list; tracks strings, nesting and the last key."""
+
+    def __init__(self):
+        self.depth = 0
+        self.in_str = False
+        self.escape = False
+        self.chars: list[str] = []
+        self.last_str = None
+        self.key = None
+
+    def feed(self, text: str) -> int:
+        """Return the index just past the list's '[' in text, or -1 if not found yet."""
+        for i, c in enumerate(text):
+            if self.in_str:
+                if self.escape:
+                    self.escape = False
+                elif c == "\\":
+                    self.escape = True
+                elif c == '"':
+                    self.in_str = False
+                    self.last_str = "".join(self.chars)
+                elif len(self.chars) < 64:
+                    self.chars.append(c)
+            elif c == '"':
+                self.in_str = True
+                self.chars = []
+            elif c == ":":
+                self.key = self.last_str
+            elif c == "[":
+                if self.depth == 0 or self.key in USER_LIST_KEYS:
+                    return i + 1
+                self.depth += 1
+                self.key = None
+            elif c == "{":
+                self.depth += 1
+                self.key = None
+            elif c in "]}":
+                self.depth -= 1
+            elif c == ",":
+                self.key = None
+        return -1
+
+
+async def _iter_json_array(first: str, texts: AsyncIterator[str]) -> AsyncIterator[dict]:
+    seeker = _ArraySeeker()
+    buf = first
+    start = seeker.feed(buf)
+    while start < 0:
+        buf = await anext(texts, None)
+        if buf is None:
+            return
+        start = seeker.feed(buf)
+    buf = buf[start:]
+    pos = 0
+    done = False
+    while True:
+        # Decode every complete element currently buffered
+        while True:
+            while pos < len(buf) and (buf[pos] in _WS or buf[pos] == ","):
+                pos += 1
+            if pos >= len(buf):
+                break
+            if buf[pos] == "]":
+                return
+            try:
+                obj, end = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if done:
+                    raise
+                break  # element continues in the next chunk
+            pos = end
+            if isinstance(obj, dict):
+                yield obj
+        if done:
+            return
+        more = await anext(texts, None)
+        if more is None:
+            done = True
+            more = ""
+        buf = buf[pos:] + more
+        pos = 0
+
+
+async def _iter_lines(first: str, texts: AsyncIterator[str]) -> AsyncIterator[str]:
+    pending = ""
+    text = first
+    while text is not None:
+        pending += text
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line
+        text = await anext(texts, None)
+    if pending:
+        yield pending
+
+
+async def _iter_ndjson(first: str, texts: AsyncIterator[str]) -> AsyncIterator[dict]:
+    async for line in _iter_lines(first, texts):
+        line = line.strip()
+        if line:
+            obj = json.loads(line)
+            if isinstance(obj, dict):
+                yield obj
+
+
+def _csv_key(header: str) -> str:
+    """'Agent Profile Name' / 'agent_profile_name' -> 'agentProfileName' (keys the directory helpers know)."""
+    words = [w for w in re.split(r"[\s_\-]+", header.strip()) if w]
+    if not words:
+        return header
+    if len(words) == 1:
+        w = words[0]
+        return w[:1].lower() + w[1:]
+    return words[0].lower() + "".join(w[:1].upper() + w[1:].lower() for w in words[1:])
+
+
+async def _iter_csv(first: str, texts: AsyncIterator[str]) -> AsyncIterator[dict]:
+    header = None
+    record = ""
+    async for line in _iter_lines(first, texts):
+        record = record + "\n" + line if record else line
+        if record.count('"') % 2:
+            continue  # quoted field spans lines
+        row = next(csv.reader([record.rstrip("\r")]), [])
+        record = ""
+        if not row:
+            continue
+        if header is None:
+            header = [_csv_key(h.lstrip("\ufeff")) for h in row]
+            continue
+        yield dict(zip(header, row))
+
+
+async def iter_user_rows(resp: httpx.Response) -> AsyncIterator[dict]:
+    """Yield user dicts from a streamed bulk-export response (JSON, NDJSON or CSV)."""
+    texts = _iter_text(resp)
+    first = ""
+    async for text in texts:
+        first += text
+        if first.strip(_LEADING):
+            break
+    stripped = first.lstrip(_LEADING)
+    if not stripped:
+        return
+    content_type = (resp.headers.get("content-type") or "").lower()
+    if "ndjson" in content_type or "jsonl" in content_type:
+        rows = _iter_ndjson(first, texts)
+    elif stripped[0] in "[{":
+        rows = _iter_json_array(first, texts)
+    else:
+        rows = _iter_csv(first, texts)
+    async for row in rows:
+        yield row
+
+
+async def build_user_index(resp: httpx.Response) -> UserIndex:
+    """Consume a streamed bulk-export straight into a UserIndex (rows are dropped once indexed)."""
+    index = UserIndex()
+    async for row in iter_user_rows(resp):
+        index.add(row)
+    return index
+
+
+def user_finder(email: str):
+    """consume() for cc_stream that stops reading at the first user with this email.
+    Returns a one-user UserIndex (empty if not found; rows = users scanned) so callers can treat both modes alike."""
+    target = normalize_email(email)
+
+    async def consume(resp: httpx.Response) -> UserIndex:
+        index = UserIndex()
+        scanned = 0
+        async for row in iter_user_rows(resp):
+            scanned += 1
+            if get_email_from_user(row) == target:
+                index.add(row)
+                break
+        index.rows = scanned
+        return index
+
+    return consume
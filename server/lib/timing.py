@@ -0,0 +1,104 @@
+"""
+Per-request timing spans (contextvars), reported as a Server-Timing header and, on request, as a timings list.
+TimingMiddleware opens a trace for /api/* and /mcp requests; span() anywhere below it (chat loop, in-process
+MCP dispatch, cc_rest) records into that trace and is a no-op outside one. Concurrent tasks started from the
+request (asyncio.gather, create_task) copy the context and record into the same trace.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_trace: ContextVar["Trace | None"] = ContextVar("timing_trace", default=None)
+_depth: ContextVar[int] = ContextVar("timing_depth", default=0)
+
+# Bound spans per request (a runaway loop must not grow the trace without limit)
+MAX_SPANS = 500
+
+
+class Trace:
+    __slots__ = ("start", "spans", "dropped")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.spans: list[tuple] = []  # (name, start offset s, duration s, depth, detail)
+        self.dropped = 0
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def add(self, name: str, start: float, duration: float, depth: int, detail: str) -> None:
+        if len(self.spans) >= MAX_SPANS:
+            self.dropped += 1
+            return
+        self.spans.append((name, start - self.start, duration, depth, detail))
+
+    def as_list(self) -> list[dict]:
+        """Spans in start order: [{ name, startMs, durationMs, depth, detail? }]."""
+        out = []
+        for name, start, duration, depth, detail in sorted(self.spans, key=lambda s: s[1]):
+            item = {"name": name, "startMs": round(start * 1000, 2), "durationMs": round(duration * 1000, 2), "depth": depth}
+            if detail:
+                item["detail"] = detail
+            out.append(item)
+        return out
+
+    def server_timing(self) -> str:
+        """Server-Timing header value: one entry per span name (summed durations, call count), plus total."""
+        totals: dict[str, list] = {}
+        for name, _, duration, _, _ in self.spans:
+            entry = totals.setdefault(name, [0.0, 0])
+            entry[0] += duration
+            entry[1] += 1
+        parts = [f'{name};dur={dur * 1000:.1f};desc="{count}x"' for name, (dur, count) in totals.items()]
+        parts.append(f"total;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(parts)
+
+
+def current() -> Trace | None:
+    return _trace.get()
+
+
+@contextmanager
+def span(name: str, detail: str = ""):
+    """Time the body as one span of the current request's trace (nothing is recorded outside a trace)."""
+    trace = _trace.get()
+    if trace is None:
+        yield
+        return
+    depth = _depth.get()
+    token = _depth.set(depth + 1)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, start, time.perf_counter() - start, depth, detail)
+        _depth.reset(token)
+
+
+class TimingMiddleware:
+    """ASGI middleware: trace requests whose path starts with one of prefixes and add a Server-Timing
+    header (spans finished before the response headers are sent, plus total)."""
+
+    def __init__(self, app, prefixes: tuple = ("/api/", "/mcp")):
+        self.app = app
+        self.prefixes = prefixes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefixes):
+            await self.app(scope, receive, send)
+            return
+        trace = Trace()
+        token = _trace.set(trace)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers") or [])
+                headers.append((b"server-timing", trace.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _trace.reset(token)
@@ -15,13 +15,34 @@ try:
 except Exception:
     pass  # .env optional (e.g. in App Runner env vars are set in console)
 
-import json
+import asyncio
+import logging
+import time
+from urllib.parse import urlencode
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
-from fastapi.staticfiles import StaticFiles
-
-from lib.api import get_base_url, get_access_token, get_org_id, cc_rest
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+
+from lib import metrics, timing
+from lib.addressbook import book_page, entry_page, has_next, page_request, page_result
+from lib.agents import AgentTable, query_agents
+from lib.api import get_base_url, get_access_token, get_org_id, cc_rest, cc_stream, env_flag, env_int, init_client, close_client, path_segment
+from lib.cache import address_book_pages, org_datasets, token_scope
+from lib.directory import ProfileIndex, UserIndex, normalize_email
+from lib.jsonio import JSONBytesResponse, dumps, tool_text
+from lib.mcp_client import is_local_url, local_mcp_url, set_local_server
+from lib.mirror import mirror
+from lib.breaker import breakers
+from lib.ratelimit import scheduler as upstream_scheduler
+from lib.refresh import refresher
+from lib.sessions import get_session_store
+from lib.static import PrecompressedStaticFiles, warn_if_stale
+from lib.stream import build_user_index, user_finder
+
+log = logging.getLogger(__name__)
 
 # Optional: serve Chat UI from server/static (built with npm run build + copy to server/static)
 _STATIC_DIR = Path(__file__).resolve().parent / "static"
@@ -31,8 +52,16 @@ _SERVE_UI = (_STATIC_DIR / "index.html").exists()
 TOOLS = [
     {
         "name": "cc_list_address_books",
-        "description": "List address books. GET organization/{orgId}/v3/address-book. Requires Organization ID (set in Chat or CONTACT_CENTER_ORG_ID).",
-        "inputSchema": {"type": "object", "properties": {}},
+        "description": "List address books one page at a time (GET organization/{orgId}/v3/address-book), or with addressBookId the entries of that address book (GET .../address-book/{id}/entry). Returns compact rows plus page, totalPages, totalRecords and, when there are more, nextCursor: pass it back as cursor for the next page. Requires Organization ID (set in Chat or CONTACT_CENTER_ORG_ID).",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "addressBookId": {"type": "string", "description": "List the entries of this address book instead of the address books"},
+                "cursor": {"type": "string", "description": "nextCursor from a previous result (overrides page and pageSize)"},
+                "page": {"type": "integer", "description": "Page number, starting at 0 (default 0)"},
+                "pageSize": {"type": "integer", "description": "Rows per page (default 25, max 100)"},
+            },
+        },
     },
     {
         "name": "cc_end_task",
@@ -45,6 +74,21 @@ TOOLS = [
             "required": ["taskID"],
         },
     },
+    {
+        "name": "cc_end_tasks",
+        "description": "End (clear) many interactions/tasks at once, e.g. orphaned tasks of a stuck queue. Provide a list of task IDs (duplicates are ignored). Sends POST v1/tasks/{taskID}/end for each, several at a time, and returns summary counts plus a compact table (columns: taskID, status, httpStatus, error). Status is one of: ended, not-found, failed, invalid.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "taskIDs": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Task IDs of the interactions to end/clear",
+                },
+            },
+            "required": ["taskIDs"],
+        },
+    },
     {
         "name": "cc_check_agent_outbound",
         "description": "Check if an agent is configured to place outbound calls. Provide the agent's user email. Uses org ID and token from the Chat tab. Runs: 1) GET user bulk-export to find the user and their agent profile name, 2) GET agent-profile to find the profile and read outdialEnabled.",
@@ -56,11 +100,50 @@ TOOLS = [
             "required": ["userEmail"],
         },
     },
+    {
+        "name": "cc_check_agents_outbound",
+        "description": "Check outbound-call capability for many agents at once (e.g. an audit). Provide a list of user emails. Fetches the user bulk-export and agent profiles once and returns a compact table (columns: email, status, agentProfileName) plus summary counts. Status is one of: outbound, no-outbound, not-found, no-profile, profile-not-found, invalid.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "userEmails": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Email addresses of the agents/users to check",
+                },
+            },
+            "required": ["userEmails"],
+        },
+    },
+    {
+        "name": "cc_query_agents",
+        "description": "Query the org's agent directory (user bulk-export joined with agent profiles), e.g. 'which agents on profile X cannot dial out?' or 'how many agents have outdial enabled?'. All filters are optional and combined with AND. Returns the matched count, optional group-by counts, and a page of rows (columns: email, agentProfileName, outdialEnabled, status). Status is one of: outbound, no-outbound, no-profile, profile-not-found. Use offset/nextOffset to page.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "profile": {"type": "string", "description": "Agent profile name or id (case-insensitive)"},
+                "outdialEnabled": {"type": "boolean", "description": "Only agents whose profile allows (true) or does not allow (false) outbound calls"},
+                "domain": {"type": "string", "description": "Email domain, e.g. example.com"},
+                "status": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": ["outbound", "no-outbound", "no-profile", "profile-not-found"]},
+                    "description": "Only agents with one of these statuses",
+                },
+                "groupBy": {"type": "string", "enum": ["profile", "domain", "outdialEnabled", "status"], "description": "Return counts per value of this column"},
+                "offset": {"type": "integer", "description": "First row to return (default 0)"},
+                "limit": {"type": "integer", "description": "Rows to return (default 25, or 0 with groupBy; max 200)"},
+            },
+        },
+    },
 ]
 
 
 # Hint for MCP clients when org/token are missing (returned in tool error payloads)
 _MCP_AUTH_HINT = " For MCP clients: include __orgId and __accessToken in the tools/call arguments. See the Webex Contact Center MCP page for details."
+
+
+def strip_auth_overrides(args: dict | None) -> tuple[dict, dict]:
+    """Remove __accessToken / __orgId from tool arguments and return (clean_args, overrides)."""
     if not args or not isinstance(args, dict):
         return {}, {}
     args = dict(args)
@@ -74,136 +157,124 @@ _MCP_AUTH_HINT = " For MCP clients: include __orgId and __accessToken in the too
     return args, overrides
 
 
-def _normalize_email(s: str) -> str:
-    """Strip, lower, and extract email from 'Name <email>' format."""
-    if not s or not isinstance(s, str):
-        return ""
-    s = s.strip().lower()
-    if "<" in s and ">" in s:
-        start = s.index("<") + 1
-        end = s.index(">")
-        s = s[start:end].strip()
-    return s
-
-
-def _get_email_from_user(u: dict) -> str:
-    """Get email from user dict using any common field name."""
-    if not isinstance(u, dict):
-        return ""
-    # Prefer known email-like keys
-    for key in ("primaryEmail", "email", "userName", "emailAddress", "mail", "primaryEmailAddress", "userPrincipalName"):
-        val = u.get(key)
-        if val and isinstance(val, str) and "@" in val:
-            return _normalize_email(val)
-    # Fallback: any string value that looks like an email
-    for key, val in u.items():
-        if isinstance(val, str) and "@" in val and "." in val and "email" in key.lower():
-            return _normalize_email(val)
-    if u.get("id") and isinstance(u["id"], str) and "@" in u["id"]:
-        return _normalize_email(u["id"])
-    return ""
-
-
-def _extract_user_list(data: dict | list | None) -> list:
-    """Extract list of user objects from API response (nested or flat)."""
-    if isinstance(data, list):
-        return data if data and all(isinstance(x, dict) for x in data) else []
-    if not isinstance(data, dict):
-        return []
-    # Direct keys that often hold the list
-    for key in ("data", "users", "userList", "result", "content", "items", "export", "userExport", "userDetails"):
-        val = data.get(key)
-        if isinstance(val, list) and val and isinstance(val[0], dict):
-            return val
-    # Any value that is a list of dicts (catch arbitrary key names)
-    for val in data.values():
-        if isinstance(val, list) and val and isinstance(val[0], dict):
-            return val
-    # One level deeper: data.users, etc.
-    for key in ("data", "body", "result"):
-        inner = data.get(key)
-        if isinstance(inner, dict):
-            found = _extract_user_list(inner)
-            if found:
-                return found
-    return []
-
-
-def _check_agent_outbound(user_email: str, org_id: str, overrides: dict) -> dict:
+# Org-wide datasets cached (and, when hot, refreshed in the background) per (dataset, orgId, token scope):
+# path template, extra request headers, the index built from a buffered payload, and (for large exports) a streaming consumer building the same index
+_ORG_DATASETS = {
+    "users": ("organization/{orgId}/user/bulk-export", {"Accept": "application/json"}, UserIndex.from_payload, build_user_index),
+    "profiles": ("organization/{orgId}/v2/agent-profile", {}, ProfileIndex.from_payload, None),
+    # One page each (query page / pageSize), kept as compact summaries
+    "addressBooks": ("organization/{orgId}/v3/address-book", {}, book_page, None),
+    "addressBookEntries": ("organization/{orgId}/v3/address-book/{bookId}/entry", {}, entry_page, None),
+}
+# Datasets not kept in org_datasets
+_DATASET_CACHES = {"addressBooks": address_book_pages, "addressBookEntries": address_book_pages}
+
+
+async def _get_org_dataset(
+    dataset: str,
+    org_id: str,
+    overrides: dict,
+    find_email: str | None = None,
+    path_args: dict | None = None,
+    query: dict | None = None,
+    prefetch: bool = False,
+) -> dict:
+    """GET an org-wide dataset through the shared cache (TTL, ETag revalidation, single-flight).
+    On success data is the dataset's index (UserIndex / ProfileIndex, or a view of the on-disk mirror when this
+    worker has no copy yet). With the cache disabled, find_email lets a single lookup stop reading the stream
+    once that user is found. path_args fill the path template (percent-encoded) and query is sent as query
+    string; both are part of the cache key. A prefetch is cached but does not count as a lookup for refresher."""
+    path_template, headers, build, consume = _ORG_DATASETS[dataset]
+    cache = _DATASET_CACHES.get(dataset, org_datasets)
+    path = path_template.format(orgId=path_segment(org_id), **{k: path_segment(v) for k, v in (path_args or {}).items()})
+    token = overrides.get("token") or get_access_token()
+    key = (dataset, org_id, token_scope(token))
+    if path_args or query:
+        key += tuple(sorted((path_args or {}).items())) + tuple(sorted((query or {}).items()))
+    if query:
+        path += "?" + urlencode(query)
+    stream = consume is not None and env_flag("CC_STREAM_EXPORTS")
+    full = True  # False for a one-user finder result
+    if stream and find_email and not cache.enabled:
+        consume = user_finder(find_email)
+        key += ("find", normalize_email(find_email))  # result holds only this user: never share it
+        full = False
+
+    async def download(conditional: dict) -> dict:
+        extra = {**headers, **conditional} or None
+        if stream:
+            res = await cc_stream(path, consume, overrides, extra)
+            if not res.get("ok") or res.get("notModified") or res["data"].rows:
+                return res
+            # Nothing recognizable in the stream (unexpected layout): retry as a buffered GET
+        res = await cc_rest("GET", path, None, overrides, extra)
+        if res.get("ok") and not res.get("notModified"):
+            res["data"] = build(res.get("data"))
+        return res
+
+    async def fetch(conditional: dict) -> dict:
+        if cache.peek(key) is None:
+            # Nothing in this worker yet (new worker or restart): answer from the on-disk mirror if it is recent
+            mirrored = mirror.load(dataset, org_id, key[2])
+            if mirrored is not None:
+                return mirrored
+        res = await download(conditional)
+        if res.get("ok") and full:
+            if res.get("notModified"):
+                mirror.touch(dataset, org_id, key[2])
+            else:
+                mirror.sync(dataset, org_id, key[2], res["data"], res.get("etag"), res.get("lastModified"))
+        return res
+
+    if full and not prefetch:
+        refresher.track(key, fetch, cache)
+    return await cache.get(key, fetch)
+
+
+async def _check_agent_outbound(user_email: str, org_id: str, overrides: dict) -> dict:
     """Step 1: GET user bulk-export, find user by email and get agentProfileName. Step 2: GET agent-profile, find profile and read outdialEnabled."""
-    email_lower = _normalize_email(user_email)
-    if not email_lower:
+    if not normalize_email(user_email):
         return {"ok": False, "error": "Invalid userEmail.", "step": "input"}
     # Step 1: GET organization/{orgId}/user/bulk-export (Accept: application/json for JSON response)
-    path_bulk = f"organization/{org_id}/user/bulk-export"
-    bulk_res = cc_rest("GET", path_bulk, None, overrides, extra_headers={"Accept": "application/json"})
+    bulk_res = await _get_org_dataset("users", org_id, overrides, find_email=user_email)
     if not bulk_res.get("ok"):
         return {"ok": False, "error": bulk_res.get("error", "Bulk export failed"), "step": "user/bulk-export"}
-    # Extract user list from full response (data) or nested
-    data = bulk_res.get("data")
-    users = _extract_user_list(data) if data is not None else _extract_user_list(bulk_res)
-    if not users:
-        # Last resort: entire response might be the list
-        users = _extract_user_list({"data": bulk_res})
-    # Find user matching email
-    user = None
-    for u in users:
-        if not isinstance(u, dict):
-            continue
-        u_email = _get_email_from_user(u)
-        if u_email and u_email == email_lower:
-            user = u
-            break
-    if not user:
+    users: UserIndex = bulk_res["data"]
+    user = users.get(user_email)
+    if user is not None and user.profile_ref:
+        # Step 2: GET organization/{orgId}/v2/agent-profile
+        profile_res = await _get_org_dataset("profiles", org_id, overrides)
+        if not profile_res.get("ok"):
+            return {"ok": False, "error": profile_res.get("error", "Agent profile fetch failed"), "step": "agent-profile"}
+        return _resolve_outbound(user_email, users, profile_res["data"])
+    return _resolve_outbound(user_email, users, None)
+
+
+def _resolve_outbound(user_email: str, users: UserIndex, profiles: ProfileIndex | None) -> dict:
+    """Outbound-capability result for one email against already-fetched indexes."""
+    user = users.get(user_email)
+    if user is None:
         return {
             "ok": False,
             "error": f"No user found with email {user_email} in this organization.",
             "step": "user/bulk-export",
         }
-    agent_profile_name = (
-        user.get("agentProfileName")
-        or user.get("agentProfile")
-        or user.get("profileName")
-        or user.get("agentProfileId")
-    )
+    agent_profile_name = user.profile_ref
     if not agent_profile_name:
         return {
             "ok": False,
             "error": f"User {user_email} has no agent profile configured (no agentProfileName).",
             "step": "user/bulk-export",
         }
-    # Step 2: GET organization/{orgId}/v2/agent-profile
-    path_profile = f"organization/{org_id}/v2/agent-profile"
-    profile_res = cc_rest("GET", path_profile, None, overrides)
-    if not profile_res.get("ok"):
-        return {"ok": False, "error": profile_res.get("error", "Agent profile fetch failed"), "step": "agent-profile"}
-    profile_data = profile_res.get("data")
-    if isinstance(profile_data, list):
-        profiles = profile_data
-    elif isinstance(profile_data, dict):
-        profiles = profile_data.get("data") or profile_data.get("agentProfiles") or profile_data.get("result") or []
-    else:
-        profiles = []
-    if not isinstance(profiles, list):
-        profiles = []
-    # Find profile by name or id
-    profile = None
-    for p in profiles:
-        if not isinstance(p, dict):
-            continue
-        name = (p.get("name") or p.get("agentProfileName") or "").strip()
-        pid = (p.get("id") or p.get("agentProfileId") or "").strip()
-        if name == agent_profile_name or pid == agent_profile_name:
-            profile = p
-            break
-    if not profile:
+    profile = profiles.get(agent_profile_name) if profiles is not None else None
+    if profile is None:
         return {
             "ok": False,
             "error": f"Agent profile '{agent_profile_name}' not found in tenant.",
             "agentProfileName": agent_profile_name,
             "step": "agent-profile",
         }
-    outdial_enabled = profile.get("outdialEnabled", False) is True
+    outdial_enabled = profile.outdial_enabled
     return {
         "ok": True,
         "userEmail": user_email,
@@ -214,6 +285,146 @@ def _check_agent_outbound(user_email: str, org_id: str, overrides: dict) -> dict
     }
 
 
+async def _check_agents_outbound(user_emails: list, org_id: str, overrides: dict) -> dict:
+    """Batch outbound check: fetch both org datasets once, then resolve every email against the indexes."""
+    users_res, profiles_res = await asyncio.gather(
+        _get_org_dataset("users", org_id, overrides),
+        _get_org_dataset("profiles", org_id, overrides),
+    )
+    if not users_res.get("ok"):
+        return {"ok": False, "error": users_res.get("error", "Bulk export failed"), "step": "user/bulk-export"}
+    if not profiles_res.get("ok"):
+        return {"ok": False, "error": profiles_res.get("error", "Agent profile fetch failed"), "step": "agent-profile"}
+    users: UserIndex = users_res["data"]
+    profiles: ProfileIndex = profiles_res["data"]
+    summary = dict.fromkeys(("outbound", "no-outbound", "not-found", "no-profile", "profile-not-found", "invalid"), 0)
+    rows = []
+    seen = set()
+    for raw in user_emails:
+        email = raw.strip() if isinstance(raw, str) else ""
+        key = normalize_email(email)
+        if key in seen:
+            continue
+        seen.add(key)
+        profile_ref = None
+        if not key or "@" not in key:
+            status = "invalid"
+        else:
+            user = users.get(key)
+            if user is None:
+                status = "not-found"
+            elif not user.profile_ref:
+                status = "no-profile"
+            else:
+                profile_ref = user.profile_ref
+                profile = profiles.get(profile_ref)
+                if profile is None:
+                    status = "profile-not-found"
+                else:
+                    status = "outbound" if profile.outdial_enabled else "no-outbound"
+        summary[status] += 1
+        rows.append([email or raw, status, profile_ref])
+    return {
+        "ok": True,
+        "total": len(rows),
+        "summary": summary,
+        "columns": ["email", "status", "agentProfileName"],
+        "rows": rows,
+    }
+
+
+def _end_task_status(result: dict) -> str:
+    if result.get("ok"):
+        return "ended"
+    return "not-found" if result.get("status") == 404 else "failed"
+
+
+async def _end_tasks(task_ids: list, overrides: dict) -> dict:
+    """Bulk cc_end_task: dedupe the IDs and POST the ends concurrently, at most CC_END_TASKS_CONCURRENCY at a time
+    (the per-org upstream limits in lib.ratelimit still apply on top)."""
+    slots = asyncio.Semaphore(max(1, env_int("CC_END_TASKS_CONCURRENCY", 10)))
+    summary = dict.fromkeys(("ended", "not-found", "failed", "invalid"), 0)
+    rows = []
+    seen = set()
+    for raw in task_ids:
+        task_id = raw.strip() if isinstance(raw, str) else ""
+        if task_id in seen:
+            continue
+        seen.add(task_id)
+        rows.append([task_id or raw, None if task_id and "/" not in task_id else "invalid", None, None])
+
+    async def end(row: list) -> None:
+        async with slots:
+            result = await cc_rest("POST", f"v1/tasks/{path_segment(row[0])}/end", {}, overrides)
+        row[1] = _end_task_status(result)
+        row[2] = result.get("status")
+        if not result.get("ok"):
+            row[3] = result.get("error")
+
+    await asyncio.gather(*(end(row) for row in rows if row[1] is None))
+    for row in rows:
+        summary[row[1]] += 1
+    return {
+        "ok": True,
+        "total": len(rows),
+        "duplicates": len(task_ids) - len(rows),
+        "summary": summary,
+        "columns": ["taskID", "status", "httpStatus", "error"],
+        "rows": rows,
+    }
+
+
+# Background prefetches of the next address-book page (kept referenced until done)
+_prefetches: set[asyncio.Task] = set()
+
+
+async def _address_book_page(org_id: str, overrides: dict, page: int, size: int, book_id: str | None = None) -> dict:
+    """One cached page of address books (or of one book's entries); the next page is prefetched meanwhile."""
+    dataset, path_args = ("addressBookEntries", {"bookId": book_id}) if book_id else ("addressBooks", None)
+
+    def get(number: int, prefetch: bool = False):
+        return _get_org_dataset(dataset, org_id, overrides, path_args=path_args, query={"page": number, "pageSize": size}, prefetch=prefetch)
+
+    res = await get(page)
+    if not res.get("ok"):
+        return {"ok": False, "error": res.get("error", "Address book fetch failed"), "status": res.get("status")}
+    if has_next(res["data"], page, size) and env_flag("CC_ADDRESS_BOOK_PREFETCH"):
+        task = asyncio.get_running_loop().create_task(get(page + 1, prefetch=True))
+        _prefetches.add(task)
+        task.add_done_callback(_prefetches.discard)
+    return page_result(res["data"], page, size, book_id)
+
+
+# (orgId, token scope) -> (users index, profiles index, AgentTable), rebuilt when either cached dataset changes
+_agent_tables: OrderedDict[tuple, tuple] = OrderedDict()
+_AGENT_TABLES_MAX = 16
+
+
+async def _agent_table(org_id: str, overrides: dict) -> dict:
+    """Columnar agent view for cc_query_agents over the cached user and profile datasets."""
+    users_res, profiles_res = await asyncio.gather(
+        _get_org_dataset("users", org_id, overrides),
+        _get_org_dataset("profiles", org_id, overrides),
+    )
+    if not users_res.get("ok"):
+        return {"ok": False, "error": users_res.get("error", "Bulk export failed"), "step": "user/bulk-export"}
+    if not profiles_res.get("ok"):
+        return {"ok": False, "error": profiles_res.get("error", "Agent profile fetch failed"), "step": "agent-profile"}
+    users, profiles = users_res["data"], profiles_res["data"]
+    key = (org_id, token_scope(overrides.get("token") or get_access_token()))
+    cached = _agent_tables.get(key)
+    if cached is not None and cached[0] is users and cached[1] is profiles:
+        _agent_tables.move_to_end(key)
+        return {"ok": True, "data": cached[2]}
+    with timing.span("agent-table"):
+        table = AgentTable(users, profiles)
+    _agent_tables[key] = (users, profiles, table)
+    _agent_tables.move_to_end(key)
+    while len(_agent_tables) > _AGENT_TABLES_MAX:
+        _agent_tables.popitem(last=False)
+    return {"ok": True, "data": table}
+
+
 async def handle_tool_call(name: str, args: dict | None) -> dict:
     args = dict(args or {})
     clean_args, overrides = strip_auth_overrides(args)
@@ -221,47 +432,102 @@ async def handle_tool_call(name: str, args: dict | None) -> dict:
         org_id = overrides.get("orgId") or get_org_id()
         if not org_id:
             return {
-                "content": [{"type": "text", "text": json.dumps({"ok": False, "error": "Organization ID is required. Set it in the Chat tab (Organization ID field) or in server .env as CONTACT_CENTER_ORG_ID." + _MCP_AUTH_HINT})}],
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "Organization ID is required. Set it in the Chat tab (Organization ID field) or in server .env as CONTACT_CENTER_ORG_ID." + _MCP_AUTH_HINT})}],
                 "isError": True,
             }
-        path = f"organization/{org_id}/v3/address-book"
-        result = cc_rest("GET", path, None, overrides)
-        return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+        request = page_request(clean_args)
+        if not request["ok"]:
+            return {"content": [{"type": "text", "text": tool_text(request)}], "isError": True}
+        result = await _address_book_page(org_id, overrides, request["page"], request["pageSize"], request["addressBookId"])
+        return {"content": [{"type": "text", "text": tool_text(result)}]}
     if name == "cc_end_task":
-        task_id = (clean_args.get("taskID") or "").strip()
+        task_id = str(clean_args.get("taskID") or "").strip()
         if not task_id:
             return {
-                "content": [{"type": "text", "text": json.dumps({"ok": False, "error": "taskID is required. Provide the task ID of the interaction to end."})}],
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "taskID is required. Provide the task ID of the interaction to end."})}],
+                "isError": True,
+            }
+        if not overrides.get("token") and not get_access_token():
+            return {
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "Access token is required. Set it in the Chat tab or pass __accessToken in tools/call arguments." + _MCP_AUTH_HINT})}],
+                "isError": True,
+            }
+        path = f"v1/tasks/{path_segment(task_id)}/end"
+        result = await cc_rest("POST", path, {}, overrides)
+        return {"content": [{"type": "text", "text": tool_text(result)}]}
+    if name == "cc_end_tasks":
+        task_ids = clean_args.get("taskIDs")
+        if isinstance(task_ids, str):
+            task_ids = [t for t in task_ids.replace(";", ",").replace("\n", ",").split(",") if t.strip()]
+        if not task_ids or not isinstance(task_ids, list):
+            return {
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "taskIDs is required. Provide a list of task IDs of the interactions to end."})}],
                 "isError": True,
             }
         if not overrides.get("token") and not get_access_token():
             return {
-                "content": [{"type": "text", "text": json.dumps({"ok": False, "error": "Access token is required. Set it in the Chat tab or pass __accessToken in tools/call arguments." + _MCP_AUTH_HINT})}],
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "Access token is required. Set it in the Chat tab or pass __accessToken in tools/call arguments." + _MCP_AUTH_HINT})}],
                 "isError": True,
             }
-        path = f"v1/tasks/{task_id}/end"
-        result = cc_rest("POST", path, {}, overrides)
-        return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+        result = await _end_tasks(task_ids, overrides)
+        return {"content": [{"type": "text", "text": tool_text(result)}]}
     if name == "cc_check_agent_outbound":
-        user_email = (clean_args.get("userEmail") or "").strip()
+        user_email = str(clean_args.get("userEmail") or "").strip()
         if not user_email:
             return {
-                "content": [{"type": "text", "text": json.dumps({"ok": False, "error": "userEmail is required. Provide the agent's email address."})}],
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "userEmail is required. Provide the agent's email address."})}],
                 "isError": True,
             }
         org_id = overrides.get("orgId") or get_org_id()
         if not org_id:
             return {
-                "content": [{"type": "text", "text": json.dumps({"ok": False, "error": "Organization ID is required. Set it in the Chat tab or in server .env as CONTACT_CENTER_ORG_ID." + _MCP_AUTH_HINT})}],
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "Organization ID is required. Set it in the Chat tab or in server .env as CONTACT_CENTER_ORG_ID." + _MCP_AUTH_HINT})}],
                 "isError": True,
             }
         if not overrides.get("token") and not get_access_token():
             return {
-                "content": [{"type": "text", "text": json.dumps({"ok": False, "error": "Access token is required. Set it in the Chat tab or pass __accessToken in tools/call arguments." + _MCP_AUTH_HINT})}],
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "Access token is required. Set it in the Chat tab or pass __accessToken in tools/call arguments." + _MCP_AUTH_HINT})}],
+                "isError": True,
+            }
+        result = await _check_agent_outbound(user_email, org_id, overrides)
+        return {"content": [{"type": "text", "text": tool_text(result)}]}
+    if name == "cc_check_agents_outbound":
+        user_emails = clean_args.get("userEmails")
+        if isinstance(user_emails, str):
+            user_emails = [e for e in user_emails.replace(";", ",").replace("\n", ",").split(",") if e.strip()]
+        if not user_emails or not isinstance(user_emails, list):
+            return {
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "userEmails is required. Provide a list of agent email addresses."})}],
+                "isError": True,
+            }
+        org_id = overrides.get("orgId") or get_org_id()
+        if not org_id:
+            return {
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "Organization ID is required. Set it in the Chat tab or in server .env as CONTACT_CENTER_ORG_ID." + _MCP_AUTH_HINT})}],
                 "isError": True,
             }
-        result = _check_agent_outbound(user_email, org_id, overrides)
-        return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+        if not overrides.get("token") and not get_access_token():
+            return {
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "Access token is required. Set it in the Chat tab or pass __accessToken in tools/call arguments." + _MCP_AUTH_HINT})}],
+                "isError": True,
+            }
+        result = await _check_agents_outbound(user_emails, org_id, overrides)
+        return {"content": [{"type": "text", "text": tool_text(result)}]}
+    if name == "cc_query_agents":
+        org_id = overrides.get("orgId") or get_org_id()
+        if not org_id:
+            return {
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "Organization ID is required. Set it in the Chat tab or in server .env as CONTACT_CENTER_ORG_ID." + _MCP_AUTH_HINT})}],
+                "isError": True,
+            }
+        if not overrides.get("token") and not get_access_token():
+            return {
+                "content": [{"type": "text", "text": tool_text({"ok": False, "error": "Access token is required. Set it in the Chat tab or pass __accessToken in tools/call arguments." + _MCP_AUTH_HINT})}],
+                "isError": True,
+            }
+        res = await _agent_table(org_id, overrides)
+        result = query_agents(res["data"], clean_args) if res.get("ok") else res
+        return {"content": [{"type": "text", "text": tool_text(result)}]}
     return {"content": [{"type": "text", "text": f'{{"error":"Unknown tool: {name}"}}'}], "isError": True}
 
 
@@ -292,14 +558,91 @@ def handle_mcp_message(body: dict) -> dict | None:
     return {"jsonrpc": "2.0", "id": req_id, "error": {"code": -32601, "message": "Method not found"}}
 
 
-app = FastAPI(title="Webex Contact Center MCP")
+metrics.register_tools(t["name"] for t in TOOLS)
+
+
+def _rpc_error(req_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": req_id, "error": {"code": code, "message": message}}
+
+
+async def dispatch_mcp(body: dict) -> dict | None:
+    """Handle one JSON-RPC 2.0 MCP request, including tools/call. Returns response dict or None for 204.
+    Used by POST /mcp and, in-process, by the chat loop (lib.mcp_client local transport)."""
+    req_id = body.get("id")
+    params = body.get("params") or {}
+    if not isinstance(params, dict):
+        return _rpc_error(req_id, -32602, "Invalid params")
+    if body.get("method") != "tools/call":
+        try:
+            return handle_mcp_message(body)
+        except Exception:
+            log.exception("MCP %s failed", body.get("method"))
+            return _rpc_error(req_id, -32603, "Internal error")
+    name = params.get("name")
+    args = params.get("arguments") or {}
+    if not isinstance(args, dict):
+        return _rpc_error(req_id, -32602, "Invalid params")
+    label = metrics.tool_label(name)
+    start = time.perf_counter()
+    try:
+        with metrics.TOOLS_IN_FLIGHT.track(), timing.span("tool", label):
+            result = await handle_tool_call(name, args)
+    except Exception:
+        # One failing call answers for its own id only; the rest of a batch still completes
+        log.exception("Tool %s failed", label)
+        metrics.TOOL_LATENCY.observe(time.perf_counter() - start, label)
+        metrics.TOOL_CALLS.inc(label, "error")
+        return _rpc_error(req_id, -32603, "Internal error")
+    metrics.TOOL_LATENCY.observe(time.perf_counter() - start, label)
+    metrics.TOOL_CALLS.inc(label, "error" if result.get("isError") else "ok")
+    return {"jsonrpc": "2.0", "id": req_id, "result": {"content": result["content"], "isError": result.get("isError", False)}}
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # One pooled Contact Center client per worker, reused by every tool call
+    await init_client()
+    # Mirror schema created in a thread, not by the first lookup on the event loop
+    await mirror.open()
+    # Chat requests whose MCP URL points at this server call dispatch_mcp directly instead of HTTP loopback
+    set_local_server(dispatch_mcp, int(os.environ.get("PORT", "3100")))
+    # Hot org datasets are refreshed ahead of expiry
+    refresher.start()
+    try:
+        yield
+    finally:
+        await refresher.stop()
+        await mirror.close()
+        await close_client()
+
+
+app = FastAPI(title="Webex Contact Center MCP", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+# Server-Timing header for /api/* and /mcp (spans from lib.timing)
+app.add_middleware(timing.TimingMiddleware)
+
+
+def _wants_timings(request: Request, data: dict | None = None) -> bool:
+    """Debug flag for a timings list in the response: body "debug": true, ?debug=1, X-Debug-Timings: 1 or DEBUG_TIMINGS=1."""
+    if env_flag("DEBUG_TIMINGS", False) or (isinstance(data, dict) and data.get("debug") is True):
+        return True
+    flag = request.query_params.get("debug") or request.headers.get("x-debug-timings") or ""
+    return flag.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _with_timings(payload, enabled: bool):
+    """Add the request's spans (timings, totalMs) to a JSON response dict when enabled."""
+    trace = timing.current()
+    if enabled and trace is not None and isinstance(payload, dict):
+        payload = {**payload, "timings": trace.as_list(), "totalMs": round(trace.elapsed() * 1000, 2)}
+    return payload
 
 
 @app.get("/health")
@@ -309,9 +652,22 @@ def health():
         "service": "webex-contact-center-mcp",
         "configured": bool(get_access_token()),
         "baseUrl": get_base_url(),
+        "cache": org_datasets.stats(),
+        "addressBookCache": address_book_pages.stats(),
+        "mirror": mirror.stats(),
+        "refresh": refresher.stats(),
+        "upstream": upstream_scheduler.stats(),
+        "breakers": breakers.stats(),
+        "sessions": get_session_store().stats(),
     }
 
 
+@app.get("/metrics")
+def metrics_endpoint():
+    """Prometheus text exposition of tool, upstream REST and chat/LLM metrics (per worker process)."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 # Chrome DevTools requests this; return 204 to avoid 404 log noise
 @app.get("/.well-known/appspecific/com.chrome.devtools.json")
 def chrome_devtools():
@@ -330,6 +686,34 @@ def mcp_get():
     )
 
 
+_INVALID_REQUEST = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+
+# Max requests of one JSON-RPC batch dispatched at the same time
+_BATCH_CONCURRENCY = max(1, env_int("MCP_BATCH_CONCURRENCY", 16))
+
+
+async def _dispatch_batch(batch: list) -> list | dict:
+    """JSON-RPC 2.0 batch: dispatch entries concurrently and return their responses in request order.
+    Notifications (no id) are run but get no response; an empty batch is a single Invalid Request error."""
+    if not batch:
+        return _INVALID_REQUEST
+    slots = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def one(item) -> dict | None:
+        if not isinstance(item, dict):
+            return _INVALID_REQUEST
+        async with slots:
+            try:
+                response = await dispatch_mcp(item)
+            except Exception:
+                log.exception("MCP batch entry failed")
+                response = _rpc_error(item.get("id"), -32603, "Internal error")
+        return response if "id" in item else None
+
+    responses = await asyncio.gather(*(one(item) for item in batch))
+    return [r for r in responses if r is not None]
+
+
 @app.post("/mcp")
 @app.post("/mcp/")
 async def mcp_post(request: Request):
@@ -340,24 +724,25 @@ async def mcp_post(request: Request):
             status_code=400,
             content={"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}},
         )
-    method = body.get("method")
-    params = body.get("params") or {}
-    req_id = body.get("id")
-
-    if method == "tools/call":
-        name = params.get("name")
-        args = params.get("arguments") or {}
-        result = await handle_tool_call(name, args)
-        return {"jsonrpc": "2.0", "id": req_id, "result": {"content": result["content"], "isError": result.get("isError", False)}}
-
-    response = handle_mcp_message(body)
+    if isinstance(body, list):
+        responses = await _dispatch_batch(body)
+        if isinstance(responses, dict):
+            return JSONResponse(status_code=400, content=responses)
+        return JSONBytesResponse(responses) if responses else Response(status_code=204)
+    if not isinstance(body, dict):
+        return JSONResponse(status_code=400, content=_INVALID_REQUEST)
+    response = await dispatch_mcp(body)
     if response is None:
         return Response(status_code=204)
-    return response
+    return JSONBytesResponse(_with_timings(response, _wants_timings(request)))
 
 
-@app.post("/api/chat")
-async def api_chat(request: Request):
+# Concurrent chats per worker; further requests wait for a slot
+_chat_slots = asyncio.Semaphore(max(1, env_int("CHAT_MAX_CONCURRENCY", 64)))
+
+
+async def _chat_args(request: Request) -> dict | JSONResponse:
+    """Validate a chat request body. Returns run_chat_with_mcp keyword arguments or a 400 response."""
     try:
         data = await request.json()
     except Exception:
@@ -370,24 +755,98 @@ async def api_chat(request: Request):
         return JSONResponse(status_code=400, content={"error": "Authentication required. Set the access token in the Chat tab before sending."})
     port = int(os.environ.get("PORT", "3100"))
     mcp_url = (data.get("mcpServerUrl") or "").strip() or f"http://localhost:{port}/mcp"
+    # The UI defaults to window.location.origin + '/mcp', i.e. this server under the host this request came in on.
+    # Decided per request: nothing from the Host header is remembered for other requests.
+    if is_local_url(mcp_url, request.url.netloc):
+        mcp_url = local_mcp_url()
+    request.state.debug_timings = _wants_timings(request, data)
     org_id = (data.get("orgId") or "").strip() or None
-    auth = {"accessToken": access_token, "orgId": org_id}
-    openai_key = os.environ.get("OPENAI_API_KEY")
-    claude_key = os.environ.get("CLAUDE_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
+    # History is kept only for a client-chosen conversation id; calls without one stay stateless
+    conversation_id = str(data.get("conversationId") or "").strip()[:128] or None
+    return {
+        "prompt": prompt,
+        "mcp_server_url": mcp_url,
+        "openai_api_key": os.environ.get("OPENAI_API_KEY"),
+        "claude_api_key": os.environ.get("CLAUDE_API_KEY") or os.environ.get("ANTHROPIC_API_KEY"),
+        "auth": {"accessToken": access_token, "orgId": org_id},
+        "conversation_id": conversation_id,
+    }
+
+
+@app.post("/api/chat")
+async def api_chat(request: Request):
+    chat_args = await _chat_args(request)
+    if isinstance(chat_args, JSONResponse):
+        return chat_args
     try:
-        import asyncio
         from lib.chat import run_chat_with_mcp
-        result = await asyncio.to_thread(run_chat_with_mcp, prompt, mcp_url, openai_key, claude_key, auth)
-        return result
+        with timing.span("queue"):
+            await _chat_slots.acquire()
+        try:
+            result = await run_chat_with_mcp(**chat_args)
+        finally:
+            _chat_slots.release()
+        return JSONBytesResponse(_with_timings(result, request.state.debug_timings))
     except ValueError as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {dumps(data)}\n\n"
+
+
+@app.post("/api/chat/stream")
+async def api_chat_stream(request: Request):
+    """Same as /api/chat, streamed as Server-Sent Events: start, delta {text}, tool_start {index, name, arguments},
+    tool_result {index, name, result, isError}, then done {reply, toolCalls} or error {error}."""
+    chat_args = await _chat_args(request)
+    if isinstance(chat_args, JSONResponse):
+        return chat_args
+    from lib.chat import run_chat_with_mcp
+
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def emit(event: str, data: dict) -> None:
+        await queue.put(_sse(event, data))
+
+    async def run() -> None:
+        try:
+            with timing.span("queue"):
+                await _chat_slots.acquire()
+            try:
+                result = await run_chat_with_mcp(**chat_args, emit=emit)
+            finally:
+                _chat_slots.release()
+            await queue.put(_sse("done", _with_timings(result, request.state.debug_timings)))
+        except Exception as e:
+            await queue.put(_sse("error", {"error": str(e) or type(e).__name__}))
+        finally:
+            await queue.put(None)
+
+    async def events():
+        task = asyncio.create_task(run())
+        try:
+            # First byte right away so clients (and proxies) see the stream open before the first model call
+            yield _sse("start", {})
+            while (chunk := await queue.get()) is not None:
+                yield chunk
+        finally:
+            if not task.done():
+                task.cancel()  # client went away
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # Serve Chat UI at / when server/static is populated (see NEXT_STEPS.md). Use /health for health checks.
 if _SERVE_UI:
-    app.mount("/", StaticFiles(directory=str(_STATIC_DIR), html=True), name="static")
+    warn_if_stale(_STATIC_DIR, _STATIC_DIR.parent.parent)
+    app.mount("/", PrecompressedStaticFiles(directory=str(_STATIC_DIR), html=True), name="static")
 else:
     @app.get("/")
     def root():
@@ -1,53 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function lc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Qu={exports:{}},ol={},Ku={exports:{}},O={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var qn=Symbol.for("react.element"),oc=Symbol.for("react.portal"),ic=Symbol.for("react.fragment"),uc=Symbol.for("react.strict_mode"),sc=Symbol.for("react.profiler"),ac=Symbol.for("react.provider"),cc=Symbol.for("react.context"),fc=Symbol.for("react.forward_ref"),dc=Symbol.for("react.suspense"),pc=Symbol.for("react.memo"),hc=Symbol.for("react.lazy"),Di=Symbol.iterator;function mc(e){return e===null||typeof e!="object"?null:(e=Di&&e[Di]||e["@@iterator"],typeof e=="function"?e:null)}var Yu={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Gu=Object.assign,Xu={};function fn(e,t,n){this.props=e,this.context=t,this.refs=Xu,this.updater=n||Yu}fn.prototype.isReactComponent={};fn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};fn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function Zu(){}Zu.prototype=fn.prototype;function $o(e,t,n){this.props=e,this.context=t,this.refs=Xu,this.updater=n||Yu}var Vo=$o.prototype=new Zu;Vo.constructor=$o;Gu(Vo,fn.prototype);Vo.isPureReactComponent=!0;var Fi=Array.isArray,Ju=Object.prototype.hasOwnProperty,Ho={current:null},qu={key:!0,ref:!0,__self:!0,__source:!0};function bu(e,t,n){var r,l={},o=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(o=""+t.key),t)Ju.call(t,r)&&!qu.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:qn,type:e,key:o,ref:i,props:l,_owner:Ho.current}}function vc(e,t){return{$$typeof:qn,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function Qo(e){return typeof e=="object"&&e!==null&&e.$$typeof===qn}function yc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Ui=/\/+/g;function xl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?yc(""+e.key):t.toString(36)}function xr(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(o){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case qn:case oc:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+xl(i,0):r,Fi(l)?(n="",e!=null&&(n=e.replace(Ui,"$&/")+"/"),xr(l,t,n,"",function(c){return c})):l!=null&&(Qo(l)&&(l=vc(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(Ui,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",Fi(e))for(var u=0;u<e.length;u++){o=e[u];var s=r+xl(o,u);i+=xr(o,t,n,s,l)}else if(s=mc(e),typeof s=="function")for(e=s.call(e),u=0;!(o=e.next()).done;)o=o.value,s=r+xl(o,u++),i+=xr(o,t,n,s,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function or(e,t,n){if(e==null)return e;var r=[],l=0;return xr(e,r,"","",function(o){return t.call(n,o,l++)}),r}function gc(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var ce={current:null},Cr={transition:null},wc={ReactCurrentDispatcher:ce,ReactCurrentBatchConfig:Cr,ReactCurrentOwner:Ho};function es(){throw Error("act(...) is not supported in production builds of React.")}O.Children={map:or,forEach:function(e,t,n){or(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return or(e,function(){t++}),t},toArray:function(e){return or(e,function(t){return t})||[]},only:function(e){if(!Qo(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};O.Component=fn;O.Fragment=ic;O.Profiler=sc;O.PureComponent=$o;O.StrictMode=uc;O.Suspense=dc;O.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=wc;O.act=es;O.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=Gu({},e.props),l=e.key,o=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,i=Ho.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)Ju.call(t,s)&&!qu.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];r.children=u}return{$$typeof:qn,type:e.type,key:l,ref:o,props:r,_owner:i}};O.createContext=function(e){return e={$$typeof:cc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:ac,_context:e},e.Consumer=e};O.createElement=bu;O.createFactory=function(e){var t=bu.bind(null,e);return t.type=e,t};O.createRef=function(){return{current:null}};O.forwardRef=function(e){return{$$typeof:fc,render:e}};O.isValidElement=Qo;O.lazy=function(e){return{$$typeof:hc,_payload:{_status:-1,_result:e},_init:gc}};O.memo=function(e,t){return{$$typeof:pc,type:e,compare:t===void 0?null:t}};O.startTransition=function(e){var t=Cr.transition;Cr.transition={};try{e()}finally{Cr.transition=t}};O.unstable_act=es;O.useCallback=function(e,t){return ce.current.useCallback(e,t)};O.useContext=function(e){return ce.current.useContext(e)};O.useDebugValue=function(){};O.useDeferredValue=function(e){return ce.current.useDeferredValue(e)};O.useEffect=function(e,t){return ce.current.useEffect(e,t)};O.useId=function(){return ce.current.useId()};O.useImperativeHandle=function(e,t,n){return ce.current.useImperativeHandle(e,t,n)};O.useInsertionEffect=function(e,t){return ce.current.useInsertionEffect(e,t)};O.useLayoutEffect=function(e,t){return ce.current.useLayoutEffect(e,t)};O.useMemo=function(e,t){return ce.current.useMemo(e,t)};O.useReducer=function(e,t,n){return ce.current.useReducer(e,t,n)};O.useRef=function(e){return ce.current.useRef(e)};O.useState=function(e){return ce.current.useState(e)};O.useSyncExternalStore=function(e,t,n){return ce.current.useSyncExternalStore(e,t,n)};O.useTransition=function(){return ce.current.useTransition()};O.version="18.3.1";Ku.exports=O;var J=Ku.exports;const kc=lc(J);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Sc=J,xc=Symbol.for("react.element"),Cc=Symbol.for("react.fragment"),Ec=Object.prototype.hasOwnProperty,_c=Sc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Nc={key:!0,ref:!0,__self:!0,__source:!0};function ts(e,t,n){var r,l={},o=null,i=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)Ec.call(t,r)&&!Nc.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:xc,type:e,key:o,ref:i,props:l,_owner:_c.current}}ol.Fragment=Cc;ol.jsx=ts;ol.jsxs=ts;Qu.exports=ol;var p=Qu.exports,Gl={},ns={exports:{}},Ce={},rs={exports:{}},ls={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(C,z){var L=C.length;C.push(z);e:for(;0<L;){var Q=L-1>>>1,Z=C[Q];if(0<l(Z,z))C[Q]=z,C[L]=Z,L=Q;else break e}}function n(C){return C.length===0?null:C[0]}function r(C){if(C.length===0)return null;var z=C[0],L=C.pop();if(L!==z){C[0]=L;e:for(var Q=0,Z=C.length,rr=Z>>>1;Q<rr;){var xt=2*(Q+1)-1,Sl=C[xt],Ct=xt+1,lr=C[Ct];if(0>l(Sl,L))Ct<Z&&0>l(lr,Sl)?(C[Q]=lr,C[Ct]=L,Q=Ct):(C[Q]=Sl,C[xt]=L,Q=xt);else if(Ct<Z&&0>l(lr,L))C[Q]=lr,C[Ct]=L,Q=Ct;else break e}}return z}function l(C,z){var L=C.sortIndex-z.sortIndex;return L!==0?L:C.id-z.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();e.unstable_now=function(){return i.now()-u}}var s=[],c=[],v=1,m=null,h=3,w=!1,k=!1,S=!1,M=typeof setTimeout=="function"?setTimeout:null,f=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function d(C){for(var z=n(c);z!==null;){if(z.callback===null)r(c);else if(z.startTime<=C)r(c),z.sortIndex=z.expirationTime,t(s,z);else break;z=n(c)}}function y(C){if(S=!1,d(C),!k)if(n(s)!==null)k=!0,pe(x);else{var z=n(c);z!==null&&St(y,z.startTime-C)}}function x(C,z){k=!1,S&&(S=!1,f(P),P=-1),w=!0;var L=h;try{for(d(z),m=n(s);m!==null&&(!(m.expirationTime>z)||C&&!ue());){var Q=m.callback;if(typeof Q=="function"){m.callback=null,h=m.priorityLevel;var Z=Q(m.expirationTime<=z);z=e.unstable_now(),typeof Z=="function"?m.callback=Z:m===n(s)&&r(s),d(z)}else r(s);m=n(s)}if(m!==null)var rr=!0;else{var xt=n(c);xt!==null&&St(y,xt.startTime-z),rr=!1}return rr}finally{m=null,h=L,w=!1}}var _=!1,N=null,P=-1,A=5,T=-1;function ue(){return!(e.unstable_now()-T<A)}function wt(){if(N!==null){var C=e.unstable_now();T=C;var z=!0;try{z=N(!0,C)}finally{z?kt():(_=!1,N=null)}}else _=!1}var kt;if(typeof a=="function")kt=function(){a(wt)};else if(typeof MessageChannel<"u"){var j=new MessageChannel,de=j.port2;j.port1.onmessage=wt,kt=function(){de.postMessage(null)}}else kt=function(){M(wt,0)};function pe(C){N=C,_||(_=!0,kt())}function St(C,z){P=M(function(){C(e.unstable_now())},z)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(C){C.callback=null},e.unstable_continueExecution=function(){k||w||(k=!0,pe(x))},e.unstable_forceFrameRate=function(C){0>C||125<C?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):A=0<C?Math.floor(1e3/C):5},e.unstable_getCurrentPriorityLevel=function(){return h},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(C){switch(h){case 1:case 2:case 3:var z=3;break;default:z=h}var L=h;h=z;try{return C()}finally{h=L}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(C,z){switch(C){case 1:case 2:case 3:case 4:case 5:break;default:C=3}var L=h;h=C;try{return z()}finally{h=L}},e.unstable_scheduleCallback=function(C,z,L){var Q=e.unstable_now();switch(typeof L=="object"&&L!==null?(L=L.delay,L=typeof L=="number"&&0<L?Q+L:Q):L=Q,C){case 1:var Z=-1;break;case 2:Z=250;break;case 5:Z=1073741823;break;case 4:Z=1e4;break;default:Z=5e3}return Z=L+Z,C={id:v++,callback:z,priorityLevel:C,startTime:L,expirationTime:Z,sortIndex:-1},L>Q?(C.sortIndex=L,t(c,C),n(s)===null&&C===n(c)&&(S?(f(P),P=-1):S=!0,St(y,L-Q))):(C.sortIndex=Z,t(s,C),k||w||(k=!0,pe(x))),C},e.unstable_shouldYield=ue,e.unstable_wrapCallback=function(C){var z=h;return function(){var L=h;h=z;try{return C.apply(this,arguments)}finally{h=L}}}})(ls);rs.exports=ls;var Pc=rs.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var jc=J,xe=Pc;function g(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var os=new Set,Rn={};function Dt(e,t){rn(e,t),rn(e+"Capture",t)}function rn(e,t){for(Rn[e]=t,e=0;e<t.length;e++)os.add(t[e])}var Ge=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Xl=Object.prototype.hasOwnProperty,Tc=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Ai={},Wi={};function zc(e){return Xl.call(Wi,e)?!0:Xl.call(Ai,e)?!1:Tc.test(e)?Wi[e]=!0:(Ai[e]=!0,!1)}function Lc(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Oc(e,t,n,r){if(t===null||typeof t>"u"||Lc(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function fe(e,t,n,r,l,o,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=i}var ne={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){ne[e]=new fe(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];ne[t]=new fe(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){ne[e]=new fe(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){ne[e]=new fe(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){ne[e]=new fe(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){ne[e]=new fe(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){ne[e]=new fe(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){ne[e]=new fe(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){ne[e]=new fe(e,5,!1,e.toLowerCase(),null,!1,!1)});var Ko=/[\-:]([a-z])/g;function Yo(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(Ko,Yo);ne[t]=new fe(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(Ko,Yo);ne[t]=new fe(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(Ko,Yo);ne[t]=new fe(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){ne[e]=new fe(e,1,!1,e.toLowerCase(),null,!1,!1)});ne.xlinkHref=new fe("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){ne[e]=new fe(e,1,!1,e.toLowerCase(),null,!0,!0)});function Go(e,t,n,r){var l=ne.hasOwnProperty(t)?ne[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Oc(t,n,l,r)&&(n=null),r||l===null?zc(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var qe=jc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,ir=Symbol.for("react.element"),At=Symbol.for("react.portal"),Wt=Symbol.for("react.fragment"),Xo=Symbol.for("react.strict_mode"),Zl=Symbol.for("react.profiler"),is=Symbol.for("react.provider"),us=Symbol.for("react.context"),Zo=Symbol.for("react.forward_ref"),Jl=Symbol.for("react.suspense"),ql=Symbol.for("react.suspense_list"),Jo=Symbol.for("react.memo"),et=Symbol.for("react.lazy"),ss=Symbol.for("react.offscreen"),Bi=Symbol.iterator;function hn(e){return e===null||typeof e!="object"?null:(e=Bi&&e[Bi]||e["@@iterator"],typeof e=="function"?e:null)}var V=Object.assign,Cl;function xn(e){if(Cl===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Cl=t&&t[1]||""}return`
-`+Cl+e}var El=!1;function _l(e,t){if(!e||El)return"";El=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(c){var r=c}Reflect.construct(e,[],t)}else{try{t.call()}catch(c){r=c}e.call(t.prototype)}else{try{throw Error()}catch(c){r=c}e()}}catch(c){if(c&&r&&typeof c.stack=="string"){for(var l=c.stack.split(`
-`),o=r.stack.split(`
-`),i=l.length-1,u=o.length-1;1<=i&&0<=u&&l[i]!==o[u];)u--;for(;1<=i&&0<=u;i--,u--)if(l[i]!==o[u]){if(i!==1||u!==1)do if(i--,u--,0>u||l[i]!==o[u]){var s=`
-`+l[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=i&&0<=u);break}}}finally{El=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?xn(e):""}function Ic(e){switch(e.tag){case 5:return xn(e.type);case 16:return xn("Lazy");case 13:return xn("Suspense");case 19:return xn("SuspenseList");case 0:case 2:case 15:return e=_l(e.type,!1),e;case 11:return e=_l(e.type.render,!1),e;case 1:return e=_l(e.type,!0),e;default:return""}}function bl(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Wt:return"Fragment";case At:return"Portal";case Zl:return"Profiler";case Xo:return"StrictMode";case Jl:return"Suspense";case ql:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case us:return(e.displayName||"Context")+".Consumer";case is:return(e._context.displayName||"Context")+".Provider";case Zo:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case Jo:return t=e.displayName||null,t!==null?t:bl(e.type)||"Memo";case et:t=e._payload,e=e._init;try{return bl(e(t))}catch{}}return null}function Mc(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return bl(t);case 8:return t===Xo?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function ht(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function as(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Rc(e){var t=as(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,o.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function ur(e){e._valueTracker||(e._valueTracker=Rc(e))}function cs(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=as(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Mr(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function eo(e,t){var n=t.checked;return V({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function $i(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=ht(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function fs(e,t){t=t.checked,t!=null&&Go(e,"checked",t,!1)}function to(e,t){fs(e,t);var n=ht(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?no(e,t.type,n):t.hasOwnProperty("defaultValue")&&no(e,t.type,ht(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Vi(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function no(e,t,n){(t!=="number"||Mr(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Cn=Array.isArray;function Jt(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ht(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function ro(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(g(91));return V({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Hi(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(g(92));if(Cn(n)){if(1<n.length)throw Error(g(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:ht(n)}}function ds(e,t){var n=ht(t.value),r=ht(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function Qi(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function ps(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function lo(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?ps(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var sr,hs=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(sr=sr||document.createElement("div"),sr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=sr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Dn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Nn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},Dc=["Webkit","ms","Moz","O"];Object.keys(Nn).forEach(function(e){Dc.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Nn[t]=Nn[e]})});function ms(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Nn.hasOwnProperty(e)&&Nn[e]?(""+t).trim():t+"px"}function vs(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=ms(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var Fc=V({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function oo(e,t){if(t){if(Fc[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(g(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(g(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(g(61))}if(t.style!=null&&typeof t.style!="object")throw Error(g(62))}}function io(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var uo=null;function qo(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var so=null,qt=null,bt=null;function Ki(e){if(e=tr(e)){if(typeof so!="function")throw Error(g(280));var t=e.stateNode;t&&(t=cl(t),so(e.stateNode,e.type,t))}}function ys(e){qt?bt?bt.push(e):bt=[e]:qt=e}function gs(){if(qt){var e=qt,t=bt;if(bt=qt=null,Ki(e),t)for(e=0;e<t.length;e++)Ki(t[e])}}function ws(e,t){return e(t)}function ks(){}var Nl=!1;function Ss(e,t,n){if(Nl)return e(t,n);Nl=!0;try{return ws(e,t,n)}finally{Nl=!1,(qt!==null||bt!==null)&&(ks(),gs())}}function Fn(e,t){var n=e.stateNode;if(n===null)return null;var r=cl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(g(231,t,typeof n));return n}var ao=!1;if(Ge)try{var mn={};Object.defineProperty(mn,"passive",{get:function(){ao=!0}}),window.addEventListener("test",mn,mn),window.removeEventListener("test",mn,mn)}catch{ao=!1}function Uc(e,t,n,r,l,o,i,u,s){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(v){this.onError(v)}}var Pn=!1,Rr=null,Dr=!1,co=null,Ac={onError:function(e){Pn=!0,Rr=e}};function Wc(e,t,n,r,l,o,i,u,s){Pn=!1,Rr=null,Uc.apply(Ac,arguments)}function Bc(e,t,n,r,l,o,i,u,s){if(Wc.apply(this,arguments),Pn){if(Pn){var c=Rr;Pn=!1,Rr=null}else throw Error(g(198));Dr||(Dr=!0,co=c)}}function Ft(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function xs(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function Yi(e){if(Ft(e)!==e)throw Error(g(188))}function $c(e){var t=e.alternate;if(!t){if(t=Ft(e),t===null)throw Error(g(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return Yi(l),e;if(o===r)return Yi(l),t;o=o.sibling}throw Error(g(188))}if(n.return!==r.return)n=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===n){i=!0,n=l,r=o;break}if(u===r){i=!0,r=l,n=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===n){i=!0,n=o,r=l;break}if(u===r){i=!0,r=o,n=l;break}u=u.sibling}if(!i)throw Error(g(189))}}if(n.alternate!==r)throw Error(g(190))}if(n.tag!==3)throw Error(g(188));return n.stateNode.current===n?e:t}function Cs(e){return e=$c(e),e!==null?Es(e):null}function Es(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Es(e);if(t!==null)return t;e=e.sibling}return null}var _s=xe.unstable_scheduleCallback,Gi=xe.unstable_cancelCallback,Vc=xe.unstable_shouldYield,Hc=xe.unstable_requestPaint,K=xe.unstable_now,Qc=xe.unstable_getCurrentPriorityLevel,bo=xe.unstable_ImmediatePriority,Ns=xe.unstable_UserBlockingPriority,Fr=xe.unstable_NormalPriority,Kc=xe.unstable_LowPriority,Ps=xe.unstable_IdlePriority,il=null,Be=null;function Yc(e){if(Be&&typeof Be.onCommitFiberRoot=="function")try{Be.onCommitFiberRoot(il,e,void 0,(e.current.flags&128)===128)}catch{}}var Re=Math.clz32?Math.clz32:Zc,Gc=Math.log,Xc=Math.LN2;function Zc(e){return e>>>=0,e===0?32:31-(Gc(e)/Xc|0)|0}var ar=64,cr=4194304;function En(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Ur(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,i=n&268435455;if(i!==0){var u=i&~l;u!==0?r=En(u):(o&=i,o!==0&&(r=En(o)))}else i=n&~l,i!==0?r=En(i):o!==0&&(r=En(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Re(t),l=1<<n,r|=e[n],t&=~l;return r}function Jc(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function qc(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var i=31-Re(o),u=1<<i,s=l[i];s===-1?(!(u&n)||u&r)&&(l[i]=Jc(u,t)):s<=t&&(e.expiredLanes|=u),o&=~u}}function fo(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function js(){var e=ar;return ar<<=1,!(ar&4194240)&&(ar=64),e}function Pl(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function bn(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Re(t),e[t]=n}function bc(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Re(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function ei(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Re(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var R=0;function Ts(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var zs,ti,Ls,Os,Is,po=!1,fr=[],it=null,ut=null,st=null,Un=new Map,An=new Map,nt=[],ef="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Xi(e,t){switch(e){case"focusin":case"focusout":it=null;break;case"dragenter":case"dragleave":ut=null;break;case"mouseover":case"mouseout":st=null;break;case"pointerover":case"pointerout":Un.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":An.delete(t.pointerId)}}function vn(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=tr(t),t!==null&&ti(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function tf(e,t,n,r,l){switch(t){case"focusin":return it=vn(it,e,t,n,r,l),!0;case"dragenter":return ut=vn(ut,e,t,n,r,l),!0;case"mouseover":return st=vn(st,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return Un.set(o,vn(Un.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,An.set(o,vn(An.get(o)||null,e,t,n,r,l)),!0}return!1}function Ms(e){var t=Nt(e.target);if(t!==null){var n=Ft(t);if(n!==null){if(t=n.tag,t===13){if(t=xs(n),t!==null){e.blockedOn=t,Is(e.priority,function(){Ls(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Er(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=ho(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);uo=r,n.target.dispatchEvent(r),uo=null}else return t=tr(n),t!==null&&ti(t),e.blockedOn=n,!1;t.shift()}return!0}function Zi(e,t,n){Er(e)&&n.delete(t)}function nf(){po=!1,it!==null&&Er(it)&&(it=null),ut!==null&&Er(ut)&&(ut=null),st!==null&&Er(st)&&(st=null),Un.forEach(Zi),An.forEach(Zi)}function yn(e,t){e.blockedOn===t&&(e.blockedOn=null,po||(po=!0,xe.unstable_scheduleCallback(xe.unstable_NormalPriority,nf)))}function Wn(e){function t(l){return yn(l,e)}if(0<fr.length){yn(fr[0],e);for(var n=1;n<fr.length;n++){var r=fr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(it!==null&&yn(it,e),ut!==null&&yn(ut,e),st!==null&&yn(st,e),Un.forEach(t),An.forEach(t),n=0;n<nt.length;n++)r=nt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<nt.length&&(n=nt[0],n.blockedOn===null);)Ms(n),n.blockedOn===null&&nt.shift()}var en=qe.ReactCurrentBatchConfig,Ar=!0;function rf(e,t,n,r){var l=R,o=en.transition;en.transition=null;try{R=1,ni(e,t,n,r)}finally{R=l,en.transition=o}}function lf(e,t,n,r){var l=R,o=en.transition;en.transition=null;try{R=4,ni(e,t,n,r)}finally{R=l,en.transition=o}}function ni(e,t,n,r){if(Ar){var l=ho(e,t,n,r);if(l===null)Fl(e,t,r,Wr,n),Xi(e,r);else if(tf(l,e,t,n,r))r.stopPropagation();else if(Xi(e,r),t&4&&-1<ef.indexOf(e)){for(;l!==null;){var o=tr(l);if(o!==null&&zs(o),o=ho(e,t,n,r),o===null&&Fl(e,t,r,Wr,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else Fl(e,t,r,null,n)}}var Wr=null;function ho(e,t,n,r){if(Wr=null,e=qo(r),e=Nt(e),e!==null)if(t=Ft(e),t===null)e=null;else if(n=t.tag,n===13){if(e=xs(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Wr=e,null}function Rs(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Qc()){case bo:return 1;case Ns:return 4;case Fr:case Kc:return 16;case Ps:return 536870912;default:return 16}default:return 16}}var lt=null,ri=null,_r=null;function Ds(){if(_r)return _r;var e,t=ri,n=t.length,r,l="value"in lt?lt.value:lt.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[o-r];r++);return _r=l.slice(e,1<r?1-r:void 0)}function Nr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function dr(){return!0}function Ji(){return!1}function Ee(e){function t(n,r,l,o,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=i,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(o):o[u]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?dr:Ji,this.isPropagationStopped=Ji,this}return V(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=dr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=dr)},persist:function(){},isPersistent:dr}),t}var dn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},li=Ee(dn),er=V({},dn,{view:0,detail:0}),of=Ee(er),jl,Tl,gn,ul=V({},er,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:oi,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==gn&&(gn&&e.type==="mousemove"?(jl=e.screenX-gn.screenX,Tl=e.screenY-gn.screenY):Tl=jl=0,gn=e),jl)},movementY:function(e){return"movementY"in e?e.movementY:Tl}}),qi=Ee(ul),uf=V({},ul,{dataTransfer:0}),sf=Ee(uf),af=V({},er,{relatedTarget:0}),zl=Ee(af),cf=V({},dn,{animationName:0,elapsedTime:0,pseudoElement:0}),ff=Ee(cf),df=V({},dn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),pf=Ee(df),hf=V({},dn,{data:0}),bi=Ee(hf),mf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},vf={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},yf={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function gf(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=yf[e])?!!t[e]:!1}function oi(){return gf}var wf=V({},er,{key:function(e){if(e.key){var t=mf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Nr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?vf[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:oi,charCode:function(e){return e.type==="keypress"?Nr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Nr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),kf=Ee(wf),Sf=V({},ul,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),eu=Ee(Sf),xf=V({},er,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:oi}),Cf=Ee(xf),Ef=V({},dn,{propertyName:0,elapsedTime:0,pseudoElement:0}),_f=Ee(Ef),Nf=V({},ul,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Pf=Ee(Nf),jf=[9,13,27,32],ii=Ge&&"CompositionEvent"in window,jn=null;Ge&&"documentMode"in document&&(jn=document.documentMode);var Tf=Ge&&"TextEvent"in window&&!jn,Fs=Ge&&(!ii||jn&&8<jn&&11>=jn),tu=" ",nu=!1;function Us(e,t){switch(e){case"keyup":return jf.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function As(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Bt=!1;function zf(e,t){switch(e){case"compositionend":return As(t);case"keypress":return t.which!==32?null:(nu=!0,tu);case"textInput":return e=t.data,e===tu&&nu?null:e;default:return null}}function Lf(e,t){if(Bt)return e==="compositionend"||!ii&&Us(e,t)?(e=Ds(),_r=ri=lt=null,Bt=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Fs&&t.locale!=="ko"?null:t.data;default:return null}}var Of={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function ru(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Of[e.type]:t==="textarea"}function Ws(e,t,n,r){ys(r),t=Br(t,"onChange"),0<t.length&&(n=new li("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Tn=null,Bn=null;function If(e){Js(e,0)}function sl(e){var t=Ht(e);if(cs(t))return e}function Mf(e,t){if(e==="change")return t}var Bs=!1;if(Ge){var Ll;if(Ge){var Ol="oninput"in document;if(!Ol){var lu=document.createElement("div");lu.setAttribute("oninput","return;"),Ol=typeof lu.oninput=="function"}Ll=Ol}else Ll=!1;Bs=Ll&&(!document.documentMode||9<document.documentMode)}function ou(){Tn&&(Tn.detachEvent("onpropertychange",$s),Bn=Tn=null)}function $s(e){if(e.propertyName==="value"&&sl(Bn)){var t=[];Ws(t,Bn,e,qo(e)),Ss(If,t)}}function Rf(e,t,n){e==="focusin"?(ou(),Tn=t,Bn=n,Tn.attachEvent("onpropertychange",$s)):e==="focusout"&&ou()}function Df(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return sl(Bn)}function Ff(e,t){if(e==="click")return sl(t)}function Uf(e,t){if(e==="input"||e==="change")return sl(t)}function Af(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Fe=typeof Object.is=="function"?Object.is:Af;function $n(e,t){if(Fe(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!Xl.call(t,l)||!Fe(e[l],t[l]))return!1}return!0}function iu(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function uu(e,t){var n=iu(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=iu(n)}}function Vs(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Vs(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Hs(){for(var e=window,t=Mr();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Mr(e.document)}return t}function ui(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Wf(e){var t=Hs(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Vs(n.ownerDocument.documentElement,n)){if(r!==null&&ui(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=uu(n,o);var i=uu(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Bf=Ge&&"documentMode"in document&&11>=document.documentMode,$t=null,mo=null,zn=null,vo=!1;function su(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;vo||$t==null||$t!==Mr(r)||(r=$t,"selectionStart"in r&&ui(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),zn&&$n(zn,r)||(zn=r,r=Br(mo,"onSelect"),0<r.length&&(t=new li("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=$t)))}function pr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Vt={animationend:pr("Animation","AnimationEnd"),animationiteration:pr("Animation","AnimationIteration"),animationstart:pr("Animation","AnimationStart"),transitionend:pr("Transition","TransitionEnd")},Il={},Qs={};Ge&&(Qs=document.createElement("div").style,"AnimationEvent"in window||(delete Vt.animationend.animation,delete Vt.animationiteration.animation,delete Vt.animationstart.animation),"TransitionEvent"in window||delete Vt.transitionend.transition);function al(e){if(Il[e])return Il[e];if(!Vt[e])return e;var t=Vt[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Qs)return Il[e]=t[n];return e}var Ks=al("animationend"),Ys=al("animationiteration"),Gs=al("animationstart"),Xs=al("transitionend"),Zs=new Map,au="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function vt(e,t){Zs.set(e,t),Dt(t,[e])}for(var Ml=0;Ml<au.length;Ml++){var Rl=au[Ml],$f=Rl.toLowerCase(),Vf=Rl[0].toUpperCase()+Rl.slice(1);vt($f,"on"+Vf)}vt(Ks,"onAnimationEnd");vt(Ys,"onAnimationIteration");vt(Gs,"onAnimationStart");vt("dblclick","onDoubleClick");vt("focusin","onFocus");vt("focusout","onBlur");vt(Xs,"onTransitionEnd");rn("onMouseEnter",["mouseout","mouseover"]);rn("onMouseLeave",["mouseout","mouseover"]);rn("onPointerEnter",["pointerout","pointerover"]);rn("onPointerLeave",["pointerout","pointerover"]);Dt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Dt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Dt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Dt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Dt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Dt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var _n="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Hf=new Set("cancel close invalid load scroll toggle".split(" ").concat(_n));function cu(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,Bc(r,t,void 0,e),e.currentTarget=null}function Js(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var i=r.length-1;0<=i;i--){var u=r[i],s=u.instance,c=u.currentTarget;if(u=u.listener,s!==o&&l.isPropagationStopped())break e;cu(l,u,c),o=s}else for(i=0;i<r.length;i++){if(u=r[i],s=u.instance,c=u.currentTarget,u=u.listener,s!==o&&l.isPropagationStopped())break e;cu(l,u,c),o=s}}}if(Dr)throw e=co,Dr=!1,co=null,e}function F(e,t){var n=t[So];n===void 0&&(n=t[So]=new Set);var r=e+"__bubble";n.has(r)||(qs(t,e,2,!1),n.add(r))}function Dl(e,t,n){var r=0;t&&(r|=4),qs(n,e,r,t)}var hr="_reactListening"+Math.random().toString(36).slice(2);function Vn(e){if(!e[hr]){e[hr]=!0,os.forEach(function(n){n!=="selectionchange"&&(Hf.has(n)||Dl(n,!1,e),Dl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[hr]||(t[hr]=!0,Dl("selectionchange",!1,t))}}function qs(e,t,n,r){switch(Rs(t)){case 1:var l=rf;break;case 4:l=lf;break;default:l=ni}n=l.bind(null,t,n,e),l=void 0,!ao||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Fl(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var s=i.tag;if((s===3||s===4)&&(s=i.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;i=i.return}for(;u!==null;){if(i=Nt(u),i===null)return;if(s=i.tag,s===5||s===6){r=o=i;continue e}u=u.parentNode}}r=r.return}Ss(function(){var c=o,v=qo(n),m=[];e:{var h=Zs.get(e);if(h!==void 0){var w=li,k=e;switch(e){case"keypress":if(Nr(n)===0)break e;case"keydown":case"keyup":w=kf;break;case"focusin":k="focus",w=zl;break;case"focusout":k="blur",w=zl;break;case"beforeblur":case"afterblur":w=zl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":w=qi;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":w=sf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":w=Cf;break;case Ks:case Ys:case Gs:w=ff;break;case Xs:w=_f;break;case"scroll":w=of;break;case"wheel":w=Pf;break;case"copy":case"cut":case"paste":w=pf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":w=eu}var S=(t&4)!==0,M=!S&&e==="scroll",f=S?h!==null?h+"Capture":null:h;S=[];for(var a=c,d;a!==null;){d=a;var y=d.stateNode;if(d.tag===5&&y!==null&&(d=y,f!==null&&(y=Fn(a,f),y!=null&&S.push(Hn(a,y,d)))),M)break;a=a.return}0<S.length&&(h=new w(h,k,null,n,v),m.push({event:h,listeners:S}))}}if(!(t&7)){e:{if(h=e==="mouseover"||e==="pointerover",w=e==="mouseout"||e==="pointerout",h&&n!==uo&&(k=n.relatedTarget||n.fromElement)&&(Nt(k)||k[Xe]))break e;if((w||h)&&(h=v.window===v?v:(h=v.ownerDocument)?h.defaultView||h.parentWindow:window,w?(k=n.relatedTarget||n.toElement,w=c,k=k?Nt(k):null,k!==null&&(M=Ft(k),k!==M||k.tag!==5&&k.tag!==6)&&(k=null)):(w=null,k=c),w!==k)){if(S=qi,y="onMouseLeave",f="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(S=eu,y="onPointerLeave",f="onPointerEnter",a="pointer"),M=w==null?h:Ht(w),d=k==null?h:Ht(k),h=new S(y,a+"leave",w,n,v),h.target=M,h.relatedTarget=d,y=null,Nt(v)===c&&(S=new S(f,a+"enter",k,n,v),S.target=d,S.relatedTarget=M,y=S),M=y,w&&k)t:{for(S=w,f=k,a=0,d=S;d;d=Ut(d))a++;for(d=0,y=f;y;y=Ut(y))d++;for(;0<a-d;)S=Ut(S),a--;for(;0<d-a;)f=Ut(f),d--;for(;a--;){if(S===f||f!==null&&S===f.alternate)break t;S=Ut(S),f=Ut(f)}S=null}else S=null;w!==null&&fu(m,h,w,S,!1),k!==null&&M!==null&&fu(m,M,k,S,!0)}}e:{if(h=c?Ht(c):window,w=h.nodeName&&h.nodeName.toLowerCase(),w==="select"||w==="input"&&h.type==="file")var x=Mf;else if(ru(h))if(Bs)x=Uf;else{x=Df;var _=Rf}else(w=h.nodeName)&&w.toLowerCase()==="input"&&(h.type==="checkbox"||h.type==="radio")&&(x=Ff);if(x&&(x=x(e,c))){Ws(m,x,n,v);break e}_&&_(e,h,c),e==="focusout"&&(_=h._wrapperState)&&_.controlled&&h.type==="number"&&no(h,"number",h.value)}switch(_=c?Ht(c):window,e){case"focusin":(ru(_)||_.contentEditable==="true")&&($t=_,mo=c,zn=null);break;case"focusout":zn=mo=$t=null;break;case"mousedown":vo=!0;break;case"contextmenu":case"mouseup":case"dragend":vo=!1,su(m,n,v);break;case"selectionchange":if(Bf)break;case"keydown":case"keyup":su(m,n,v)}var N;if(ii)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else Bt?Us(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(Fs&&n.locale!=="ko"&&(Bt||P!=="onCompositionStart"?P==="onCompositionEnd"&&Bt&&(N=Ds()):(lt=v,ri="value"in lt?lt.value:lt.textContent,Bt=!0)),_=Br(c,P),0<_.length&&(P=new bi(P,e,null,n,v),m.push({event:P,listeners:_}),N?P.data=N:(N=As(n),N!==null&&(P.data=N)))),(N=Tf?zf(e,n):Lf(e,n))&&(c=Br(c,"onBeforeInput"),0<c.length&&(v=new bi("onBeforeInput","beforeinput",null,n,v),m.push({event:v,listeners:c}),v.data=N))}Js(m,t)})}function Hn(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Br(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=Fn(e,n),o!=null&&r.unshift(Hn(e,o,l)),o=Fn(e,t),o!=null&&r.push(Hn(e,o,l))),e=e.return}return r}function Ut(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function fu(e,t,n,r,l){for(var o=t._reactName,i=[];n!==null&&n!==r;){var u=n,s=u.alternate,c=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&c!==null&&(u=c,l?(s=Fn(n,o),s!=null&&i.unshift(Hn(n,s,u))):l||(s=Fn(n,o),s!=null&&i.push(Hn(n,s,u)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var Qf=/\r\n?/g,Kf=/\u0000|\uFFFD/g;function du(e){return(typeof e=="string"?e:""+e).replace(Qf,`
-`).replace(Kf,"")}function mr(e,t,n){if(t=du(t),du(e)!==t&&n)throw Error(g(425))}function $r(){}var yo=null,go=null;function wo(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var ko=typeof setTimeout=="function"?setTimeout:void 0,Yf=typeof clearTimeout=="function"?clearTimeout:void 0,pu=typeof Promise=="function"?Promise:void 0,Gf=typeof queueMicrotask=="function"?queueMicrotask:typeof pu<"u"?function(e){return pu.resolve(null).then(e).catch(Xf)}:ko;function Xf(e){setTimeout(function(){throw e})}function Ul(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),Wn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);Wn(t)}function at(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function hu(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var pn=Math.random().toString(36).slice(2),We="__reactFiber$"+pn,Qn="__reactProps$"+pn,Xe="__reactContainer$"+pn,So="__reactEvents$"+pn,Zf="__reactListeners$"+pn,Jf="__reactHandles$"+pn;function Nt(e){var t=e[We];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Xe]||n[We]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=hu(e);e!==null;){if(n=e[We])return n;e=hu(e)}return t}e=n,n=e.parentNode}return null}function tr(e){return e=e[We]||e[Xe],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Ht(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(g(33))}function cl(e){return e[Qn]||null}var xo=[],Qt=-1;function yt(e){return{current:e}}function U(e){0>Qt||(e.current=xo[Qt],xo[Qt]=null,Qt--)}function D(e,t){Qt++,xo[Qt]=e.current,e.current=t}var mt={},ie=yt(mt),ve=yt(!1),Lt=mt;function ln(e,t){var n=e.type.contextTypes;if(!n)return mt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function ye(e){return e=e.childContextTypes,e!=null}function Vr(){U(ve),U(ie)}function mu(e,t,n){if(ie.current!==mt)throw Error(g(168));D(ie,t),D(ve,n)}function bs(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(g(108,Mc(e)||"Unknown",l));return V({},n,r)}function Hr(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||mt,Lt=ie.current,D(ie,e),D(ve,ve.current),!0}function vu(e,t,n){var r=e.stateNode;if(!r)throw Error(g(169));n?(e=bs(e,t,Lt),r.__reactInternalMemoizedMergedChildContext=e,U(ve),U(ie),D(ie,e)):U(ve),D(ve,n)}var He=null,fl=!1,Al=!1;function ea(e){He===null?He=[e]:He.push(e)}function qf(e){fl=!0,ea(e)}function gt(){if(!Al&&He!==null){Al=!0;var e=0,t=R;try{var n=He;for(R=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}He=null,fl=!1}catch(l){throw He!==null&&(He=He.slice(e+1)),_s(bo,gt),l}finally{R=t,Al=!1}}return null}var Kt=[],Yt=0,Qr=null,Kr=0,_e=[],Ne=0,Ot=null,Qe=1,Ke="";function Et(e,t){Kt[Yt++]=Kr,Kt[Yt++]=Qr,Qr=e,Kr=t}function ta(e,t,n){_e[Ne++]=Qe,_e[Ne++]=Ke,_e[Ne++]=Ot,Ot=e;var r=Qe;e=Ke;var l=32-Re(r)-1;r&=~(1<<l),n+=1;var o=32-Re(t)+l;if(30<o){var i=l-l%5;o=(r&(1<<i)-1).toString(32),r>>=i,l-=i,Qe=1<<32-Re(t)+l|n<<l|r,Ke=o+e}else Qe=1<<o|n<<l|r,Ke=e}function si(e){e.return!==null&&(Et(e,1),ta(e,1,0))}function ai(e){for(;e===Qr;)Qr=Kt[--Yt],Kt[Yt]=null,Kr=Kt[--Yt],Kt[Yt]=null;for(;e===Ot;)Ot=_e[--Ne],_e[Ne]=null,Ke=_e[--Ne],_e[Ne]=null,Qe=_e[--Ne],_e[Ne]=null}var Se=null,ke=null,W=!1,Me=null;function na(e,t){var n=Pe(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function yu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Se=e,ke=at(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Se=e,ke=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Ot!==null?{id:Qe,overflow:Ke}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Pe(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Se=e,ke=null,!0):!1;default:return!1}}function Co(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Eo(e){if(W){var t=ke;if(t){var n=t;if(!yu(e,t)){if(Co(e))throw Error(g(418));t=at(n.nextSibling);var r=Se;t&&yu(e,t)?na(r,n):(e.flags=e.flags&-4097|2,W=!1,Se=e)}}else{if(Co(e))throw Error(g(418));e.flags=e.flags&-4097|2,W=!1,Se=e}}}function gu(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Se=e}function vr(e){if(e!==Se)return!1;if(!W)return gu(e),W=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!wo(e.type,e.memoizedProps)),t&&(t=ke)){if(Co(e))throw ra(),Error(g(418));for(;t;)na(e,t),t=at(t.nextSibling)}if(gu(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(g(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){ke=at(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}ke=null}}else ke=Se?at(e.stateNode.nextSibling):null;return!0}function ra(){for(var e=ke;e;)e=at(e.nextSibling)}function on(){ke=Se=null,W=!1}function ci(e){Me===null?Me=[e]:Me.push(e)}var bf=qe.ReactCurrentBatchConfig;function wn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(g(309));var r=n.stateNode}if(!r)throw Error(g(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(i){var u=l.refs;i===null?delete u[o]:u[o]=i},t._stringRef=o,t)}if(typeof e!="string")throw Error(g(284));if(!n._owner)throw Error(g(290,e))}return e}function yr(e,t){throw e=Object.prototype.toString.call(t),Error(g(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function wu(e){var t=e._init;return t(e._payload)}function la(e){function t(f,a){if(e){var d=f.deletions;d===null?(f.deletions=[a],f.flags|=16):d.push(a)}}function n(f,a){if(!e)return null;for(;a!==null;)t(f,a),a=a.sibling;return null}function r(f,a){for(f=new Map;a!==null;)a.key!==null?f.set(a.key,a):f.set(a.index,a),a=a.sibling;return f}function l(f,a){return f=pt(f,a),f.index=0,f.sibling=null,f}function o(f,a,d){return f.index=d,e?(d=f.alternate,d!==null?(d=d.index,d<a?(f.flags|=2,a):d):(f.flags|=2,a)):(f.flags|=1048576,a)}function i(f){return e&&f.alternate===null&&(f.flags|=2),f}function u(f,a,d,y){return a===null||a.tag!==6?(a=Kl(d,f.mode,y),a.return=f,a):(a=l(a,d),a.return=f,a)}function s(f,a,d,y){var x=d.type;return x===Wt?v(f,a,d.props.children,y,d.key):a!==null&&(a.elementType===x||typeof x=="object"&&x!==null&&x.$$typeof===et&&wu(x)===a.type)?(y=l(a,d.props),y.ref=wn(f,a,d),y.return=f,y):(y=Ir(d.type,d.key,d.props,null,f.mode,y),y.ref=wn(f,a,d),y.return=f,y)}function c(f,a,d,y){return a===null||a.tag!==4||a.stateNode.containerInfo!==d.containerInfo||a.stateNode.implementation!==d.implementation?(a=Yl(d,f.mode,y),a.return=f,a):(a=l(a,d.children||[]),a.return=f,a)}function v(f,a,d,y,x){return a===null||a.tag!==7?(a=zt(d,f.mode,y,x),a.return=f,a):(a=l(a,d),a.return=f,a)}function m(f,a,d){if(typeof a=="string"&&a!==""||typeof a=="number")return a=Kl(""+a,f.mode,d),a.return=f,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case ir:return d=Ir(a.type,a.key,a.props,null,f.mode,d),d.ref=wn(f,null,a),d.return=f,d;case At:return a=Yl(a,f.mode,d),a.return=f,a;case et:var y=a._init;return m(f,y(a._payload),d)}if(Cn(a)||hn(a))return a=zt(a,f.mode,d,null),a.return=f,a;yr(f,a)}return null}function h(f,a,d,y){var x=a!==null?a.key:null;if(typeof d=="string"&&d!==""||typeof d=="number")return x!==null?null:u(f,a,""+d,y);if(typeof d=="object"&&d!==null){switch(d.$$typeof){case ir:return d.key===x?s(f,a,d,y):null;case At:return d.key===x?c(f,a,d,y):null;case et:return x=d._init,h(f,a,x(d._payload),y)}if(Cn(d)||hn(d))return x!==null?null:v(f,a,d,y,null);yr(f,d)}return null}function w(f,a,d,y,x){if(typeof y=="string"&&y!==""||typeof y=="number")return f=f.get(d)||null,u(a,f,""+y,x);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case ir:return f=f.get(y.key===null?d:y.key)||null,s(a,f,y,x);case At:return f=f.get(y.key===null?d:y.key)||null,c(a,f,y,x);case et:var _=y._init;return w(f,a,d,_(y._payload),x)}if(Cn(y)||hn(y))return f=f.get(d)||null,v(a,f,y,x,null);yr(a,y)}return null}function k(f,a,d,y){for(var x=null,_=null,N=a,P=a=0,A=null;N!==null&&P<d.length;P++){N.index>P?(A=N,N=null):A=N.sibling;var T=h(f,N,d[P],y);if(T===null){N===null&&(N=A);break}e&&N&&T.alternate===null&&t(f,N),a=o(T,a,P),_===null?x=T:_.sibling=T,_=T,N=A}if(P===d.length)return n(f,N),W&&Et(f,P),x;if(N===null){for(;P<d.length;P++)N=m(f,d[P],y),N!==null&&(a=o(N,a,P),_===null?x=N:_.sibling=N,_=N);return W&&Et(f,P),x}for(N=r(f,N);P<d.length;P++)A=w(N,f,P,d[P],y),A!==null&&(e&&A.alternate!==null&&N.delete(A.key===null?P:A.key),a=o(A,a,P),_===null?x=A:_.sibling=A,_=A);return e&&N.forEach(function(ue){return t(f,ue)}),W&&Et(f,P),x}function S(f,a,d,y){var x=hn(d);if(typeof x!="function")throw Error(g(150));if(d=x.call(d),d==null)throw Error(g(151));for(var _=x=null,N=a,P=a=0,A=null,T=d.next();N!==null&&!T.done;P++,T=d.next()){N.index>P?(A=N,N=null):A=N.sibling;var ue=h(f,N,T.value,y);if(ue===null){N===null&&(N=A);break}e&&N&&ue.alternate===null&&t(f,N),a=o(ue,a,P),_===null?x=ue:_.sibling=ue,_=ue,N=A}if(T.done)return n(f,N),W&&Et(f,P),x;if(N===null){for(;!T.done;P++,T=d.next())T=m(f,T.value,y),T!==null&&(a=o(T,a,P),_===null?x=T:_.sibling=T,_=T);return W&&Et(f,P),x}for(N=r(f,N);!T.done;P++,T=d.next())T=w(N,f,P,T.value,y),T!==null&&(e&&T.alternate!==null&&N.delete(T.key===null?P:T.key),a=o(T,a,P),_===null?x=T:_.sibling=T,_=T);return e&&N.forEach(function(wt){return t(f,wt)}),W&&Et(f,P),x}function M(f,a,d,y){if(typeof d=="object"&&d!==null&&d.type===Wt&&d.key===null&&(d=d.props.children),typeof d=="object"&&d!==null){switch(d.$$typeof){case ir:e:{for(var x=d.key,_=a;_!==null;){if(_.key===x){if(x=d.type,x===Wt){if(_.tag===7){n(f,_.sibling),a=l(_,d.props.children),a.return=f,f=a;break e}}else if(_.elementType===x||typeof x=="object"&&x!==null&&x.$$typeof===et&&wu(x)===_.type){n(f,_.sibling),a=l(_,d.props),a.ref=wn(f,_,d),a.return=f,f=a;break e}n(f,_);break}else t(f,_);_=_.sibling}d.type===Wt?(a=zt(d.props.children,f.mode,y,d.key),a.return=f,f=a):(y=Ir(d.type,d.key,d.props,null,f.mode,y),y.ref=wn(f,a,d),y.return=f,f=y)}return i(f);case At:e:{for(_=d.key;a!==null;){if(a.key===_)if(a.tag===4&&a.stateNode.containerInfo===d.containerInfo&&a.stateNode.implementation===d.implementation){n(f,a.sibling),a=l(a,d.children||[]),a.return=f,f=a;break e}else{n(f,a);break}else t(f,a);a=a.sibling}a=Yl(d,f.mode,y),a.return=f,f=a}return i(f);case et:return _=d._init,M(f,a,_(d._payload),y)}if(Cn(d))return k(f,a,d,y);if(hn(d))return S(f,a,d,y);yr(f,d)}return typeof d=="string"&&d!==""||typeof d=="number"?(d=""+d,a!==null&&a.tag===6?(n(f,a.sibling),a=l(a,d),a.return=f,f=a):(n(f,a),a=Kl(d,f.mode,y),a.return=f,f=a),i(f)):n(f,a)}return M}var un=la(!0),oa=la(!1),Yr=yt(null),Gr=null,Gt=null,fi=null;function di(){fi=Gt=Gr=null}function pi(e){var t=Yr.current;U(Yr),e._currentValue=t}function _o(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function tn(e,t){Gr=e,fi=Gt=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(me=!0),e.firstContext=null)}function Te(e){var t=e._currentValue;if(fi!==e)if(e={context:e,memoizedValue:t,next:null},Gt===null){if(Gr===null)throw Error(g(308));Gt=e,Gr.dependencies={lanes:0,firstContext:e}}else Gt=Gt.next=e;return t}var Pt=null;function hi(e){Pt===null?Pt=[e]:Pt.push(e)}function ia(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,hi(t)):(n.next=l.next,l.next=n),t.interleaved=n,Ze(e,r)}function Ze(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var tt=!1;function mi(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function ua(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Ye(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function ct(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,I&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,Ze(e,n)}return l=r.interleaved,l===null?(t.next=t,hi(r)):(t.next=l.next,l.next=t),r.interleaved=t,Ze(e,n)}function Pr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,ei(e,n)}}function ku(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=i:o=o.next=i,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Xr(e,t,n,r){var l=e.updateQueue;tt=!1;var o=l.firstBaseUpdate,i=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,c=s.next;s.next=null,i===null?o=c:i.next=c,i=s;var v=e.alternate;v!==null&&(v=v.updateQueue,u=v.lastBaseUpdate,u!==i&&(u===null?v.firstBaseUpdate=c:u.next=c,v.lastBaseUpdate=s))}if(o!==null){var m=l.baseState;i=0,v=c=s=null,u=o;do{var h=u.lane,w=u.eventTime;if((r&h)===h){v!==null&&(v=v.next={eventTime:w,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var k=e,S=u;switch(h=t,w=n,S.tag){case 1:if(k=S.payload,typeof k=="function"){m=k.call(w,m,h);break e}m=k;break e;case 3:k.flags=k.flags&-65537|128;case 0:if(k=S.payload,h=typeof k=="function"?k.call(w,m,h):k,h==null)break e;m=V({},m,h);break e;case 2:tt=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,h=l.effects,h===null?l.effects=[u]:h.push(u))}else w={eventTime:w,lane:h,tag:u.tag,payload:u.payload,callback:u.callback,next:null},v===null?(c=v=w,s=m):v=v.next=w,i|=h;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;h=u,u=h.next,h.next=null,l.lastBaseUpdate=h,l.shared.pending=null}}while(!0);if(v===null&&(s=m),l.baseState=s,l.firstBaseUpdate=c,l.lastBaseUpdate=v,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);Mt|=i,e.lanes=i,e.memoizedState=m}}function Su(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(g(191,l));l.call(r)}}}var nr={},$e=yt(nr),Kn=yt(nr),Yn=yt(nr);function jt(e){if(e===nr)throw Error(g(174));return e}function vi(e,t){switch(D(Yn,t),D(Kn,e),D($e,nr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:lo(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=lo(t,e)}U($e),D($e,t)}function sn(){U($e),U(Kn),U(Yn)}function sa(e){jt(Yn.current);var t=jt($e.current),n=lo(t,e.type);t!==n&&(D(Kn,e),D($e,n))}function yi(e){Kn.current===e&&(U($e),U(Kn))}var B=yt(0);function Zr(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Wl=[];function gi(){for(var e=0;e<Wl.length;e++)Wl[e]._workInProgressVersionPrimary=null;Wl.length=0}var jr=qe.ReactCurrentDispatcher,Bl=qe.ReactCurrentBatchConfig,It=0,$=null,G=null,q=null,Jr=!1,Ln=!1,Gn=0,ed=0;function re(){throw Error(g(321))}function wi(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Fe(e[n],t[n]))return!1;return!0}function ki(e,t,n,r,l,o){if(It=o,$=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,jr.current=e===null||e.memoizedState===null?ld:od,e=n(r,l),Ln){o=0;do{if(Ln=!1,Gn=0,25<=o)throw Error(g(301));o+=1,q=G=null,t.updateQueue=null,jr.current=id,e=n(r,l)}while(Ln)}if(jr.current=qr,t=G!==null&&G.next!==null,It=0,q=G=$=null,Jr=!1,t)throw Error(g(300));return e}function Si(){var e=Gn!==0;return Gn=0,e}function Ae(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return q===null?$.memoizedState=q=e:q=q.next=e,q}function ze(){if(G===null){var e=$.alternate;e=e!==null?e.memoizedState:null}else e=G.next;var t=q===null?$.memoizedState:q.next;if(t!==null)q=t,G=e;else{if(e===null)throw Error(g(310));G=e,e={memoizedState:G.memoizedState,baseState:G.baseState,baseQueue:G.baseQueue,queue:G.queue,next:null},q===null?$.memoizedState=q=e:q=q.next=e}return q}function Xn(e,t){return typeof t=="function"?t(e):t}function $l(e){var t=ze(),n=t.queue;if(n===null)throw Error(g(311));n.lastRenderedReducer=e;var r=G,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var u=i=null,s=null,c=o;do{var v=c.lane;if((It&v)===v)s!==null&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var m={lane:v,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};s===null?(u=s=m,i=r):s=s.next=m,$.lanes|=v,Mt|=v}c=c.next}while(c!==null&&c!==o);s===null?i=r:s.next=u,Fe(r,t.memoizedState)||(me=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,$.lanes|=o,Mt|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Vl(e){var t=ze(),n=t.queue;if(n===null)throw Error(g(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do o=e(o,i.action),i=i.next;while(i!==l);Fe(o,t.memoizedState)||(me=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function aa(){}function ca(e,t){var n=$,r=ze(),l=t(),o=!Fe(r.memoizedState,l);if(o&&(r.memoizedState=l,me=!0),r=r.queue,xi(pa.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||q!==null&&q.memoizedState.tag&1){if(n.flags|=2048,Zn(9,da.bind(null,n,r,l,t),void 0,null),b===null)throw Error(g(349));It&30||fa(n,t,l)}return l}function fa(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=$.updateQueue,t===null?(t={lastEffect:null,stores:null},$.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function da(e,t,n,r){t.value=n,t.getSnapshot=r,ha(t)&&ma(e)}function pa(e,t,n){return n(function(){ha(t)&&ma(e)})}function ha(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Fe(e,n)}catch{return!0}}function ma(e){var t=Ze(e,1);t!==null&&De(t,e,1,-1)}function xu(e){var t=Ae();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Xn,lastRenderedState:e},t.queue=e,e=e.dispatch=rd.bind(null,$,e),[t.memoizedState,e]}function Zn(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=$.updateQueue,t===null?(t={lastEffect:null,stores:null},$.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function va(){return ze().memoizedState}function Tr(e,t,n,r){var l=Ae();$.flags|=e,l.memoizedState=Zn(1|t,n,void 0,r===void 0?null:r)}function dl(e,t,n,r){var l=ze();r=r===void 0?null:r;var o=void 0;if(G!==null){var i=G.memoizedState;if(o=i.destroy,r!==null&&wi(r,i.deps)){l.memoizedState=Zn(t,n,o,r);return}}$.flags|=e,l.memoizedState=Zn(1|t,n,o,r)}function Cu(e,t){return Tr(8390656,8,e,t)}function xi(e,t){return dl(2048,8,e,t)}function ya(e,t){return dl(4,2,e,t)}function ga(e,t){return dl(4,4,e,t)}function wa(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function ka(e,t,n){return n=n!=null?n.concat([e]):null,dl(4,4,wa.bind(null,t,e),n)}function Ci(){}function Sa(e,t){var n=ze();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&wi(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function xa(e,t){var n=ze();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&wi(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ca(e,t,n){return It&21?(Fe(n,t)||(n=js(),$.lanes|=n,Mt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,me=!0),e.memoizedState=n)}function td(e,t){var n=R;R=n!==0&&4>n?n:4,e(!0);var r=Bl.transition;Bl.transition={};try{e(!1),t()}finally{R=n,Bl.transition=r}}function Ea(){return ze().memoizedState}function nd(e,t,n){var r=dt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},_a(e))Na(t,n);else if(n=ia(e,t,n,r),n!==null){var l=ae();De(n,e,r,l),Pa(n,t,r)}}function rd(e,t,n){var r=dt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(_a(e))Na(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var i=t.lastRenderedState,u=o(i,n);if(l.hasEagerState=!0,l.eagerState=u,Fe(u,i)){var s=t.interleaved;s===null?(l.next=l,hi(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=ia(e,t,l,r),n!==null&&(l=ae(),De(n,e,r,l),Pa(n,t,r))}}function _a(e){var t=e.alternate;return e===$||t!==null&&t===$}function Na(e,t){Ln=Jr=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Pa(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,ei(e,n)}}var qr={readContext:Te,useCallback:re,useContext:re,useEffect:re,useImperativeHandle:re,useInsertionEffect:re,useLayoutEffect:re,useMemo:re,useReducer:re,useRef:re,useState:re,useDebugValue:re,useDeferredValue:re,useTransition:re,useMutableSource:re,useSyncExternalStore:re,useId:re,unstable_isNewReconciler:!1},ld={readContext:Te,useCallback:function(e,t){return Ae().memoizedState=[e,t===void 0?null:t],e},useContext:Te,useEffect:Cu,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Tr(4194308,4,wa.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Tr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Tr(4,2,e,t)},useMemo:function(e,t){var n=Ae();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Ae();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=nd.bind(null,$,e),[r.memoizedState,e]},useRef:function(e){var t=Ae();return e={current:e},t.memoizedState=e},useState:xu,useDebugValue:Ci,useDeferredValue:function(e){return Ae().memoizedState=e},useTransition:function(){var e=xu(!1),t=e[0];return e=td.bind(null,e[1]),Ae().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=$,l=Ae();if(W){if(n===void 0)throw Error(g(407));n=n()}else{if(n=t(),b===null)throw Error(g(349));It&30||fa(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,Cu(pa.bind(null,r,o,e),[e]),r.flags|=2048,Zn(9,da.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=Ae(),t=b.identifierPrefix;if(W){var n=Ke,r=Qe;n=(r&~(1<<32-Re(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=Gn++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=ed++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},od={readContext:Te,useCallback:Sa,useContext:Te,useEffect:xi,useImperativeHandle:ka,useInsertionEffect:ya,useLayoutEffect:ga,useMemo:xa,useReducer:$l,useRef:va,useState:function(){return $l(Xn)},useDebugValue:Ci,useDeferredValue:function(e){var t=ze();return Ca(t,G.memoizedState,e)},useTransition:function(){var e=$l(Xn)[0],t=ze().memoizedState;return[e,t]},useMutableSource:aa,useSyncExternalStore:ca,useId:Ea,unstable_isNewReconciler:!1},id={readContext:Te,useCallback:Sa,useContext:Te,useEffect:xi,useImperativeHandle:ka,useInsertionEffect:ya,useLayoutEffect:ga,useMemo:xa,useReducer:Vl,useRef:va,useState:function(){return Vl(Xn)},useDebugValue:Ci,useDeferredValue:function(e){var t=ze();return G===null?t.memoizedState=e:Ca(t,G.memoizedState,e)},useTransition:function(){var e=Vl(Xn)[0],t=ze().memoizedState;return[e,t]},useMutableSource:aa,useSyncExternalStore:ca,useId:Ea,unstable_isNewReconciler:!1};function Oe(e,t){if(e&&e.defaultProps){t=V({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function No(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:V({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var pl={isMounted:function(e){return(e=e._reactInternals)?Ft(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=ae(),l=dt(e),o=Ye(r,l);o.payload=t,n!=null&&(o.callback=n),t=ct(e,o,l),t!==null&&(De(t,e,l,r),Pr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=ae(),l=dt(e),o=Ye(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=ct(e,o,l),t!==null&&(De(t,e,l,r),Pr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=ae(),r=dt(e),l=Ye(n,r);l.tag=2,t!=null&&(l.callback=t),t=ct(e,l,r),t!==null&&(De(t,e,r,n),Pr(t,e,r))}};function Eu(e,t,n,r,l,o,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,i):t.prototype&&t.prototype.isPureReactComponent?!$n(n,r)||!$n(l,o):!0}function ja(e,t,n){var r=!1,l=mt,o=t.contextType;return typeof o=="object"&&o!==null?o=Te(o):(l=ye(t)?Lt:ie.current,r=t.contextTypes,o=(r=r!=null)?ln(e,l):mt),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=pl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function _u(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&pl.enqueueReplaceState(t,t.state,null)}function Po(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},mi(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=Te(o):(o=ye(t)?Lt:ie.current,l.context=ln(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(No(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&pl.enqueueReplaceState(l,l.state,null),Xr(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function an(e,t){try{var n="",r=t;do n+=Ic(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function Hl(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function jo(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var ud=typeof WeakMap=="function"?WeakMap:Map;function Ta(e,t,n){n=Ye(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){el||(el=!0,Uo=r),jo(e,t)},n}function za(e,t,n){n=Ye(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){jo(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){jo(e,t),typeof r!="function"&&(ft===null?ft=new Set([this]):ft.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function Nu(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new ud;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=Sd.bind(null,e,t,n),t.then(e,e))}function Pu(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function ju(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=Ye(-1,1),t.tag=2,ct(n,t,1))),n.lanes|=1),e)}var sd=qe.ReactCurrentOwner,me=!1;function se(e,t,n,r){t.child=e===null?oa(t,null,n,r):un(t,e.child,n,r)}function Tu(e,t,n,r,l){n=n.render;var o=t.ref;return tn(t,l),r=ki(e,t,n,r,o,l),n=Si(),e!==null&&!me?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Je(e,t,l)):(W&&n&&si(t),t.flags|=1,se(e,t,r,l),t.child)}function zu(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!Li(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,La(e,t,o,r,l)):(e=Ir(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var i=o.memoizedProps;if(n=n.compare,n=n!==null?n:$n,n(i,r)&&e.ref===t.ref)return Je(e,t,l)}return t.flags|=1,e=pt(o,r),e.ref=t.ref,e.return=t,t.child=e}function La(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if($n(o,r)&&e.ref===t.ref)if(me=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(me=!0);else return t.lanes=e.lanes,Je(e,t,l)}return To(e,t,n,r,l)}function Oa(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},D(Zt,we),we|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,D(Zt,we),we|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,D(Zt,we),we|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,D(Zt,we),we|=r;return se(e,t,l,n),t.child}function Ia(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function To(e,t,n,r,l){var o=ye(n)?Lt:ie.current;return o=ln(t,o),tn(t,l),n=ki(e,t,n,r,o,l),r=Si(),e!==null&&!me?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Je(e,t,l)):(W&&r&&si(t),t.flags|=1,se(e,t,n,l),t.child)}function Lu(e,t,n,r,l){if(ye(n)){var o=!0;Hr(t)}else o=!1;if(tn(t,l),t.stateNode===null)zr(e,t),ja(t,n,r),Po(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,u=t.memoizedProps;i.props=u;var s=i.context,c=n.contextType;typeof c=="object"&&c!==null?c=Te(c):(c=ye(n)?Lt:ie.current,c=ln(t,c));var v=n.getDerivedStateFromProps,m=typeof v=="function"||typeof i.getSnapshotBeforeUpdate=="function";m||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==r||s!==c)&&_u(t,i,r,c),tt=!1;var h=t.memoizedState;i.state=h,Xr(t,r,i,l),s=t.memoizedState,u!==r||h!==s||ve.current||tt?(typeof v=="function"&&(No(t,n,v,r),s=t.memoizedState),(u=tt||Eu(t,n,u,r,h,s,c))?(m||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=c,r=u):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,ua(e,t),u=t.memoizedProps,c=t.type===t.elementType?u:Oe(t.type,u),i.props=c,m=t.pendingProps,h=i.context,s=n.contextType,typeof s=="object"&&s!==null?s=Te(s):(s=ye(n)?Lt:ie.current,s=ln(t,s));var w=n.getDerivedStateFromProps;(v=typeof w=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==m||h!==s)&&_u(t,i,r,s),tt=!1,h=t.memoizedState,i.state=h,Xr(t,r,i,l);var k=t.memoizedState;u!==m||h!==k||ve.current||tt?(typeof w=="function"&&(No(t,n,w,r),k=t.memoizedState),(c=tt||Eu(t,n,c,r,h,k,s)||!1)?(v||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,k,s),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,k,s)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=k),i.props=r,i.state=k,i.context=s,r=c):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),r=!1)}return zo(e,t,n,r,o,l)}function zo(e,t,n,r,l,o){Ia(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&vu(t,n,!1),Je(e,t,o);r=t.stateNode,sd.current=t;var u=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=un(t,e.child,null,o),t.child=un(t,null,u,o)):se(e,t,u,o),t.memoizedState=r.state,l&&vu(t,n,!0),t.child}function Ma(e){var t=e.stateNode;t.pendingContext?mu(e,t.pendingContext,t.pendingContext!==t.context):t.context&&mu(e,t.context,!1),vi(e,t.containerInfo)}function Ou(e,t,n,r,l){return on(),ci(l),t.flags|=256,se(e,t,n,r),t.child}var Lo={dehydrated:null,treeContext:null,retryLane:0};function Oo(e){return{baseLanes:e,cachePool:null,transitions:null}}function Ra(e,t,n){var r=t.pendingProps,l=B.current,o=!1,i=(t.flags&128)!==0,u;if((u=i)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),D(B,l&1),e===null)return Eo(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,o?(r=t.mode,o=t.child,i={mode:"hidden",children:i},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=i):o=vl(i,r,0,null),e=zt(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=Oo(n),t.memoizedState=Lo,e):Ei(t,i));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return ad(e,t,i,r,u,l,n);if(o){o=r.fallback,i=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=pt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?o=pt(u,o):(o=zt(o,i,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,i=e.child.memoizedState,i=i===null?Oo(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},o.memoizedState=i,o.childLanes=e.childLanes&~n,t.memoizedState=Lo,r}return o=e.child,e=o.sibling,r=pt(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Ei(e,t){return t=vl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function gr(e,t,n,r){return r!==null&&ci(r),un(t,e.child,null,n),e=Ei(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function ad(e,t,n,r,l,o,i){if(n)return t.flags&256?(t.flags&=-257,r=Hl(Error(g(422))),gr(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=vl({mode:"visible",children:r.children},l,0,null),o=zt(o,l,i,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&un(t,e.child,null,i),t.child.memoizedState=Oo(i),t.memoizedState=Lo,o);if(!(t.mode&1))return gr(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,o=Error(g(419)),r=Hl(o,r,void 0),gr(e,t,i,r)}if(u=(i&e.childLanes)!==0,me||u){if(r=b,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,Ze(e,l),De(r,e,l,-1))}return zi(),r=Hl(Error(g(421))),gr(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=xd.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,ke=at(l.nextSibling),Se=t,W=!0,Me=null,e!==null&&(_e[Ne++]=Qe,_e[Ne++]=Ke,_e[Ne++]=Ot,Qe=e.id,Ke=e.overflow,Ot=t),t=Ei(t,r.children),t.flags|=4096,t)}function Iu(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),_o(e.return,t,n)}function Ql(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function Da(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(se(e,t,r.children,n),r=B.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Iu(e,n,t);else if(e.tag===19)Iu(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(D(B,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&Zr(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),Ql(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&Zr(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}Ql(t,!0,n,null,o);break;case"together":Ql(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function zr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Je(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Mt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(g(153));if(t.child!==null){for(e=t.child,n=pt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=pt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function cd(e,t,n){switch(t.tag){case 3:Ma(t),on();break;case 5:sa(t);break;case 1:ye(t.type)&&Hr(t);break;case 4:vi(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;D(Yr,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(D(B,B.current&1),t.flags|=128,null):n&t.child.childLanes?Ra(e,t,n):(D(B,B.current&1),e=Je(e,t,n),e!==null?e.sibling:null);D(B,B.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Da(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),D(B,B.current),r)break;return null;case 22:case 23:return t.lanes=0,Oa(e,t,n)}return Je(e,t,n)}var Fa,Io,Ua,Aa;Fa=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Io=function(){};Ua=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,jt($e.current);var o=null;switch(n){case"input":l=eo(e,l),r=eo(e,r),o=[];break;case"select":l=V({},l,{value:void 0}),r=V({},r,{value:void 0}),o=[];break;case"textarea":l=ro(e,l),r=ro(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=$r)}oo(n,r);var i;n=null;for(c in l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&l[c]!=null)if(c==="style"){var u=l[c];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else c!=="dangerouslySetInnerHTML"&&c!=="children"&&c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&c!=="autoFocus"&&(Rn.hasOwnProperty(c)?o||(o=[]):(o=o||[]).push(c,null));for(c in r){var s=r[c];if(u=l!=null?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(s!=null||u!=null))if(c==="style")if(u){for(i in u)!u.hasOwnProperty(i)||s&&s.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in s)s.hasOwnProperty(i)&&u[i]!==s[i]&&(n||(n={}),n[i]=s[i])}else n||(o||(o=[]),o.push(c,n)),n=s;else c==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(o=o||[]).push(c,s)):c==="children"?typeof s!="string"&&typeof s!="number"||(o=o||[]).push(c,""+s):c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&(Rn.hasOwnProperty(c)?(s!=null&&c==="onScroll"&&F("scroll",e),o||u===s||(o=[])):(o=o||[]).push(c,s))}n&&(o=o||[]).push("style",n);var c=o;(t.updateQueue=c)&&(t.flags|=4)}};Aa=function(e,t,n,r){n!==r&&(t.flags|=4)};function kn(e,t){if(!W)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function le(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function fd(e,t,n){var r=t.pendingProps;switch(ai(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return le(t),null;case 1:return ye(t.type)&&Vr(),le(t),null;case 3:return r=t.stateNode,sn(),U(ve),U(ie),gi(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(vr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Me!==null&&(Bo(Me),Me=null))),Io(e,t),le(t),null;case 5:yi(t);var l=jt(Yn.current);if(n=t.type,e!==null&&t.stateNode!=null)Ua(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(g(166));return le(t),null}if(e=jt($e.current),vr(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[We]=t,r[Qn]=o,e=(t.mode&1)!==0,n){case"dialog":F("cancel",r),F("close",r);break;case"iframe":case"object":case"embed":F("load",r);break;case"video":case"audio":for(l=0;l<_n.length;l++)F(_n[l],r);break;case"source":F("error",r);break;case"img":case"image":case"link":F("error",r),F("load",r);break;case"details":F("toggle",r);break;case"input":$i(r,o),F("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},F("invalid",r);break;case"textarea":Hi(r,o),F("invalid",r)}oo(n,o),l=null;for(var i in o)if(o.hasOwnProperty(i)){var u=o[i];i==="children"?typeof u=="string"?r.textContent!==u&&(o.suppressHydrationWarning!==!0&&mr(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(o.suppressHydrationWarning!==!0&&mr(r.textContent,u,e),l=["children",""+u]):Rn.hasOwnProperty(i)&&u!=null&&i==="onScroll"&&F("scroll",r)}switch(n){case"input":ur(r),Vi(r,o,!0);break;case"textarea":ur(r),Qi(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=$r)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=ps(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[We]=t,e[Qn]=r,Fa(e,t,!1,!1),t.stateNode=e;e:{switch(i=io(n,r),n){case"dialog":F("cancel",e),F("close",e),l=r;break;case"iframe":case"object":case"embed":F("load",e),l=r;break;case"video":case"audio":for(l=0;l<_n.length;l++)F(_n[l],e);l=r;break;case"source":F("error",e),l=r;break;case"img":case"image":case"link":F("error",e),F("load",e),l=r;break;case"details":F("toggle",e),l=r;break;case"input":$i(e,r),l=eo(e,r),F("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=V({},r,{value:void 0}),F("invalid",e);break;case"textarea":Hi(e,r),l=ro(e,r),F("invalid",e);break;default:l=r}oo(n,l),u=l;for(o in u)if(u.hasOwnProperty(o)){var s=u[o];o==="style"?vs(e,s):o==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&hs(e,s)):o==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Dn(e,s):typeof s=="number"&&Dn(e,""+s):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(Rn.hasOwnProperty(o)?s!=null&&o==="onScroll"&&F("scroll",e):s!=null&&Go(e,o,s,i))}switch(n){case"input":ur(e),Vi(e,r,!1);break;case"textarea":ur(e),Qi(e);break;case"option":r.value!=null&&e.setAttribute("value",""+ht(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?Jt(e,!!r.multiple,o,!1):r.defaultValue!=null&&Jt(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=$r)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return le(t),null;case 6:if(e&&t.stateNode!=null)Aa(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(g(166));if(n=jt(Yn.current),jt($e.current),vr(t)){if(r=t.stateNode,n=t.memoizedProps,r[We]=t,(o=r.nodeValue!==n)&&(e=Se,e!==null))switch(e.tag){case 3:mr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&mr(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[We]=t,t.stateNode=r}return le(t),null;case 13:if(U(B),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(W&&ke!==null&&t.mode&1&&!(t.flags&128))ra(),on(),t.flags|=98560,o=!1;else if(o=vr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(g(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(g(317));o[We]=t}else on(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;le(t),o=!1}else Me!==null&&(Bo(Me),Me=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||B.current&1?X===0&&(X=3):zi())),t.updateQueue!==null&&(t.flags|=4),le(t),null);case 4:return sn(),Io(e,t),e===null&&Vn(t.stateNode.containerInfo),le(t),null;case 10:return pi(t.type._context),le(t),null;case 17:return ye(t.type)&&Vr(),le(t),null;case 19:if(U(B),o=t.memoizedState,o===null)return le(t),null;if(r=(t.flags&128)!==0,i=o.rendering,i===null)if(r)kn(o,!1);else{if(X!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=Zr(e),i!==null){for(t.flags|=128,kn(o,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,i=o.alternate,i===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=i.childLanes,o.lanes=i.lanes,o.child=i.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=i.memoizedProps,o.memoizedState=i.memoizedState,o.updateQueue=i.updateQueue,o.type=i.type,e=i.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return D(B,B.current&1|2),t.child}e=e.sibling}o.tail!==null&&K()>cn&&(t.flags|=128,r=!0,kn(o,!1),t.lanes=4194304)}else{if(!r)if(e=Zr(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),kn(o,!0),o.tail===null&&o.tailMode==="hidden"&&!i.alternate&&!W)return le(t),null}else 2*K()-o.renderingStartTime>cn&&n!==1073741824&&(t.flags|=128,r=!0,kn(o,!1),t.lanes=4194304);o.isBackwards?(i.sibling=t.child,t.child=i):(n=o.last,n!==null?n.sibling=i:t.child=i,o.last=i)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=K(),t.sibling=null,n=B.current,D(B,r?n&1|2:n&1),t):(le(t),null);case 22:case 23:return Ti(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?we&1073741824&&(le(t),t.subtreeFlags&6&&(t.flags|=8192)):le(t),null;case 24:return null;case 25:return null}throw Error(g(156,t.tag))}function dd(e,t){switch(ai(t),t.tag){case 1:return ye(t.type)&&Vr(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return sn(),U(ve),U(ie),gi(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return yi(t),null;case 13:if(U(B),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(g(340));on()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return U(B),null;case 4:return sn(),null;case 10:return pi(t.type._context),null;case 22:case 23:return Ti(),null;case 24:return null;default:return null}}var wr=!1,oe=!1,pd=typeof WeakSet=="function"?WeakSet:Set,E=null;function Xt(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){H(e,t,r)}else n.current=null}function Mo(e,t,n){try{n()}catch(r){H(e,t,r)}}var Mu=!1;function hd(e,t){if(yo=Ar,e=Hs(),ui(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var i=0,u=-1,s=-1,c=0,v=0,m=e,h=null;t:for(;;){for(var w;m!==n||l!==0&&m.nodeType!==3||(u=i+l),m!==o||r!==0&&m.nodeType!==3||(s=i+r),m.nodeType===3&&(i+=m.nodeValue.length),(w=m.firstChild)!==null;)h=m,m=w;for(;;){if(m===e)break t;if(h===n&&++c===l&&(u=i),h===o&&++v===r&&(s=i),(w=m.nextSibling)!==null)break;m=h,h=m.parentNode}m=w}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(go={focusedElem:e,selectionRange:n},Ar=!1,E=t;E!==null;)if(t=E,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,E=e;else for(;E!==null;){t=E;try{var k=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(k!==null){var S=k.memoizedProps,M=k.memoizedState,f=t.stateNode,a=f.getSnapshotBeforeUpdate(t.elementType===t.type?S:Oe(t.type,S),M);f.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var d=t.stateNode.containerInfo;d.nodeType===1?d.textContent="":d.nodeType===9&&d.documentElement&&d.removeChild(d.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(g(163))}}catch(y){H(t,t.return,y)}if(e=t.sibling,e!==null){e.return=t.return,E=e;break}E=t.return}return k=Mu,Mu=!1,k}function On(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&Mo(t,n,o)}l=l.next}while(l!==r)}}function hl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Ro(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function Wa(e){var t=e.alternate;t!==null&&(e.alternate=null,Wa(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[We],delete t[Qn],delete t[So],delete t[Zf],delete t[Jf])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Ba(e){return e.tag===5||e.tag===3||e.tag===4}function Ru(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Ba(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Do(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=$r));else if(r!==4&&(e=e.child,e!==null))for(Do(e,t,n),e=e.sibling;e!==null;)Do(e,t,n),e=e.sibling}function Fo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Fo(e,t,n),e=e.sibling;e!==null;)Fo(e,t,n),e=e.sibling}var ee=null,Ie=!1;function be(e,t,n){for(n=n.child;n!==null;)$a(e,t,n),n=n.sibling}function $a(e,t,n){if(Be&&typeof Be.onCommitFiberUnmount=="function")try{Be.onCommitFiberUnmount(il,n)}catch{}switch(n.tag){case 5:oe||Xt(n,t);case 6:var r=ee,l=Ie;ee=null,be(e,t,n),ee=r,Ie=l,ee!==null&&(Ie?(e=ee,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ee.removeChild(n.stateNode));break;case 18:ee!==null&&(Ie?(e=ee,n=n.stateNode,e.nodeType===8?Ul(e.parentNode,n):e.nodeType===1&&Ul(e,n),Wn(e)):Ul(ee,n.stateNode));break;case 4:r=ee,l=Ie,ee=n.stateNode.containerInfo,Ie=!0,be(e,t,n),ee=r,Ie=l;break;case 0:case 11:case 14:case 15:if(!oe&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,i=o.destroy;o=o.tag,i!==void 0&&(o&2||o&4)&&Mo(n,t,i),l=l.next}while(l!==r)}be(e,t,n);break;case 1:if(!oe&&(Xt(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){H(n,t,u)}be(e,t,n);break;case 21:be(e,t,n);break;case 22:n.mode&1?(oe=(r=oe)||n.memoizedState!==null,be(e,t,n),oe=r):be(e,t,n);break;default:be(e,t,n)}}function Du(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new pd),t.forEach(function(r){var l=Cd.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Le(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,i=t,u=i;e:for(;u!==null;){switch(u.tag){case 5:ee=u.stateNode,Ie=!1;break e;case 3:ee=u.stateNode.containerInfo,Ie=!0;break e;case 4:ee=u.stateNode.containerInfo,Ie=!0;break e}u=u.return}if(ee===null)throw Error(g(160));$a(o,i,l),ee=null,Ie=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(c){H(l,t,c)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Va(t,e),t=t.sibling}function Va(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Le(t,e),Ue(e),r&4){try{On(3,e,e.return),hl(3,e)}catch(S){H(e,e.return,S)}try{On(5,e,e.return)}catch(S){H(e,e.return,S)}}break;case 1:Le(t,e),Ue(e),r&512&&n!==null&&Xt(n,n.return);break;case 5:if(Le(t,e),Ue(e),r&512&&n!==null&&Xt(n,n.return),e.flags&32){var l=e.stateNode;try{Dn(l,"")}catch(S){H(e,e.return,S)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,i=n!==null?n.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&o.type==="radio"&&o.name!=null&&fs(l,o),io(u,i);var c=io(u,o);for(i=0;i<s.length;i+=2){var v=s[i],m=s[i+1];v==="style"?vs(l,m):v==="dangerouslySetInnerHTML"?hs(l,m):v==="children"?Dn(l,m):Go(l,v,m,c)}switch(u){case"input":to(l,o);break;case"textarea":ds(l,o);break;case"select":var h=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var w=o.value;w!=null?Jt(l,!!o.multiple,w,!1):h!==!!o.multiple&&(o.defaultValue!=null?Jt(l,!!o.multiple,o.defaultValue,!0):Jt(l,!!o.multiple,o.multiple?[]:"",!1))}l[Qn]=o}catch(S){H(e,e.return,S)}}break;case 6:if(Le(t,e),Ue(e),r&4){if(e.stateNode===null)throw Error(g(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(S){H(e,e.return,S)}}break;case 3:if(Le(t,e),Ue(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Wn(t.containerInfo)}catch(S){H(e,e.return,S)}break;case 4:Le(t,e),Ue(e);break;case 13:Le(t,e),Ue(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||(Pi=K())),r&4&&Du(e);break;case 22:if(v=n!==null&&n.memoizedState!==null,e.mode&1?(oe=(c=oe)||v,Le(t,e),oe=c):Le(t,e),Ue(e),r&8192){if(c=e.memoizedState!==null,(e.stateNode.isHidden=c)&&!v&&e.mode&1)for(E=e,v=e.child;v!==null;){for(m=E=v;E!==null;){switch(h=E,w=h.child,h.tag){case 0:case 11:case 14:case 15:On(4,h,h.return);break;case 1:Xt(h,h.return);var k=h.stateNode;if(typeof k.componentWillUnmount=="function"){r=h,n=h.return;try{t=r,k.props=t.memoizedProps,k.state=t.memoizedState,k.componentWillUnmount()}catch(S){H(r,n,S)}}break;case 5:Xt(h,h.return);break;case 22:if(h.memoizedState!==null){Uu(m);continue}}w!==null?(w.return=h,E=w):Uu(m)}v=v.sibling}e:for(v=null,m=e;;){if(m.tag===5){if(v===null){v=m;try{l=m.stateNode,c?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(u=m.stateNode,s=m.memoizedProps.style,i=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=ms("display",i))}catch(S){H(e,e.return,S)}}}else if(m.tag===6){if(v===null)try{m.stateNode.nodeValue=c?"":m.memoizedProps}catch(S){H(e,e.return,S)}}else if((m.tag!==22&&m.tag!==23||m.memoizedState===null||m===e)&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===e)break e;for(;m.sibling===null;){if(m.return===null||m.return===e)break e;v===m&&(v=null),m=m.return}v===m&&(v=null),m.sibling.return=m.return,m=m.sibling}}break;case 19:Le(t,e),Ue(e),r&4&&Du(e);break;case 21:break;default:Le(t,e),Ue(e)}}function Ue(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Ba(n)){var r=n;break e}n=n.return}throw Error(g(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Dn(l,""),r.flags&=-33);var o=Ru(e);Fo(e,o,l);break;case 3:case 4:var i=r.stateNode.containerInfo,u=Ru(e);Do(e,u,i);break;default:throw Error(g(161))}}catch(s){H(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function md(e,t,n){E=e,Ha(e)}function Ha(e,t,n){for(var r=(e.mode&1)!==0;E!==null;){var l=E,o=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||wr;if(!i){var u=l.alternate,s=u!==null&&u.memoizedState!==null||oe;u=wr;var c=oe;if(wr=i,(oe=s)&&!c)for(E=l;E!==null;)i=E,s=i.child,i.tag===22&&i.memoizedState!==null?Au(l):s!==null?(s.return=i,E=s):Au(l);for(;o!==null;)E=o,Ha(o),o=o.sibling;E=l,wr=u,oe=c}Fu(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,E=o):Fu(e)}}function Fu(e){for(;E!==null;){var t=E;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:oe||hl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!oe)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Oe(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&Su(t,o,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Su(t,i,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var c=t.alternate;if(c!==null){var v=c.memoizedState;if(v!==null){var m=v.dehydrated;m!==null&&Wn(m)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(g(163))}oe||t.flags&512&&Ro(t)}catch(h){H(t,t.return,h)}}if(t===e){E=null;break}if(n=t.sibling,n!==null){n.return=t.return,E=n;break}E=t.return}}function Uu(e){for(;E!==null;){var t=E;if(t===e){E=null;break}var n=t.sibling;if(n!==null){n.return=t.return,E=n;break}E=t.return}}function Au(e){for(;E!==null;){var t=E;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{hl(4,t)}catch(s){H(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){H(t,l,s)}}var o=t.return;try{Ro(t)}catch(s){H(t,o,s)}break;case 5:var i=t.return;try{Ro(t)}catch(s){H(t,i,s)}}}catch(s){H(t,t.return,s)}if(t===e){E=null;break}var u=t.sibling;if(u!==null){u.return=t.return,E=u;break}E=t.return}}var vd=Math.ceil,br=qe.ReactCurrentDispatcher,_i=qe.ReactCurrentOwner,je=qe.ReactCurrentBatchConfig,I=0,b=null,Y=null,te=0,we=0,Zt=yt(0),X=0,Jn=null,Mt=0,ml=0,Ni=0,In=null,he=null,Pi=0,cn=1/0,Ve=null,el=!1,Uo=null,ft=null,kr=!1,ot=null,tl=0,Mn=0,Ao=null,Lr=-1,Or=0;function ae(){return I&6?K():Lr!==-1?Lr:Lr=K()}function dt(e){return e.mode&1?I&2&&te!==0?te&-te:bf.transition!==null?(Or===0&&(Or=js()),Or):(e=R,e!==0||(e=window.event,e=e===void 0?16:Rs(e.type)),e):1}function De(e,t,n,r){if(50<Mn)throw Mn=0,Ao=null,Error(g(185));bn(e,n,r),(!(I&2)||e!==b)&&(e===b&&(!(I&2)&&(ml|=n),X===4&&rt(e,te)),ge(e,r),n===1&&I===0&&!(t.mode&1)&&(cn=K()+500,fl&&gt()))}function ge(e,t){var n=e.callbackNode;qc(e,t);var r=Ur(e,e===b?te:0);if(r===0)n!==null&&Gi(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Gi(n),t===1)e.tag===0?qf(Wu.bind(null,e)):ea(Wu.bind(null,e)),Gf(function(){!(I&6)&&gt()}),n=null;else{switch(Ts(r)){case 1:n=bo;break;case 4:n=Ns;break;case 16:n=Fr;break;case 536870912:n=Ps;break;default:n=Fr}n=qa(n,Qa.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Qa(e,t){if(Lr=-1,Or=0,I&6)throw Error(g(327));var n=e.callbackNode;if(nn()&&e.callbackNode!==n)return null;var r=Ur(e,e===b?te:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=nl(e,r);else{t=r;var l=I;I|=2;var o=Ya();(b!==e||te!==t)&&(Ve=null,cn=K()+500,Tt(e,t));do try{wd();break}catch(u){Ka(e,u)}while(!0);di(),br.current=o,I=l,Y!==null?t=0:(b=null,te=0,t=X)}if(t!==0){if(t===2&&(l=fo(e),l!==0&&(r=l,t=Wo(e,l))),t===1)throw n=Jn,Tt(e,0),rt(e,r),ge(e,K()),n;if(t===6)rt(e,r);else{if(l=e.current.alternate,!(r&30)&&!yd(l)&&(t=nl(e,r),t===2&&(o=fo(e),o!==0&&(r=o,t=Wo(e,o))),t===1))throw n=Jn,Tt(e,0),rt(e,r),ge(e,K()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(g(345));case 2:_t(e,he,Ve);break;case 3:if(rt(e,r),(r&130023424)===r&&(t=Pi+500-K(),10<t)){if(Ur(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){ae(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=ko(_t.bind(null,e,he,Ve),t);break}_t(e,he,Ve);break;case 4:if(rt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-Re(r);o=1<<i,i=t[i],i>l&&(l=i),r&=~o}if(r=l,r=K()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*vd(r/1960))-r,10<r){e.timeoutHandle=ko(_t.bind(null,e,he,Ve),r);break}_t(e,he,Ve);break;case 5:_t(e,he,Ve);break;default:throw Error(g(329))}}}return ge(e,K()),e.callbackNode===n?Qa.bind(null,e):null}function Wo(e,t){var n=In;return e.current.memoizedState.isDehydrated&&(Tt(e,t).flags|=256),e=nl(e,t),e!==2&&(t=he,he=n,t!==null&&Bo(t)),e}function Bo(e){he===null?he=e:he.push.apply(he,e)}function yd(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!Fe(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function rt(e,t){for(t&=~Ni,t&=~ml,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Re(t),r=1<<n;e[n]=-1,t&=~r}}function Wu(e){if(I&6)throw Error(g(327));nn();var t=Ur(e,0);if(!(t&1))return ge(e,K()),null;var n=nl(e,t);if(e.tag!==0&&n===2){var r=fo(e);r!==0&&(t=r,n=Wo(e,r))}if(n===1)throw n=Jn,Tt(e,0),rt(e,t),ge(e,K()),n;if(n===6)throw Error(g(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,_t(e,he,Ve),ge(e,K()),null}function ji(e,t){var n=I;I|=1;try{return e(t)}finally{I=n,I===0&&(cn=K()+500,fl&&gt())}}function Rt(e){ot!==null&&ot.tag===0&&!(I&6)&&nn();var t=I;I|=1;var n=je.transition,r=R;try{if(je.transition=null,R=1,e)return e()}finally{R=r,je.transition=n,I=t,!(I&6)&&gt()}}function Ti(){we=Zt.current,U(Zt)}function Tt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Yf(n)),Y!==null)for(n=Y.return;n!==null;){var r=n;switch(ai(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Vr();break;case 3:sn(),U(ve),U(ie),gi();break;case 5:yi(r);break;case 4:sn();break;case 13:U(B);break;case 19:U(B);break;case 10:pi(r.type._context);break;case 22:case 23:Ti()}n=n.return}if(b=e,Y=e=pt(e.current,null),te=we=t,X=0,Jn=null,Ni=ml=Mt=0,he=In=null,Pt!==null){for(t=0;t<Pt.length;t++)if(n=Pt[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var i=o.next;o.next=l,r.next=i}n.pending=r}Pt=null}return e}function Ka(e,t){do{var n=Y;try{if(di(),jr.current=qr,Jr){for(var r=$.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}Jr=!1}if(It=0,q=G=$=null,Ln=!1,Gn=0,_i.current=null,n===null||n.return===null){X=1,Jn=t,Y=null;break}e:{var o=e,i=n.return,u=n,s=t;if(t=te,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var c=s,v=u,m=v.tag;if(!(v.mode&1)&&(m===0||m===11||m===15)){var h=v.alternate;h?(v.updateQueue=h.updateQueue,v.memoizedState=h.memoizedState,v.lanes=h.lanes):(v.updateQueue=null,v.memoizedState=null)}var w=Pu(i);if(w!==null){w.flags&=-257,ju(w,i,u,o,t),w.mode&1&&Nu(o,c,t),t=w,s=c;var k=t.updateQueue;if(k===null){var S=new Set;S.add(s),t.updateQueue=S}else k.add(s);break e}else{if(!(t&1)){Nu(o,c,t),zi();break e}s=Error(g(426))}}else if(W&&u.mode&1){var M=Pu(i);if(M!==null){!(M.flags&65536)&&(M.flags|=256),ju(M,i,u,o,t),ci(an(s,u));break e}}o=s=an(s,u),X!==4&&(X=2),In===null?In=[o]:In.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var f=Ta(o,s,t);ku(o,f);break e;case 1:u=s;var a=o.type,d=o.stateNode;if(!(o.flags&128)&&(typeof a.getDerivedStateFromError=="function"||d!==null&&typeof d.componentDidCatch=="function"&&(ft===null||!ft.has(d)))){o.flags|=65536,t&=-t,o.lanes|=t;var y=za(o,u,t);ku(o,y);break e}}o=o.return}while(o!==null)}Xa(n)}catch(x){t=x,Y===n&&n!==null&&(Y=n=n.return);continue}break}while(!0)}function Ya(){var e=br.current;return br.current=qr,e===null?qr:e}function zi(){(X===0||X===3||X===2)&&(X=4),b===null||!(Mt&268435455)&&!(ml&268435455)||rt(b,te)}function nl(e,t){var n=I;I|=2;var r=Ya();(b!==e||te!==t)&&(Ve=null,Tt(e,t));do try{gd();break}catch(l){Ka(e,l)}while(!0);if(di(),I=n,br.current=r,Y!==null)throw Error(g(261));return b=null,te=0,X}function gd(){for(;Y!==null;)Ga(Y)}function wd(){for(;Y!==null&&!Vc();)Ga(Y)}function Ga(e){var t=Ja(e.alternate,e,we);e.memoizedProps=e.pendingProps,t===null?Xa(e):Y=t,_i.current=null}function Xa(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=dd(n,t),n!==null){n.flags&=32767,Y=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{X=6,Y=null;return}}else if(n=fd(n,t,we),n!==null){Y=n;return}if(t=t.sibling,t!==null){Y=t;return}Y=t=e}while(t!==null);X===0&&(X=5)}function _t(e,t,n){var r=R,l=je.transition;try{je.transition=null,R=1,kd(e,t,n,r)}finally{je.transition=l,R=r}return null}function kd(e,t,n,r){do nn();while(ot!==null);if(I&6)throw Error(g(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(g(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(bc(e,o),e===b&&(Y=b=null,te=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||kr||(kr=!0,qa(Fr,function(){return nn(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=je.transition,je.transition=null;var i=R;R=1;var u=I;I|=4,_i.current=null,hd(e,n),Va(n,e),Wf(go),Ar=!!yo,go=yo=null,e.current=n,md(n),Hc(),I=u,R=i,je.transition=o}else e.current=n;if(kr&&(kr=!1,ot=e,tl=l),o=e.pendingLanes,o===0&&(ft=null),Yc(n.stateNode),ge(e,K()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(el)throw el=!1,e=Uo,Uo=null,e;return tl&1&&e.tag!==0&&nn(),o=e.pendingLanes,o&1?e===Ao?Mn++:(Mn=0,Ao=e):Mn=0,gt(),null}function nn(){if(ot!==null){var e=Ts(tl),t=je.transition,n=R;try{if(je.transition=null,R=16>e?16:e,ot===null)var r=!1;else{if(e=ot,ot=null,tl=0,I&6)throw Error(g(331));var l=I;for(I|=4,E=e.current;E!==null;){var o=E,i=o.child;if(E.flags&16){var u=o.deletions;if(u!==null){for(var s=0;s<u.length;s++){var c=u[s];for(E=c;E!==null;){var v=E;switch(v.tag){case 0:case 11:case 15:On(8,v,o)}var m=v.child;if(m!==null)m.return=v,E=m;else for(;E!==null;){v=E;var h=v.sibling,w=v.return;if(Wa(v),v===c){E=null;break}if(h!==null){h.return=w,E=h;break}E=w}}}var k=o.alternate;if(k!==null){var S=k.child;if(S!==null){k.child=null;do{var M=S.sibling;S.sibling=null,S=M}while(S!==null)}}E=o}}if(o.subtreeFlags&2064&&i!==null)i.return=o,E=i;else e:for(;E!==null;){if(o=E,o.flags&2048)switch(o.tag){case 0:case 11:case 15:On(9,o,o.return)}var f=o.sibling;if(f!==null){f.return=o.return,E=f;break e}E=o.return}}var a=e.current;for(E=a;E!==null;){i=E;var d=i.child;if(i.subtreeFlags&2064&&d!==null)d.return=i,E=d;else e:for(i=a;E!==null;){if(u=E,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:hl(9,u)}}catch(x){H(u,u.return,x)}if(u===i){E=null;break e}var y=u.sibling;if(y!==null){y.return=u.return,E=y;break e}E=u.return}}if(I=l,gt(),Be&&typeof Be.onPostCommitFiberRoot=="function")try{Be.onPostCommitFiberRoot(il,e)}catch{}r=!0}return r}finally{R=n,je.transition=t}}return!1}function Bu(e,t,n){t=an(n,t),t=Ta(e,t,1),e=ct(e,t,1),t=ae(),e!==null&&(bn(e,1,t),ge(e,t))}function H(e,t,n){if(e.tag===3)Bu(e,e,n);else for(;t!==null;){if(t.tag===3){Bu(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(ft===null||!ft.has(r))){e=an(n,e),e=za(t,e,1),t=ct(t,e,1),e=ae(),t!==null&&(bn(t,1,e),ge(t,e));break}}t=t.return}}function Sd(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=ae(),e.pingedLanes|=e.suspendedLanes&n,b===e&&(te&n)===n&&(X===4||X===3&&(te&130023424)===te&&500>K()-Pi?Tt(e,0):Ni|=n),ge(e,t)}function Za(e,t){t===0&&(e.mode&1?(t=cr,cr<<=1,!(cr&130023424)&&(cr=4194304)):t=1);var n=ae();e=Ze(e,t),e!==null&&(bn(e,t,n),ge(e,n))}function xd(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),Za(e,n)}function Cd(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(g(314))}r!==null&&r.delete(t),Za(e,n)}var Ja;Ja=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||ve.current)me=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return me=!1,cd(e,t,n);me=!!(e.flags&131072)}else me=!1,W&&t.flags&1048576&&ta(t,Kr,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;zr(e,t),e=t.pendingProps;var l=ln(t,ie.current);tn(t,n),l=ki(null,t,r,e,l,n);var o=Si();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,ye(r)?(o=!0,Hr(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,mi(t),l.updater=pl,t.stateNode=l,l._reactInternals=t,Po(t,r,e,n),t=zo(null,t,r,!0,o,n)):(t.tag=0,W&&o&&si(t),se(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(zr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=_d(r),e=Oe(r,e),l){case 0:t=To(null,t,r,e,n);break e;case 1:t=Lu(null,t,r,e,n);break e;case 11:t=Tu(null,t,r,e,n);break e;case 14:t=zu(null,t,r,Oe(r.type,e),n);break e}throw Error(g(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),To(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Lu(e,t,r,l,n);case 3:e:{if(Ma(t),e===null)throw Error(g(387));r=t.pendingProps,o=t.memoizedState,l=o.element,ua(e,t),Xr(t,r,null,n);var i=t.memoizedState;if(r=i.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=an(Error(g(423)),t),t=Ou(e,t,r,n,l);break e}else if(r!==l){l=an(Error(g(424)),t),t=Ou(e,t,r,n,l);break e}else for(ke=at(t.stateNode.containerInfo.firstChild),Se=t,W=!0,Me=null,n=oa(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(on(),r===l){t=Je(e,t,n);break e}se(e,t,r,n)}t=t.child}return t;case 5:return sa(t),e===null&&Eo(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,i=l.children,wo(r,l)?i=null:o!==null&&wo(r,o)&&(t.flags|=32),Ia(e,t),se(e,t,i,n),t.child;case 6:return e===null&&Eo(t),null;case 13:return Ra(e,t,n);case 4:return vi(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=un(t,null,r,n):se(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Tu(e,t,r,l,n);case 7:return se(e,t,t.pendingProps,n),t.child;case 8:return se(e,t,t.pendingProps.children,n),t.child;case 12:return se(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,i=l.value,D(Yr,r._currentValue),r._currentValue=i,o!==null)if(Fe(o.value,i)){if(o.children===l.children&&!ve.current){t=Je(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var u=o.dependencies;if(u!==null){i=o.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(o.tag===1){s=Ye(-1,n&-n),s.tag=2;var c=o.updateQueue;if(c!==null){c=c.shared;var v=c.pending;v===null?s.next=s:(s.next=v.next,v.next=s),c.pending=s}}o.lanes|=n,s=o.alternate,s!==null&&(s.lanes|=n),_o(o.return,n,t),u.lanes|=n;break}s=s.next}}else if(o.tag===10)i=o.type===t.type?null:o.child;else if(o.tag===18){if(i=o.return,i===null)throw Error(g(341));i.lanes|=n,u=i.alternate,u!==null&&(u.lanes|=n),_o(i,n,t),i=o.sibling}else i=o.child;if(i!==null)i.return=o;else for(i=o;i!==null;){if(i===t){i=null;break}if(o=i.sibling,o!==null){o.return=i.return,i=o;break}i=i.return}o=i}se(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,tn(t,n),l=Te(l),r=r(l),t.flags|=1,se(e,t,r,n),t.child;case 14:return r=t.type,l=Oe(r,t.pendingProps),l=Oe(r.type,l),zu(e,t,r,l,n);case 15:return La(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),zr(e,t),t.tag=1,ye(r)?(e=!0,Hr(t)):e=!1,tn(t,n),ja(t,r,l),Po(t,r,l,n),zo(null,t,r,!0,e,n);case 19:return Da(e,t,n);case 22:return Oa(e,t,n)}throw Error(g(156,t.tag))};function qa(e,t){return _s(e,t)}function Ed(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Pe(e,t,n,r){return new Ed(e,t,n,r)}function Li(e){return e=e.prototype,!(!e||!e.isReactComponent)}function _d(e){if(typeof e=="function")return Li(e)?1:0;if(e!=null){if(e=e.$$typeof,e===Zo)return 11;if(e===Jo)return 14}return 2}function pt(e,t){var n=e.alternate;return n===null?(n=Pe(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Ir(e,t,n,r,l,o){var i=2;if(r=e,typeof e=="function")Li(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case Wt:return zt(n.children,l,o,t);case Xo:i=8,l|=8;break;case Zl:return e=Pe(12,n,t,l|2),e.elementType=Zl,e.lanes=o,e;case Jl:return e=Pe(13,n,t,l),e.elementType=Jl,e.lanes=o,e;case ql:return e=Pe(19,n,t,l),e.elementType=ql,e.lanes=o,e;case ss:return vl(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case is:i=10;break e;case us:i=9;break e;case Zo:i=11;break e;case Jo:i=14;break e;case et:i=16,r=null;break e}throw Error(g(130,e==null?e:typeof e,""))}return t=Pe(i,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function zt(e,t,n,r){return e=Pe(7,e,r,t),e.lanes=n,e}function vl(e,t,n,r){return e=Pe(22,e,r,t),e.elementType=ss,e.lanes=n,e.stateNode={isHidden:!1},e}function Kl(e,t,n){return e=Pe(6,e,null,t),e.lanes=n,e}function Yl(e,t,n){return t=Pe(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Nd(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Pl(0),this.expirationTimes=Pl(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Pl(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Oi(e,t,n,r,l,o,i,u,s){return e=new Nd(e,t,n,u,s),t===1?(t=1,o===!0&&(t|=8)):t=0,o=Pe(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},mi(o),e}function Pd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:At,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function ba(e){if(!e)return mt;e=e._reactInternals;e:{if(Ft(e)!==e||e.tag!==1)throw Error(g(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(ye(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(g(171))}if(e.tag===1){var n=e.type;if(ye(n))return bs(e,n,t)}return t}function ec(e,t,n,r,l,o,i,u,s){return e=Oi(n,r,!0,e,l,o,i,u,s),e.context=ba(null),n=e.current,r=ae(),l=dt(n),o=Ye(r,l),o.callback=t??null,ct(n,o,l),e.current.lanes=l,bn(e,l,r),ge(e,r),e}function yl(e,t,n,r){var l=t.current,o=ae(),i=dt(l);return n=ba(n),t.context===null?t.context=n:t.pendingContext=n,t=Ye(o,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=ct(l,t,i),e!==null&&(De(e,l,i,o),Pr(e,l,i)),i}function rl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function $u(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Ii(e,t){$u(e,t),(e=e.alternate)&&$u(e,t)}function jd(){return null}var tc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Mi(e){this._internalRoot=e}gl.prototype.render=Mi.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(g(409));yl(e,t,null,null)};gl.prototype.unmount=Mi.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Rt(function(){yl(null,e,null,null)}),t[Xe]=null}};function gl(e){this._internalRoot=e}gl.prototype.unstable_scheduleHydration=function(e){if(e){var t=Os();e={blockedOn:null,target:e,priority:t};for(var n=0;n<nt.length&&t!==0&&t<nt[n].priority;n++);nt.splice(n,0,e),n===0&&Ms(e)}};function Ri(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function wl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Vu(){}function Td(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var c=rl(i);o.call(c)}}var i=ec(t,r,e,0,null,!1,!1,"",Vu);return e._reactRootContainer=i,e[Xe]=i.current,Vn(e.nodeType===8?e.parentNode:e),Rt(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var c=rl(s);u.call(c)}}var s=Oi(e,0,!1,null,null,!1,!1,"",Vu);return e._reactRootContainer=s,e[Xe]=s.current,Vn(e.nodeType===8?e.parentNode:e),Rt(function(){yl(t,s,n,r)}),s}function kl(e,t,n,r,l){var o=n._reactRootContainer;if(o){var i=o;if(typeof l=="function"){var u=l;l=function(){var s=rl(i);u.call(s)}}yl(t,i,e,l)}else i=Td(n,t,e,l,r);return rl(i)}zs=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=En(t.pendingLanes);n!==0&&(ei(t,n|1),ge(t,K()),!(I&6)&&(cn=K()+500,gt()))}break;case 13:Rt(function(){var r=Ze(e,1);if(r!==null){var l=ae();De(r,e,1,l)}}),Ii(e,1)}};ti=function(e){if(e.tag===13){var t=Ze(e,134217728);if(t!==null){var n=ae();De(t,e,134217728,n)}Ii(e,134217728)}};Ls=function(e){if(e.tag===13){var t=dt(e),n=Ze(e,t);if(n!==null){var r=ae();De(n,e,t,r)}Ii(e,t)}};Os=function(){return R};Is=function(e,t){var n=R;try{return R=e,t()}finally{R=n}};so=function(e,t,n){switch(t){case"input":if(to(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=cl(r);if(!l)throw Error(g(90));cs(r),to(r,l)}}}break;case"textarea":ds(e,n);break;case"select":t=n.value,t!=null&&Jt(e,!!n.multiple,t,!1)}};ws=ji;ks=Rt;var zd={usingClientEntryPoint:!1,Events:[tr,Ht,cl,ys,gs,ji]},Sn={findFiberByHostInstance:Nt,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Ld={bundleType:Sn.bundleType,version:Sn.version,rendererPackageName:Sn.rendererPackageName,rendererConfig:Sn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:qe.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Cs(e),e===null?null:e.stateNode},findFiberByHostInstance:Sn.findFiberByHostInstance||jd,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Sr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Sr.isDisabled&&Sr.supportsFiber)try{il=Sr.inject(Ld),Be=Sr}catch{}}Ce.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=zd;Ce.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Ri(t))throw Error(g(200));return Pd(e,t,null,n)};Ce.createRoot=function(e,t){if(!Ri(e))throw Error(g(299));var n=!1,r="",l=tc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Oi(e,1,!1,null,null,n,!1,r,l),e[Xe]=t.current,Vn(e.nodeType===8?e.parentNode:e),new Mi(t)};Ce.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(g(188)):(e=Object.keys(e).join(","),Error(g(268,e)));return e=Cs(t),e=e===null?null:e.stateNode,e};Ce.flushSync=function(e){return Rt(e)};Ce.hydrate=function(e,t,n){if(!wl(t))throw Error(g(200));return kl(null,e,t,!0,n)};Ce.hydrateRoot=function(e,t,n){if(!Ri(e))throw Error(g(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",i=tc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=ec(t,null,e,1,n??null,l,!1,o,i),e[Xe]=t.current,Vn(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new gl(t)};Ce.render=function(e,t,n){if(!wl(t))throw Error(g(200));return kl(null,e,t,!1,n)};Ce.unmountComponentAtNode=function(e){if(!wl(e))throw Error(g(40));return e._reactRootContainer?(Rt(function(){kl(null,null,e,!1,function(){e._reactRootContainer=null,e[Xe]=null})}),!0):!1};Ce.unstable_batchedUpdates=ji;Ce.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!wl(n))throw Error(g(200));if(e==null||e._reactInternals===void 0)throw Error(g(38));return kl(e,t,n,!1,r)};Ce.version="18.3.1-next-f1338f8080-20240426";function nc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(nc)}catch(e){console.error(e)}}nc(),ns.exports=Ce;var Od=ns.exports,Hu=Od;Gl.createRoot=Hu.createRoot,Gl.hydrateRoot=Hu.hydrateRoot;const ll="webex-contact-center";function Id(){return typeof window<"u"?window.location.origin+"/mcp":"http://localhost:8080/mcp"}function Md(){return typeof window<"u"?window.location.origin:"http://localhost:8080"}function Rd(){return typeof window<"u"?window.location.origin+"/mcp":"http://localhost:8080/mcp"}const Dd="http://localhost:8080",rc="http://localhost:8080/mcp",Fd=[{id:"chat",label:"Chat (MCP Client)"},{id:"contact-center",label:"Webex Contact Center MCP"}],Ud=[{name:"cc_list_address_books",description:"Lists address books for the organization. Calls Webex Contact Center API: GET organization/{orgId}/v3/address-book. Requires Organization ID (provide in Chat or in MCP arguments as __orgId, or set on server as CONTACT_CENTER_ORG_ID).",howToUseFromChat:'In the Chat tab, enter your Organization ID and Access token, then type a natural prompt such as: "What address books do you have?", "List all address books", or "Show me the address books for my org." The assistant will call this tool and return the list.',examplePrompts:["What address books do you have?","List all address books","Show me the address books for my org"]},{name:"cc_end_task",description:"Ends (clears) an interaction/task by task ID. Calls POST v1/tasks/{taskID}/end. You must provide the task ID. Uses the access token from the Chat tab or from MCP arguments (__accessToken), or server env.",howToUseFromChat:'In Chat, after your Org ID and token are set, ask to end a specific task by ID, for example: "End task abc-123-def", "Clear the interaction for task xyz-456", or "Close task 12345."',examplePrompts:["End task abc-123-def","Clear the interaction for task xyz-456","Close task 12345"]},{name:"cc_check_agent_outbound",description:"Checks if an agent is configured to place outbound calls. Uses org ID and token from Chat or MCP arguments. Internally: (1) GET user bulk-export to find the user and agent profile name, (2) GET agent-profile to read outdialEnabled.",howToUseFromChat:'In Chat, with Org ID and token set, ask about a specific agent by email, e.g.: "Can agent john@company.com place outbound calls?", "Is outbound enabled for jane@example.com?", or "Check if this agent has outdial: user@org.com."',examplePrompts:["Can agent john@company.com place outbound calls?","Is outbound enabled for jane@example.com?","Check if this agent has outdial: user@org.com"]}];function Ad(e,t){return{mcpServers:{[(e||ll).trim()||ll]:{url:t||(typeof window<"u"?window.location.origin+"/mcp":rc)}}}}function Wd(){const[e,t]=J.useState("chat"),[n,r]=J.useState(!1),[l,o]=J.useState(ll),[i,u]=J.useState(Id),[s,c]=J.useState(!1),[v,m]=J.useState(Md),[h,w]=J.useState(Rd),[k,S]=J.useState(""),[M,f]=J.useState(""),[a,d]=J.useState([]),[y,x]=J.useState(""),[_,N]=J.useState(!1),[P,A]=J.useState(null),T=!!(M!=null&&M.trim()),ue=Ad(l,i),wt=J.useCallback(async()=>{try{await navigator.clipboard.writeText(JSON.stringify(ue,null,2)),c(!0),setTimeout(()=>c(!1),2e3)}catch{c(!1)}},[ue]),kt=J.useCallback(async()=>{const j=y.trim();if(!(!j||_||!T)){x(""),A(null),d(de=>[...de,{role:"user",content:j}]),N(!0);try{const de=v.replace(/\/$/,""),pe=await fetch(`${de}/api/chat`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({prompt:j,mcpServerUrl:h,accessToken:M.trim(),orgId:k.trim()||void 0})}),St=await pe.json();if(!pe.ok)throw new Error(St.error||`HTTP ${pe.status}`);d(C=>[...C,{role:"assistant",content:St.reply||"",toolCalls:St.toolCalls}])}catch(de){A(de.message||String(de)),d(pe=>[...pe,{role:"assistant",content:`Error: ${de.message||String(de)}`,isError:!0}])}finally{N(!1)}}},[y,_,T,v,h,M,k]);return p.jsxs("div",{className:"app",children:[p.jsxs("header",{className:"header",children:[p.jsx("div",{className:"header-left",children:p.jsx("h1",{children:"Webex Contact Center MCP"})}),p.jsx("div",{className:"header-right",children:p.jsx("button",{type:"button",className:"doc-link-btn",onClick:()=>r(!0),children:"Documentation"})})]}),p.jsx("nav",{className:"tabs",role:"tablist",children:Fd.map(j=>p.jsx("button",{type:"button",role:"tab","aria-selected":e===j.id,className:`tab ${e===j.id?"tab-active":""}`,onClick:()=>t(j.id),children:j.label},j.id))}),e==="contact-center"&&p.jsxs("div",{className:"layout",children:[p.jsxs("section",{className:"panel config-panel",children:[p.jsx("h2",{children:"How to use this MCP"}),p.jsxs("p",{className:"intro",children:["This server is hosted on AWS. The AI (Claude) is already configured — you only need your ",p.jsx("strong",{children:"Webex Contact Center Organization ID"})," and ",p.jsx("strong",{children:"Access token"}),". Follow the steps below."]}),p.jsx("h3",{children:"What you need"}),p.jsxs("ul",{className:"doc-list",children:[p.jsxs("li",{children:[p.jsx("strong",{children:"Organization ID"})," — Your Webex Contact Center organization ID (e.g. from the Webex CC Developer Portal)."]}),p.jsxs("li",{children:[p.jsx("strong",{children:"Access token"})," — A Webex Contact Center API access token for that organization."]})]}),p.jsx("h3",{children:"Step 1: Choose how you want to use the MCP"}),p.jsx("p",{children:p.jsx("strong",{children:"Option A — Chat on this website (easiest)"})}),p.jsxs("ol",{className:"doc-list",children:[p.jsxs("li",{children:["Open the ",p.jsx("strong",{children:"Chat (MCP Client)"})," tab."]}),p.jsxs("li",{children:["Enter your ",p.jsx("strong",{children:"Organization ID"})," and ",p.jsx("strong",{children:"Access token"})," in the form."]}),p.jsx("li",{children:"Type your prompt and click Send. The server uses your token and org ID for every request; you don’t configure anything else."})]}),p.jsx("p",{children:p.jsx("strong",{children:"Option B — Use an MCP client (Cursor, Claude Desktop, etc.)"})}),p.jsxs("ol",{className:"doc-list",children:[p.jsx("li",{children:"Add this MCP server to your client config (see Step 2 below)."}),p.jsxs("li",{children:["When calling tools, you must send your ",p.jsx("strong",{children:"Org ID"})," and ",p.jsx("strong",{children:"token"})," in every request (see Step 3)."]})]}),p.jsx("h3",{children:"Step 2: Add the server to your MCP client (Option B only)"}),p.jsxs("ol",{className:"doc-list",children:[p.jsxs("li",{children:["The MCP endpoint URL is: ",p.jsx("code",{children:"https://ipcykaiq4a.us-east-1.awsapprunner.com/mcp"})," (this site’s URL + ",p.jsx("code",{children:"/mcp"}),")."]}),p.jsxs("li",{children:["In the right panel below, the ",p.jsx("strong",{children:"MCP endpoint URL"})," field is pre-filled when you open this page from the deployed site. You can change the ",p.jsx("strong",{children:"Server name"})," if you like."]}),p.jsxs("li",{children:["Click ",p.jsx("strong",{children:"Copy JSON"})," and paste the result into your MCP client configuration (e.g. Cursor → Settings → MCP → edit config JSON)."]}),p.jsx("li",{children:"Save and restart your client."})]}),p.jsx("h3",{children:"Step 3: How to send Org ID and token in requests"}),p.jsx("p",{children:p.jsx("strong",{children:"If you use Chat on this website (Option A)"})}),p.jsx("ul",{className:"doc-list",children:p.jsxs("li",{children:["You enter Org ID and Access token in the Chat form. Each time you send a message, the browser sends a request to ",p.jsx("code",{children:"POST /api/chat"})," with a JSON body that includes ",p.jsx("code",{children:"orgId"})," and ",p.jsx("code",{children:"accessToken"}),". The server uses them for Webex Contact Center API calls. Nothing else is required."]})}),p.jsx("p",{children:p.jsx("strong",{children:"If you use an MCP client and call tools directly (Option B)"})}),p.jsxs("ul",{className:"doc-list",children:[p.jsxs("li",{children:["Every ",p.jsx("code",{children:"tools/call"})," request must include your credentials in the ",p.jsx("code",{children:"arguments"})," object. The server accepts two reserved keys:",p.jsxs("ul",{children:[p.jsxs("li",{children:[p.jsx("code",{children:"__orgId"})," — Your Webex Contact Center organization ID (string)."]}),p.jsxs("li",{children:[p.jsx("code",{children:"__accessToken"})," — Your Webex Contact Center API access token (string)."]})]}),"The server removes these from the arguments and uses them for authentication; they are not passed to the tool itself."]}),p.jsxs("li",{children:[p.jsx("strong",{children:"Example request body"})," (JSON-RPC ",p.jsx("code",{children:"tools/call"}),"):"]})]}),p.jsx("pre",{className:"code-block doc-example-request",children:`{
-  "jsonrpc": "2.0",
-  "id": 1,
-  "method": "tools/call",
-  "params": {
-    "name": "cc_list_address_books",
-    "arguments": {
-      "__orgId": "YOUR_ORG_ID",
-      "__accessToken": "YOUR_ACCESS_TOKEN"
-    }
-  }
-}`}),p.jsxs("p",{className:"hint",children:["Replace ",p.jsx("code",{children:"YOUR_ORG_ID"})," and ",p.jsx("code",{children:"YOUR_ACCESS_TOKEN"})," with your actual values. For other tools (e.g. ",p.jsx("code",{children:"cc_end_task"}),"), add the tool’s parameters in ",p.jsx("code",{children:"arguments"})," along with ",p.jsx("code",{children:"__orgId"})," and ",p.jsx("code",{children:"__accessToken"}),"."]}),p.jsxs("div",{className:"field-group",children:[p.jsx("label",{htmlFor:"ccServerName",children:"Server name (config key)"}),p.jsx("input",{id:"ccServerName",type:"text",value:l,onChange:j=>o(j.target.value),placeholder:ll,className:"input"})]}),p.jsxs("div",{className:"field-group",children:[p.jsx("label",{htmlFor:"ccMcpUrl",children:"MCP endpoint URL"}),p.jsx("input",{id:"ccMcpUrl",type:"url",value:i,onChange:j=>u(j.target.value),placeholder:"https://ipcykaiq4a.us-east-1.awsapprunner.com/mcp",className:"input"}),p.jsxs("span",{className:"hint",children:["This server’s URL + ",p.jsx("code",{children:"/mcp"}),". Pre-filled when you open this page from the deployed site."]})]})]}),p.jsxs("section",{className:"panel output-panel",children:[p.jsx("h2",{children:"Generated config"}),p.jsxs("p",{className:"hint",children:["Paste this into your MCP client config (e.g. Cursor). You still need to send ",p.jsx("code",{children:"__orgId"})," and ",p.jsx("code",{children:"__accessToken"})," in each tool call — see Step 3 above."]}),p.jsx("pre",{className:"code-block",children:p.jsx("code",{children:JSON.stringify(ue,null,2)})}),p.jsx("button",{type:"button",onClick:wt,className:"copy-btn","aria-pressed":s,children:s?"Copied":"Copy JSON"})]})]}),n&&p.jsx("div",{className:"modal-overlay",role:"dialog","aria-modal":"true","aria-labelledby":"docs-modal-title",children:p.jsxs("div",{className:"modal-content docs-modal",children:[p.jsxs("div",{className:"modal-header",children:[p.jsx("h2",{id:"docs-modal-title",children:"Documentation — MCP tools"}),p.jsx("button",{type:"button",className:"modal-close",onClick:()=>r(!1),"aria-label":"Close",children:"×"})]}),p.jsxs("div",{className:"modal-body",children:[p.jsxs("p",{className:"intro",children:["Use ",p.jsx("strong",{children:"Chat (MCP Client)"})," with your Org ID and Access token, or an MCP client configured with this server."]}),Ud.map(j=>p.jsxs("div",{className:"doc-tool-block",children:[p.jsx("h3",{children:p.jsx("code",{children:j.name})}),p.jsx("p",{className:"doc-tool-examples",children:p.jsx("strong",{children:"Example prompts:"})}),p.jsx("ul",{className:"doc-tool-examples-list",children:j.examplePrompts.map((de,pe)=>p.jsx("li",{children:p.jsx("code",{children:de})},pe))}),p.jsx("p",{className:"doc-tool-desc",children:j.description}),p.jsxs("p",{className:"doc-tool-how",children:[p.jsx("strong",{children:"How to use from Chat:"})," ",j.howToUseFromChat]})]},j.name))]})]})}),e==="chat"&&p.jsx("div",{className:"chat-layout",children:p.jsxs("section",{className:"panel chat-panel",children:[p.jsx("h2",{children:"Chat (MCP Client)"}),p.jsxs("p",{className:"intro",children:["Set your ",p.jsx("strong",{children:"Organization ID"})," and ",p.jsx("strong",{children:"Access token"})," below to start chatting. The app uses them for Webex Contact Center API calls. Use ",p.jsx("strong",{children:"Chat API base URL"})," and ",p.jsx("strong",{children:"MCP server URL"})," below to point to a local server or a deployed one (e.g. App Runner). The server must have ",p.jsx("code",{children:"CLAUDE_API_KEY"})," or ",p.jsx("code",{children:"OPENAI_API_KEY"})," set in its environment (e.g. App Runner) so everyone can use the Chat; keys are never stored in code."]}),p.jsxs("div",{className:"chat-auth",children:[p.jsxs("div",{className:"field-group",children:[p.jsxs("label",{htmlFor:"chatOrgId",children:["Organization ID ",p.jsx("span",{className:"required",children:"required"})]}),p.jsx("input",{id:"chatOrgId",type:"text",value:k,onChange:j=>S(j.target.value),placeholder:"e.g. 7c3733e0-ea21-4e66-9e73-b14c6ac91c27",className:"input",autoComplete:"off"})]}),p.jsxs("div",{className:"field-group",children:[p.jsxs("label",{htmlFor:"chatAccessToken",children:["Access token ",p.jsx("span",{className:"required",children:"required"})]}),p.jsx("input",{id:"chatAccessToken",type:"password",value:M,onChange:j=>f(j.target.value),placeholder:"Webex Contact Center API token",className:"input",autoComplete:"off"}),p.jsx("span",{className:"hint",children:"Get a token from the Webex Contact Center Developer Portal. Not stored on the server."})]})]}),!T&&p.jsx("p",{className:"chat-auth-required",children:"Enter your access token above to enable the chat."}),p.jsxs("div",{className:"chat-settings",children:[p.jsxs("div",{className:"field-group",children:[p.jsx("label",{htmlFor:"chatApiBase",children:"Chat API base URL"}),p.jsx("input",{id:"chatApiBase",type:"url",value:v,onChange:j=>m(j.target.value),placeholder:Dd,className:"input"})]}),p.jsxs("div",{className:"field-group",children:[p.jsx("label",{htmlFor:"chatMcpUrl",children:"MCP server URL"}),p.jsx("input",{id:"chatMcpUrl",type:"url",value:h,onChange:j=>w(j.target.value),placeholder:rc,className:"input"})]})]}),p.jsxs("div",{className:"chat-messages",role:"log","aria-live":"polite",children:[a.length===0&&p.jsx("p",{className:"chat-placeholder",children:'e.g. "List Webex Contact Center agents" or "Get agent statistics"'}),a.map((j,de)=>p.jsxs("div",{className:`chat-message chat-message-${j.role}${j.isError?" isError":""}`,children:[p.jsx("span",{className:"chat-message-role",children:j.role==="user"?"You":"Assistant"}),p.jsx("div",{className:"chat-message-content",children:j.content}),j.toolCalls&&j.toolCalls.length>0&&p.jsxs("details",{className:"chat-tool-calls",children:[p.jsxs("summary",{children:["Tools used (",j.toolCalls.length,")"]}),p.jsx("pre",{children:j.toolCalls.map(pe=>`${pe.name}: ${pe.result}`).join(`
-
-`)})]})]},de)),_&&p.jsxs("div",{className:"chat-message chat-message-assistant",children:[p.jsx("span",{className:"chat-message-role",children:"Assistant"}),p.jsx("div",{className:"chat-message-content",children:"Thinking…"})]})]}),P&&p.jsx("p",{className:"chat-error",children:P}),p.jsxs("form",{className:"chat-form",onSubmit:j=>{j.preventDefault(),kt()},children:[p.jsx("input",{type:"text",value:y,onChange:j=>x(j.target.value),placeholder:T?"Type a prompt to run MCP tools…":"Set token above to enable chat",className:"input chat-input",disabled:_||!T,"aria-label":"Chat prompt"}),p.jsx("button",{type:"submit",className:"copy-btn chat-send",disabled:_||!T,children:_?"Sending…":"Send"})]})]})}),p.jsx("footer",{className:"footer",children:p.jsxs("p",{children:["Webex Contact Center:"," ",p.jsx("a",{href:"https://developer.webex.com/webex-contact-center/docs/webex-contact-center",target:"_blank",rel:"noopener noreferrer",children:"API docs"})]})})]})}Gl.createRoot(document.getElementById("root")).render(p.jsx(kc.StrictMode,{children:p.jsx(Wd,{})}));
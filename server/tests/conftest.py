@@ -0,0 +1,74 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+SERVER = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SERVER))
+sys.path.insert(0, str(SERVER / "bench"))  # mock_cc / mock_llm
+
+
+@pytest.fixture(scope="session")
+def mocks():
+    """Mock Contact Center and LLM APIs, with the server's env pointed at them (set before main is imported)."""
+    import mock_llm
+    from mock_cc import MockServer, create_app, free_port
+
+    cc_app = create_app(users=50, profiles=4, address_books=3, entries=5)
+    with MockServer(cc_app) as cc, MockServer(mock_llm.create_app(latency_ms=0)) as llm:
+        env = {
+            "CONTACT_CENTER_BASE_URL": cc.url,
+            "ANTHROPIC_BASE_URL": llm.url,
+            "CLAUDE_API_KEY": "mock-key",
+            "ANTHROPIC_CHAT_MODEL": "mock",
+            "ANTHROPIC_API_KEY": "",
+            "OPENAI_API_KEY": "",
+            "PORT": str(free_port()),
+            "CC_MIRROR_PATH": "",
+            "CC_REFRESH_CONCURRENCY": "0",
+        }
+        saved = {k: os.environ.get(k) for k in env}
+        os.environ.update(env)
+        try:
+            yield {"cc": cc, "llm": llm, "cc_state": cc_app.state.mock}
+        finally:
+            for k, v in saved.items():
+                if v is None:
+                    os.environ.pop(k, None)
+                else:
+                    os.environ[k] = v
+
+
+@pytest.fixture(scope="module")
+def server(mocks):
+    """TestClient of main.app (lifespan run) against the mocks. Per module: the lifespan closes the shared
+    Contact Center client, so modules that call lib.api directly get one on their own event loop."""
+    from fastapi.testclient import TestClient
+
+    import main
+
+    with TestClient(main.app) as client:
+        yield client
+
+
+def call_tool(client, name: str, args: dict, org: str = "org-1") -> dict:
+    body = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": name, "arguments": {**args, "__accessToken": "x", "__orgId": org}}}
+    resp = client.post("/mcp", json=body)
+    assert resp.status_code == 200
+    return resp.json()["result"]
+
+
+def run(go):
+    """asyncio.run(go()) with the shared Contact Center client opened and closed on that event loop."""
+    from lib.api import close_client, init_client
+
+    async def main():
+        await init_client()
+        try:
+            return await go()
+        finally:
+            await close_client()
+
+    return asyncio.run(main())
@@ -0,0 +1,60 @@
+"""cc_list_address_books / cc_end_task(s) against mock_cc: IDs in URL paths and the address-book page cache."""
+
+import time
+
+from conftest import call_tool
+
+from lib.api import path_segment
+from lib.cache import address_book_pages, org_datasets
+from lib.jsonio import loads
+from lib.refresh import refresher
+
+
+def tool(server, name: str, args: dict, org: str) -> dict:
+    return loads(call_tool(server, name, args, org)["content"][0]["text"])
+
+
+def test_path_segment():
+    assert path_segment("ab-1") == "ab-1"
+    assert path_segment("a/b?c=1#d %") == "a%2Fb%3Fc%3D1%23d%20%25"
+    assert path_segment("..") == "%2E%2E"
+    assert path_segment(".") == "%2E"
+
+
+def test_book_and_task_ids_are_one_path_segment(server):
+    book = "book one?page=9#x"
+    res = tool(server, "cc_list_address_books", {"addressBookId": book, "pageSize": 2}, "org-ids")
+    assert res["ok"] is True
+    assert [e["id"] for e in res["entries"]] == [f"{book}-e0", f"{book}-e1"]
+    res = tool(server, "cc_end_task", {"taskID": "t 1?force=1#y"}, "org-ids")
+    assert res["ok"] is True and res["data"] == {"id": "t 1?force=1#y"}
+    res = tool(server, "cc_end_tasks", {"taskIDs": ["t%2", "t#3", "missing?4"]}, "org-ids")
+    assert res["rows"] == [["t%2", "ended", 202, None], ["t#3", "ended", 202, None], ["missing?4", "not-found", 404, "Task missing?4 not found"]]
+
+
+def test_pages_have_their_own_cache_and_prefetches_are_not_tracked(server, monkeypatch):
+    monkeypatch.setattr(refresher, "concurrency", 1)  # tracking is off with refreshes disabled
+    org = "org-pages"
+    datasets = org_datasets.stats()["entries"]
+    pages = address_book_pages.stats()["entries"]
+    res = tool(server, "cc_list_address_books", {"pageSize": 1}, org)
+    assert res["ok"] is True and res["nextCursor"]
+    deadline = time.monotonic() + 5
+    while address_book_pages.stats()["entries"] < pages + 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # Page 0 and its prefetched successor are cached, outside org_datasets
+    assert address_book_pages.stats()["entries"] == pages + 2
+    assert org_datasets.stats()["entries"] == datasets
+    # Only the page that was asked for counts as a lookup
+    tracked = [key for key in refresher.keys if key[1] == org]
+    assert len(tracked) == 1 and ("page", 0) in tracked[0]
+    assert refresher.keys[tracked[0]].cache is address_book_pages
+
+
+def test_address_book_id_of_another_type(server):
+    res = tool(server, "cc_list_address_books", {"addressBookId": 42, "pageSize": 1}, "org-ids")
+    assert res["ok"] is True and res["addressBookId"] == "42"
+    assert [e["id"] for e in res["entries"]] == ["42-e0"]
+    for book in ({"id": "x"}, ["x"], True):
+        res = tool(server, "cc_list_address_books", {"addressBookId": book}, "org-ids")
+        assert res == {"ok": False, "error": "addressBookId must be a string."}
@@ -0,0 +1,57 @@
+"""cc_query_agents filters (lib/agents.py), including arguments of the wrong type."""
+
+from types import SimpleNamespace
+
+import pytest
+from conftest import call_tool
+
+from lib.agents import AgentTable, query_agents
+from lib.jsonio import loads
+
+
+class Users:
+    def __init__(self, rows):
+        self.rows = [SimpleNamespace(email=email, profile_ref=ref) for email, ref in rows]
+
+    def records(self):
+        return self.rows
+
+
+@pytest.fixture
+def table():
+    profiles = {
+        "p1": SimpleNamespace(id="p1", name="Outbound", outdial_enabled=True),
+        "p2": SimpleNamespace(id="p2", name="Inbound", outdial_enabled=False),
+    }
+    users = Users([("a@one.com", "p1"), ("b@one.com", "p2"), ("c@two.com", "p1"), ("d@two.com", None), ("e@two.com", "gone")])
+    return AgentTable(users, profiles)
+
+
+def test_filters(table):
+    assert query_agents(table, {"status": "outbound"})["matched"] == 2
+    assert query_agents(table, {"status": ["no-profile", "profile-not-found"]})["matched"] == 2
+    assert query_agents(table, {"profile": " outbound ", "domain": "@two.com"})["rows"] == [["c@two.com", "Outbound", True, "outbound"]]
+    assert query_agents(table, {"outdialEnabled": "false"})["matched"] == 1
+
+
+@pytest.mark.parametrize(
+    "args, field",
+    [
+        ({"status": 5}, "status"),
+        ({"status": ["outbound", 5]}, "status"),
+        ({"status": [["outbound"]]}, "status"),
+        ({"status": {"outbound": True}}, "status"),
+        ({"profile": 7}, "profile"),
+        ({"profile": ["Outbound"]}, "profile"),
+        ({"domain": {"name": "one.com"}}, "domain"),
+    ],
+)
+def test_wrong_types_are_tool_errors(table, args, field):
+    res = query_agents(table, args)
+    assert res["ok"] is False
+    assert res["error"].startswith(field)
+
+
+def test_wrong_types_over_mcp(server):
+    result = call_tool(server, "cc_query_agents", {"status": 5, "limit": 1}, "org-agents")
+    assert loads(result["content"][0]["text"]) == {"ok": False, "error": "status must be a string or a list of strings."}
@@ -0,0 +1,88 @@
+"""Circuit breaker half-open probing (lib/breaker.py), on its own and through cc_rest against mock_cc."""
+
+import asyncio
+import time
+
+import pytest
+from conftest import run
+
+from lib.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def opened(cooldown_ago: float = 0.0) -> CircuitBreaker:
+    breaker = CircuitBreaker("test")
+    breaker.record(False, 1)
+    breaker.opened_at -= cooldown_ago
+    return breaker
+
+
+def test_one_probe_after_cooldown():
+    breaker = opened()
+    assert breaker.state == OPEN
+    assert 0 < breaker.allow(10.0) <= 10.0
+    breaker.opened_at -= 10.0
+    assert breaker.allow(10.0) is None
+    assert breaker.state == HALF_OPEN and breaker.probing
+    assert breaker.allow(10.0) is not None
+    breaker.record(True, 1)
+    assert breaker.state == CLOSED and not breaker.probing
+    assert breaker.allow(10.0) is None
+
+
+def test_failed_probe_opens_again():
+    breaker = opened(10.0)
+    assert breaker.allow(10.0) is None
+    breaker.record(False, 5)
+    assert breaker.state == OPEN and not breaker.probing
+    assert breaker.allow(10.0) > 9
+
+
+def test_probe_that_never_reports_expires():
+    breaker = opened(10.0)
+    assert breaker.allow(10.0) is None
+    # Still waiting on the probe: others are turned away until it is a cooldown old
+    assert 9 < breaker.allow(10.0) <= 10.0
+    breaker.probe_started -= 10.0
+    assert breaker.allow(10.0) is None
+    assert breaker.probing and breaker.probe_started > time.monotonic() - 1
+
+
+@pytest.fixture
+def cc(mocks, monkeypatch):
+    """cc_rest against mock_cc with a breaker that opens on the first failure and one request per org at a time."""
+    for name, value in {"CC_BREAKER_FAILURES": "1", "CC_BREAKER_COOLDOWN": "0.5", "CC_ORG_MAX_CONCURRENCY": "1", "CC_HEDGE_PERCENTILE": "0"}.items():
+        monkeypatch.setenv(name, value)
+    state = mocks["cc_state"]
+    state["script"].clear()
+    yield state
+    state["script"].clear()
+
+
+def test_probe_cancelled_while_queued_does_not_wedge_the_breaker(cc):
+    from lib.api import cc_rest, get_rate_limits
+    from lib.breaker import breakers
+    from lib.ratelimit import scheduler
+
+    org = "org-probe"
+    overrides = {"token": "x", "orgId": org}
+
+    def end_task():
+        return cc_rest("POST", "v1/tasks/t-1/end", {}, overrides)
+
+    async def go():
+        cc["script"].append(503)
+        assert (await end_task())["status"] == 503
+        assert (await end_task()).get("circuitOpen")
+        await asyncio.sleep(0.55)
+        # The org's only slot is taken, so the would-be probe queues for it and is cancelled there
+        async with scheduler.slot(org, get_rate_limits()):
+            probe = asyncio.create_task(end_task())
+            await asyncio.sleep(0.05)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+        return await end_task()
+
+    res = run(go)
+    assert res["ok"] is True
+    assert next(b for key, b in breakers.breakers.items() if key.endswith("v1/tasks/{taskID}/end")).state == CLOSED
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from lib.cache import DatasetCache
+
+KEY = ("users", "org-1", "-")
+
+
+def test_cancelled_caller_does_not_cancel_shared_fetch():
+    async def go():
+        cache = DatasetCache(ttl=60, max_entries=4, stale=0)
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch(headers):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"ok": True, "data": ["agent1@example.com"]}
+
+        first = asyncio.create_task(cache.get(KEY, fetch))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get(KEY, fetch))
+        await asyncio.sleep(0)
+        first.cancel()  # e.g. CHAT_TOOL_TIMEOUT or a client disconnect
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        res = await second
+        assert res == {"ok": True, "data": ["agent1@example.com"], "cache": "miss"}
+        assert calls == 1
+        assert cache.stats()["shared"] == 1
+        assert cache.stats()["inflight"] == 0
+        # The fetch still filled the cache
+        assert (await cache.get(KEY, fetch))["cache"] == "hit"
+
+    asyncio.run(go())
+
+
+def test_fetch_survives_when_every_caller_is_cancelled():
+    async def go():
+        cache = DatasetCache(ttl=60, max_entries=4, stale=0)
+        release = asyncio.Event()
+
+        async def fetch(headers):
+            await release.wait()
+            return {"ok": True, "data": 1}
+
+        caller = asyncio.create_task(cache.get(KEY, fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert cache.peek(KEY).value == 1
+
+    asyncio.run(go())
+
+
+def test_fetch_error_reaches_every_caller():
+    async def go():
+        cache = DatasetCache(ttl=60, max_entries=4, stale=0)
+
+        async def fetch(headers):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(cache.get(KEY, fetch), cache.get(KEY, fetch), return_exceptions=True)
+        assert [str(r) for r in results] == ["boom", "boom"]
+        assert cache.stats()["inflight"] == 0
+
+    asyncio.run(go())
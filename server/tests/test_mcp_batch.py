@@ -0,0 +1,59 @@
+"""JSON-RPC batches on POST /mcp: a failing entry answers for its own id and the rest still complete."""
+
+import pytest
+
+from lib.jsonio import loads
+
+
+def call(tool: str, args: dict, req_id=None) -> dict:
+    body = {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": tool, "arguments": {**args, "__accessToken": "x", "__orgId": "org-batch"}}}
+    return body if req_id is None else {**body, "id": req_id}
+
+
+@pytest.fixture
+def failing(monkeypatch):
+    import main
+
+    real = main.handle_tool_call
+
+    async def handle_tool_call(name, args):
+        if name == "cc_query_agents":
+            raise RuntimeError("boom")
+        return await real(name, args)
+
+    monkeypatch.setattr(main, "handle_tool_call", handle_tool_call)
+
+
+def test_mixed_batch(server, failing):
+    batch = [
+        {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": [1]},
+        call("cc_end_task", {"taskID": 5}, 3),
+        call("cc_query_agents", {}, 4),
+        {"jsonrpc": "2.0", "method": "tools/call", "params": [1]},
+        call("cc_query_agents", {}),
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        7,
+        {"jsonrpc": "2.0", "id": 5, "method": "tools/call", "params": {"name": "cc_end_task", "arguments": ["t-1"]}},
+        {"jsonrpc": "2.0", "id": 6, "method": "tools/list"},
+    ]
+    resp = server.post("/mcp", json=batch)
+    assert resp.status_code == 200
+    out = resp.json()
+    # Notifications (no id) get no response, whether they succeed or fail
+    assert [r["id"] for r in out] == [1, 2, 3, 4, None, 5, 6]
+    assert out[0]["result"] == {}
+    assert out[1]["error"]["code"] == -32602
+    assert out[2]["result"]["isError"] is False
+    assert loads(out[2]["result"]["content"][0]["text"])["data"] == {"id": "5"}
+    assert out[3]["error"]["code"] == -32603
+    assert out[4]["error"]["code"] == -32600
+    assert out[5]["error"]["code"] == -32602
+    assert out[6]["result"]["tools"]
+
+
+def test_single_request_errors(server, failing):
+    resp = server.post("/mcp", json={"jsonrpc": "2.0", "id": "a", "method": "tools/call", "params": "cc_end_task"})
+    assert resp.status_code == 200 and resp.json()["error"] == {"code": -32602, "message": "Invalid params"}
+    resp = server.post("/mcp", json=call("cc_query_agents", {}, "b"))
+    assert resp.status_code == 200 and resp.json() == {"jsonrpc": "2.0", "id": "b", "error": {"code": -32603, "message": "Internal error"}}
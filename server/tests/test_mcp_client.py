@@ -0,0 +1,24 @@
+from lib import mcp_client
+
+
+async def _dispatch(body):
+    return {"jsonrpc": "2.0", "id": body["id"], "result": {}}
+
+
+def test_request_origin_is_local_only_for_that_request(monkeypatch):
+    monkeypatch.setattr(mcp_client, "_local", {"dispatch": _dispatch, "port": 3100})
+    remote = "https://some-remote-mcp.example.com/mcp"
+    assert mcp_client.is_local_url(remote, "some-remote-mcp.example.com")
+    # A later request from another origin still goes to the remote server
+    assert not mcp_client.is_local_url(remote, "app.example.com")
+    assert not mcp_client.is_local_url(remote)
+
+
+def test_localhost_port_is_local(monkeypatch):
+    monkeypatch.setattr(mcp_client, "_local", {"dispatch": _dispatch, "port": 3100})
+    assert mcp_client.is_local_url(mcp_client.local_mcp_url())
+    assert mcp_client.is_local_url("http://127.0.0.1:3100/mcp/")
+    assert not mcp_client.is_local_url("http://localhost:3101/mcp")
+    assert not mcp_client.is_local_url("http://localhost:3100/other")
+    monkeypatch.setenv("MCP_LOCAL_DISPATCH", "0")
+    assert not mcp_client.is_local_url("http://localhost:3100/mcp")
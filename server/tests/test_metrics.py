@@ -0,0 +1,80 @@
+import re
+
+from conftest import call_tool, run
+
+_SAMPLE = re.compile(r"^(\w+)(\{.*\})? (\S+)$")
+
+
+def scrape(client) -> dict[str, float]:
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    samples = {}
+    for line in resp.text.splitlines():
+        if line and not line.startswith("#"):
+            m = _SAMPLE.match(line)
+            assert m, line
+            samples[m[1] + (m[2] or "")] = float(m[3])
+    return samples
+
+
+def buckets(samples: dict, name: str, labels: str) -> list[float]:
+    """Cumulative bucket counts of one histogram series, in le order (+Inf last)."""
+    return [v for k, v in samples.items() if k.startswith(f"{name}_bucket{{{labels},le=")]
+
+
+def test_metrics_after_mocked_workload(server):
+    before = scrape(server)
+    org = "org-metrics"  # not cached by other tests: the first tool call downloads the datasets
+    for email in ("agent1@example.com", "agent2@example.com"):
+        assert "ok" in call_tool(server, "cc_check_agent_outbound", {"userEmail": email}, org)["content"][0]["text"]
+    call_tool(server, "cc_query_agents", {"groupBy": "status"}, org)
+    chat = server.post("/api/chat", json={"prompt": "Can agent3@example.com dial out?", "accessToken": "x", "orgId": org})
+    assert chat.status_code == 200 and chat.json()["reply"]
+    after = scrape(server)
+
+    def delta(key: str) -> float:
+        return after.get(key, 0) - before.get(key, 0)
+
+    # Request counters: 2 direct + 1 from the chat round
+    assert delta('mcp_tool_calls_total{tool="cc_check_agent_outbound",outcome="ok"}') == 3
+    assert delta('mcp_tool_calls_total{tool="cc_query_agents",outcome="ok"}') == 1
+    assert delta('cc_upstream_responses_total{method="GET",path="organization/{orgId}/user/bulk-export",status="200"}') == 1
+    assert delta('cc_upstream_responses_total{method="GET",path="organization/{orgId}/v2/agent-profile",status="200"}') == 1
+    assert delta('chat_llm_rounds_total{provider="anthropic"}') == 2
+    assert delta('chat_mcp_call_duration_seconds_count{tool="cc_check_agent_outbound",transport="local"}') == 1
+    assert delta('chat_duration_seconds_count{provider="anthropic",outcome="ok"}') == 1
+    assert delta('chat_llm_tokens_total{provider="anthropic",type="output"}') == 40
+
+    # Histograms: cumulative buckets, +Inf bucket == count, sum grows with the observations
+    for name, labels, n in (
+        ("mcp_tool_duration_seconds", 'tool="cc_check_agent_outbound"', 3),
+        ("cc_upstream_duration_seconds", 'method="GET",path="organization/{orgId}/user/bulk-export"', 1),
+        ("chat_llm_round_duration_seconds", 'provider="anthropic"', 2),
+        ("chat_rounds_per_chat", 'provider="anthropic"', 1),
+    ):
+        series = buckets(after, name, labels)
+        assert series, name
+        assert series == sorted(series), name
+        assert series[-1] == after[f"{name}_count{{{labels}}}"]
+        assert delta(f"{name}_count{{{labels}}}") == n
+        assert delta(f"{name}_sum{{{labels}}}") > 0
+        assert delta(f'{name}_bucket{{{labels},le="+Inf"}}') == n
+
+    # Every in-flight gauge is back to 0
+    for gauge in ("mcp_tools_in_flight", "cc_upstream_in_flight", "chat_in_flight"):
+        assert after[gauge] == 0, gauge
+
+
+def test_unknown_tool_names_share_one_label(server):
+    from lib.mcp_client import call_mcp_tool, local_mcp_url
+
+    before = scrape(server)
+    for name in ("made-up-1", "made-up-2"):
+        res = run(lambda: call_mcp_tool(local_mcp_url(), name, {}))
+        assert res["isError"] is True
+    after = scrape(server)
+    key = 'chat_mcp_call_duration_seconds_count{tool="unknown",transport="local"}'
+    assert after[key] - before.get(key, 0) == 2
+    assert after['mcp_tool_calls_total{tool="unknown",outcome="error"}'] - before.get('mcp_tool_calls_total{tool="unknown",outcome="error"}', 0) == 2
+    assert not any("made-up" in k for k in after)
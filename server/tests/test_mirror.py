@@ -0,0 +1,109 @@
+"""On-disk directory mirror (lib/mirror.py): sync upserts and deletes, load expiry, pruning and the views."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from lib.directory import ProfileIndex, UserIndex
+
+USERS = [
+    {"email": "Ann@Example.com", "id": "u1", "agentProfileName": "Sales"},
+    {"email": "bob@example.com", "id": "u2", "agentProfileId": "p2"},
+    {"email": "cy@example.com", "id": "u3"},
+]
+PROFILES = [{"id": "p1", "name": "Sales", "outdialEnabled": True}, {"id": "p2", "name": "Support"}]
+
+
+@pytest.fixture
+def mirror(mocks, tmp_path):
+    # Imported once the mocks disable the shared mirror, which lib.mirror creates from the env on import
+    from lib.mirror import DirectoryMirror
+
+    m = DirectoryMirror(str(tmp_path / "mirror.db"), max_age=60)
+    yield m
+    asyncio.run(m.close())
+
+
+def sync(m, dataset: str, index, org: str = "org-1", scope: str = "s1", etag: str | None = None) -> None:
+    async def go():
+        m.sync(dataset, org, scope, index, etag, "Mon, 01 Jan 2024 00:00:00 GMT")
+        await m.drain()
+
+    asyncio.run(go())
+
+
+def count(m, table: str) -> int:
+    with sqlite3.connect(m.path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_open_creates_the_schema(mirror):
+    assert mirror.load("users", "org-1", "s1") is None  # not opened: no query at all
+    asyncio.run(mirror.open())
+    assert mirror.load("users", "org-1", "s1") is None
+    assert mirror.counters["errors"] == 0 and count(mirror, "datasets") == 0
+
+
+def test_sync_upserts_changed_rows_and_deletes_vanished_ones(mirror):
+    sync(mirror, "users", UserIndex.from_users(USERS), etag='"v1"')
+    assert mirror.counters["upserted"] == 3 and mirror.counters["deleted"] == 0
+    # Same data: nothing is rewritten
+    sync(mirror, "users", UserIndex.from_users(USERS), etag='"v1"')
+    assert mirror.counters["upserted"] == 3
+    changed = [{**USERS[0], "agentProfileName": "Support"}, USERS[1]]
+    sync(mirror, "users", UserIndex.from_users(changed), etag='"v2"')
+    assert mirror.counters["upserted"] == 4 and mirror.counters["deleted"] == 1
+    res = mirror.load("users", "org-1", "s1")
+    assert res["ok"] and res["mirror"] and res["etag"] == '"v2"' and res["lastModified"].startswith("Mon")
+    users = res["data"]
+    assert len(users) == 2 and users.rows == 2
+    assert users.get(" ANN@example.com ").profile_ref == "Support"
+    assert users.get("cy@example.com") is None
+    assert sorted((u.email, u.id) for u in users.records()) == [("ann@example.com", "u1"), ("bob@example.com", "u2")]
+
+
+def test_views_are_scoped_to_org_and_token(mirror):
+    sync(mirror, "users", UserIndex.from_users(USERS))
+    sync(mirror, "profiles", ProfileIndex.from_payload(PROFILES))
+    assert mirror.load("users", "org-1", "s2") is None
+    assert mirror.load("users", "org-2", "s1") is None
+    profiles = mirror.load("profiles", "org-1", "s1")["data"]
+    assert len(profiles) == 2
+    sales = profiles.get("Sales")
+    assert (sales.id, sales.name, sales.outdial_enabled) == ("p1", "Sales", True)
+    assert profiles.get("p2").outdial_enabled is False
+    assert profiles.get(None) is None and profiles.get("nope") is None
+
+
+def test_load_expires_after_max_age(mirror):
+    sync(mirror, "users", UserIndex.from_users(USERS))
+    assert mirror.load("users", "org-1", "s1") is not None
+    mirror.max_age = 0.001
+    asyncio.run(asyncio.sleep(0.01))
+    assert mirror.load("users", "org-1", "s1") is None
+    assert mirror.counters["stale"] == 1
+    # A revalidation makes it fresh again
+    mirror.max_age = 60
+
+    async def touch():
+        mirror.touch("users", "org-1", "s1")
+        await mirror.drain()
+
+    asyncio.run(touch())
+    assert mirror.load("users", "org-1", "s1") is not None
+
+
+def test_sync_prunes_expired_datasets_of_other_scopes(mirror):
+    sync(mirror, "users", UserIndex.from_users(USERS), scope="old-token")
+    sync(mirror, "profiles", ProfileIndex.from_payload(PROFILES), scope="old-token")
+    assert count(mirror, "users") == 3 and count(mirror, "profiles") == 4
+    mirror.max_age = 0.001
+    asyncio.run(asyncio.sleep(0.01))
+    sync(mirror, "users", UserIndex.from_users(USERS[:1]), scope="new-token")
+    # Only the dataset just synced is left
+    assert mirror.counters["pruned"] == 2
+    assert count(mirror, "datasets") == 1 and count(mirror, "users") == 1 and count(mirror, "profiles") == 0
+    mirror.max_age = 60
+    assert mirror.load("users", "org-1", "new-token") is not None
+    assert mirror.load("users", "org-1", "old-token") is None
@@ -0,0 +1,146 @@
+"""Retry / Retry-After / per-org concurrency policy (lib/ratelimit.py), on its own and through cc_rest against mock_cc."""
+
+import asyncio
+import random
+import time
+from email.utils import formatdate
+
+import pytest
+from conftest import run
+
+from lib.ratelimit import UpstreamScheduler, parse_retry_after, retry_delay
+
+LIMITS = {"rps": 0.0, "burst": 20, "max_concurrency": 10, "max_retries": 3, "base_delay": 0.5, "max_delay": 30.0}
+
+
+@pytest.fixture
+def cc(mocks, monkeypatch):
+    """cc_rest against mock_cc with fast retries and no breaker or hedging in the way; yields the mock's state."""
+    for name, value in {"CC_RETRY_BASE_DELAY": "0.01", "CC_BREAKER_FAILURES": "0", "CC_HEDGE_PERCENTILE": "0", "CC_RATE_LIMIT_RPS": "0"}.items():
+        monkeypatch.setenv(name, value)
+    state = mocks["cc_state"]
+    state["script"].clear()
+    yield state
+    state["script"].clear()
+
+
+def test_parse_retry_after_delta_seconds():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(" 7 ") == 7
+    assert parse_retry_after("0") == 0
+    assert parse_retry_after("-3") == 0
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after(formatdate(time.time() + 30, usegmt=True)) == pytest.approx(30, abs=2)
+    assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0
+
+
+def test_parse_retry_after_invalid():
+    for value in (None, "", "soon", "Thu, 99 Foo 2025"):
+        assert parse_retry_after(value) is None
+
+
+def test_backoff_stays_within_jitter_bounds_and_max_delay():
+    random.seed(1)
+    limits = {**LIMITS, "max_retries": 12, "base_delay": 0.5, "max_delay": 4.0}
+    for attempt in range(12):
+        cap = min(limits["max_delay"], limits["base_delay"] * 2**attempt)
+        delays = [retry_delay("GET", 503, None, attempt, limits) for _ in range(200)]
+        assert all(0 <= d <= cap for d in delays)
+        # Full jitter: spread over the whole window, not clustered at its top
+        assert min(delays) < cap * 0.1 and max(delays) > cap * 0.9
+    assert retry_delay("GET", 503, None, 12, limits) is None
+
+
+def test_retry_after_is_honoured_up_to_max_delay():
+    assert retry_delay("GET", 429, 2.5, 0, LIMITS) == 2.5
+    assert retry_delay("GET", 429, LIMITS["max_delay"] + 1, 0, LIMITS) is None
+
+
+def test_only_idempotent_methods_retry_5xx():
+    for status in (502, 503, 504):
+        assert retry_delay("POST", status, None, 0, LIMITS) is None
+        assert retry_delay("PATCH", status, None, 0, LIMITS) is None
+        assert retry_delay("GET", status, None, 0, LIMITS) is not None
+        assert retry_delay("PUT", status, None, 0, LIMITS) is not None
+    assert retry_delay("POST", 429, None, 0, LIMITS) is not None
+    assert retry_delay("GET", 500, None, 0, LIMITS) is None
+
+
+def test_org_concurrency_cap():
+    scheduler = UpstreamScheduler()
+    limits = {**LIMITS, "max_concurrency": 2}
+    running = {"org-a": 0, "org-b": 0}
+    peak = {"org-a": 0, "org-b": 0}
+
+    async def call(org):
+        async with scheduler.slot(org, limits):
+            running[org] += 1
+            peak[org] = max(peak[org], running[org])
+            await asyncio.sleep(0.01)
+            running[org] -= 1
+
+    async def go():
+        await asyncio.gather(*(call(org) for org in ("org-a", "org-b") for _ in range(8)))
+
+    asyncio.run(go())
+    # Each org is held to its cap, independently of the other
+    assert peak == {"org-a": 2, "org-b": 2}
+
+
+def test_post_not_retried_on_5xx(cc):
+    from lib.api import cc_rest
+
+    for status in (502, 503, 504):
+        cc["script"].append(status)
+        before = cc["requests"]
+        res = run(lambda: cc_rest("POST", "v1/tasks/t-1/end", {}, {"token": "x", "orgId": "org-retry"}))
+        assert res["ok"] is False and res["status"] == status
+        assert cc["requests"] - before == 1
+
+
+def test_get_retried_on_5xx(cc):
+    from lib.api import cc_rest
+
+    cc["script"].extend([503, 502])
+    before = cc["requests"]
+    res = run(lambda: cc_rest("GET", "organization/org-retry/v3/address-book", None, {"token": "x", "orgId": "org-retry"}))
+    assert res["ok"] is True
+    assert cc["requests"] - before == 3
+
+
+def test_post_retried_on_429(cc):
+    from lib.api import cc_rest
+
+    cc["script"].append((429, {"Retry-After": "0"}))
+    before = cc["requests"]
+    res = run(lambda: cc_rest("POST", "v1/tasks/t-1/end", {}, {"token": "x", "orgId": "org-retry"}))
+    assert res["ok"] is True
+    assert cc["requests"] - before == 2
+
+
+def test_429_pauses_the_org_for_retry_after(cc):
+    from lib.api import cc_rest
+
+    def get(org):
+        return cc_rest("GET", f"organization/{org}/v3/address-book", None, {"token": "x", "orgId": org})
+
+    async def timed(coro):
+        start = time.monotonic()
+        res = await coro
+        return res, time.monotonic() - start
+
+    async def go():
+        cc["script"].append((429, {"Retry-After": "0.6"}))
+        first = asyncio.create_task(timed(get("org-paused")))
+        await asyncio.sleep(0.1)  # the 429 has come back and paused org-paused
+        same_org, other_org = await asyncio.gather(timed(get("org-paused")), timed(get("org-free")))
+        return await first, same_org, other_org
+
+    (first, t_first), (same_org, t_same), (other_org, t_other) = run(go)
+    assert first["ok"] and same_org["ok"] and other_org["ok"]
+    assert t_first >= 0.55
+    # Started 0.1s into the pause, the org's next request waits out the rest of it; other orgs do not
+    assert t_same >= 0.4
+    assert t_other < 0.3
@@ -0,0 +1,96 @@
+"""Chat sessions (lib/sessions.py): history trimming at turn boundaries, the store, and stateless /api/chat calls."""
+
+import asyncio
+
+import pytest
+
+from lib.sessions import MemorySessionStore, SessionStore, get_session_store, trim_history
+
+
+def anthropic_turn(n: int, tools: int = 1) -> list[dict]:
+    """Prompt, then tools x (tool_use, tool_result), then the reply: 2 + 2 * tools messages."""
+    turn = [{"role": "user", "content": f"question {n}"}]
+    for t in range(tools):
+        turn.append({"role": "assistant", "content": [{"type": "tool_use", "id": f"{n}-{t}", "name": "cc_end_task", "input": {}}]})
+        turn.append({"role": "user", "content": [{"type": "tool_result", "tool_use_id": f"{n}-{t}", "content": "{}"}]})
+    turn.append({"role": "assistant", "content": f"answer {n}"})
+    return turn
+
+
+def openai_turn(n: int, tools: int = 1) -> list[dict]:
+    turn = [{"role": "user", "content": f"question {n}"}]
+    for t in range(tools):
+        turn.append({"role": "assistant", "content": None, "tool_calls": [{"id": f"{n}-{t}", "type": "function"}]})
+        turn.append({"role": "tool", "tool_call_id": f"{n}-{t}", "content": "{}"})
+    turn.append({"role": "assistant", "content": f"answer {n}"})
+    return turn
+
+
+@pytest.mark.parametrize("turn", [anthropic_turn, openai_turn])
+def test_kept_history_starts_at_a_prompt(turn):
+    messages = [m for n in range(6) for m in turn(n, tools=n % 3)]
+    for limit in range(1, len(messages) + 1):
+        kept = trim_history(messages, limit)
+        assert kept == messages[len(messages) - len(kept) :]
+        assert kept[0]["role"] == "user" and isinstance(kept[0]["content"], str), limit
+        # Whole turns only: within the limit unless the last turn alone is longer
+        last = turn(5, tools=2)
+        assert len(kept) <= max(limit, len(last)), limit
+
+
+def test_short_history_is_unchanged():
+    messages = anthropic_turn(0)
+    assert trim_history(messages, 4) is messages
+    assert trim_history(messages, 40) is messages
+
+
+def test_one_turn_longer_than_the_limit():
+    messages = anthropic_turn(0) + anthropic_turn(1, tools=5)
+    # The last turn alone (12 messages) is over the limit: it is kept whole, from its prompt
+    assert trim_history(messages, 3) == anthropic_turn(1, tools=5)
+    # History without any prompt to start from is dropped
+    assert trim_history(anthropic_turn(2, tools=3)[1:], 2) == []
+
+
+def test_session_store_is_abstract():
+    with pytest.raises(TypeError):
+        SessionStore()
+
+    class Partial(SessionStore):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_memory_store_ttl_and_lru():
+    async def go():
+        store = MemorySessionStore(ttl=60, max_entries=2)
+        for key in ("a", "b"):
+            await store.put(key, {"provider": "openai", "messages": [key]})
+        assert (await store.get("a"))["messages"] == ["a"]  # a is now the most recent
+        await store.put("c", {"provider": "openai", "messages": []})
+        assert await store.get("b") is None and await store.get("a") is not None
+        await store.delete("a")
+        assert store.stats()["sessions"] == 1 and store.stats()["evictions"] == 1
+        expired = MemorySessionStore(ttl=0.01, max_entries=2)
+        await expired.put("a", {"provider": "openai", "messages": []})
+        await asyncio.sleep(0.02)
+        assert await expired.get("a") is None
+        disabled = MemorySessionStore(ttl=60, max_entries=0)
+        await disabled.put("a", {"provider": "openai", "messages": []})
+        assert disabled.stats()["sessions"] == 0
+
+    asyncio.run(go())
+
+
+def test_only_requests_with_a_conversation_id_store_history(server):
+    body = {"prompt": "Can agent3@example.com dial out?", "accessToken": "x", "orgId": "org-sessions"}
+    before = get_session_store().stats()["sessions"]
+    res = server.post("/api/chat", json=body)
+    assert res.status_code == 200 and "conversationId" not in res.json()
+    assert get_session_store().stats()["sessions"] == before
+    res = server.post("/api/chat", json={**body, "conversationId": "c-1"})
+    assert res.status_code == 200 and res.json()["conversationId"] == "c-1"
+    assert get_session_store().stats()["sessions"] == before + 1
@@ -0,0 +1,30 @@
+"""Model-facing tool results (lib/shaping.py) stay within their byte budget."""
+
+from lib.jsonio import dumps
+from lib.shaping import shape_tool_result
+
+
+def test_text_within_budget_is_unchanged():
+    assert shape_tool_result("cc_end_task", "plain text", max_bytes=100) == "plain text"
+
+
+def test_truncated_text_never_exceeds_max_bytes():
+    text = "é" * 500 + "x" * 500  # multi-byte characters, so a cut can land inside one
+    for max_bytes in (1, 2, 5, 13, 14, 15, 40, 80, 81, 90, 200, 999, 1499):
+        out = shape_tool_result("cc_end_task", text, max_bytes=max_bytes)
+        assert len(out.encode()) <= max_bytes, max_bytes
+
+
+def test_truncation_note():
+    out = shape_tool_result("cc_end_task", "x" * 1000, max_bytes=200)
+    assert out.endswith("...[truncated to 200 of 1000 bytes; the user sees the full result]")
+    assert out.startswith("x") and len(out) == 200
+    assert shape_tool_result("cc_end_task", "x" * 1000, max_bytes=20) == "x" * 6 + "...[truncated]"
+    assert shape_tool_result("cc_end_task", "x" * 1000, max_bytes=5) == "x" * 5
+
+
+def test_json_lists_shrink_before_the_text_is_cut():
+    text = dumps({"ok": True, "rows": [{"id": i, "email": f"agent{i}@example.com"} for i in range(200)]})
+    out = shape_tool_result("cc_query_agents", text, max_items=25, max_bytes=500)
+    assert len(out.encode()) <= 500
+    assert "truncated" not in out and '"nextOffset"' in out
@@ -0,0 +1,120 @@
+import gzip
+import hashlib
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from lib.static import MANIFEST, PrecompressedStaticFiles, ui_build_status
+
+SERVER = Path(__file__).resolve().parent.parent
+ROOT = SERVER.parent
+
+
+@pytest.fixture
+def ui_repo(tmp_path):
+    """Minimal repo: UI sources, a Vite dist/ and build-static.js."""
+    shutil.copy(ROOT / "build-static.js", tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "App.jsx").write_bytes(b"export default function App() {\r\n  return null\r\n}\r\n")
+    (tmp_path / "index.html").write_text("<div id=root></div>")
+    (tmp_path / "dist" / "assets").mkdir(parents=True)
+    (tmp_path / "dist" / "index.html").write_text('<script src="/assets/index-AbCd1234.js"></script>')
+    (tmp_path / "dist" / "assets" / "index-AbCd1234.js").write_text("console.log('chat');\n" * 200)
+    return tmp_path
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_build_manifest_tracks_ui_sources(ui_repo):
+    subprocess.run(["node", "build-static.js"], cwd=ui_repo, check=True, capture_output=True)
+    static = ui_repo / "server" / "static"
+    status = ui_build_status(static, ui_repo)
+    assert status["built"] and status["stale"] is False
+    # Same sources checked out with LF line endings: still fresh
+    app = ui_repo / "src" / "App.jsx"
+    app.write_bytes(app.read_bytes().replace(b"\r\n", b"\n"))
+    assert ui_build_status(static, ui_repo)["stale"] is False
+    app.write_text("export default function App() { return 'changed' }\n")
+    assert ui_build_status(static, ui_repo)["stale"] is True
+
+
+def test_no_sources_means_unknown(tmp_path):
+    assert ui_build_status(tmp_path, tmp_path) == {"built": None, "sources": None, "stale": None}
+
+
+def test_committed_ui_bundle_is_built_from_current_sources():
+    assert ui_build_status(SERVER / "static", ROOT)["stale"] is False
+
+
+def static_client(directory: Path) -> TestClient:
+    return TestClient(Starlette(routes=[Mount("/", PrecompressedStaticFiles(directory=str(directory), html=True))]))
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """A built static dir: one hashed asset with a gzip variant recorded in the manifest."""
+    body = b"console.log('chat');\n" * 200
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index-AbCd1234.js").write_bytes(body)
+    (tmp_path / "assets" / "index-AbCd1234.js.gz").write_bytes(gzip.compress(body))
+    (tmp_path / MANIFEST).write_text(json.dumps({"compressed": {"assets/index-AbCd1234.js": hashlib.sha256(body).hexdigest()}}))
+    return tmp_path
+
+
+def test_serves_recorded_variant(static_dir):
+    resp = static_client(static_dir).get("/assets/index-AbCd1234.js", headers={"Accept-Encoding": "br, gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip" and resp.headers["vary"] == "Accept-Encoding"
+    assert resp.headers["content-type"].startswith("text/javascript")
+    assert resp.content == (static_dir / "assets" / "index-AbCd1234.js").read_bytes()  # decoded by the client
+
+
+def test_variants_are_not_files_of_their_own(static_dir):
+    client = static_client(static_dir)
+    assert client.get("/assets/index-AbCd1234.js.gz", headers={"Accept-Encoding": "gzip"}).status_code == 404
+    assert client.get("/assets/index-AbCd1234.js.br").status_code == 404
+
+
+def test_variant_of_other_contents_is_not_sent(static_dir):
+    asset = static_dir / "assets" / "index-AbCd1234.js"
+    client = static_client(static_dir)
+    # Bundle replaced without recompressing: the old .gz must not stand in for the new file
+    asset.write_bytes(b"console.log('new');\n" * 200)
+    resp = client.get("/assets/index-AbCd1234.js", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in resp.headers
+    assert resp.content == asset.read_bytes()
+    # Nothing recorded at all
+    (static_dir / MANIFEST).write_text("{}")
+    asset.write_bytes(gzip.decompress((static_dir / "assets" / "index-AbCd1234.js.gz").read_bytes()))
+    assert "content-encoding" not in client.get("/assets/index-AbCd1234.js", headers={"Accept-Encoding": "gzip"}).headers
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_build_records_compressed_files(ui_repo):
+    subprocess.run(["node", "build-static.js"], cwd=ui_repo, check=True, capture_output=True)
+    static = ui_repo / "server" / "static"
+    manifest = json.loads((static / MANIFEST).read_text())
+    assert manifest["sources"] and list(manifest["compressed"]) == ["assets/index-AbCd1234.js"]
+    resp = static_client(static).get("/assets/index-AbCd1234.js", headers={"Accept-Encoding": "br"})
+    assert resp.headers["content-encoding"] == "br"
+    # --compress-only keeps the sources hash
+    subprocess.run(["node", "build-static.js", "--compress-only"], cwd=ui_repo, check=True, capture_output=True)
+    assert json.loads((static / MANIFEST).read_text()) == manifest
+
+
+def test_committed_variants_match_their_files():
+    static = SERVER / "static"
+    compressed = json.loads((static / MANIFEST).read_text())["compressed"]
+    variants = sorted(p for p in static.rglob("*") if p.suffix in (".br", ".gz"))
+    assert variants
+    for variant in variants:
+        original = variant.with_suffix("")
+        rel = original.relative_to(static).as_posix()
+        assert compressed.get(rel) == hashlib.sha256(original.read_bytes()).hexdigest(), rel
+        if variant.suffix == ".gz":
+            assert gzip.decompress(variant.read_bytes()) == original.read_bytes(), rel
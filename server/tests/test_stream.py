@@ -0,0 +1,130 @@
+"""Streamed bulk-export parsing (lib/stream.py): JSON, NDJSON and CSV split across arbitrary chunks."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from conftest import run
+from starlette.responses import Response
+
+from lib.stream import build_user_index, iter_user_rows, user_finder
+
+USERS = [
+    {"email": "ann@example.com", "note": 'quote " bracket ] brace } comma ,', "roles": ["a", ["b"]], "agentProfileName": "Sales"},
+    {"email": "bob@example.com", "note": "back\\slash \\\" é 日本  ", "nested": {"data": [1, {"x": "]"}]}},
+    {"email": "cy@example.com", "n": -12.5e3, "ok": True, "none": None, "empty": {}, "list": []},
+]
+# The user list follows a key that also holds an array, and strings that look like structure
+JSON_DOC = json.dumps(
+    {"meta": {"note": 'data: [not this] {"users": []}', "tags": ["x", "y"]}, "links": [1, 2], "data": USERS, "after": [{"email": "no@x.y"}]},
+    ensure_ascii=False,
+).encode()
+
+
+def response(chunks: list[bytes], content_type: str = "application/json", pulled: list | None = None) -> httpx.Response:
+    async def body():
+        for chunk in chunks:
+            if pulled is not None:
+                pulled.append(chunk)
+            yield chunk
+
+    return httpx.Response(200, headers={"Content-Type": content_type}, content=body())
+
+
+def rows(chunks: list[bytes], content_type: str = "application/json") -> list[dict]:
+    async def collect():
+        return [row async for row in iter_user_rows(response(chunks, content_type))]
+
+    return asyncio.run(collect())
+
+
+def every_split(data: bytes):
+    """data in one chunk, in two split at each byte (inside strings, escapes, multi-byte characters and
+    elements), then in chunks of 1..7 bytes."""
+    yield [data]
+    for i in range(1, len(data)):
+        yield [data[:i], data[i:]]
+    for size in range(1, 8):
+        yield [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_json_list_under_a_known_key():
+    for chunks in every_split(JSON_DOC):
+        assert rows(chunks) == USERS
+
+
+def test_json_top_level_array_and_bom():
+    doc = json.dumps(USERS, ensure_ascii=False).encode()
+    for chunks in every_split(doc):
+        assert rows(chunks) == USERS
+    assert rows([b"\xef\xbb\xbf", b"  \n", doc]) == USERS
+    assert rows([b"\xef\xbb\xbf" + JSON_DOC]) == USERS
+
+
+def test_json_without_a_user_list():
+    assert rows([b'{"meta": {"people": [{"email": "a@b.c"}]}}']) == []
+    assert rows([b"   "]) == []
+    assert rows([]) == []
+
+
+def test_truncated_json_raises():
+    with pytest.raises(json.JSONDecodeError):
+        rows([JSON_DOC[: JSON_DOC.index(b"bob") + 10]])
+
+
+def test_ndjson():
+    doc = b"\r\n".join(json.dumps(u, ensure_ascii=False).encode() for u in USERS) + b"\r\n\r\n"
+    for chunks in every_split(doc):
+        assert rows(chunks, "application/x-ndjson") == USERS
+
+
+def test_csv_with_bom_and_quoted_fields_spanning_lines():
+    doc = (
+        '\ufeffEmail,Agent Profile Name,first_name,Note\r\n'
+        'ann@example.com,Sales,Ann,"two\r\nlines, and a comma"\r\n'
+        'bob@example.com,"Sales, EMEA",Bob,"say ""hi"""\r\n'
+        'cy@example.com,,Cy,plain\r\n'
+    ).encode()
+    expected = [
+        {"email": "ann@example.com", "agentProfileName": "Sales", "firstName": "Ann", "note": "two\r\nlines, and a comma"},
+        {"email": "bob@example.com", "agentProfileName": "Sales, EMEA", "firstName": "Bob", "note": 'say "hi"'},
+        {"email": "cy@example.com", "agentProfileName": "", "firstName": "Cy", "note": "plain"},
+    ]
+    for chunks in every_split(doc):
+        assert rows(chunks, "text/csv") == expected
+
+
+def test_build_user_index():
+    index = asyncio.run(build_user_index(response([JSON_DOC[:50], JSON_DOC[50:]])))
+    assert len(index) == 3
+    assert index.get("ann@example.com").profile_ref == "Sales"
+
+
+def test_user_finder_stops_at_the_match():
+    chunks = [b'{"data": ['] + [json.dumps({"email": f"user{i}@example.com"}).encode() + b"," for i in range(100)] + [b"{}]}"]
+    pulled = []
+    index = asyncio.run(user_finder("User3@Example.com")(response(chunks, pulled=pulled)))
+    assert index.get("user3@example.com") is not None and len(index) == 1
+    assert index.rows == 4
+    assert len(pulled) < 10  # the rest of the export is never read
+    missing = asyncio.run(user_finder("nobody@example.com")(response(chunks)))
+    assert len(missing) == 0 and missing.rows == 101
+
+
+def test_unrecognized_stream_falls_back_to_a_buffered_get(mocks, monkeypatch):
+    """A list the streaming parser does not look for (not under a known key) is found by the buffered parse."""
+    import main
+
+    monkeypatch.setenv("CC_STREAM_EXPORTS", "1")
+    payload = json.dumps({"meta": {"count": 2}, "people": [{"email": "ann@example.com"}, {"email": "bob@example.com"}]}).encode()
+    state = mocks["cc_state"]
+    state["script"].extend(Response(payload, media_type="application/json") for _ in range(2))
+    before = state["requests"]
+    try:
+        res = run(lambda: main._get_org_dataset("users", "org-stream-fallback", {"token": "x", "orgId": "org-stream-fallback"}))
+    finally:
+        state["script"].clear()
+    assert res["ok"] is True
+    assert len(res["data"]) == 2 and res["data"].get("bob@example.com") is not None
+    assert state["requests"] - before == 2  # the stream, then the buffered GET
@@ -27,9 +27,9 @@ const TABS = [
 const MCP_TOOLS_DOCS = [
   {
     name: 'cc_list_address_books',
-    description: 'Lists address books for the organization. Calls Webex Contact Center API: GET organization/{orgId}/v3/address-book. Requires Organization ID (provide in Chat or in MCP arguments as __orgId, or set on server as CONTACT_CENTER_ORG_ID).',
-    howToUseFromChat: 'In the Chat tab, enter your Organization ID and Access token, then type a natural prompt such as: "What address books do you have?", "List all address books", or "Show me the address books for my org." The assistant will call this tool and return the list.',
-    examplePrompts: ['What address books do you have?', 'List all address books', 'Show me the address books for my org'],
+    description: 'Lists address books for the organization one page at a time (GET organization/{orgId}/v3/address-book with page/pageSize), or with addressBookId the entries of one address book. Results are compact and include nextCursor for the next page. Requires Organization ID (provide in Chat or in MCP arguments as __orgId, or set on server as CONTACT_CENTER_ORG_ID).',
+    howToUseFromChat: 'In the Chat tab, enter your Organization ID and Access token, then type a natural prompt such as: "What address books do you have?", "Show me the next page" or "List the entries of the Default address book." The assistant will call this tool and return the list.',
+    examplePrompts: ['What address books do you have?', 'Show me the next page of address books', 'List the entries of the Default address book'],
   },
   {
     name: 'cc_end_task',
@@ -37,14 +37,55 @@ const MCP_TOOLS_DOCS = [
     howToUseFromChat: 'In Chat, after your Org ID and token are set, ask to end a specific task by ID, for example: "End task 97d4ad13-c8fa-4ec7-a035-ec691682caa4" or "Clear the interaction for task 97d4ad13-c8fa-4ec7-a035-ec691682caa4."',
     examplePrompts: ['End task 97d4ad13-c8fa-4ec7-a035-ec691682caa4', 'Clear the interaction for task 97d4ad13-c8fa-4ec7-a035-ec691682caa4', 'Close task 97d4ad13-c8fa-4ec7-a035-ec691682caa4'],
   },
+  {
+    name: 'cc_end_tasks',
+    description: 'Ends (clears) many interactions/tasks at once, e.g. the orphaned tasks of a stuck queue. Duplicate IDs are ignored; POST v1/tasks/{taskID}/end is sent for each, several at a time. Returns summary counts and a compact table (taskID, status, httpStatus, error). Status is ended, not-found, failed or invalid.',
+    howToUseFromChat: 'In Chat, with your Org ID and token set, paste the task IDs, e.g.: "End these tasks: 97d4ad13-..., 5b1c02e9-..., 0e7f3a44-..." or "Clear all of these stuck interactions: ..."',
+    examplePrompts: ['End these tasks: 97d4ad13-c8fa-4ec7-a035-ec691682caa4, 5b1c02e9-7d8e-4f10-9a2b-3c4d5e6f7a8b', 'Clear all of these stuck interactions: ...'],
+  },
   {
     name: 'cc_check_agent_outbound',
     description: 'Checks if an agent is configured to place outbound calls. Uses org ID and token from Chat or MCP arguments. Internally: (1) GET user bulk-export to find the user and agent profile name, (2) GET agent-profile to read outdialEnabled.',
     howToUseFromChat: 'In Chat, with Org ID and token set, ask about a specific agent by email, e.g.: "Can agent john@company.com place outbound calls?", "Is outbound enabled for jane@example.com?", or "Check if this agent has outdial: user@org.com."',
     examplePrompts: ['Can agent john@company.com place outbound calls?', 'Is outbound enabled for jane@example.com?', 'Check if this agent has outdial: user@org.com'],
   },
+  {
+    name: 'cc_check_agents_outbound',
+    description: 'Checks outbound-call capability for many agents at once. Fetches the user bulk-export and agent profiles once, then returns a compact table (email, status, agentProfileName) with summary counts. Status is outbound, no-outbound, not-found, no-profile, profile-not-found or invalid.',
+    howToUseFromChat: 'In Chat, with Org ID and token set, paste a list of agent emails, e.g.: "Which of these agents can place outbound calls: a@company.com, b@company.com, c@company.com?" or "Audit outbound dialing for these 200 agents: ..."',
+    examplePrompts: ['Which of these agents can place outbound calls: a@company.com, b@company.com?', 'Audit outbound dialing for these agents: ...'],
+  },
+  {
+    name: 'cc_query_agents',
+    description: 'Queries the org agent directory (user bulk-export joined with agent profiles) without checking agents one by one. Optional filters: profile, outdialEnabled, email domain, status; optional group-by counts (profile, domain, outdialEnabled, status); paginated rows (email, agentProfileName, outdialEnabled, status).',
+    howToUseFromChat: 'In Chat, with Org ID and token set, ask a question about many agents at once, e.g.: "How many agents have outdial enabled?", "Which agents on profile Sales cannot dial out?" or "How many agents are there per agent profile?"',
+    examplePrompts: ['How many agents have outdial enabled?', 'Which agents on profile Sales cannot dial out?', 'How many agents are there per agent profile?'],
+  },
 ]
 
+// Parse one Server-Sent Event block ("event: x\ndata: {...}") from /api/chat/stream
+function parseSseEvent(block) {
+  let event = 'message'
+  const dataLines = []
+  for (const line of block.split('\n')) {
+    if (line.startsWith('event:')) event = line.slice(6).trim()
+    else if (line.startsWith('data:')) dataLines.push(line.slice(5).trimStart())
+  }
+  let data = {}
+  try {
+    data = dataLines.length ? JSON.parse(dataLines.join('\n')) : {}
+  } catch {
+    data = {}
+  }
+  return { event, data }
+}
+
+// Id of this page's chat conversation; the server keeps history only for requests that send one
+function newConversationId() {
+  if (typeof crypto !== 'undefined' && crypto.randomUUID) return crypto.randomUUID()
+  return Array.from({ length: 4 }, () => Math.random().toString(16).slice(2, 10)).join('')
+}
+
 function buildCcMcpConfig(serverName, mcpUrl) {
   const name = (serverName || DEFAULT_CC_SERVER_NAME).trim() || DEFAULT_CC_SERVER_NAME
   return {
@@ -71,6 +112,8 @@ function App() {
   const [chatInput, setChatInput] = useState('')
   const [chatLoading, setChatLoading] = useState(false)
   const [chatError, setChatError] = useState(null)
+  // Server-side conversation (history kept by the chat API), one per page load
+  const [chatConversationId] = useState(newConversationId)
 
   const chatAuthReady = Boolean(chatAccessToken?.trim())
 
@@ -95,7 +138,7 @@ function App() {
     setChatLoading(true)
     try {
       const base = chatApiBase.replace(/\/$/, '')
-      const res = await fetch(`${base}/api/chat`, {
+      const res = await fetch(`${base}/api/chat/stream`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
@@ -103,30 +146,57 @@ function App() {
           mcpServerUrl: chatMcpUrl,
           accessToken: chatAccessToken.trim(),
           orgId: chatOrgId.trim() || undefined,
+          conversationId: chatConversationId,
         }),
       })
-      const data = await res.json()
-      if (!res.ok) {
+      if (!res.ok || !res.body) {
+        const data = await res.json().catch(() => ({}))
         throw new Error(data.error || `HTTP ${res.status}`)
       }
-      setChatMessages((prev) => [
-        ...prev,
-        {
-          role: 'assistant',
-          content: data.reply || '',
-          toolCalls: data.toolCalls,
-        },
-      ])
+      // Assistant message rendered incrementally from Server-Sent Events
+      setChatMessages((prev) => [...prev, { role: 'assistant', content: '', toolCalls: [], streaming: true }])
+      const updateLast = (fn) => setChatMessages((prev) => [...prev.slice(0, -1), fn(prev[prev.length - 1])])
+      const pending = {}
+      let toolCount = 0
+      const reader = res.body.getReader()
+      const decoder = new TextDecoder()
+      let buffer = ''
+      for (;;) {
+        const { done, value } = await reader.read()
+        if (done) break
+        buffer += decoder.decode(value, { stream: true })
+        let sep
+        while ((sep = buffer.indexOf('\n\n')) !== -1) {
+          const { event, data } = parseSseEvent(buffer.slice(0, sep))
+          buffer = buffer.slice(sep + 2)
+          if (event === 'delta') {
+            updateLast((m) => ({ ...m, content: m.content + data.text }))
+          } else if (event === 'tool_start') {
+            pending[data.index] = toolCount++
+            updateLast((m) => ({ ...m, toolCalls: [...m.toolCalls, { name: data.name, result: '(running…)' }] }))
+          } else if (event === 'tool_result') {
+            updateLast((m) => ({
+              ...m,
+              toolCalls: m.toolCalls.map((t, i) => (i === pending[data.index] ? { name: data.name, result: data.result } : t)),
+            }))
+          } else if (event === 'done') {
+            updateLast(() => ({ role: 'assistant', content: data.reply || '', toolCalls: data.toolCalls }))
+          } else if (event === 'error') {
+            throw new Error(data.error || 'Chat failed')
+          }
+        }
+      }
+      updateLast((m) => (m.streaming ? { ...m, streaming: false } : m))
     } catch (err) {
       setChatError(err.message || String(err))
-      setChatMessages((prev) => [
-        ...prev,
-        { role: 'assistant', content: `Error: ${err.message || String(err)}`, isError: true },
-      ])
+      const errorMessage = { role: 'assistant', content: `Error: ${err.message || String(err)}`, isError: true }
+      setChatMessages((prev) =>
+        prev.length && prev[prev.length - 1].streaming ? [...prev.slice(0, -1), errorMessage] : [...prev, errorMessage],
+      )
     } finally {
       setChatLoading(false)
     }
-  }, [chatInput, chatLoading, chatAuthReady, chatApiBase, chatMcpUrl, chatAccessToken, chatOrgId])
+  }, [chatInput, chatLoading, chatAuthReady, chatApiBase, chatMcpUrl, chatAccessToken, chatOrgId, chatConversationId])
 
   return (
     <div className="app">
@@ -380,7 +450,7 @@ function App() {
                   )}
                 </div>
               ))}
-              {chatLoading && (
+              {chatLoading && !chatMessages[chatMessages.length - 1]?.streaming && (
                 <div className="chat-message chat-message-assistant">
                   <span className="chat-message-role">Assistant</span>
                   <div className="chat-message-content">Thinking…</div>